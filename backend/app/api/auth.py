@@ -21,10 +21,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.db.crm_db import get_tenant_db
-from app.services.tenant import get_org_id, get_user_id
+from app.services.tenant import get_org_id, get_user_id, invalidate_visibility
 from app.models.crm.user import User, Role
 from app.models.crm.organization import Tenant as Organization
 from app.config import settings
+from app.services.auth_cache import invalidate_user
 from app.services.email import (
     generate_code, send_verification_email, send_password_reset_email,
 )
@@ -320,6 +321,9 @@ async def signup(request: Request, data: SignupRequest, db: AsyncSession = Depen
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    await invalidate_user(user.id)
+    if user.org_id:
+        invalidate_visibility(user.org_id)
 
     # Load relationships for token
     result = await db.execute(
@@ -369,6 +373,9 @@ async def login(data: LoginRequest, request: Request, db: AsyncSession = Depends
     user.login_count = (user.login_count or 0) + 1
     await db.commit()
 
+    # A fresh login is the natural point to pick up out-of-band org/role changes
+    await invalidate_user(user.id)
+
     token, expires_in = _create_token(user)
     return TokenResponse(
         access_token=token,
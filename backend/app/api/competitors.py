@@ -16,7 +16,7 @@ from app.db.crm_db import get_tenant_db
 from app.services.tenant import get_org_id, get_user_id
 from app.models.crm.competitor import Competitor
 from app.models.crm.social import SocialAccount
-from app.api.scraper import sync_instagram_competitor, sync_instagram_competitor_batch
+from app.api.scraper import invalidate_synced_personas, sync_instagram_competitor, sync_instagram_competitor_batch
 from app.api.auth import get_current_user
 from app.models.crm.user import User
 from app.db.crm_db import crm_session
@@ -50,6 +50,7 @@ async def _background_sync_competitor(competitor_id: int, platform: str, org_id:
             
             if sync_result["success"]:
                 await db.commit()
+                await invalidate_synced_personas(db)
                 logger.info(f"Successfully synced competitor {competitor.handle} (ID: {competitor_id})")
             else:
                 logger.error(f"Failed to sync competitor {competitor.handle} (ID: {competitor_id}): {sync_result['error']}")
@@ -552,6 +553,7 @@ async def auto_populate_competitor(
             )
 
         await db.commit()
+        await invalidate_synced_personas(db)
         await db.refresh(competitor)
 
         return CompetitorResponse.model_validate(competitor)
@@ -654,6 +656,7 @@ async def sync_competitors(
                 })
         
         await db.commit()
+        await invalidate_synced_personas(db)
         
         return {
             "message": f"Sync completed: {sync_results['success']} succeeded, {sync_results['failed']} failed",
@@ -692,6 +695,7 @@ async def sync_single_competitor(
             )
         
         await db.commit()
+        await invalidate_synced_personas(db)
         await db.refresh(competitor)
         
         return CompetitorResponse.model_validate(competitor)
@@ -5,9 +5,11 @@ import os
 import re
 import httpx
 import asyncio
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any, Tuple
 from collections import Counter, defaultdict
+from functools import lru_cache
 import string
 import re
 
@@ -26,11 +28,22 @@ from app.models.crm.content_script import ContentScript
 from app.models.crm.social import SocialAccount
 from app.models.crm.user import User
 from app.api.scraper import (
+    invalidate_synced_personas,
     sync_instagram_competitor,
     sync_instagram_competitor_batch,
     calculate_competitor_engagement_score,
 )
 from app.services.competitor_benchmarks import competitor_benchmarks_service
+from app.services.competitor_posts import PostRow, upsert_competitor_posts
+from app.services.competitor_analytics import (
+    load_ranked_posts,
+    load_top_video_per_competitor,
+    load_topic_stats,
+    mark_snapshot_stale,
+    refresh_org_snapshot,
+)
+from app.services.shared_state import SharedLock, get_json, set_json
+from app.services.workflow_queue import enqueue_task, get_job_info, run_stage
 # Removed direct scraper imports - now using HTTP calls to scraper service
 # _get_business_settings moved here from contracts.py to avoid cross-dependency
 from app.db.leadgen_db import leadgen_session
@@ -107,7 +120,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-_competitor_sync_locks: Dict[int, asyncio.Lock] = {}
 
 
 async def _get_business_settings() -> dict:
@@ -153,13 +165,9 @@ async def _get_business_settings() -> dict:
     return out
 
 
-def _get_competitor_sync_lock(competitor_id: int) -> asyncio.Lock:
-    """Return the in-process lock used to dedupe competitor sync requests."""
-    lock = _competitor_sync_locks.get(competitor_id)
-    if lock is None:
-        lock = asyncio.Lock()
-        _competitor_sync_locks[competitor_id] = lock
-    return lock
+def _get_competitor_sync_lock(competitor_id: int) -> SharedLock:
+    """Return the cross-worker lock used to dedupe competitor sync requests."""
+    return SharedLock(f"competitor-sync:{competitor_id}", ttl_seconds=600)
 
 
 # Enhanced Pydantic models
@@ -1285,6 +1293,12 @@ def extract_cta_from_transcript(transcript_data: Optional[str]) -> str:
     return re.sub(r'\s+', ' ', cta_text)
 
 
+@lru_cache(maxsize=1)
+def _english_stopwords() -> frozenset:
+    """NLTK's English stopword list, loaded once."""
+    return frozenset(stopwords.words('english'))
+
+
 def extract_ngrams(text: str, n: int = 2) -> List[str]:
     """Extract n-grams from text using NLTK if available."""
     if not text or not NLTK_AVAILABLE:
@@ -1297,7 +1311,7 @@ def extract_ngrams(text: str, n: int = 2) -> List[str]:
         tokens = word_tokenize(text)
         
         # Remove stopwords
-        stop_words = set(stopwords.words('english'))
+        stop_words = _english_stopwords()
         tokens = [token for token in tokens if token not in stop_words and len(token) > 2]
         
         # Generate n-grams
@@ -1308,6 +1322,21 @@ def extract_ngrams(text: str, n: int = 2) -> List[str]:
         return []
 
 
+GENERIC_TOPIC_WORDS = ('the', 'and', 'for', 'with', 'this', 'that', 'you', 'your', 'how')
+
+
+def _post_topic_phrases(text: str) -> List[str]:
+    """Candidate topic phrases (bigrams + trigrams) for one post's text."""
+    if not text:
+        return []
+    phrases = extract_ngrams(text, 2) + extract_ngrams(text, 3)
+    # Filter out generic phrases
+    return [
+        phrase for phrase in phrases
+        if len(phrase.split()) >= 2 and not any(word in phrase.lower() for word in GENERIC_TOPIC_WORDS)
+    ]
+
+
 def cluster_topics(topics: List[str], max_clusters: int = 5) -> Dict[str, List[str]]:
     """Cluster similar topics together using TF-IDF and K-means."""
     if not topics or not NLTK_AVAILABLE or len(topics) < 2:
@@ -1380,52 +1409,48 @@ async def get_social_account_token(db: AsyncSession, user_id: int, org_id: int,
 
 async def save_competitor_posts(db: AsyncSession, competitor_id: int, org_id: int, platform: str, 
                                posts: List[CompetitorPost]) -> bool:
-    """Save competitor posts to cache table."""
+    """Save competitor posts to cache table.
+    
+    Bulk upsert keyed on (competitor_id, shortcode/post URL): metrics are
+    updated in place and enrichment (transcripts, comment analysis, content
+    analysis) is kept. Only genuinely new posts are classified.
+    """
     try:
-        # Delete old posts for this competitor/platform (with org_id check via competitor)
-        await db.execute(
-            text("""
-                DELETE FROM crm.competitor_posts 
-                WHERE competitor_id = :competitor_id AND platform = :platform 
-                AND competitor_id IN (SELECT id FROM crm.competitors WHERE id = :competitor_id AND org_id = :org_id)
-            """),
-            {"competitor_id": competitor_id, "platform": platform, "org_id": org_id}
+        # Only write posts for a competitor this org owns
+        owned = await db.execute(
+            text("SELECT 1 FROM crm.competitors WHERE id = :competitor_id AND org_id = :org_id"),
+            {"competitor_id": competitor_id, "org_id": org_id}
         )
-        
-        # Insert new posts and collect IDs for classification
-        new_post_ids = []
-        for post in posts:
-            result = await db.execute(
-                text("""
-                    INSERT INTO crm.competitor_posts 
-                    (competitor_id, platform, post_text, likes, comments, shares, 
-                     engagement_score, hook, post_url, posted_at, fetched_at)
-                    VALUES (:competitor_id, :platform, :post_text, :likes, :comments, :shares,
-                            :engagement_score, :hook, :post_url, :posted_at, NOW())
-                    RETURNING id
-                """),
-                {
-                    "competitor_id": competitor_id,
-                    "platform": platform,
-                    "post_text": post.text,
-                    "likes": post.likes,
-                    "comments": post.comments,
-                    "shares": post.shares,
-                    "engagement_score": post.engagement_score,
-                    "hook": "",  # Will be populated by content_analyzer from transcript
-                    "post_url": post.url,
-                    "posted_at": post.timestamp
-                }
-            )
-            post_id = result.scalar()
-            if post_id:
-                new_post_ids.append(post_id)
-        
+        if owned.scalar() is None:
+            logger.warning("Competitor %s not found for org %s; posts not saved", competitor_id, org_id)
+            return False
+        
+        result = await upsert_competitor_posts(
+            db, competitor_id, org_id, platform,
+            [
+                PostRow(
+                    post_text=post.text,
+                    likes=post.likes,
+                    comments=post.comments,
+                    shares=post.shares,
+                    engagement_score=post.engagement_score,
+                    hook="",  # Will be populated by content_analyzer from transcript
+                    post_url=post.url,
+                    posted_at=post.timestamp,
+                )
+                for post in posts
+            ],
+        )
+        await mark_snapshot_stale(db, org_id)
         await db.commit()
+        if result.new_ids or result.updated_ids:
+            # MiroFish personas are clustered from these posts
+            from app.services.mirofish_engine import invalidate_personas
+            await invalidate_personas(org_id)
         
         # Classify the newly saved posts
-        if new_post_ids:
-            await classify_new_posts(db, org_id, new_post_ids)
+        if result.new_ids:
+            await classify_new_posts(db, result.new_ids)
             await db.commit()
         
         return True
@@ -1436,6 +1461,41 @@ async def save_competitor_posts(db: AsyncSession, competitor_id: int, org_id: in
         return False
 
 
+async def classify_new_posts(db: AsyncSession, post_ids: List[int]) -> int:
+    """Set detected_format on newly inserted posts. Does not commit."""
+    result = await db.execute(
+        text("""
+            SELECT id, post_text, hook, content_analysis
+            FROM crm.competitor_posts
+            WHERE id = ANY(:ids) AND detected_format IS NULL
+        """),
+        {"ids": post_ids}
+    )
+    rows = result.fetchall()
+    if not rows:
+        return 0
+    
+    formats = []
+    for post_id, post_text, hook, content_analysis in rows:
+        if isinstance(content_analysis, str):
+            try:
+                content_analysis = json.loads(content_analysis)
+            except (json.JSONDecodeError, TypeError):
+                content_analysis = None
+        formats.append(classify_post_format(post_text or "", hook or "", content_analysis))
+    
+    await db.execute(
+        text("""
+            UPDATE crm.competitor_posts cp
+            SET detected_format = v.format
+            FROM UNNEST(CAST(:ids AS INTEGER[]), CAST(:formats AS TEXT[])) AS v(id, format)
+            WHERE cp.id = v.id
+        """),
+        {"ids": [r[0] for r in rows], "formats": formats}
+    )
+    return len(rows)
+
+
 async def load_cached_posts(db: AsyncSession, org_id: int, competitor_id: int = None,
                            platform: str = None, days: Optional[int] = 30) -> List[Dict]:
     """Load cached competitor posts from database."""
@@ -1476,6 +1536,22 @@ async def load_cached_posts(db: AsyncSession, org_id: int, competitor_id: int =
         return []
 
 
+async def load_posts_by_ids(db: AsyncSession, org_id: int, post_ids: List[int]) -> Dict[int, Dict]:
+    """Load full cached post rows (with handle/followers) by id, keyed by id."""
+    if not post_ids:
+        return {}
+    result = await db.execute(
+        text("""
+            SELECT cp.*, c.handle, COALESCE(c.followers, 0) AS followers
+            FROM crm.competitor_posts cp
+            JOIN crm.competitors c ON cp.competitor_id = c.id
+            WHERE c.org_id = :org_id AND cp.id = ANY(:ids)
+        """),
+        {"org_id": org_id, "ids": list(post_ids)},
+    )
+    return {row._mapping["id"]: dict(row._mapping) for row in result.fetchall()}
+
+
 def _cached_rows_to_posts(cached_posts: List[Dict[str, Any]]) -> List[CompetitorPost]:
     """Convert cached post rows into API response models."""
     posts: List[CompetitorPost] = []
@@ -1564,6 +1640,7 @@ async def _ensure_competitor_cached_posts(
             )
 
         await db.commit()
+        await invalidate_synced_personas(db)
         cached_posts = await load_cached_posts(db, competitor.org_id, competitor.id, platform, days=days)
         return cached_posts, sync_result["profile"]
 
@@ -1773,11 +1850,16 @@ async def analyze_trending_topics(posts: List[Dict], enable_clustering: bool = T
     })
     
     for post in posts:
-        text = post.get('post_text', '')
-        if not text:
+        # Snapshot rows carry precomputed phrases; raw posts are tokenized here
+        phrases = post.get('topic_labels')
+        if phrases is None:
+            phrases = _post_topic_phrases(post.get('post_text', ''))
+        if isinstance(phrases, str):
+            phrases = json.loads(phrases)
+        if not phrases:
             continue
             
-        posted_at = post.get('posted_at', datetime.now())
+        posted_at = post.get('posted_at') or datetime.now()
         if isinstance(posted_at, str):
             try:
                 posted_at = datetime.fromisoformat(posted_at.replace('Z', '+00:00'))
@@ -1787,20 +1869,10 @@ async def analyze_trending_topics(posts: List[Dict], enable_clustering: bool = T
         engagement_score = _post_engagement_score(post)
         recency_weight = calculate_recency_weight(posted_at)
         
-        # Extract bigrams and trigrams
-        bigrams = extract_ngrams(text, 2)
-        trigrams = extract_ngrams(text, 3)
-        
-        # Combine all phrases
-        phrases = bigrams + trigrams
-        
         for phrase in phrases:
-            # Filter out generic phrases
-            if len(phrase.split()) >= 2 and not any(word in phrase.lower() for word in 
-                ['the', 'and', 'for', 'with', 'this', 'that', 'you', 'your', 'how']):
-                phrase_data[phrase]['posts'].append(post)
-                phrase_data[phrase]['engagement_scores'].append(engagement_score)
-                phrase_data[phrase]['recency_weights'].append(recency_weight)
+            phrase_data[phrase]['posts'].append(post)
+            phrase_data[phrase]['engagement_scores'].append(engagement_score)
+            phrase_data[phrase]['recency_weights'].append(recency_weight)
     
     # Calculate trending topics
     trending = []
@@ -1835,19 +1907,47 @@ async def analyze_trending_topics(posts: List[Dict], enable_clustering: bool = T
     # Cluster related topics if requested
     if enable_clustering and trending:
         topic_names = [t.topic for t in trending[:20]]  # Top 20 topics
-        clusters = cluster_topics(topic_names)
-        
-        # Add related topics to each trending topic
-        for topic in trending[:20]:
-            for cluster_name, cluster_members in clusters.items():
-                if topic.topic in cluster_members:
-                    related = [t for t in cluster_members if t != topic.topic]
-                    topic.related_topics = related[:3]  # Max 3 related topics
-                    break
+        _assign_related_topics(trending[:20], cluster_topics(topic_names))
     
     return trending[:15]  # Return top 15 topics
 
 
+def _assign_related_topics(topics: List[TrendingTopic], clusters: Dict[str, List[str]]) -> None:
+    """Add up to 3 related topics from each topic's cluster."""
+    for topic in topics:
+        for cluster_name, cluster_members in clusters.items():
+            if topic.topic in cluster_members:
+                related = [t for t in cluster_members if t != topic.topic]
+                topic.related_topics = related[:3]  # Max 3 related topics
+                break
+
+
+# Topic clusters are reused until the top-topic vocabulary drifts by more
+# than this fraction (Jaccard distance)
+TOPIC_CLUSTER_DRIFT = 0.25
+TOPIC_CLUSTER_TTL = 24 * 3600
+
+
+async def _clusters_for_topics(cache_name: str, topic_names: List[str]) -> Dict[str, List[str]]:
+    """Cluster topic names, reusing the cached clustering while the set is stable."""
+    current = set(topic_names)
+    cached = await get_json(cache_name)
+    if cached:
+        previous = set(cached.get("topics", []))
+        union = current | previous
+        drift = 1 - len(current & previous) / len(union) if union else 0.0
+        if drift <= TOPIC_CLUSTER_DRIFT:
+            clusters = {name: [t for t in members if t in current] for name, members in cached["clusters"].items()}
+            clustered = {t for members in clusters.values() for t in members}
+            # New topics since the last fit stand alone until the next refit
+            clusters.update({t: [t] for t in topic_names if t not in clustered})
+            return {name: members for name, members in clusters.items() if members}
+
+    clusters = await asyncio.to_thread(cluster_topics, topic_names)
+    await set_json(cache_name, {"topics": topic_names, "clusters": clusters}, ttl_seconds=TOPIC_CLUSTER_TTL)
+    return clusters
+
+
 # API Endpoints
 
 @router.get("/competitors/{competitor_id}/content", response_model=CompetitorContentResponse)
@@ -1910,6 +2010,10 @@ async def get_competitor_content(
         raise HTTPException(status_code=500, detail="Failed to fetch competitor content")
 
 
+# Snapshot columns each dashboard needs (see app/services/competitor_analytics.py)
+HOOK_SNAPSHOT_COLUMNS = "a.post_id, a.hook, a.handle, a.platform, a.post_url, a.engagement_score"
+
+
 @router.get("/competitors/trending-topics", response_model=TrendingTopicsResponse)
 async def get_trending_topics(
     request: Request,
@@ -1920,10 +2024,10 @@ async def get_trending_topics(
     """Analyze all competitor content to extract common themes/topics ranked by engagement."""
     org_id = get_org_id(request)
     try:
-        # Load cached posts from all competitors
-        cached_posts = await load_cached_posts(db, org_id, platform=platform, days=days)
+        # Phrase statistics aggregated in SQL from per-post stored n-grams
+        total_posts, stats = await load_topic_stats(db, org_id, platform=platform, days=days, limit=20)
         
-        if not cached_posts:
+        if not total_posts:
             # If no cached posts, we need to refresh data
             return TrendingTopicsResponse(
                 topics=[],
@@ -1931,12 +2035,28 @@ async def get_trending_topics(
                 timeframe_days=days
             )
         
-        # Analyze trending topics
-        trending_topics = await analyze_trending_topics(cached_posts)
+        trending_topics = [
+            TrendingTopic(
+                topic=row["phrase"].title(),
+                frequency=row["frequency"],
+                avg_engagement=row["avg_engagement"],
+                recency_weight=row["avg_recency"],
+                final_score=row["final_score"],
+                sources=list(row["sources"] or []),
+                keywords=row["phrase"].split(),
+            )
+            for row in stats
+        ]
+        if trending_topics:
+            clusters = await _clusters_for_topics(
+                f"content-intel:topic-clusters:{org_id}:{platform or 'all'}:{days}",
+                [t.topic for t in trending_topics],
+            )
+            _assign_related_topics(trending_topics, clusters)
         
         return TrendingTopicsResponse(
-            topics=trending_topics,
-            total_analyzed_posts=len(cached_posts),
+            topics=trending_topics[:15],  # Return top 15 topics
+            total_analyzed_posts=total_posts,
             timeframe_days=days
         )
         
@@ -1956,36 +2076,33 @@ async def get_top_content(
     """Get top performing content across all competitors."""
     org_id = get_org_id(request)
     try:
-        # Load cached posts sorted by engagement
-        cached_posts = await load_cached_posts(db, org_id, platform=platform, days=days)
+        # Pre-ranked snapshot rows (virality, engagement, rate, recency)
+        top_posts = await load_ranked_posts(db, org_id, platform=platform, days=days, limit=limit)
         
-        if not cached_posts:
+        if not top_posts:
             return TopContentResponse(posts=[], total_posts=0)
         
-        # Recompute ranking from current counts, follower context, and recency
-        top_posts = _sorted_posts_for_analysis(cached_posts)[:limit]
-        
         # Convert to response format
         top_content = []
         for post in top_posts:
             top_content.append(TopContentItem(
-                id=post.get('id'),
+                id=post.get('post_id'),
                 text=post.get('post_text', ''),
                 hook=post.get('hook', ''),
                 likes=post.get('likes', 0),
                 comments=post.get('comments', 0),
                 shares=post.get('shares', 0),
-                engagement_score=_post_engagement_score(post),
+                engagement_score=post.get('engagement_score', 0.0),
                 platform=post.get('platform', ''),
                 competitor_handle=post.get('handle', ''),
                 url=post.get('post_url', ''),
-                timestamp=post.get('posted_at', datetime.now()),
-                virality_score=_post_virality_score(post),
+                timestamp=post.get('posted_at') or datetime.now(),
+                virality_score=float(post.get('virality_score') or 0),
             ))
         
         return TopContentResponse(
             posts=top_content,
-            total_posts=len(cached_posts)
+            total_posts=top_posts[0]['total_count']
         )
         
     except Exception as e:
@@ -2004,17 +2121,19 @@ async def get_hooks(
     """Get extracted hooks ranked by engagement score."""
     org_id = get_org_id(request)
     try:
-        # Load cached posts
-        cached_posts = await load_cached_posts(db, org_id, platform=platform, days=days)
+        # Snapshot rows carry the resolved hook and come ranked by virality
+        # first so refreshes reflect changing winner content
+        snapshot_posts = await load_ranked_posts(
+            db, org_id, platform=platform, days=days, columns=HOOK_SNAPSHOT_COLUMNS,
+        )
         
-        if not cached_posts:
+        if not snapshot_posts:
             return HooksResponse(hooks=[], total_hooks=0)
         
-        # Extract hooks and rank them from the current post performance snapshot
         hooks = []
         seen_hooks: set[str] = set()
-        for post in cached_posts:
-            hook = _post_hook(post)
+        for post in snapshot_posts:
+            hook = post.get('hook') or ''
             if hook and len(hook.strip()) > 10:  # Filter out short/empty hooks
                 hook_key = hook.strip().lower()
                 if hook_key in seen_hooks:
@@ -2022,15 +2141,13 @@ async def get_hooks(
                 seen_hooks.add(hook_key)
                 hooks.append(HookItem(
                     hook=hook,
-                    engagement_score=_post_engagement_score(post),
+                    engagement_score=post.get('engagement_score', 0.0),
                     platform=post.get('platform', ''),
                     competitor_handle=post.get('handle', ''),
                     source_url=post.get('post_url', ''),
-                    virality_score=_post_virality_score(post),
+                    virality_score=float(post.get('virality_score') or 0),
                 ))
         
-        # Sort by virality first so refreshes reflect changing winner content
-        hooks.sort(key=lambda x: (x.virality_score, x.engagement_score), reverse=True)
         top_hooks = hooks[:limit]
         
         return HooksResponse(
@@ -2100,7 +2217,7 @@ async def refresh_competitor_content(
                     pass
                 
                 if posts:
-                    success = await save_competitor_posts(db, competitor.id, platform_name, posts)
+                    success = await save_competitor_posts(db, competitor.id, org_id, platform_name, posts)
                     if success:
                         refreshed += 1
                     else:
@@ -2113,6 +2230,7 @@ async def refresh_competitor_content(
                 errors.append(f"Error refreshing {competitor.handle}: {str(e)}")
 
         await db.commit()
+        await invalidate_synced_personas(db)
         
         return {
             "message": f"Refreshed content for {refreshed} competitors",
@@ -3623,29 +3741,16 @@ async def get_top_competitor_videos(
     """Return one top video-like post per leading Instagram competitor."""
     org_id = get_org_id(request)
     try:
-        result = await db.execute(
-            select(Competitor).where(Competitor.platform == "instagram")
-        )
-        competitors = sorted(
-            result.scalars().all(),
-            key=lambda comp: (
-                getattr(comp, "followers", 0) or 0,
-                _coerce_float(getattr(comp, "avg_engagement_rate", 0)),
-            ),
-            reverse=True,
-        )
-
-        top_videos: List[TopVideoItem] = []
-        for competitor in competitors[: max(limit * 3, limit)]:
-            cached_posts, _ = await _ensure_competitor_cached_posts(db, competitor, days=days)
-            video_posts = [post for post in cached_posts if _is_video_like_post(post)]
-            if not video_posts:
-                continue
-
-            best_post = _sorted_posts_for_analysis(video_posts)[0]
-            top_videos.append(_top_video_item_from_post(best_post))
-            if len(top_videos) >= limit:
-                break
+        # Pick each leading competitor's best video from the snapshot, then
+        # load full rows (transcript, analysis) for just those posts
+        best = await load_top_video_per_competitor(db, org_id, platform="instagram", days=days, limit=limit)
+        full_posts = await load_posts_by_ids(db, org_id, [row["post_id"] for row in best])
+
+        top_videos: List[TopVideoItem] = [
+            _top_video_item_from_post(full_posts[row["post_id"]])
+            for row in best
+            if row["post_id"] in full_posts
+        ]
 
         return sorted(
             top_videos,
@@ -3877,8 +3982,9 @@ async def index_content_for_recommendations(
 ):
     """Index top competitor content into Qdrant for the recommendation engine.
     
-    Call after syncing competitors or transcribing videos to update the index.
+    The sync-all pipeline refreshes the index automatically; this forces a pass.
     Only indexes top 20% by engagement — the content worth learning from.
+    Unchanged posts are skipped; only changed documents are re-embedded.
     """
     org_id = get_org_id(request)
     from app.services.content_embedder import index_top_content
@@ -3981,11 +4087,23 @@ async def recommend_content(request: Request, body: dict = {}, db: AsyncSession
 _sync_all_task: Optional[asyncio.Task] = None
 _sync_all_status: Dict[str, Any] = {"running": False}
 
+# Sync-all status is shared across workers so any of them can report it and
+# refuse to start a second run. The TTL bounds how long a "running" status
+# can outlive a worker that crashed mid-sync.
+SYNC_ALL_STATUS_KEY = "content-intel:sync-all-status"
+SYNC_ALL_STATUS_TTL = 6 * 3600
+
+
+async def _publish_sync_status() -> None:
+    """Push the local sync-all status to shared storage."""
+    await set_json(SYNC_ALL_STATUS_KEY, _sync_all_status, ttl_seconds=SYNC_ALL_STATUS_TTL)
+
 
 async def _run_sync_all():
     """Background task: sync all competitors."""
     global _sync_all_status
     _sync_all_status = {"running": True, "started_at": datetime.now(timezone.utc).isoformat(), "message": "Syncing..."}
+    await _publish_sync_status()
     print("[SYNC-ALL] Background task started", flush=True)
     
     try:
@@ -4003,17 +4121,33 @@ async def _run_sync_all():
             
             if not competitors:
                 _sync_all_status = {"running": False, "message": "No active competitors", "total": 0}
+                await _publish_sync_status()
                 return
             
             _sync_all_status["total"] = len(competitors)
             _sync_all_status["message"] = f"Scraping {len(competitors)} competitors..."
+            await _publish_sync_status()
             print(f"[SYNC-ALL] Found {len(competitors)} competitors, starting batch scrape", flush=True)
             
             # Use org_id from first competitor (background task has no request context)
             bg_org_id = competitors[0].org_id if competitors else 1
-            batch_result = await sync_instagram_competitor_batch(db, competitors, bg_org_id)
-            print(f"[SYNC-ALL] Batch complete — success={batch_result.success} failed={batch_result.failed} posts={batch_result.posts_saved}", flush=True)
-            await db.commit()
+            competitor_ids = [c.id for c in competitors]
+            run_id = uuid.uuid4().hex[:12]
+            _sync_all_status["jobs"] = {
+                stage: f"sync-all:{run_id}:{stage}"
+                for stage in ("scrape", "transcribe", "comments", "analysis", "index")
+            }
+            await _publish_sync_status()
+            
+            # Phase 1: Scrape — runs on the scrape worker queue (or inline without Redis)
+            batch_result = await run_stage(
+                "scrape", competitor_ids, bg_org_id, job_id=_sync_all_status["jobs"]["scrape"]
+            )
+            print(f"[SYNC-ALL] Batch complete — success={batch_result['success']} failed={batch_result['failed']} posts={batch_result['posts_saved']}", flush=True)
+            
+            # Dashboards read the analytics snapshot; rebuild it with fresh metrics
+            snapshot_org_ids = sorted({c.org_id for c in competitors if c.org_id is not None})
+            await _refresh_analytics_snapshots(db, snapshot_org_ids)
             
             # Audience analysis
             audience_refreshed = 0
@@ -4040,50 +4174,38 @@ async def _run_sync_all():
                     logger.warning("Audience refresh failed for %s: %s", comp.handle, e)
             await db.commit()
             
-            # Phase 2: Transcription + Comment analysis (parallel, non-blocking)
-            _sync_all_status["message"] = f"Synced {batch_result.success}/{len(competitors)}. Enriching content..."
+            # Phase 2: Transcription + Comment analysis (parallel, each on its own worker queue)
+            _sync_all_status["message"] = f"Synced {batch_result['success']}/{len(competitors)}. Enriching content..."
+            await _publish_sync_status()
             print(f"[SYNC-ALL] Starting parallel enrichment (transcription + comments)", flush=True)
             
             enriched = {"transcribed": 0, "comments_analyzed": 0}
             try:
-                from app.services.video_transcriber import transcribe_competitor_videos_batch
-                from app.services.comment_scraper import analyze_competitor_comments_batch
-                
-                # Get competitor IDs that synced successfully
-                synced_ids = [c.id for c in competitors]
-                
-                # Run transcription and comment analysis in parallel
                 # Transcribe up to 10 videos per competitor, analyze up to 15 comment threads
                 results = await asyncio.gather(
-                    _safe_enrich(lambda db, ids: transcribe_competitor_videos_batch(db, ids, limit_per_competitor=10), db, synced_ids, "transcription"),
-                    _safe_enrich(lambda db, ids: analyze_competitor_comments_batch(db, ids, top_n_per_competitor=15), db, synced_ids, "comments"),
-                    return_exceptions=True,
+                    _safe_enrich("transcribe", competitor_ids, _sync_all_status["jobs"]["transcribe"], limit_per_competitor=10),
+                    _safe_enrich("comments", competitor_ids, _sync_all_status["jobs"]["comments"], top_n_per_competitor=15),
                 )
-                
-                for r in results:
-                    if isinstance(r, dict):
-                        enriched["transcribed"] += r.get("transcribed", 0)
-                        enriched["comments_analyzed"] += r.get("analyzed", 0)
-                
-                await db.commit()
+                enriched["transcribed"] = results[0].get("transcribed", 0)
+                enriched["comments_analyzed"] = results[1].get("analyzed", 0)
                 
                 # Phase 3: Content structure analysis (Hook/Value/CTA) on transcribed posts
-                enriched["content_analyzed"] = 0
-                try:
-                    from app.services.content_analyzer import analyze_competitor_content_batch
-                    print(f"[SYNC-ALL] Analyzing content structure (Hook/Value/CTA)...", flush=True)
-                    ca_result = await _safe_enrich(analyze_competitor_content_batch, db, synced_ids, "content_analysis")
-                    if isinstance(ca_result, dict):
-                        enriched["content_analyzed"] = ca_result.get("analyzed", 0)
-                    await db.commit()
-                except Exception as ca_err:
-                    print(f"[SYNC-ALL] Content analysis error (non-fatal): {ca_err}", flush=True)
+                print(f"[SYNC-ALL] Analyzing content structure (Hook/Value/CTA)...", flush=True)
+                ca_result = await _safe_enrich("analysis", competitor_ids, _sync_all_status["jobs"]["analysis"])
+                enriched["content_analyzed"] = ca_result.get("analyzed", 0)
+                
+                # Phase 4: Refresh the recommendation index (only changed posts are re-embedded)
+                idx_result = await _safe_enrich("index", competitor_ids, _sync_all_status["jobs"]["index"])
+                enriched["indexed"] = idx_result.get("indexed", 0)
                 
                 print(f"[SYNC-ALL] Enrichment done — {enriched}", flush=True)
             except Exception as enrich_err:
                 print(f"[SYNC-ALL] Enrichment error (non-fatal): {enrich_err}", flush=True)
             
-            summary = f"Done: {batch_result.success}/{len(competitors)} synced, {batch_result.posts_saved} new posts"
+            # Transcripts and analysis change hooks and formats
+            await _refresh_analytics_snapshots(db, snapshot_org_ids)
+            
+            summary = f"Done: {batch_result['success']}/{len(competitors)} synced, {batch_result['posts_saved']} new posts"
             if enriched["transcribed"]:
                 summary += f", {enriched['transcribed']} transcribed"
             if enriched.get("content_analyzed"):
@@ -4095,13 +4217,15 @@ async def _run_sync_all():
                 "running": False,
                 "message": summary,
                 "total": len(competitors),
-                "success": batch_result.success,
-                "failed": batch_result.failed,
-                "posts_saved": batch_result.posts_saved,
+                "success": batch_result["success"],
+                "failed": batch_result["failed"],
+                "posts_saved": batch_result["posts_saved"],
                 "audience_refreshed": audience_refreshed,
                 "enriched": enriched,
+                "jobs": _sync_all_status.get("jobs", {}),
                 "completed_at": datetime.now(timezone.utc).isoformat(),
             }
+            await _publish_sync_status()
             
             # Create notification
             await _create_sync_notification(summary, batch_result, enriched)
@@ -4110,6 +4234,7 @@ async def _run_sync_all():
         import traceback
         print(f"[SYNC-ALL] FAILED: {e}\n{traceback.format_exc()}", flush=True)
         _sync_all_status = {"running": False, "message": f"Failed: {str(e)[:100]}", "error": True}
+        await _publish_sync_status()
         await _create_sync_notification(f"Sync failed: {str(e)[:80]}", None, None, is_error=True)
 
 
@@ -4117,17 +4242,19 @@ async def _create_sync_notification(message: str, batch_result=None, enriched=No
     """Create a notification for sync completion/failure."""
     try:
         from app.db.leadgen_db import leadgen_session
+        from app.services import notification_bus
         async with leadgen_session() as ndb:
             data = {}
             if batch_result:
-                data = {"success": batch_result.success, "failed": batch_result.failed, "posts": batch_result.posts_saved}
+                data = {"success": batch_result["success"], "failed": batch_result["failed"], "posts": batch_result["posts_saved"]}
             if enriched:
                 data["enriched"] = enriched
             
-            await ndb.execute(
+            result = await ndb.execute(
                 text("""
                     INSERT INTO public.notifications (user_id, type, title, message, data)
                     VALUES (1, :type, :title, :message, CAST(:data AS jsonb))
+                    RETURNING id, user_id, type, title, message, data, read, created_at, expires_at
                 """),
                 {
                     "type": "alert" if is_error else "success",
@@ -4136,18 +4263,31 @@ async def _create_sync_notification(message: str, batch_result=None, enriched=No
                     "data": json.dumps(data),
                 },
             )
+            row = result.fetchone()
+            if row:
+                await notification_bus.publish(ndb, dict(row._mapping))
             await ndb.commit()
             print(f"[SYNC-ALL] Notification created: {message}", flush=True)
     except Exception as e:
         print(f"[SYNC-ALL] Failed to create notification: {e}", flush=True)
 
 
-async def _safe_enrich(fn, db, competitor_ids, label):
-    """Run an enrichment function safely, catching errors."""
+async def _refresh_analytics_snapshots(db: AsyncSession, org_ids: List[int]) -> None:
+    """Rebuild the dashboard analytics snapshot for each org (non-fatal)."""
+    for org_id in org_ids:
+        try:
+            await refresh_org_snapshot(db, org_id)
+        except Exception as e:
+            await db.rollback()
+            logger.warning("Analytics snapshot refresh failed for org %s: %s", org_id, e)
+
+
+async def _safe_enrich(stage: str, competitor_ids: List[int], job_id: str, **kwargs) -> Dict[str, Any]:
+    """Run an enrichment stage safely, catching errors."""
     try:
-        return await fn(db, competitor_ids)
+        return await run_stage(stage, competitor_ids, job_id=job_id, **kwargs)
     except Exception as e:
-        print(f"[SYNC-ALL] {label} enrichment failed: {e}", flush=True)
+        print(f"[SYNC-ALL] {stage} enrichment failed: {e}", flush=True)
         return {}
 
 
@@ -4479,19 +4619,45 @@ async def adopt_emerging_format(
 @router.post("/sync-all")
 async def sync_all_competitors():
     """Kick off a background sync of all competitors. Returns immediately."""
-    global _sync_all_task
-    
-    if _sync_all_status.get("running"):
-        return {"accepted": True, "message": "Sync already running", **_sync_all_status}
+    global _sync_all_task, _sync_all_status
     
-    _sync_all_task = asyncio.create_task(_run_sync_all())
+    # Claim the run across all workers so concurrent triggers can't double-sync
+    claim = SharedLock("content-intel:sync-all-start", ttl_seconds=30)
+    if not await claim.acquire(blocking=False):
+        return {"accepted": True, "message": "Sync already running", **await get_sync_all_status()}
+    try:
+        status = await get_sync_all_status()
+        if status.get("running"):
+            return {"accepted": True, "message": "Sync already running", **status}
+        
+        # Publish "running" before releasing the claim so other workers see it
+        _sync_all_status = {"running": True, "started_at": datetime.now(timezone.utc).isoformat(), "message": "Syncing..."}
+        await _publish_sync_status()
+        # Run the orchestrator on the worker queue; fall back to an in-process task
+        job_id = await enqueue_task("sync_all_competitors_task", _job_id=f"sync-all:{uuid.uuid4().hex[:12]}")
+        if job_id is None:
+            _sync_all_task = asyncio.create_task(_run_sync_all())
+        else:
+            _sync_all_status["job_id"] = job_id
+            await _publish_sync_status()
+    finally:
+        await claim.release()
     return {"accepted": True, "message": "Sync started in background", "total": 0, "success": 0}
 
 
 @router.get("/sync-all/status")
 async def get_sync_all_status():
     """Check the status of the background sync."""
-    return _sync_all_status
+    return await get_json(SYNC_ALL_STATUS_KEY, _sync_all_status)
+
+
+@router.get("/jobs/{job_id}")
+async def get_workflow_job(job_id: str):
+    """Check the status, progress and result of a sync pipeline job."""
+    info = await get_job_info(job_id)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return info
 
 
 # ── Phase 4: Performance Feedback Loop Backend ──────────────────────────────
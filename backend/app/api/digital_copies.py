@@ -27,21 +27,19 @@ from app.services.tenant import get_org_id, get_user_id
 from app.api.auth import get_current_user
 from app.models.crm.user import User
 from app.services import nano_banana
+from app.services.s3_media import get_s3_client as shared_s3_client, presigned_get_url
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # S3 Configuration
 def get_s3_client():
-    import boto3
-    from botocore.config import Config
-    return boto3.client(
-        's3',
-        endpoint_url=os.environ.get('GARAGE_ENDPOINT', 'http://10.0.0.11:3900'),
-        aws_access_key_id=os.environ.get('GARAGE_ACCESS_KEY', 'GK6d3eb1c7bc06e00d77b8f89c'),
-        aws_secret_access_key=os.environ.get('GARAGE_SECRET_KEY', '370b99ef00dbfee300e3d73b69b217a7f5633935b02b86ee37f5691aacdf602b'),
-        region_name=os.environ.get('GARAGE_REGION', 'ai-local'),
-        config=Config(signature_version='s3v4')
+    """Shared (pooled) Garage client for the digital copies bucket."""
+    return shared_s3_client(
+        os.environ.get('GARAGE_ENDPOINT', 'http://10.0.0.11:3900'),
+        os.environ.get('GARAGE_ACCESS_KEY', 'GK6d3eb1c7bc06e00d77b8f89c'),
+        os.environ.get('GARAGE_SECRET_KEY', '370b99ef00dbfee300e3d73b69b217a7f5633935b02b86ee37f5691aacdf602b'),
+        os.environ.get('GARAGE_REGION', 'ai-local'),
     )
 
 S3_BUCKET = os.environ.get('GARAGE_BUCKET_DIGITAL_COPIES', 'digital-copies')
@@ -49,13 +47,8 @@ S3_PUBLIC_URL = os.environ.get('GARAGE_ENDPOINT', 'http://10.0.0.11:3900')
 
 
 def get_presigned_url(s3_key: str, expires_in: int = 3600) -> str:
-    """Generate a presigned URL for an S3 object."""
-    s3 = get_s3_client()
-    return s3.generate_presigned_url(
-        'get_object',
-        Params={'Bucket': S3_BUCKET, 'Key': s3_key},
-        ExpiresIn=expires_in
-    )
+    """Generate a presigned URL for an S3 object (cached while fresh)."""
+    return presigned_get_url(get_s3_client(), S3_BUCKET, s3_key, expires_in=expires_in)
 
 
 def s3_url_to_presigned(image_url: str) -> str:
@@ -103,8 +103,8 @@ INDEX_SQLS = [
 ]
 
 
-async def init_email_tables():
-    """Create email tables + indexes on startup, then warm Gmail token."""
+async def create_email_tables():
+    """Create email tables + indexes (run by app.db.migration_runner)."""
     async with _engine.begin() as conn:
         await conn.execute(text(ACCOUNTS_TABLE_SQL))
         await conn.execute(text(MESSAGES_TABLE_SQL))
@@ -112,7 +112,9 @@ async def init_email_tables():
             await conn.execute(text(idx_sql))
     logger.info("Email inbox tables initialized")
 
-    # Proactively refresh Gmail token on startup so first request doesn't fail
+
+async def warm_gmail_token():
+    """Proactively refresh Gmail token on startup so first request doesn't fail."""
     try:
         tokens = await _load_gmail_tokens()
         if tokens and tokens.get("refresh_token"):
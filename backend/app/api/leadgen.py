@@ -1,7 +1,5 @@
 """LeadGen API — Business discovery, enrichment, and website auditing."""
 
-import csv
-import io
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
@@ -13,12 +11,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.leadgen_db import get_leadgen_db, leadgen_session
 from app.models.lead import Lead, SearchJob
-from app.services.leadgen.google_places import search_places
-from app.services.leadgen.enrichment import enrich_job
+from app.services.leadgen.google_places import iter_places
+from app.services.leadgen.enrichment import enrich_job, enrich_leads
+from app.services.leadgen.throttle import LEADGEN_ENRICH_CONCURRENCY
 from app.services.leadgen.website_auditor import audit_website
 from app.services.leadgen.deep_website_auditor import run_deep_audit
 from app.services.leadgen.lead_scorer import score_lead
-from app.api.agent_assignment_helpers import load_assignment_summaries
+from app.services.leadgen.lead_export import export_query, stream_leads_csv
+from app.api.agent_contract import load_agent_assignment_map
 from app.api.leadgen_schemas import (
     LeadResponse, LeadUpdate, StatsResponse, SearchRequest,
     SearchJobResponse, WebsiteAuditResult, ContactLogRequest,
@@ -59,204 +59,113 @@ def _build_contact_edit_history_entry(lead: Lead, update_data: dict) -> dict | N
 
 
 # ---------------------------------------------------------------------------
-# Ensure enrichment_error column exists (idempotent ALTER TABLE)
-# ---------------------------------------------------------------------------
-_DEEP_AUDIT_COLS_ADDED = False
-
-
-async def _ensure_deep_audit_columns(db: AsyncSession):
-    """Add deep audit columns to leads table if they don't exist."""
-    global _DEEP_AUDIT_COLS_ADDED
-    if _DEEP_AUDIT_COLS_ADDED:
-        return
-    try:
-        stmts = [
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_results JSONB",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_score INTEGER",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_grade VARCHAR(2)",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_date TIMESTAMPTZ",
-        ]
-        for stmt in stmts:
-            await db.execute(text(stmt))
-        await db.commit()
-        _DEEP_AUDIT_COLS_ADDED = True
-    except Exception:
-        await db.rollback()
-        _DEEP_AUDIT_COLS_ADDED = True
-
-
-_ENRICHMENT_ERROR_COL_ADDED = False
-
-
-async def _ensure_enrichment_error_column(db: AsyncSession):
-    """Add enrichment columns to leads table if they don't exist."""
-    global _ENRICHMENT_ERROR_COL_ADDED
-    if _ENRICHMENT_ERROR_COL_ADDED:
-        return
-    try:
-        columns = [
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS enrichment_error TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_url TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_rating TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_accredited BOOLEAN",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_complaints INTEGER DEFAULT 0",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_summary TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_url TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_rating NUMERIC(2,1)",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_review_count INTEGER DEFAULT 0",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_summary TEXT",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS reddit_mentions JSONB DEFAULT '[]'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS news_mentions JSONB DEFAULT '[]'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS social_scan JSONB DEFAULT '{}'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS video_analysis JSONB DEFAULT '[]'",
-        ]
-        for col_sql in columns:
-            await db.execute(text(col_sql))
-        await db.commit()
-        _ENRICHMENT_ERROR_COL_ADDED = True
-    except Exception:
-        await db.rollback()
-        _ENRICHMENT_ERROR_COL_ADDED = True  # Don't retry on every request
-
-
-# ---------------------------------------------------------------------------
-# Ensure lead_source column exists (idempotent ALTER TABLE)
+# Background tasks
 # ---------------------------------------------------------------------------
-_SOURCE_COL_ADDED = False
 
-
-async def _ensure_source_column(db: AsyncSession):
-    """Add lead_source column to leads table if it doesn't exist."""
-    global _SOURCE_COL_ADDED
-    if _SOURCE_COL_ADDED:
-        return
-    try:
-        await db.execute(text(
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS lead_source TEXT DEFAULT 'google_places'"
+async def _insert_places(db: AsyncSession, job_id: int, org_id: int, places: list) -> list[int]:
+    """Insert leads for places this org doesn't have yet; returns the new lead IDs."""
+    place_ids = [p.place_id for p in places if p.place_id]
+    existing_ids: set = set()
+    if place_ids:
+        existing = await db.execute(
+            select(Lead.google_place_id)
+            .where(Lead.google_place_id.in_(place_ids))
+            .where(Lead.org_id == org_id)
+        )
+        existing_ids = {row[0] for row in existing.all()}
+
+    leads = []
+    for place in places:
+        if place.place_id:
+            if place.place_id in existing_ids:
+                continue
+            existing_ids.add(place.place_id)
+        leads.append(Lead(
+            search_job_id=job_id,
+            google_place_id=place.place_id,
+            business_name=place.name,
+            address=place.address,
+            city=place.city,
+            state=place.state,
+            zip=place.zip_code,
+            phone=place.phone,
+            website=place.website or None,
+            google_maps_url=place.maps_url,
+            google_rating=place.rating or None,
+            google_reviews_count=place.review_count,
+            business_category=place.category,
+            business_types=place.types,
+            latitude=place.latitude or None,
+            longitude=place.longitude or None,
+            opening_hours=place.opening_hours,
+            has_website=bool(place.website),
+            enrichment_status="pending",
+            lead_source=place.source,
+            org_id=org_id,
         ))
-        await db.commit()
-        _SOURCE_COL_ADDED = True
-    except Exception:
-        await db.rollback()
-        _SOURCE_COL_ADDED = True
-
-
-# ---------------------------------------------------------------------------
-# Ensure review intelligence columns exist (idempotent ALTER TABLE)
-# ---------------------------------------------------------------------------
-_REVIEW_COLS_ADDED = False
+    db.add_all(leads)
+    await db.flush()
+    return [lead.id for lead in leads]
 
 
-async def _ensure_review_columns(db: AsyncSession):
-    """Add review intelligence columns to leads table if they don't exist."""
-    global _REVIEW_COLS_ADDED
-    if _REVIEW_COLS_ADDED:
-        return
-    try:
-        stmts = [
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS yelp_rating NUMERIC(2,1)",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS yelp_reviews_count INTEGER DEFAULT 0",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_highlights TEXT[] DEFAULT '{}'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_sentiment_score NUMERIC(3,2)",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_pain_points TEXT[] DEFAULT '{}'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_opportunity_flags TEXT[] DEFAULT '{}'",
-            "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS reviews_scraped_at TIMESTAMPTZ",
-        ]
-        for stmt in stmts:
-            await db.execute(text(stmt))
-        await db.commit()
-        _REVIEW_COLS_ADDED = True
-    except Exception:
-        await db.rollback()
-        _REVIEW_COLS_ADDED = True  # Don't retry on every request
-
+async def _run_search(job_id: int, request: SearchRequest, org_id: int):
+    """Background task: search for businesses, insert leads and enrich them.
 
-# ---------------------------------------------------------------------------
-# Background tasks
-# ---------------------------------------------------------------------------
+    Leads from each discovery source are inserted (and their enrichment
+    started) as soon as that source answers, instead of after all sources
+    finish. The job is marked complete once its leads exist, as before;
+    ``enriched_count`` is filled in when their enrichment finishes.
+    """
+    enrichment_tasks: list[asyncio.Task] = []
+    # One lead-concurrency budget for every batch of this job
+    enrich_semaphore = asyncio.Semaphore(LEADGEN_ENRICH_CONCURRENCY)
 
-async def _run_search(job_id: int, request: SearchRequest, org_id: int):
-    """Background task: search for businesses, insert leads with pending enrichment."""
     async with leadgen_session() as db:
         try:
-            await _ensure_enrichment_error_column(db)
-            await _ensure_source_column(db)
-            await _ensure_review_columns(db)
+            job = (await db.execute(select(SearchJob).where(SearchJob.id == job_id).where(SearchJob.org_id == org_id))).scalar_one()
+            total_found = 0
+            inserted = 0
 
-            places = await search_places(request.query, request.location, request.max_results, request.radius_km)
+            async for source, places in iter_places(request.query, request.location, request.max_results, request.radius_km):
+                new_ids = await _insert_places(db, job_id, org_id, places)
+                total_found += len(places)
+                inserted += len(new_ids)
+                job.total_found = total_found
+                await db.commit()
 
-            inserted = 0
-            for place in places:
-                existing = await db.execute(
-                    select(Lead).where(Lead.google_place_id == place.place_id).where(Lead.org_id == org_id)
-                )
-                if existing.scalar_one_or_none():
-                    continue
-
-                lead = Lead(
-                    search_job_id=job_id,
-                    google_place_id=place.place_id,
-                    business_name=place.name,
-                    address=place.address,
-                    city=place.city,
-                    state=place.state,
-                    zip=place.zip_code,
-                    phone=place.phone,
-                    website=place.website or None,
-                    google_maps_url=place.maps_url,
-                    google_rating=place.rating or None,
-                    google_reviews_count=place.review_count,
-                    business_category=place.category,
-                    business_types=place.types,
-                    latitude=place.latitude or None,
-                    longitude=place.longitude or None,
-                    opening_hours=place.opening_hours,
-                    has_website=bool(place.website),
-                    enrichment_status="pending",
-                    org_id=org_id,
+                if new_ids:
+                    enrichment_tasks.append(asyncio.create_task(enrich_leads(new_ids, enrich_semaphore)))
+                logger.info(
+                    "Search job %d: %d places from %s (%d new), enrichment started",
+                    job_id, len(places), source, len(new_ids),
                 )
-                db.add(lead)
-                inserted += 1
 
-            # Complete the search job — leads available
-            job = (await db.execute(select(SearchJob).where(SearchJob.id == job_id).where(SearchJob.org_id == org_id))).scalar_one()
-            job.total_found = len(places)
             job.status = "complete"
             await db.commit()
-
-            # Try to set lead_source for newly inserted leads
-            try:
-                for place in places:
-                    await db.execute(
-                        text("UPDATE leadgen.leads SET lead_source = :src WHERE google_place_id = :pid AND org_id = :org_id"),
-                        {"src": place.source, "pid": place.place_id, "org_id": org_id},
-                    )
-                await db.commit()
-            except Exception:
-                await db.rollback()
-
-            logger.info(
-                "Search complete for job %d (%d found, %d new), starting enrichment",
-                job_id, len(places), inserted,
-            )
+            logger.info("Search complete for job %d (%d found, %d new)", job_id, total_found, inserted)
 
             # Notification: search complete
             await send_notification(
                 type="lead",
                 title="Lead Search Complete",
-                message=f"{len(places)} businesses found for '{request.query}' in {request.location}",
+                message=f"{total_found} businesses found for '{request.query}' in {request.location}",
                 data={"job_id": job_id, "link": "/leadgen"},
             )
 
-            # Run enrichment inline
-            await _run_enrichment_safe(job_id, db)
-            logger.info("Enrichment complete for job %d", job_id)
+            enriched = sum(await asyncio.gather(*enrichment_tasks))
+            job.enriched_count = enriched
+            await db.commit()
+            logger.info("Enrichment complete for job %d: %d leads", job_id, enriched)
 
         except Exception as exc:
             logger.error("Search job %d failed: %s", job_id, exc, exc_info=True)
+            # Let enrichment already under way finish so its leads aren't left mid-crawl
+            await asyncio.gather(*enrichment_tasks, return_exceptions=True)
             try:
+                await db.rollback()
                 job = (await db.execute(select(SearchJob).where(SearchJob.id == job_id).where(SearchJob.org_id == org_id))).scalar_one_or_none()
-                if job:
+                # A failure while enriching doesn't undo a completed search
+                if job and job.status != "complete":
                     job.status = "failed"
                     job.error_message = str(exc)[:500]
                     await db.commit()
@@ -321,7 +230,6 @@ async def list_leads(
     """List leads with filtering and sorting."""
     try:
         org_id = get_org_id(request)
-        await _ensure_review_columns(db)
         query = select(Lead).where(Lead.org_id == org_id)
 
         if search_job_id:
@@ -347,7 +255,7 @@ async def list_leads(
 
         result = await db.execute(query)
         leads = result.scalars().all()
-        assignment_map = await load_assignment_summaries(
+        assignment_map = await load_agent_assignment_map(
             db,
             entity_type="leadgen_lead",
             entity_ids=[lead.id for lead in leads],
@@ -426,53 +334,14 @@ async def export_leads(
     request: Request,
     search_job_id: int | None = None,
     tier: str | None = None,
-    db: AsyncSession = Depends(get_leadgen_db),
 ):
-    """Export leads to CSV."""
-    try:
-        org_id = get_org_id(request)
-        query = select(Lead).where(Lead.org_id == org_id)
-        if search_job_id:
-            query = query.where(Lead.search_job_id == search_job_id)
-        if tier:
-            query = query.where(Lead.lead_tier == tier)
-        query = query.order_by(Lead.lead_score.desc())
-
-        result = await db.execute(query)
-        leads = result.scalars().all()
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow([
-            "Business Name", "Address", "City", "State", "Zip", "Phone",
-            "Website", "Emails", "Google Rating", "Reviews",
-            "Category", "Platform", "Lead Score", "Tier",
-            "Facebook", "Instagram", "LinkedIn", "Twitter",
-            "Audit Score", "Audit Grade", "Notes",
-        ])
-        for lead in leads:
-            writer.writerow([
-                lead.business_name, lead.address, lead.city, lead.state,
-                lead.zip, lead.phone, lead.website,
-                "; ".join(lead.emails or []),
-                lead.google_rating, lead.google_reviews_count,
-                lead.business_category, lead.website_platform,
-                lead.lead_score, lead.lead_tier,
-                lead.facebook_url, lead.instagram_url,
-                lead.linkedin_url, lead.twitter_url,
-                lead.website_audit_score, lead.website_audit_grade,
-                lead.notes,
-            ])
-
-        output.seek(0)
-        return StreamingResponse(
-            io.BytesIO(output.getvalue().encode()),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=leads_export.csv"},
-        )
-    except Exception as exc:
-        logger.error("Failed to export leads: %s", exc, exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(exc)[:200]}")
+    """Export leads to CSV, streamed as rows are read."""
+    query = export_query(get_org_id(request), search_job_id, tier)
+    return StreamingResponse(
+        stream_leads_csv(query),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=leads_export.csv"},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -570,9 +439,6 @@ async def create_search(request_data: SearchRequest, request: Request, backgroun
     """Start a new business search."""
     try:
         org_id = get_org_id(request)
-        await _ensure_enrichment_error_column(db)
-        await _ensure_source_column(db)
-        await _ensure_review_columns(db)
 
         job = SearchJob(
             query=request_data.query,
@@ -722,7 +588,7 @@ async def get_lead(lead_id: int, request: Request, db: AsyncSession = Depends(ge
         lead = result.scalar_one_or_none()
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
-        assignment_map = await load_assignment_summaries(
+        assignment_map = await load_agent_assignment_map(
             db,
             entity_type="leadgen_lead",
             entity_ids=[lead.id],
@@ -761,7 +627,7 @@ async def update_lead(lead_id: int, body: LeadUpdate, request: Request, db: Asyn
         await db.commit()
         await db.refresh(lead)
 
-        assignment_map = await load_assignment_summaries(
+        assignment_map = await load_agent_assignment_map(
             db, entity_type="leadgen_lead", entity_ids=[lead.id],
         )
         return LeadResponse.model_validate(lead).model_copy(
@@ -850,8 +716,6 @@ async def trigger_deep_audit(
 ):
     """Trigger a comprehensive AI-powered website audit (15-30 seconds)."""
     try:
-        await _ensure_deep_audit_columns(db)
-
         result = await db.execute(select(Lead).where(Lead.id == lead_id))
         lead = result.scalar_one_or_none()
         if not lead:
@@ -897,8 +761,6 @@ async def trigger_deep_audit(
 async def get_deep_audit_results(lead_id: int, db: AsyncSession = Depends(get_leadgen_db)):
     """Get deep audit results for a lead."""
     try:
-        await _ensure_deep_audit_columns(db)
-
         result = await db.execute(select(Lead).where(Lead.id == lead_id))
         lead = result.scalar_one_or_none()
         if not lead:
@@ -1036,7 +898,6 @@ async def re_enrich_lead(lead_id: int, background_tasks: BackgroundTasks, db: As
 async def re_enrich_all_leads(background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_leadgen_db)):
     """Force re-enrich ALL leads — resets all to pending and re-runs enrichment."""
     try:
-        await _ensure_enrichment_error_column(db)
         result = await db.execute(select(Lead))
         leads = result.scalars().all()
         job_ids = set()
@@ -1098,7 +959,7 @@ async def list_contacts(
         query = query.order_by(Lead.contacted_at.desc()).offset(offset).limit(limit)
         result = await db.execute(query)
         leads = result.scalars().all()
-        assignment_map = await load_assignment_summaries(
+        assignment_map = await load_agent_assignment_map(
             db,
             entity_type="leadgen_lead",
             entity_ids=[lead.id for lead in leads],
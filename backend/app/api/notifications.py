@@ -2,6 +2,9 @@
 
 Table: public.notifications
 SSE: GET /api/notifications/stream (token via query param)
+
+New rows are pushed to SSE clients through app.services.notification_bus
+(Postgres LISTEN/NOTIFY); the stream only queries the DB to catch up.
 """
 import asyncio
 import json
@@ -18,6 +21,7 @@ from sse_starlette.sse import EventSourceResponse
 
 from app.config import settings
 from app.db.leadgen_db import leadgen_engine, leadgen_session
+from app.services import notification_bus
 from app.services.tenant import get_org_id
 
 logger = logging.getLogger(__name__)
@@ -87,6 +91,14 @@ class NotificationOut(BaseModel):
     expires_at: Optional[datetime]
 
 
+def _row_to_out(r) -> NotificationOut:
+    return NotificationOut(
+        id=r.id, user_id=r.user_id, type=r.type, title=r.title,
+        message=r.message, data=r.data, read=r.read,
+        created_at=r.created_at, expires_at=r.expires_at,
+    )
+
+
 # ── Endpoints ────────────────────────────────────────────────────────
 
 @router.get("/notifications")
@@ -130,14 +142,7 @@ async def list_notifications(
     rows = result.fetchall()
 
     return {
-        "notifications": [
-            NotificationOut(
-                id=r.id, user_id=r.user_id, type=r.type, title=r.title,
-                message=r.message, data=r.data, read=r.read,
-                created_at=r.created_at, expires_at=r.expires_at,
-            ).model_dump()
-            for r in rows
-        ],
+        "notifications": [_row_to_out(r).model_dump() for r in rows],
         "total": total,
         "page": page,
         "limit": limit,
@@ -173,14 +178,12 @@ async def create_notification(
             "expires_at": body.expires_at,
         },
     )
-    await db.commit()
     r = result.fetchone()
+    out = _row_to_out(r).model_dump()
+    await notification_bus.publish(db, out)
+    await db.commit()
 
-    return NotificationOut(
-        id=r.id, user_id=r.user_id, type=r.type, title=r.title,
-        message=r.message, data=r.data, read=r.read,
-        created_at=r.created_at, expires_at=r.expires_at,
-    ).model_dump()
+    return out
 
 
 @router.patch("/notifications/{notification_id}/read")
@@ -251,12 +254,72 @@ def _validate_sse_token(token: str) -> dict | None:
         return None
 
 
+# Fallback poll interval when this process has no LISTEN connection
+SSE_POLL_SECONDS = 3
+# Idle keep-alive so proxies don't close quiet streams
+SSE_PING_SECONDS = 15
+# Page size for catch-up queries
+SSE_CATCHUP_LIMIT = 20
+
+
+async def _fetch_unread_since(user_id: int, last_id: int) -> list:
+    """Unread notifications for a user with id > last_id, oldest first."""
+    async with notify_session() as db:
+        result = await db.execute(
+            text("""
+                SELECT id, user_id, type, title, message, data, read, created_at, expires_at
+                FROM public.notifications
+                WHERE user_id = :user_id AND id > :last_id AND read = FALSE
+                ORDER BY id ASC
+                LIMIT :limit
+            """),
+            {"user_id": user_id, "last_id": last_id, "limit": SSE_CATCHUP_LIMIT},
+        )
+        return result.fetchall()
+
+
+async def _fetch_notification(notification_id: int, user_id: int) -> Optional[dict]:
+    """Load one notification (used when a NOTIFY payload was trimmed)."""
+    async with notify_session() as db:
+        result = await db.execute(
+            text("""
+                SELECT id, user_id, type, title, message, data, read, created_at, expires_at
+                FROM public.notifications
+                WHERE id = :id AND user_id = :user_id
+            """),
+            {"id": notification_id, "user_id": user_id},
+        )
+        r = result.fetchone()
+    return _row_to_out(r).model_dump() if r else None
+
+
+def _sse_event(notification: dict) -> dict:
+    return {
+        "event": "notification",
+        "id": str(notification["id"]),
+        "data": json.dumps(notification, default=str),
+    }
+
+
+def _parse_last_event_id(request: Request) -> int:
+    try:
+        return max(int(request.headers.get("last-event-id", "0")), 0)
+    except ValueError:
+        return 0
+
+
 @router.get("/notifications/stream")
 async def notification_stream(
     request: Request,
     token: str = Query(None, description="JWT token (EventSource can't set headers)"),
 ):
-    """SSE endpoint — polls for new notifications every 3 seconds.
+    """SSE endpoint — pushes new notifications as they are created.
+
+    On connect, unread notifications after ``Last-Event-ID`` (or all unread
+    ones on a fresh connection) are replayed from the DB; after that events
+    arrive from the per-process LISTEN/NOTIFY fan-out. If this process has
+    no listener connection, the stream falls back to polling every
+    ``SSE_POLL_SECONDS``.
 
     Auth via ?token=xxx since EventSource API can't set Authorization headers.
     Also falls back to header-based auth if available (path is public in middleware).
@@ -275,46 +338,66 @@ async def notification_stream(
     if not user_id:
         raise HTTPException(401, "Valid token required for SSE stream")
 
+    start_id = _parse_last_event_id(request)
+
     async def event_generator():
-        """Yield new unread notifications as SSE events."""
-        last_id = 0
-        while True:
-            if await request.is_disconnected():
-                break
-
-            try:
-                async with notify_session() as db:
-                    result = await db.execute(
-                        text("""
-                            SELECT id, user_id, type, title, message, data, read, created_at, expires_at
-                            FROM public.notifications
-                            WHERE user_id = :user_id AND id > :last_id AND read = FALSE
-                            ORDER BY id ASC
-                            LIMIT 20
-                        """),
-                        {"user_id": user_id, "last_id": last_id},
-                    )
-                    rows = result.fetchall()
-
-                if rows:
-                    last_id = rows[-1].id
-                    for r in rows:
-                        n = NotificationOut(
-                            id=r.id, user_id=r.user_id, type=r.type, title=r.title,
-                            message=r.message, data=r.data, read=r.read,
-                            created_at=r.created_at, expires_at=r.expires_at,
-                        )
-                        yield {"event": "notification", "data": json.dumps(n.model_dump(), default=str)}
-                else:
-                    yield {"event": "ping", "data": ""}
-
-            except asyncio.CancelledError:
-                logger.debug("SSE stream cancelled for user %s", user_id)
-                return
-            except Exception as e:
-                logger.error("SSE poll error: %s", e)
-                yield {"event": "error", "data": str(e)}
-
-            await asyncio.sleep(3)
+        """Replay missed notifications, then yield pushed ones as SSE events."""
+        last_id = start_id
+        # Subscribe before catching up so nothing committed in between is lost;
+        # duplicates are skipped by id.
+        queue = notification_bus.subscribe(user_id)
+        try:
+            needs_catchup = True
+            while True:
+                if await request.is_disconnected():
+                    break
+
+                try:
+                    # Events were dropped while this client lagged: re-read from the DB
+                    if notification_bus.take_overflow(queue):
+                        needs_catchup = True
+                    if needs_catchup or not notification_bus.is_listening():
+                        rows = await _fetch_unread_since(user_id, last_id)
+                        for r in rows:
+                            last_id = r.id
+                            yield _sse_event(_row_to_out(r).model_dump())
+                        # Keep paging until caught up, then switch to push
+                        needs_catchup = len(rows) == SSE_CATCHUP_LIMIT
+                        if needs_catchup:
+                            continue
+                        if not notification_bus.is_listening():
+                            if not rows:
+                                yield {"event": "ping", "data": ""}
+                            await asyncio.sleep(SSE_POLL_SECONDS)
+                            # Anything pushed meanwhile was covered by the poll
+                            while not queue.empty():
+                                queue.get_nowait()
+                            continue
+
+                    try:
+                        event = await asyncio.wait_for(queue.get(), timeout=SSE_PING_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield {"event": "ping", "data": ""}
+                        continue
+
+                    if event["id"] <= last_id:
+                        continue
+                    if "title" not in event:
+                        event = await _fetch_notification(event["id"], user_id)
+                        if event is None:
+                            continue
+                    last_id = event["id"]
+                    yield _sse_event(event)
+
+                except asyncio.CancelledError:
+                    logger.debug("SSE stream cancelled for user %s", user_id)
+                    return
+                except Exception as e:
+                    logger.error("SSE stream error: %s", e)
+                    yield {"event": "error", "data": str(e)}
+                    needs_catchup = True
+                    await asyncio.sleep(SSE_POLL_SECONDS)
+        finally:
+            notification_bus.unsubscribe(user_id, queue)
 
     return EventSourceResponse(event_generator())
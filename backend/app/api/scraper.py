@@ -28,6 +28,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.crm_db import get_tenant_db, crm_session
 from app.services.tenant import get_org_id, get_user_id
 from app.models.crm.competitor import Competitor
+from app.services.competitor_posts import PostRow, upsert_competitor_posts
+from app.services.competitor_analytics import mark_snapshot_stale
 # Removed direct scraper imports - now using HTTP calls to scraper service
 
 logger = logging.getLogger(__name__)
@@ -107,6 +109,8 @@ async def scrape_multiple(handles: List[str], delay_range: tuple = (3, 7)) -> Li
         return [ScrapedProfile(handle=handle, error=f"Service unavailable: {str(e)}") for handle in handles]
 
 _instagram_sync_task: Optional[asyncio.Task] = None
+# Session.info key: orgs whose cached posts changed in the open transaction
+_PERSONAS_STALE_KEY = "personas_stale_orgs"
 _instagram_sync_result: Optional[Dict[str, Any]] = None
 
 
@@ -379,126 +383,42 @@ async def _save_profile_to_competitor(
 async def _save_posts_to_cache(
     db: AsyncSession, competitor_id: int, platform: str, posts: List[ScrapedPost], org_id: int
 ) -> int:
-    """Save scraped posts to competitor_posts cache table using UPSERT.
+    """Save scraped posts to competitor_posts cache table using one bulk UPSERT.
     
     Preserves transcript and comments_data on existing posts.
     Only inserts new posts or updates engagement metrics on existing ones.
+    Returns the number of genuinely new posts.
     """
     if not posts:
         return 0
 
-    try:
-        saved = 0
-        for post in posts:
-            score = calculate_competitor_engagement_score(
+    rows = [
+        PostRow(
+            post_text=post.caption,
+            likes=post.likes,
+            comments=post.comments,
+            shares=post.views,
+            engagement_score=calculate_competitor_engagement_score(
                 post.likes, post.comments, post.views, platform=platform,
-            )
-            # UPSERT: insert if new shortcode, update metrics if exists
-            # Never touch transcript or comments_data — those are enriched separately
-            if post.shortcode:
-                upsert_key = "shortcode"
-                upsert_val = post.shortcode
-            else:
-                upsert_key = "post_url"
-                upsert_val = post.post_url
-
-            # Check if post exists
-            existing = await db.execute(
-                text(f"SELECT id FROM crm.competitor_posts WHERE competitor_id = :cid AND {upsert_key} = :key AND org_id = :org_id LIMIT 1"),
-                {"cid": competitor_id, "key": upsert_val, "org_id": org_id},
-            )
-            row = existing.fetchone()
-
-            if row:
-                # Get existing post details to check for expired URLs
-                existing_post = await db.execute(
-                    text("SELECT media_url, thumbnail_url, posted_at FROM crm.competitor_posts WHERE id = :id"),
-                    {"id": row[0]}
-                )
-                existing_data = existing_post.fetchone()
-                
-                # Determine if we should force refresh URLs
-                force_refresh_urls = False
-                if existing_data:
-                    existing_media_url = existing_data[0] or ""
-                    existing_posted_at = existing_data[2]
-                    
-                    # Check if this is an Instagram CDN URL that's older than 24 hours
-                    if ("scontent" in existing_media_url and 
-                        existing_posted_at and 
-                        (datetime.now() - existing_posted_at.replace(tzinfo=None)).days >= 1):
-                        force_refresh_urls = True
-                
-                # Choose URL update strategy
-                if force_refresh_urls and post.media_url:
-                    # Force refresh: use new URLs even if they're different
-                    media_url_update = post.media_url
-                    thumbnail_url_update = post.thumbnail_url
-                else:
-                    # Normal update: only update if new URL is not empty
-                    media_url_update = post.media_url if post.media_url else existing_data[0] if existing_data else ""
-                    thumbnail_url_update = post.thumbnail_url if post.thumbnail_url else existing_data[1] if existing_data else ""
-                
-                # Update engagement metrics and URLs
-                await db.execute(
-                    text("""
-                        UPDATE crm.competitor_posts SET
-                            likes = :likes, comments = :comments, shares = :shares,
-                            engagement_score = :score, post_text = :text, hook = :hook,
-                            media_type = :media_type, media_url = :media_url,
-                            thumbnail_url = :thumbnail_url,
-                            shortcode = COALESCE(NULLIF(:shortcode, ''), shortcode),
-                            fetched_at = NOW()
-                        WHERE id = :id AND org_id = :org_id
-                    """),
-                    {
-                        "id": row[0],
-                        "likes": post.likes,
-                        "comments": post.comments,
-                        "shares": post.views,
-                        "score": score,
-                        "text": post.caption,
-                        "hook": post.hook,
-                        "media_type": post.media_type,
-                        "media_url": media_url_update,
-                        "thumbnail_url": thumbnail_url_update,
-                        "shortcode": post.shortcode,
-                        "org_id": org_id,
-                    },
-                )
-            else:
-                # New post — insert
-                await db.execute(
-                    text("""
-                        INSERT INTO crm.competitor_posts 
-                        (competitor_id, platform, post_text, likes, comments, shares,
-                         engagement_score, hook, post_url, posted_at, fetched_at,
-                         media_type, media_url, thumbnail_url, shortcode, org_id)
-                        VALUES (:cid, :platform, :text, :likes, :comments, :shares,
-                                :score, :hook, :url, :posted_at, NOW(),
-                                :media_type, :media_url, :thumbnail_url, :shortcode, :org_id)
-                    """),
-                    {
-                        "cid": competitor_id,
-                        "platform": platform,
-                        "text": post.caption,
-                        "likes": post.likes,
-                        "comments": post.comments,
-                        "shares": post.views,
-                        "media_type": post.media_type,
-                        "media_url": post.media_url,
-                        "thumbnail_url": post.thumbnail_url,
-                        "shortcode": post.shortcode,
-                        "score": score,
-                        "hook": post.hook,
-                        "url": post.post_url,
-                        "posted_at": post.posted_at,
-                        "org_id": org_id,
-                    },
-                )
-                saved += 1
-
-        return saved
+            ),
+            hook=post.hook,
+            post_url=post.post_url,
+            posted_at=post.posted_at,
+            media_type=post.media_type,
+            media_url=post.media_url,
+            thumbnail_url=post.thumbnail_url,
+            shortcode=post.shortcode,
+        )
+        for post in posts
+    ]
+    try:
+        # Savepoint: a failed upsert must not poison the rest of the batch
+        async with db.begin_nested():
+            result = await upsert_competitor_posts(db, competitor_id, org_id, platform, rows)
+            await mark_snapshot_stale(db, org_id)
+        if result.new_ids or result.updated_ids:
+            db.info.setdefault(_PERSONAS_STALE_KEY, set()).add(org_id)
+        return len(result.new_ids)
     except SQLAlchemyError as exc:
         logger.warning(
             "Failed to cache posts for competitor %s on %s: %s",
@@ -507,6 +427,21 @@ async def _save_posts_to_cache(
         return 0
 
 
+async def invalidate_synced_personas(db: AsyncSession) -> None:
+    """Invalidate MiroFish personas for orgs whose posts a sync changed.
+
+    Call right after committing a sync: personas are clustered from the
+    cached posts, and invalidating before the commit lets a concurrent
+    rebuild cache the old posts under the new version.
+    """
+    org_ids = db.info.pop(_PERSONAS_STALE_KEY, None)
+    if not org_ids:
+        return
+    from app.services.mirofish_engine import invalidate_personas
+    for org_id in org_ids:
+        await invalidate_personas(org_id)
+
+
 async def _competitor_posts_cache_available(db: AsyncSession) -> bool:
     """Return whether the competitor post cache table is available."""
     try:
@@ -640,6 +575,7 @@ async def _run_instagram_sync_in_background() -> None:
             await db.execute(text("SET search_path TO crm, public"))
             result = await _execute_instagram_sync(db, org_id=1)
             await db.commit()
+            await invalidate_synced_personas(db)
             _instagram_sync_result = {
                 "status": "complete",
                 "success": result.success,
@@ -726,6 +662,7 @@ async def sync_all_instagram_competitors(
 
         result = await _execute_instagram_sync(db, org_id)
         await db.commit()
+        await invalidate_synced_personas(db)
         return result
     except HTTPException:
         raise
@@ -418,21 +418,28 @@ DEFAULT_SETTINGS = [
 ]
 
 
-async def init_settings_table(engine):
-    """Create settings table and seed defaults, then load secrets into env."""
+async def create_settings_table(engine):
+    """Create the settings table (run by app.db.migration_runner)."""
     async with engine.begin() as conn:
         await conn.run_sync(SettingsBase.metadata.create_all)
 
+
+async def init_settings_table(engine):
+    """Seed default settings, then load secrets into env.
+
+    The table itself is created by the migration runner.
+    """
     # Seed defaults — upsert so new settings are always added
     from app.db.leadgen_db import leadgen_session
     async with leadgen_session() as db:
         # Use org_id=1 for init seeding (default org)
         _init_org_id = 1
         migrated = await _migrate_legacy_ai_setting(db, org_id=_init_org_id)
+        existing = await db.execute(select(Setting.key).where(Setting.org_id == _init_org_id))
+        existing_keys = set(existing.scalars().all())
         seeded = 0
         for s in DEFAULT_SETTINGS:
-            existing = await db.execute(select(Setting).where(Setting.key == s["key"], Setting.org_id == _init_org_id))
-            if not existing.scalar_one_or_none():
+            if s["key"] not in existing_keys:
                 db.add(Setting(org_id=_init_org_id, **s))
                 seeded += 1
         if seeded or migrated:
@@ -3,62 +3,220 @@ Social media data sync — pulls real metrics from platform APIs into SocialAnal
 POST /api/social/sync       — sync all connected accounts
 POST /api/social/sync/{platform} — sync specific platform
 
+Accounts sync concurrently, each in its own DB session, bounded per
+platform by SOCIAL_SYNC_CONCURRENCY. Every platform shares one pooled
+HTTP client. Rate-limit responses (429, Meta throttling codes, exhausted
+X quota headers) put that platform into a short cooldown that all of its
+in-flight syncs respect. Each account's daily metrics are written with a
+single INSERT ... ON CONFLICT (account_id, metric_date) DO UPDATE.
+
 Auto-refreshes expired OAuth tokens on 401 and retries once.
 """
+import asyncio
+import json
 import logging
+import os
+import time
 from datetime import datetime, date, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select, text
+from fastapi import APIRouter, HTTPException, Request
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.crm_db import get_tenant_db
-from app.services.tenant import get_org_id, get_user_id
+from app.db.crm_db import crm_session
+from app.services.tenant import get_org_id
+from app.utils.concurrency import parse_concurrency
 
 logger = logging.getLogger("social_sync")
 router = APIRouter()
 
+# Max accounts syncing at once per platform ("platform=n,..." overrides)
+_DEFAULT_CONCURRENCY = {"instagram": 4, "facebook": 4, "youtube": 4, "x": 2}
+# Per-post insight calls in flight for one Instagram account
+INSTAGRAM_INSIGHTS_CONCURRENCY = int(os.getenv("INSTAGRAM_INSIGHTS_CONCURRENCY", "5"))
+# Longest rate-limit wait honoured inline before giving up on a request
+SOCIAL_SYNC_MAX_RATE_WAIT = float(os.getenv("SOCIAL_SYNC_MAX_RATE_WAIT", "120"))
+# Meta usage headers report percent of quota; back off above this
+_META_USAGE_BACKOFF_PCT = 95
+# Meta Graph error codes that mean "throttled"
+_META_THROTTLE_CODES = {4, 17, 32, 613}
+
+
+PLATFORM_CONCURRENCY = parse_concurrency(os.getenv("SOCIAL_SYNC_CONCURRENCY", ""), _DEFAULT_CONCURRENCY)
+
+_clients: dict[str, httpx.AsyncClient] = {}
+_semaphores: dict[str, asyncio.Semaphore] = {}
+_cooldown_until: dict[str, float] = {}
+
+
 # ── Helpers ──────────────────────────────────────────────────────────
 
-async def _get_accounts(db: AsyncSession, org_id: int, platform: Optional[str] = None):
-    """Get connected accounts, optionally filtered by platform."""
-    q = "SELECT id, platform, username, access_token, refresh_token FROM crm.social_accounts WHERE status = 'connected' AND org_id = :org_id"
-    params = {"org_id": org_id}
+async def _get_accounts(db: AsyncSession, org_id: Optional[int], platform: Optional[str] = None):
+    """Get connected accounts, optionally filtered by platform.
+
+    org_id=None returns connected accounts of every org (scheduled sync).
+    """
+    q = "SELECT id, platform, username, access_token, refresh_token, org_id FROM crm.social_accounts WHERE status = 'connected'"
+    params = {}
+    if org_id is not None:
+        q += " AND org_id = :org_id"
+        params["org_id"] = org_id
     if platform:
         q += " AND platform = :p"
         params["p"] = platform
     r = await db.execute(text(q), params)
-    return [{"id": row[0], "platform": row[1], "username": row[2], "token": row[3], "refresh": row[4]} for row in r.fetchall()]
+    return [
+        {"id": row[0], "platform": row[1], "username": row[2], "token": row[3], "refresh": row[4], "org_id": row[5]}
+        for row in r.fetchall()
+    ]
+
+
+# ── HTTP / rate limits ───────────────────────────────────────────────
+
+def _client(platform: str) -> httpx.AsyncClient:
+    """Shared keep-alive client for one platform's API."""
+    client = _clients.get(platform)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=20,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _clients[platform] = client
+    return client
+
+
+def _semaphore(platform: str) -> asyncio.Semaphore:
+    sem = _semaphores.get(platform)
+    if sem is None:
+        sem = asyncio.Semaphore(PLATFORM_CONCURRENCY.get(platform, 2))
+        _semaphores[platform] = sem
+    return sem
+
+
+async def close_social_sync_clients() -> None:
+    """Close pooled platform clients on shutdown."""
+    for client in list(_clients.values()):
+        await client.aclose()
+    _clients.clear()
+
+
+def _retry_after_seconds(resp: httpx.Response) -> Optional[float]:
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        try:
+            return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+def _x_reset_seconds(resp: httpx.Response) -> Optional[float]:
+    reset = resp.headers.get("x-rate-limit-reset")
+    if not reset or not reset.isdigit():
+        return None
+    return max(int(reset) - time.time(), 0.0)
+
+
+def _meta_usage_pct(resp: httpx.Response) -> float:
+    """Highest quota usage reported in Meta's X-App-Usage style headers."""
+    peak = 0.0
+    for header in ("x-app-usage", "x-business-use-case-usage", "x-ad-account-usage"):
+        raw = resp.headers.get(header)
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        entries = [data] if isinstance(data, dict) and "call_count" in data else []
+        if isinstance(data, dict) and not entries:
+            for v in data.values():
+                entries.extend(v if isinstance(v, list) else [v])
+        for entry in entries:
+            if isinstance(entry, dict):
+                for key in ("call_count", "total_cputime", "total_time"):
+                    try:
+                        peak = max(peak, float(entry.get(key) or 0))
+                    except (TypeError, ValueError):
+                        pass
+    return peak
+
+
+def _rate_limit_delay(platform: str, resp: httpx.Response) -> tuple[Optional[float], Optional[float]]:
+    """(retry_after, cooldown) for a response.
+
+    retry_after is set when the request itself was throttled and should be
+    retried; cooldown is set when later requests should hold off even
+    though this one succeeded (quota nearly used up).
+    """
+    if resp.status_code == 429:
+        wait = _retry_after_seconds(resp) or _x_reset_seconds(resp) or 30.0
+        return wait, wait
 
+    if platform in ("instagram", "facebook"):
+        if resp.status_code in (400, 403):
+            try:
+                code = resp.json().get("error", {}).get("code")
+            except ValueError:
+                code = None
+            if code in _META_THROTTLE_CODES:
+                return 60.0, 60.0
+        if _meta_usage_pct(resp) >= _META_USAGE_BACKOFF_PCT:
+            return None, 60.0
+
+    if platform == "x" and resp.headers.get("x-rate-limit-remaining") == "0":
+        return None, _x_reset_seconds(resp)
+
+    return None, None
+
+
+async def _request(platform: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a platform API request, honouring and recording rate limits."""
+    client = _client(platform)
+    retried = False
+    while True:
+        wait = _cooldown_until.get(platform, 0.0) - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(min(wait, SOCIAL_SYNC_MAX_RATE_WAIT))
+
+        resp = await client.request(method, url, **kwargs)
+        retry_after, cooldown = _rate_limit_delay(platform, resp)
+        if cooldown:
+            until = time.monotonic() + min(cooldown, SOCIAL_SYNC_MAX_RATE_WAIT)
+            _cooldown_until[platform] = max(_cooldown_until.get(platform, 0.0), until)
+            logger.info("%s rate limit: cooling down %.0fs", platform, min(cooldown, SOCIAL_SYNC_MAX_RATE_WAIT))
+        if retry_after is None or retried or retry_after > SOCIAL_SYNC_MAX_RATE_WAIT:
+            return resp
+        retried = True
+
+
+# ── DB helpers ───────────────────────────────────────────────────────
 
 async def _upsert_daily_analytics(
     db: AsyncSession, account_id: int, metric_date: date, org_id: int, **metrics
 ):
-    """Insert or update daily analytics row (one per account per day)."""
-    # Check if row exists
-    r = await db.execute(text(
-        "SELECT id FROM crm.social_analytics WHERE account_id = :aid AND metric_date = :d AND org_id = :org_id"
-    ), {"aid": account_id, "d": metric_date, "org_id": org_id})
-    existing = r.fetchone()
-
-    # Build SET clause from non-None metrics
+    """Insert or update the daily analytics row (one per account per day).
+
+    One statement: new rows get every given metric; an existing row only
+    has the given (non-None) metrics overwritten.
+    """
     fields = {k: v for k, v in metrics.items() if v is not None}
     if not fields:
         return
 
-    if existing:
-        sets = ", ".join(f"{k} = :{k}" for k in fields)
-        await db.execute(text(
-            f"UPDATE crm.social_analytics SET {sets} WHERE id = :id AND org_id = :org_id"
-        ), {**fields, "id": existing[0], "org_id": org_id})
-    else:
-        cols = ", ".join(["account_id", "metric_date", "org_id"] + list(fields.keys()))
-        vals = ", ".join([":aid", ":d", ":org_id"] + [f":{k}" for k in fields])
-        await db.execute(text(
-            f"INSERT INTO crm.social_analytics ({cols}) VALUES ({vals})"
-        ), {"aid": account_id, "d": metric_date, "org_id": org_id, **fields})
+    cols = ", ".join(["account_id", "metric_date", "org_id"] + list(fields.keys()))
+    vals = ", ".join([":aid", ":d", ":org_id"] + [f":{k}" for k in fields])
+    sets = ", ".join(f"{k} = EXCLUDED.{k}" for k in fields)
+    await db.execute(text(
+        f"INSERT INTO crm.social_analytics ({cols}) VALUES ({vals}) "
+        f"ON CONFLICT (account_id, metric_date) DO UPDATE SET {sets}"
+    ), {"aid": account_id, "d": metric_date, "org_id": org_id, **fields})
 
 
 async def _update_account_stats(db: AsyncSession, account_id: int, org_id: int, **stats):
@@ -95,43 +253,40 @@ async def _try_refresh_token(db: AsyncSession, acc: dict, org_id: int) -> Option
             client_secret = await _get_setting("google_oauth_client_secret")
             if not client_id or not client_secret:
                 return None
-            async with httpx.AsyncClient() as client:
-                resp = await client.post("https://oauth2.googleapis.com/token", data={
-                    "client_id": client_id, "client_secret": client_secret,
-                    "grant_type": "refresh_token", "refresh_token": refresh_token,
-                })
-                resp.raise_for_status()
-                new_token = resp.json()["access_token"]
+            resp = await _request(platform, "POST", "https://oauth2.googleapis.com/token", data={
+                "client_id": client_id, "client_secret": client_secret,
+                "grant_type": "refresh_token", "refresh_token": refresh_token,
+            })
+            resp.raise_for_status()
+            new_token = resp.json()["access_token"]
 
         elif platform == "x":
             client_id = await _get_setting("x_client_id")
             client_secret = await _get_setting("x_client_secret")
             if not client_id or not client_secret:
                 return None
-            async with httpx.AsyncClient() as client:
-                resp = await client.post("https://api.x.com/2/oauth2/token", data={
-                    "grant_type": "refresh_token", "refresh_token": refresh_token, "client_id": client_id,
-                }, auth=(client_id, client_secret))
-                resp.raise_for_status()
-                data = resp.json()
-                new_token = data["access_token"]
-                # X rotates refresh tokens
-                if data.get("refresh_token"):
-                    await db.execute(text("UPDATE crm.social_accounts SET refresh_token = :rt WHERE id = :id AND org_id = :org_id"),
-                                     {"rt": data["refresh_token"], "id": account_id, "org_id": org_id})
+            resp = await _request(platform, "POST", "https://api.x.com/2/oauth2/token", data={
+                "grant_type": "refresh_token", "refresh_token": refresh_token, "client_id": client_id,
+            }, auth=(client_id, client_secret))
+            resp.raise_for_status()
+            data = resp.json()
+            new_token = data["access_token"]
+            # X rotates refresh tokens
+            if data.get("refresh_token"):
+                await db.execute(text("UPDATE crm.social_accounts SET refresh_token = :rt WHERE id = :id AND org_id = :org_id"),
+                                 {"rt": data["refresh_token"], "id": account_id, "org_id": org_id})
 
         elif platform in ("facebook", "instagram"):
             app_id = await _get_setting("meta_app_id")
             app_secret = await _get_setting("meta_app_secret")
             if not app_id or not app_secret:
                 return None
-            async with httpx.AsyncClient() as client:
-                resp = await client.get("https://graph.facebook.com/v21.0/oauth/access_token", params={
-                    "grant_type": "fb_exchange_token", "client_id": app_id,
-                    "client_secret": app_secret, "fb_exchange_token": acc["token"],
-                })
-                resp.raise_for_status()
-                new_token = resp.json()["access_token"]
+            resp = await _request(platform, "GET", "https://graph.facebook.com/v21.0/oauth/access_token", params={
+                "grant_type": "fb_exchange_token", "client_id": app_id,
+                "client_secret": app_secret, "fb_exchange_token": acc["token"],
+            })
+            resp.raise_for_status()
+            new_token = resp.json()["access_token"]
         else:
             return None
 
@@ -163,150 +318,161 @@ async def _sync_instagram(db: AsyncSession, acc: dict, org_id: int) -> dict:
     Account metrics: reach, profile_views, follows_and_unfollows.
     """
     results = {"platform": "instagram", "username": acc["username"], "status": "ok", "posts_synced": 0}
-    import json as _json
+    token = acc["token"]
 
-    async with httpx.AsyncClient(timeout=20) as client:
-        # 1. Profile stats
-        profile = await client.get("https://graph.instagram.com/me", params={
-            "fields": "id,username,account_type,media_count,followers_count,follows_count",
-            "access_token": acc["token"],
-        })
-        if profile.status_code == 200:
-            p = profile.json()
-            await _update_account_stats(db, acc["id"], org_id,
-                follower_count=p.get("followers_count", 0),
-                following_count=p.get("follows_count", 0),
-                post_count=p.get("media_count", 0),
-                username=p.get("username", acc["username"]),
-            )
-            results["followers"] = p.get("followers_count", 0)
-        else:
-            logger.warning("Instagram profile fetch failed: %s %s", profile.status_code, profile.text[:200])
-            results["status"] = "partial"
+    async def _account_insights():
+        try:
+            return await _request("instagram", "GET", "https://graph.instagram.com/me/insights", params={
+                "metric": "reach",
+                "period": "day",
+                "access_token": token,
+            })
+        except Exception as e:
+            logger.debug("Account insights error: %s", e)
+            return None
 
-        # 2. Recent media + per-post insights
-        media_resp = await client.get("https://graph.instagram.com/me/media", params={
+    # Profile, recent media and account insights don't depend on each other
+    profile, media_resp, acct_resp = await asyncio.gather(
+        _request("instagram", "GET", "https://graph.instagram.com/me", params={
+            "fields": "id,username,account_type,media_count,followers_count,follows_count",
+            "access_token": token,
+        }),
+        _request("instagram", "GET", "https://graph.instagram.com/me/media", params={
             "fields": "id,timestamp,like_count,comments_count,media_type,permalink",
             "limit": 25,
-            "access_token": acc["token"],
-        })
-
-        totals = {"likes": 0, "comments": 0, "shares": 0, "saves": 0, "views": 0,
-                  "reach": 0, "total_interactions": 0, "avg_watch_time_ms": 0,
-                  "total_watch_time_ms": 0, "video_views": 0}
-        post_insights_list = []
-
-        if media_resp.status_code == 200:
-            posts = media_resp.json().get("data", [])
-            results["posts_synced"] = len(posts)
-
-            for post in posts:
-                mid = post["id"]
-                mtype = post.get("media_type", "")
-
-                # Determine which metrics to request based on media type
-                if mtype == "VIDEO":  # Reels
-                    metrics = "reach,saved,shares,likes,comments,total_interactions,ig_reels_avg_watch_time,ig_reels_video_view_total_time,views"
-                elif mtype == "CAROUSEL_ALBUM":
-                    metrics = "reach,saved,shares,likes,comments,total_interactions"
-                else:  # IMAGE
-                    metrics = "reach,saved,shares,likes,comments,total_interactions"
-
-                try:
-                    ins_resp = await client.get(f"https://graph.instagram.com/{mid}/insights", params={
+            "access_token": token,
+        }),
+        _account_insights(),
+    )
+
+    # 1. Profile stats
+    if profile.status_code == 200:
+        p = profile.json()
+        await _update_account_stats(db, acc["id"], org_id,
+            follower_count=p.get("followers_count", 0),
+            following_count=p.get("follows_count", 0),
+            post_count=p.get("media_count", 0),
+            username=p.get("username", acc["username"]),
+        )
+        results["followers"] = p.get("followers_count", 0)
+    else:
+        logger.warning("Instagram profile fetch failed: %s %s", profile.status_code, profile.text[:200])
+        results["status"] = "partial"
+
+    # 2. Recent media + per-post insights
+    totals = {"likes": 0, "comments": 0, "shares": 0, "saves": 0, "views": 0,
+              "reach": 0, "total_interactions": 0, "avg_watch_time_ms": 0,
+              "total_watch_time_ms": 0, "video_views": 0}
+    daily: dict = {}
+
+    if media_resp.status_code == 200:
+        posts = media_resp.json().get("data", [])
+        results["posts_synced"] = len(posts)
+        insights_sem = asyncio.Semaphore(INSTAGRAM_INSIGHTS_CONCURRENCY)
+
+        async def _post_insights(post: dict) -> Optional[dict]:
+            mid = post["id"]
+            mtype = post.get("media_type", "")
+
+            # Determine which metrics to request based on media type
+            if mtype == "VIDEO":  # Reels
+                metrics = "reach,saved,shares,likes,comments,total_interactions,ig_reels_avg_watch_time,ig_reels_video_view_total_time,views"
+            elif mtype == "CAROUSEL_ALBUM":
+                metrics = "reach,saved,shares,likes,comments,total_interactions"
+            else:  # IMAGE
+                metrics = "reach,saved,shares,likes,comments,total_interactions"
+
+            try:
+                async with insights_sem:
+                    ins_resp = await _request("instagram", "GET", f"https://graph.instagram.com/{mid}/insights", params={
                         "metric": metrics,
-                        "access_token": acc["token"],
+                        "access_token": token,
                     })
-                    post_data = {"id": mid, "type": mtype, "permalink": post.get("permalink", "")}
-
-                    if ins_resp.status_code == 200:
-                        for m in ins_resp.json().get("data", []):
-                            name = m["name"]
-                            val = m["values"][0]["value"] if m.get("values") else 0
-                            post_data[name] = val
-
-                            if name == "likes":
-                                totals["likes"] += val
-                            elif name == "comments":
-                                totals["comments"] += val
-                            elif name == "shares":
-                                totals["shares"] += val
-                            elif name == "saved":
-                                totals["saves"] += val
-                            elif name == "views":
-                                totals["views"] += val
-                                totals["video_views"] += val
-                            elif name == "reach":
-                                totals["reach"] += val
-                            elif name == "total_interactions":
-                                totals["total_interactions"] += val
-                            elif name == "ig_reels_avg_watch_time":
-                                totals["avg_watch_time_ms"] += val
-                            elif name == "ig_reels_video_view_total_time":
-                                totals["total_watch_time_ms"] += val
-
-                    post_insights_list.append(post_data)
-
-                    # Snapshot for engagement velocity tracking
-                    await db.execute(text(
-                        "INSERT INTO social_snapshots (account_id, media_ig_id, views, likes, comments, shares, saves, reach, total_interactions, avg_watch_time_ms, org_id) "
-                        "VALUES (:aid, :mid, :views, :likes, :comments, :shares, :saves, :reach, :interactions, :awt, :org_id)"
-                    ), {
-                        "aid": acc["id"], "mid": mid,
-                        "views": post_data.get("views", 0),
-                        "likes": post_data.get("likes", 0),
-                        "comments": post_data.get("comments", 0),
-                        "shares": post_data.get("shares", 0),
-                        "saves": post_data.get("saved", 0),
-                        "reach": post_data.get("reach", 0),
-                        "interactions": post_data.get("total_interactions", 0),
-                        "awt": post_data.get("ig_reels_avg_watch_time", 0),
-                        "org_id": org_id,
-                    })
-                except Exception as e:
-                    logger.debug("Insights failed for %s: %s", mid, e)
-
-            # Average the avg_watch_time across posts
-            video_count = sum(1 for p in posts if p.get("media_type") == "VIDEO")
-            if video_count > 0:
-                totals["avg_watch_time_ms"] = totals["avg_watch_time_ms"] // video_count
-
-            # Engagement = likes + comments + shares + saves
-            total_engagement = totals["likes"] + totals["comments"] + totals["shares"] + totals["saves"]
-
-            await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
-                likes=totals["likes"],
-                comments=totals["comments"],
-                shares=totals["shares"],
-                saves=totals["saves"],
-                views=totals["views"],
-                video_views=totals["video_views"],
-                reach=totals["reach"],
-                total_interactions=totals["total_interactions"],
-                avg_watch_time_ms=totals["avg_watch_time_ms"],
-                total_watch_time_ms=totals["total_watch_time_ms"],
-                engagement=total_engagement,
-                engagement_rate=round(total_engagement / max(len(posts), 1), 2),
-                media_insights=_json.dumps(post_insights_list) if post_insights_list else None,
-            )
-
-        # 3. Account-level insights (daily)
+                post_data = {"id": mid, "type": mtype, "permalink": post.get("permalink", "")}
+                if ins_resp.status_code == 200:
+                    for m in ins_resp.json().get("data", []):
+                        post_data[m["name"]] = m["values"][0]["value"] if m.get("values") else 0
+                return post_data
+            except Exception as e:
+                logger.debug("Insights failed for %s: %s", mid, e)
+                return None
+
+        post_insights_list = [
+            pd for pd in await asyncio.gather(*(_post_insights(post) for post in posts)) if pd is not None
+        ]
+
+        metric_totals = {
+            "likes": "likes", "comments": "comments", "shares": "shares", "saved": "saves",
+            "reach": "reach", "total_interactions": "total_interactions",
+            "ig_reels_avg_watch_time": "avg_watch_time_ms",
+            "ig_reels_video_view_total_time": "total_watch_time_ms",
+        }
+        for post_data in post_insights_list:
+            for name, total_key in metric_totals.items():
+                if name in post_data:
+                    totals[total_key] += post_data[name]
+            if "views" in post_data:
+                totals["views"] += post_data["views"]
+                totals["video_views"] += post_data["views"]
+
+        # Snapshots for engagement velocity tracking (one batched insert)
+        if post_insights_list:
+            await db.execute(text(
+                "INSERT INTO crm.social_snapshots (account_id, media_ig_id, views, likes, comments, shares, saves, reach, total_interactions, avg_watch_time_ms, org_id) "
+                "VALUES (:aid, :mid, :views, :likes, :comments, :shares, :saves, :reach, :interactions, :awt, :org_id)"
+            ), [
+                {
+                    "aid": acc["id"], "mid": post_data["id"],
+                    "views": post_data.get("views", 0),
+                    "likes": post_data.get("likes", 0),
+                    "comments": post_data.get("comments", 0),
+                    "shares": post_data.get("shares", 0),
+                    "saves": post_data.get("saved", 0),
+                    "reach": post_data.get("reach", 0),
+                    "interactions": post_data.get("total_interactions", 0),
+                    "awt": post_data.get("ig_reels_avg_watch_time", 0),
+                    "org_id": org_id,
+                }
+                for post_data in post_insights_list
+            ])
+
+        # Average the avg_watch_time across posts
+        video_count = sum(1 for p in posts if p.get("media_type") == "VIDEO")
+        if video_count > 0:
+            totals["avg_watch_time_ms"] = totals["avg_watch_time_ms"] // video_count
+
+        # Engagement = likes + comments + shares + saves
+        total_engagement = totals["likes"] + totals["comments"] + totals["shares"] + totals["saves"]
+
+        daily.update(
+            likes=totals["likes"],
+            comments=totals["comments"],
+            shares=totals["shares"],
+            saves=totals["saves"],
+            views=totals["views"],
+            video_views=totals["video_views"],
+            reach=totals["reach"],
+            total_interactions=totals["total_interactions"],
+            avg_watch_time_ms=totals["avg_watch_time_ms"],
+            total_watch_time_ms=totals["total_watch_time_ms"],
+            engagement=total_engagement,
+            engagement_rate=round(total_engagement / max(len(posts), 1), 2),
+            media_insights=json.dumps(post_insights_list) if post_insights_list else None,
+        )
+
+    # 3. Account-level insights (daily) — wins when higher than summed post reach
+    if acct_resp is not None and acct_resp.status_code == 200:
         try:
-            acct_resp = await client.get("https://graph.instagram.com/me/insights", params={
-                "metric": "reach",
-                "period": "day",
-                "access_token": acc["token"],
-            })
-            if acct_resp.status_code == 200:
-                for m in acct_resp.json().get("data", []):
-                    vals = m.get("values", [])
-                    if vals:
-                        val = vals[-1].get("value", 0)
-                        if m["name"] == "reach" and val > totals["reach"]:
-                            await _upsert_daily_analytics(db, acc["id"], date.today(), org_id, reach=val)
+            for m in acct_resp.json().get("data", []):
+                vals = m.get("values", [])
+                if vals:
+                    val = vals[-1].get("value", 0)
+                    if m["name"] == "reach" and val > totals["reach"]:
+                        daily["reach"] = val
         except Exception as e:
             logger.debug("Account insights error: %s", e)
 
+    await _upsert_daily_analytics(db, acc["id"], date.today(), org_id, **daily)
     return results
 
 
@@ -315,78 +481,78 @@ async def _sync_youtube(db: AsyncSession, acc: dict, org_id: int) -> dict:
     results = {"platform": "youtube", "username": acc["username"], "status": "ok", "videos_synced": 0}
     headers = {"Authorization": f"Bearer {acc['token']}"}
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        # Channel stats
-        ch_resp = await client.get("https://www.googleapis.com/youtube/v3/channels", params={
-            "part": "statistics,snippet,contentDetails",
-            "mine": "true",
+    # Channel stats
+    ch_resp = await _request("youtube", "GET", "https://www.googleapis.com/youtube/v3/channels", params={
+        "part": "statistics,snippet,contentDetails",
+        "mine": "true",
+    }, headers=headers)
+
+    if ch_resp.status_code != 200:
+        logger.warning("YouTube channel fetch failed: %s", ch_resp.status_code)
+        results["status"] = "error"
+        return results
+
+    channels = ch_resp.json().get("items", [])
+    if not channels:
+        results["status"] = "no_channel"
+        return results
+
+    ch = channels[0]
+    stats = ch.get("statistics", {})
+    subs = int(stats.get("subscriberCount", 0))
+    views = int(stats.get("viewCount", 0))
+    vids = int(stats.get("videoCount", 0))
+
+    await _update_account_stats(db, acc["id"], org_id,
+        follower_count=subs,
+        post_count=vids,
+        username=ch["snippet"]["title"],
+    )
+    results["subscribers"] = subs
+
+    # Total channel views are stored as reach
+    daily: dict = {"reach": views}
+
+    # Recent videos
+    uploads_id = ch.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+    if uploads_id:
+        pl_resp = await _request("youtube", "GET", "https://www.googleapis.com/youtube/v3/playlistItems", params={
+            "part": "snippet",
+            "playlistId": uploads_id,
+            "maxResults": 10,
         }, headers=headers)
 
-        if ch_resp.status_code != 200:
-            logger.warning("YouTube channel fetch failed: %s", ch_resp.status_code)
-            results["status"] = "error"
-            return results
+        if pl_resp.status_code == 200:
+            items = pl_resp.json().get("items", [])
+            video_ids = [i["snippet"]["resourceId"]["videoId"] for i in items
+                         if i["snippet"]["resourceId"]["kind"] == "youtube#video"]
 
-        channels = ch_resp.json().get("items", [])
-        if not channels:
-            results["status"] = "no_channel"
-            return results
-
-        ch = channels[0]
-        stats = ch.get("statistics", {})
-        subs = int(stats.get("subscriberCount", 0))
-        views = int(stats.get("viewCount", 0))
-        vids = int(stats.get("videoCount", 0))
-
-        await _update_account_stats(db, acc["id"], org_id,
-            follower_count=subs,
-            post_count=vids,
-            username=ch["snippet"]["title"],
-        )
-        results["subscribers"] = subs
-
-        # Recent videos
-        uploads_id = ch.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
-        if uploads_id:
-            pl_resp = await client.get("https://www.googleapis.com/youtube/v3/playlistItems", params={
-                "part": "snippet",
-                "playlistId": uploads_id,
-                "maxResults": 10,
-            }, headers=headers)
+            if video_ids:
+                v_resp = await _request("youtube", "GET", "https://www.googleapis.com/youtube/v3/videos", params={
+                    "part": "statistics",
+                    "id": ",".join(video_ids[:10]),
+                }, headers=headers)
 
-            if pl_resp.status_code == 200:
-                items = pl_resp.json().get("items", [])
-                video_ids = [i["snippet"]["resourceId"]["videoId"] for i in items
-                             if i["snippet"]["resourceId"]["kind"] == "youtube#video"]
-
-                if video_ids:
-                    v_resp = await client.get("https://www.googleapis.com/youtube/v3/videos", params={
-                        "part": "statistics",
-                        "id": ",".join(video_ids[:10]),
-                    }, headers=headers)
-
-                    if v_resp.status_code == 200:
-                        total_views = 0
-                        total_likes = 0
-                        total_comments = 0
-                        for v in v_resp.json().get("items", []):
-                            s = v.get("statistics", {})
-                            total_views += int(s.get("viewCount", 0))
-                            total_likes += int(s.get("likeCount", 0))
-                            total_comments += int(s.get("commentCount", 0))
-
-                        results["videos_synced"] = len(video_ids)
-                        await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
-                            video_views=total_views,
-                            likes=total_likes,
-                            comments=total_comments,
-                            engagement=total_likes + total_comments,
-                            impressions=total_views,
-                        )
-
-        # Store total channel views as reach
-        await _upsert_daily_analytics(db, acc["id"], date.today(), org_id, reach=views)
+                if v_resp.status_code == 200:
+                    total_views = 0
+                    total_likes = 0
+                    total_comments = 0
+                    for v in v_resp.json().get("items", []):
+                        s = v.get("statistics", {})
+                        total_views += int(s.get("viewCount", 0))
+                        total_likes += int(s.get("likeCount", 0))
+                        total_comments += int(s.get("commentCount", 0))
+
+                    results["videos_synced"] = len(video_ids)
+                    daily.update(
+                        video_views=total_views,
+                        likes=total_likes,
+                        comments=total_comments,
+                        engagement=total_likes + total_comments,
+                        impressions=total_views,
+                    )
 
+    await _upsert_daily_analytics(db, acc["id"], date.today(), org_id, **daily)
     return results
 
 
@@ -394,36 +560,35 @@ async def _sync_facebook(db: AsyncSession, acc: dict, org_id: int) -> dict:
     """Sync Facebook: post engagement metrics."""
     results = {"platform": "facebook", "username": acc["username"], "status": "ok", "posts_synced": 0}
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get("https://graph.facebook.com/v21.0/me/posts", params={
-            "fields": "id,created_time,shares,likes.summary(true),comments.summary(true)",
-            "limit": 25,
-            "access_token": acc["token"],
-        })
-
-        if resp.status_code != 200:
-            logger.warning("Facebook posts fetch failed: %s", resp.status_code)
-            results["status"] = "error"
-            return results
-
-        posts = resp.json().get("data", [])
-        total_likes = 0
-        total_comments = 0
-        total_shares = 0
-        for p in posts:
-            total_likes += p.get("likes", {}).get("summary", {}).get("total_count", 0)
-            total_comments += p.get("comments", {}).get("summary", {}).get("total_count", 0)
-            total_shares += p.get("shares", {}).get("count", 0)
-
-        results["posts_synced"] = len(posts)
-        await _update_account_stats(db, acc["id"], org_id, post_count=len(posts))
-
-        await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
-            likes=total_likes,
-            comments=total_comments,
-            shares=total_shares,
-            engagement=total_likes + total_comments + total_shares,
-        )
+    resp = await _request("facebook", "GET", "https://graph.facebook.com/v21.0/me/posts", params={
+        "fields": "id,created_time,shares,likes.summary(true),comments.summary(true)",
+        "limit": 25,
+        "access_token": acc["token"],
+    })
+
+    if resp.status_code != 200:
+        logger.warning("Facebook posts fetch failed: %s", resp.status_code)
+        results["status"] = "error"
+        return results
+
+    posts = resp.json().get("data", [])
+    total_likes = 0
+    total_comments = 0
+    total_shares = 0
+    for p in posts:
+        total_likes += p.get("likes", {}).get("summary", {}).get("total_count", 0)
+        total_comments += p.get("comments", {}).get("summary", {}).get("total_count", 0)
+        total_shares += p.get("shares", {}).get("count", 0)
+
+    results["posts_synced"] = len(posts)
+    await _update_account_stats(db, acc["id"], org_id, post_count=len(posts))
+
+    await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
+        likes=total_likes,
+        comments=total_comments,
+        shares=total_shares,
+        engagement=total_likes + total_comments + total_shares,
+    )
 
     return results
 
@@ -433,58 +598,57 @@ async def _sync_x(db: AsyncSession, acc: dict, org_id: int) -> dict:
     results = {"platform": "x", "username": acc["username"], "status": "ok", "tweets_synced": 0}
     headers = {"Authorization": f"Bearer {acc['token']}"}
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        # Profile stats
-        me_resp = await client.get("https://api.x.com/2/users/me", params={
-            "user.fields": "public_metrics,profile_image_url",
-        }, headers=headers)
+    # Profile stats
+    me_resp = await _request("x", "GET", "https://api.x.com/2/users/me", params={
+        "user.fields": "public_metrics,profile_image_url",
+    }, headers=headers)
 
-        if me_resp.status_code == 200:
-            me = me_resp.json().get("data", {})
-            metrics = me.get("public_metrics", {})
-            await _update_account_stats(db, acc["id"], org_id,
-                follower_count=metrics.get("followers_count", 0),
-                following_count=metrics.get("following_count", 0),
-                post_count=metrics.get("tweet_count", 0),
-                username=me.get("username", acc["username"]),
-            )
-            results["followers"] = metrics.get("followers_count", 0)
-
-            # Get user ID for tweet lookup
-            user_id = me.get("id")
-            if user_id:
-                # Recent tweets with metrics
-                tweets_resp = await client.get(f"https://api.x.com/2/users/{user_id}/tweets", params={
-                    "max_results": 10,
-                    "tweet.fields": "created_at,public_metrics",
-                }, headers=headers)
+    if me_resp.status_code == 200:
+        me = me_resp.json().get("data", {})
+        metrics = me.get("public_metrics", {})
+        await _update_account_stats(db, acc["id"], org_id,
+            follower_count=metrics.get("followers_count", 0),
+            following_count=metrics.get("following_count", 0),
+            post_count=metrics.get("tweet_count", 0),
+            username=me.get("username", acc["username"]),
+        )
+        results["followers"] = metrics.get("followers_count", 0)
+
+        # Get user ID for tweet lookup
+        user_id = me.get("id")
+        if user_id:
+            # Recent tweets with metrics
+            tweets_resp = await _request("x", "GET", f"https://api.x.com/2/users/{user_id}/tweets", params={
+                "max_results": 10,
+                "tweet.fields": "created_at,public_metrics",
+            }, headers=headers)
 
-                if tweets_resp.status_code == 200:
-                    tweets = tweets_resp.json().get("data", [])
-                    total_likes = 0
-                    total_retweets = 0
-                    total_replies = 0
-                    total_impressions = 0
-                    for t in tweets:
-                        pm = t.get("public_metrics", {})
-                        total_likes += pm.get("like_count", 0)
-                        total_retweets += pm.get("retweet_count", 0)
-                        total_replies += pm.get("reply_count", 0)
-                        total_impressions += pm.get("impression_count", 0)
-
-                    results["tweets_synced"] = len(tweets)
-                    await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
-                        likes=total_likes,
-                        shares=total_retweets,
-                        comments=total_replies,
-                        impressions=total_impressions,
-                        engagement=total_likes + total_retweets + total_replies,
-                    )
-                else:
-                    logger.warning("X tweets fetch failed: %s %s", tweets_resp.status_code, tweets_resp.text[:200])
-        else:
-            logger.warning("X profile fetch failed: %s %s", me_resp.status_code, me_resp.text[:200])
-            results["status"] = "error"
+            if tweets_resp.status_code == 200:
+                tweets = tweets_resp.json().get("data", [])
+                total_likes = 0
+                total_retweets = 0
+                total_replies = 0
+                total_impressions = 0
+                for t in tweets:
+                    pm = t.get("public_metrics", {})
+                    total_likes += pm.get("like_count", 0)
+                    total_retweets += pm.get("retweet_count", 0)
+                    total_replies += pm.get("reply_count", 0)
+                    total_impressions += pm.get("impression_count", 0)
+
+                results["tweets_synced"] = len(tweets)
+                await _upsert_daily_analytics(db, acc["id"], date.today(), org_id,
+                    likes=total_likes,
+                    shares=total_retweets,
+                    comments=total_replies,
+                    impressions=total_impressions,
+                    engagement=total_likes + total_retweets + total_replies,
+                )
+            else:
+                logger.warning("X tweets fetch failed: %s %s", tweets_resp.status_code, tweets_resp.text[:200])
+    else:
+        logger.warning("X profile fetch failed: %s %s", me_resp.status_code, me_resp.text[:200])
+        results["status"] = "error"
 
     return results
 
@@ -497,20 +661,17 @@ SYNC_MAP = {
 }
 
 
-# ── Endpoints ────────────────────────────────────────────────────────
+# ── Orchestration ────────────────────────────────────────────────────
 
-@router.post("/sync")
-async def sync_all(request: Request, db: AsyncSession = Depends(get_tenant_db)):
-    """Sync all connected social accounts."""
-    org_id = get_org_id(request)
-    accounts = await _get_accounts(db, org_id)
-    if not accounts:
-        return {"status": "no_accounts", "results": []}
+async def _sync_account(acc: dict) -> dict:
+    """Sync one account in its own session, bounded by its platform's limit."""
+    platform = acc["platform"]
+    syncer = SYNC_MAP[platform]
+    org_id = acc["org_id"]
 
-    results = []
-    for acc in accounts:
-        syncer = SYNC_MAP.get(acc["platform"])
-        if syncer:
+    async with _semaphore(platform):
+        async with crm_session() as db:
+            await db.execute(text("SET search_path TO crm, public"))
             try:
                 r = await syncer(db, acc, org_id)
                 # If sync got errors (likely 401), try refreshing token and retry
@@ -521,42 +682,43 @@ async def sync_all(request: Request, db: AsyncSession = Depends(get_tenant_db)):
                         r = await syncer(db, acc, org_id)
                         if r.get("status") != "error":
                             r["token_refreshed"] = True
-                results.append(r)
+                await db.commit()
+                return r
             except Exception as e:
-                logger.error("Sync failed for %s/@%s: %s", acc['platform'], acc['username'], e)
-                results.append({"platform": acc["platform"], "username": acc["username"], "status": "error", "error": str(e)[:200]})
+                await db.rollback()
+                logger.error("Sync failed for %s/@%s: %s", platform, acc["username"], e)
+                return {"platform": platform, "username": acc["username"], "status": "error", "error": str(e)[:200]}
+
+
+async def sync_accounts(org_id: Optional[int] = None, platform: Optional[str] = None) -> list[dict]:
+    """Sync connected accounts concurrently; org_id=None covers every org."""
+    async with crm_session() as db:
+        accounts = await _get_accounts(db, org_id, platform)
+    accounts = [acc for acc in accounts if acc["platform"] in SYNC_MAP]
+    return list(await asyncio.gather(*(_sync_account(acc) for acc in accounts)))
+
 
-    await db.commit()
+# ── Endpoints ────────────────────────────────────────────────────────
+
+@router.post("/sync")
+async def sync_all(request: Request):
+    """Sync all connected social accounts."""
+    org_id = get_org_id(request)
+    results = await sync_accounts(org_id)
+    if not results:
+        return {"status": "no_accounts", "results": []}
     return {"status": "ok", "synced_at": datetime.now(timezone.utc).isoformat(), "results": results}
 
 
 @router.post("/sync/{platform}")
-async def sync_platform(request: Request, platform: str, db: AsyncSession = Depends(get_tenant_db)):
+async def sync_platform(request: Request, platform: str):
     """Sync a specific platform."""
     org_id = get_org_id(request)
-    syncer = SYNC_MAP.get(platform)
-    if not syncer:
+    if platform not in SYNC_MAP:
         raise HTTPException(400, f"Unknown platform: {platform}")
 
-    accounts = await _get_accounts(db, org_id, platform)
-    if not accounts:
+    results = await sync_accounts(org_id, platform)
+    if not results:
         raise HTTPException(404, f"No connected {platform} account")
 
-    results = []
-    for acc in accounts:
-        try:
-            r = await syncer(db, acc, org_id)
-            if r.get("status") == "error":
-                new_token = await _try_refresh_token(db, acc, org_id)
-                if new_token:
-                    acc["token"] = new_token
-                    r = await syncer(db, acc, org_id)
-                    if r.get("status") != "error":
-                        r["token_refreshed"] = True
-            results.append(r)
-        except Exception as e:
-            logger.error("Sync failed for %s/@%s: %s", platform, acc['username'], e)
-            results.append({"platform": platform, "username": acc["username"], "status": "error", "error": str(e)[:200]})
-
-    await db.commit()
     return {"status": "ok", "synced_at": datetime.now(timezone.utc).isoformat(), "results": results}
@@ -1,41 +1,42 @@
 """
 Thumbnail proxy to serve S3 images through the backend
 """
-from fastapi import APIRouter, HTTPException, Response
-from app.services.garage_s3 import create_s3_client, extract_s3_key_from_url
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.services.garage_s3 import GARAGE_CONFIG, create_s3_client, extract_s3_key_from_url
+from app.services.s3_media import stream_object_response
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/proxy/{path:path}")
-async def proxy_thumbnail(path: str):
+async def proxy_thumbnail(path: str, request: Request) -> Response:
     """Proxy S3 thumbnails through the backend to avoid CORS issues.
     
+    Streams the object from Garage over the shared client; supports Range
+    requests (206) and conditional GETs via If-None-Match (304).
+    
     Args:
         path: S3 object key path (e.g., instagram/handle/file.jpg)
         
     Returns:
-        Image response
+        Streaming image response
     """
     try:
-        s3_client = create_s3_client()
-        
-        # Get the object from S3
-        response = s3_client.get_object(Bucket='media', Key=path)
-        content = response['Body'].read()
-        content_type = response.get('ContentType', 'image/jpeg')
-        
-        # Return the image with proper headers
-        return Response(
-            content=content,
-            media_type=content_type,
+        return await stream_object_response(
+            create_s3_client(),
+            GARAGE_CONFIG["bucket"],
+            path,
+            request,
             headers={
                 "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
                 "Access-Control-Allow-Origin": "*"
-            }
+            },
         )
-        
+    except HTTPException as e:
+        if e.status_code != 404:
+            raise
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
     except Exception as e:
         logger.error(f"Error proxying thumbnail {path}: {e}")
         raise HTTPException(status_code=404, detail="Thumbnail not found")
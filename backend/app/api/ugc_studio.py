@@ -1984,7 +1984,6 @@ async def delete_voice_endpoint(
 # Visual Format Extraction for Remotion Templates
 
 from app.services.editing_dna import (
-    init_editing_dna_table,
     extract_visual_layout,
     synthesize_editing_dna,
     process_competitor_for_dna,
@@ -2019,9 +2018,6 @@ async def extract_editing_dna(
     org_id = get_org_id(request)
     api_key = await _get_gemini_key(db)
     
-    # Initialize table if needed
-    await init_editing_dna_table(db)
-    
     # Seed default templates if needed
     await seed_default_dna_templates(db, org_id)
     
@@ -2106,9 +2102,6 @@ async def list_editing_dna(
     """List all saved Editing DNA templates for the organization."""
     org_id = get_org_id(request)
     
-    # Initialize table if needed
-    await init_editing_dna_table(db)
-    
     # Seed default templates if needed
     await seed_default_dna_templates(db, org_id)
     
@@ -2185,9 +2178,6 @@ async def create_custom_dna(
     """Create a custom DNA template manually."""
     org_id = get_org_id(request)
     
-    # Initialize table if needed
-    await init_editing_dna_table(db)
-    
     try:
         # Build the DNA structure
         dna = {
@@ -2703,9 +2693,6 @@ async def start_video_pipeline(
                 raise HTTPException(status_code=400, detail="Google AI Studio API key not configured")
         
         # Create pipeline record first
-        from app.services.video_pipeline import init_pipeline_table
-        await init_pipeline_table(db)
-        
         result = await db.execute(text("""
             INSERT INTO crm.video_pipelines (
                 org_id, user_id, digital_copy_id, reference_post_id, 
@@ -3368,15 +3355,9 @@ async def _download_media_background(
 ):
     """Background: download media from Instagram CDN and store in Garage S3."""
     import asyncio as aio
-    import boto3
-
-    s3 = boto3.client(
-        's3',
-        endpoint_url=os.environ.get('GARAGE_ENDPOINT', 'http://10.0.0.11:3900'),
-        aws_access_key_id=os.environ.get('GARAGE_ACCESS_KEY', 'GK6d3eb1c7bc06e00d77b8f89c'),
-        aws_secret_access_key=os.environ.get('GARAGE_SECRET_KEY', '370b99ef00dbfee300e3d73b69b217a7f5633935b02b86ee37f5691aacdf602b'),
-        region_name=os.environ.get('GARAGE_REGION', 'ai-local'),
-    )
+    from app.api.digital_copies import get_s3_client
+
+    s3 = get_s3_client()
     bucket = 'digital-copies'
     s3_base = os.environ.get('GARAGE_ENDPOINT', 'http://10.0.0.11:3900')
 
@@ -3400,7 +3381,7 @@ async def _download_media_background(
                         elif "webp" in ct:
                             ext = "webp"
                         s3_key = f"competitor-media/{post_id}/thumb.{ext}"
-                        s3.put_object(Bucket=bucket, Key=s3_key, Body=resp.content, ContentType=ct or "image/jpeg")
+                        await aio.to_thread(s3.put_object, Bucket=bucket, Key=s3_key, Body=resp.content, ContentType=ct or "image/jpeg")
                         updates["thumbnail_url"] = f"{s3_base}/{bucket}/{s3_key}"
                         logger.info(f"Downloaded thumbnail for post {post_id} ({len(resp.content)//1024}KB)")
                 except Exception as e:
@@ -3412,7 +3393,7 @@ async def _download_media_background(
                     resp = await client.get(post["media_url"])
                     if resp.status_code == 200 and len(resp.content) > 10000:
                         s3_key = f"competitor-media/{post_id}/video.mp4"
-                        s3.put_object(Bucket=bucket, Key=s3_key, Body=resp.content, ContentType="video/mp4")
+                        await aio.to_thread(s3.put_object, Bucket=bucket, Key=s3_key, Body=resp.content, ContentType="video/mp4")
                         updates["media_url"] = f"{s3_base}/{bucket}/{s3_key}"
                         logger.info(f"Downloaded video for post {post_id} ({len(resp.content)//1024}KB)")
                 except Exception as e:
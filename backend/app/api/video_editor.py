@@ -566,7 +566,7 @@ async def compose_video(
         # Generate output based on render mode
         if request_data.render_mode == "ffmpeg":
             # Render with ffmpeg fallback
-            output_path = render_with_ffmpeg(composition)
+            output_path = await render_with_ffmpeg(composition)
             status = "completed"
             remotion_config = None
         else:
@@ -647,7 +647,7 @@ async def add_captions_to_video(
     
     try:
         # Add captions to video
-        captioned_video_path = add_captions(
+        captioned_video_path = await add_captions(
             caption_data.video_path,
             caption_data.script,
             caption_data.style
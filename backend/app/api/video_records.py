@@ -7,14 +7,14 @@ Provides access to structured video data for the CDR platform.
 
 import logging
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.auth import get_current_user
 from app.db.crm_db import get_tenant_db
 from app.services.tenant import get_org_id
 from app.services.video_record_service import create_video_record_service
-from app.models.video_record import VideoRecord
+from app.models.video_record import VideoRecord, VideoRecordPage
 from app.models.crm.user import User
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,7 @@ router = APIRouter(prefix="/api/content-intel", tags=["video-records"])
 @router.get("/video/{post_id}", response_model=VideoRecord)
 async def get_video_record(
     post_id: int,
+    request: Request,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db)
 ):
@@ -40,7 +41,7 @@ async def get_video_record(
     """
     try:
         service = create_video_record_service(db)
-        video_record = await service.get_video_record(post_id)
+        video_record = await service.get_video_record(post_id, org_id=get_org_id(request))
         
         if not video_record:
             raise HTTPException(
@@ -60,45 +61,43 @@ async def get_video_record(
         )
 
 
-@router.get("/videos", response_model=List[VideoRecord])
+@router.get("/videos", response_model=VideoRecordPage)
 async def get_video_records(
+    request: Request,
     competitor_id: Optional[int] = Query(None, description="Filter by competitor ID"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of records"),
     days: Optional[int] = Query(30, ge=1, le=365, description="Filter by days back"),
     platform: Optional[str] = Query(None, description="Filter by platform (instagram, tiktok, etc.)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db)
 ):
     """
-    Get multiple VideoRecords with filtering
+    Get a page of video record summaries with filtering
     
     Query parameters:
     - competitor_id: Optional filter by specific competitor
-    - limit: Maximum records to return (1-100, default 20)
+    - limit: Page size (1-100, default 20)
     - days: Look back this many days (1-365, default 30)
     - platform: Filter by platform (instagram, tiktok, youtube, x)
+    - cursor: Keyset cursor returned as next_cursor by the previous page
     
-    Returns list of VideoRecord objects ordered by engagement score.
+    Returns summaries (metrics, runtime, format, hook) ordered by
+    engagement score; fetch /video/{post_id} for transcript and analysis.
     """
     try:
-        from app.services.tenant import get_org_id_from_request
-        from fastapi import Request
-        
-        # Get org_id for multi-tenant filtering
-        # Note: This is a simplified approach - in production you'd get this from the request context
-        org_id = None  # TODO: Get from request context when available
-        
         service = create_video_record_service(db)
-        video_records = await service.get_video_records(
+        return await service.get_video_record_page(
             competitor_id=competitor_id,
             limit=limit,
             days=days,
             platform=platform,
-            org_id=org_id
+            org_id=get_org_id(request),
+            cursor=cursor
         )
         
-        return video_records
-        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("Failed to get video records: %s", e)
         raise HTTPException(
@@ -107,28 +106,32 @@ async def get_video_records(
         )
 
 
-@router.get("/videos/recent", response_model=List[VideoRecord])
+@router.get("/videos/recent", response_model=VideoRecordPage)
 async def get_recent_videos(
+    request: Request,
     days: int = Query(30, ge=1, le=365, description="Days back to search"),
     limit: int = Query(50, ge=1, le=100, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db)
 ):
     """
-    Get recent high-performing video records across all competitors
+    Get recent high-performing video record summaries across all competitors
     
     Returns the most recent and highest-engaging videos for analysis.
     Useful for trending content discovery and pattern identification.
     """
     try:
         service = create_video_record_service(db)
-        video_records = await service.get_recent_video_records(
+        return await service.get_recent_video_records(
             days=days,
-            limit=limit
+            limit=limit,
+            org_id=get_org_id(request),
+            cursor=cursor
         )
         
-        return video_records
-        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("Failed to get recent videos: %s", e)
         raise HTTPException(
@@ -137,36 +140,42 @@ async def get_recent_videos(
         )
 
 
-@router.get("/competitor/{competitor_id}/videos", response_model=List[VideoRecord])
+@router.get("/competitor/{competitor_id}/videos", response_model=VideoRecordPage)
 async def get_competitor_videos(
     competitor_id: int,
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Maximum records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_tenant_db)
 ):
     """
-    Get video records for a specific competitor
+    Get video record summaries for a specific competitor
     
     Returns the top-performing videos for the specified competitor,
     ordered by engagement score.
     """
     try:
         service = create_video_record_service(db)
-        video_records = await service.get_video_records_for_competitor(
+        page = await service.get_video_records_for_competitor(
             competitor_id=competitor_id,
-            limit=limit
+            limit=limit,
+            org_id=get_org_id(request),
+            cursor=cursor
         )
         
-        if not video_records:
+        if not page.records and not cursor:
             raise HTTPException(
                 status_code=404,
                 detail=f"No video records found for competitor {competitor_id}"
             )
         
-        return video_records
+        return page
         
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("Failed to get competitor videos %s: %s", competitor_id, e)
         raise HTTPException(
@@ -253,8 +262,8 @@ async def test_with_real_data(
     try:
         service = create_video_record_service(db)
         
-        # Get recent high-engagement posts for testing
-        video_records = await service.get_recent_video_records(
+        # Get recent high-engagement posts for testing (full records)
+        video_records = await service.get_video_records(
             days=90,  # Wider search for more data
             limit=limit
         )
@@ -64,6 +64,17 @@ class Settings(BaseSettings):
     # ── Admin seed ───────────────────────────────────────────────────
     ADMIN_PASSWORD: str = ""
 
+    # ── Background scheduler ─────────────────────────────────────────
+    # Every process with the scheduler enabled joins the leader election;
+    # only the elected leader runs the periodic jobs. Disable it on
+    # API-only containers to keep them out of the election entirely.
+    SCHEDULER_ENABLED: bool = True
+
+    # ── Schema migrations ────────────────────────────────────────────
+    # The backend image applies migrations once before starting uvicorn
+    # and turns this off; local runs apply pending ones on startup.
+    MIGRATE_ON_STARTUP: bool = True
+
 
 
     @property
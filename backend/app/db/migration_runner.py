@@ -0,0 +1,424 @@
+"""Versioned schema migrations, applied once per deploy.
+
+Every piece of startup / first-request DDL the app used to run (CREATE
+TABLE IF NOT EXISTS, ALTER TABLE ... ADD COLUMN IF NOT EXISTS, whole
+migration .sql files) is registered here as a numbered step. Applied
+versions are recorded in ``public.schema_migrations``, so a deploy runs
+each step exactly once and a normal boot only reads that table.
+
+Run before the app starts (the backend image does this):
+
+    python -m app.db.migration_runner          # apply pending steps
+    python -m app.db.migration_runner --status # list applied / pending
+
+With ``MIGRATE_ON_STARTUP`` enabled (the default, for local runs) the
+app lifespan calls ``run_migrations()`` too; when nothing is pending
+that costs one SELECT. Concurrent runners (several workers or
+containers) serialize on a Postgres advisory lock.
+
+Adding a migration: append a ``Migration`` to ``MIGRATIONS`` with the next
+version number. Never renumber or edit a step that has shipped.
+"""
+
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+
+from app.db.crm_db import crm_engine
+from app.db.leadgen_db import leadgen_engine
+
+logger = logging.getLogger(__name__)
+
+_DB_DIR = Path(__file__).parent
+
+# Arbitrary constant shared by every runner process
+_ADVISORY_LOCK_KEY = 7_264_019_001
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    description: str
+    apply: Callable[[], Awaitable[Optional[bool]]]
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+async def _run_statements(engine, statements: list[str]) -> None:
+    async with engine.begin() as conn:
+        for stmt in statements:
+            await conn.execute(text(stmt))
+
+
+async def _run_sql_script(engine, migration_sql: str) -> None:
+    """Execute multi-statement SQL (asyncpg simple-query protocol)."""
+    async with engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.execute(migration_sql)
+
+
+async def _run_sql_file(engine, filename: str) -> None:
+    await _run_sql_script(engine, (_DB_DIR / filename).read_text())
+
+
+async def _require_crm_schema() -> None:
+    async with crm_engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT 1 FROM information_schema.schemata WHERE schema_name = 'crm'")
+        )
+        if result.first() is None:
+            raise RuntimeError("CRM schema does not exist - run the CRM bootstrap first")
+
+
+# ── Steps ────────────────────────────────────────────────────────────
+
+async def _leadgen_schema():
+    from app.models.lead import Base
+    async with leadgen_engine.begin() as conn:
+        await conn.execute(text("CREATE SCHEMA IF NOT EXISTS leadgen"))
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _settings_table():
+    from app.api.settings import create_settings_table
+    await create_settings_table(leadgen_engine)
+
+
+async def _notifications_table():
+    from app.api.notifications import init_notifications_table
+    await init_notifications_table(leadgen_engine)
+
+
+async def _email_tables():
+    from app.api.email_inbox import create_email_tables
+    await create_email_tables()
+
+
+async def _crm_deal_and_org_columns():
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [
+        "ALTER TABLE crm.deals ADD COLUMN IF NOT EXISTS metadata JSONB DEFAULT '{}'::jsonb",
+        "ALTER TABLE crm.organizations ADD COLUMN IF NOT EXISTS emails JSONB DEFAULT '[]'::jsonb",
+        "ALTER TABLE crm.organizations ADD COLUMN IF NOT EXISTS contact_numbers JSONB DEFAULT '[]'::jsonb",
+    ])
+
+
+async def _competitor_post_index_tracking():
+    # Qdrant index tracking for incremental content indexing
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [
+        "ALTER TABLE crm.competitor_posts "
+        "ADD COLUMN IF NOT EXISTS index_doc_hash TEXT, "
+        "ADD COLUMN IF NOT EXISTS index_payload_hash TEXT, "
+        "ADD COLUMN IF NOT EXISTS indexed_at TIMESTAMP",
+    ])
+
+
+async def _competitor_post_keyset_index():
+    # Keyset pagination order for the video-records list
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [
+        "CREATE INDEX IF NOT EXISTS idx_competitor_posts_engagement_id "
+        "ON crm.competitor_posts ((COALESCE(engagement_score, 0)) DESC, id DESC)",
+    ])
+
+
+async def _competitor_post_upsert_key():
+    # Unique post key for the bulk competitor-post upsert
+    # (app/services/competitor_posts.py). Collapse any duplicates left by
+    # the old delete-and-reinsert path before indexing, keeping the copy
+    # with the most enrichment filled in, then the newest. Enrichment
+    # columns are read through to_jsonb because not every install has
+    # all of them.
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [
+        """
+        DELETE FROM crm.competitor_posts
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT p.id, ROW_NUMBER() OVER (
+                    PARTITION BY p.competitor_id, COALESCE(NULLIF(p.shortcode, ''), p.post_url)
+                    ORDER BY (
+                        (to_jsonb(p) ->> 'transcript' IS NOT NULL)::int
+                        + (to_jsonb(p) ->> 'comments_data' IS NOT NULL)::int
+                        + (to_jsonb(p) ->> 'content_analysis' IS NOT NULL)::int
+                        + (to_jsonb(p) ->> 'video_analysis' IS NOT NULL)::int
+                        + (to_jsonb(p) ->> 'detected_format' IS NOT NULL)::int
+                    ) DESC, p.id DESC
+                ) AS rn
+                FROM crm.competitor_posts p
+                WHERE p.competitor_id IS NOT NULL
+                  AND COALESCE(NULLIF(p.shortcode, ''), p.post_url) IS NOT NULL
+            ) ranked
+            WHERE rn > 1
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_competitor_posts_post_key "
+        "ON crm.competitor_posts (competitor_id, (COALESCE(NULLIF(shortcode, ''), post_url)))",
+    ])
+
+
+async def _competitor_analytics_snapshot():
+    from app.services.competitor_analytics import init_competitor_analytics_tables
+    await _require_crm_schema()
+    await init_competitor_analytics_tables(crm_engine)
+
+
+async def _video_copycat_tables():
+    # Must run before the content scheduler (compositions FK → storyboards)
+    await _run_sql_file(leadgen_engine, "video_copycat_migration.sql")
+
+
+async def _content_scheduler_tables():
+    await _run_sql_file(leadgen_engine, "content_scheduler_migration.sql")
+
+
+async def _carousel_tables():
+    await _run_sql_file(crm_engine, "carousel_migration.sql")
+
+
+async def _ugc_studio_tables():
+    from app.api.ugc_studio import init_ugc_tables, seed_templates
+    await init_ugc_tables()
+    await seed_templates()
+
+
+async def _video_editor_tables():
+    from app.api.video_editor import init_video_editor_tables, seed_remotion_templates
+    await init_video_editor_tables()
+    await seed_remotion_templates()
+
+
+async def _video_assets_tables():
+    from app.api.video_assets import init_video_copycat_tables
+    return await init_video_copycat_tables()
+
+
+async def _video_pipeline_table():
+    from app.services.video_pipeline import PIPELINE_DDL
+    await _require_crm_schema()
+    await _run_sql_script(crm_engine, PIPELINE_DDL)
+
+
+async def _lead_enrichment_columns():
+    await _run_statements(leadgen_engine, [
+        # Deep website audit
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_results JSONB",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_score INTEGER",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_grade VARCHAR(2)",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS deep_audit_date TIMESTAMPTZ",
+        # Enrichment sources
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS enrichment_error TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_url TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_rating TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_accredited BOOLEAN",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_complaints INTEGER DEFAULT 0",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS bbb_summary TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_url TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_rating NUMERIC(2,1)",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_review_count INTEGER DEFAULT 0",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS glassdoor_summary TEXT",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS reddit_mentions JSONB DEFAULT '[]'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS news_mentions JSONB DEFAULT '[]'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS social_scan JSONB DEFAULT '{}'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS video_analysis JSONB DEFAULT '[]'",
+        # Lead source
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS lead_source TEXT DEFAULT 'google_places'",
+        # Review intelligence
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS yelp_rating NUMERIC(2,1)",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS yelp_reviews_count INTEGER DEFAULT 0",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_highlights TEXT[] DEFAULT '{}'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_sentiment_score NUMERIC(3,2)",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_pain_points TEXT[] DEFAULT '{}'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS review_opportunity_flags TEXT[] DEFAULT '{}'",
+        "ALTER TABLE leadgen.leads ADD COLUMN IF NOT EXISTS reviews_scraped_at TIMESTAMPTZ",
+    ])
+
+
+async def _oauth_tokens_table():
+    await _run_statements(leadgen_engine, ["""
+        CREATE TABLE IF NOT EXISTS public.oauth_tokens (
+            service     VARCHAR(50) PRIMARY KEY,
+            tokens      JSONB NOT NULL DEFAULT '{}',
+            updated_at  TIMESTAMP DEFAULT now()
+        )
+    """])
+
+
+async def _social_analytics_upsert_key():
+    # One row per account per day for the social sync upsert
+    # (app/api/social_sync.py). Keep the newest row of any duplicates,
+    # the one holding the latest metrics for that day.
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [
+        """
+        DELETE FROM crm.social_analytics a
+        USING crm.social_analytics b
+        WHERE a.account_id = b.account_id
+          AND a.metric_date = b.metric_date
+          AND a.id < b.id
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_social_analytics_account_date "
+        "ON crm.social_analytics (account_id, metric_date)",
+    ])
+
+
+async def _enrichment_cache_table():
+    # Cross-tenant enrichment source cache (app/services/leadgen/enrichment_cache.py)
+    await _run_statements(leadgen_engine, [
+        """
+        CREATE TABLE IF NOT EXISTS leadgen.enrichment_cache (
+            source      TEXT NOT NULL,
+            cache_key   TEXT NOT NULL,
+            payload     JSONB NOT NULL,
+            fetched_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            expires_at  TIMESTAMPTZ NOT NULL,
+            hit_count   INTEGER NOT NULL DEFAULT 0,
+            last_hit_at TIMESTAMPTZ,
+            PRIMARY KEY (source, cache_key)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_enrichment_cache_expires ON leadgen.enrichment_cache (expires_at)",
+    ])
+
+
+async def _editing_dna_table():
+    from app.services.editing_dna import EDITING_DNA_DDL
+    await _require_crm_schema()
+    await _run_statements(crm_engine, [EDITING_DNA_DDL])
+
+
+async def _api_quota_table():
+    # Daily external API call counters shared by all workers (Google Places)
+    await _run_statements(leadgen_engine, ["""
+        CREATE TABLE IF NOT EXISTS leadgen.api_quota (
+            service VARCHAR(50) NOT NULL,
+            day     DATE NOT NULL,
+            calls   INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (service, day)
+        )
+    """])
+
+
+MIGRATIONS: list[Migration] = [
+    Migration("0001", "leadgen schema and lead tables", _leadgen_schema),
+    Migration("0002", "settings table", _settings_table),
+    Migration("0003", "notifications table", _notifications_table),
+    Migration("0004", "email inbox tables", _email_tables),
+    Migration("0005", "crm deal metadata and organization contact columns", _crm_deal_and_org_columns),
+    Migration("0006", "competitor post index tracking columns", _competitor_post_index_tracking),
+    Migration("0007", "competitor post keyset pagination index", _competitor_post_keyset_index),
+    Migration("0008", "competitor post upsert key", _competitor_post_upsert_key),
+    Migration("0009", "competitor analytics snapshot tables", _competitor_analytics_snapshot),
+    Migration("0010", "video copycat tables", _video_copycat_tables),
+    Migration("0011", "content scheduler tables", _content_scheduler_tables),
+    Migration("0012", "carousel tables", _carousel_tables),
+    Migration("0013", "ugc studio tables and templates", _ugc_studio_tables),
+    Migration("0014", "video editor tables and templates", _video_editor_tables),
+    Migration("0015", "video assets tables", _video_assets_tables),
+    Migration("0016", "video pipeline table", _video_pipeline_table),
+    Migration("0017", "lead enrichment, audit and review columns", _lead_enrichment_columns),
+    Migration("0018", "oauth token store table", _oauth_tokens_table),
+    Migration("0019", "social analytics upsert key", _social_analytics_upsert_key),
+    Migration("0020", "lead enrichment cache table", _enrichment_cache_table),
+    Migration("0021", "shared external API quota counters", _api_quota_table),
+    Migration("0022", "editing dna table", _editing_dna_table),
+]
+
+
+# ── Runner ───────────────────────────────────────────────────────────
+
+async def _applied_versions(conn) -> Optional[set[str]]:
+    """Versions already recorded, or None if the tracking table is missing."""
+    exists = await conn.execute(text("SELECT to_regclass('public.schema_migrations')"))
+    if exists.scalar() is None:
+        return None
+    result = await conn.execute(text("SELECT version FROM public.schema_migrations"))
+    return {r[0] for r in result.fetchall()}
+
+
+async def pending_migrations() -> list[Migration]:
+    """Steps not yet recorded as applied."""
+    async with leadgen_engine.connect() as conn:
+        applied = await _applied_versions(conn) or set()
+    return [m for m in MIGRATIONS if m.version not in applied]
+
+
+async def run_migrations() -> list[str]:
+    """Apply every pending step in order; returns the versions that failed.
+
+    A failed step is logged and left unrecorded so the next run retries
+    it; later independent steps still run (matching the old startup
+    behaviour where each init block was isolated).
+    """
+    if not await pending_migrations():
+        return []
+
+    failed: list[str] = []
+    async with leadgen_engine.connect() as lock_conn:
+        await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+        await lock_conn.commit()
+        try:
+            async with leadgen_engine.begin() as conn:
+                await conn.execute(text("""
+                    CREATE TABLE IF NOT EXISTS public.schema_migrations (
+                        version     VARCHAR(32) PRIMARY KEY,
+                        description TEXT,
+                        applied_at  TIMESTAMPTZ DEFAULT NOW()
+                    )
+                """))
+                # Another runner may have finished while we waited for the lock
+                applied = await _applied_versions(conn) or set()
+
+            for migration in MIGRATIONS:
+                if migration.version in applied:
+                    continue
+                try:
+                    if await migration.apply() is False:
+                        raise RuntimeError("step reported failure")
+                except Exception as e:
+                    logger.error("Migration %s (%s) failed: %s", migration.version, migration.description, e)
+                    failed.append(migration.version)
+                    continue
+                async with leadgen_engine.begin() as conn:
+                    await conn.execute(
+                        text("""
+                            INSERT INTO public.schema_migrations (version, description)
+                            VALUES (:version, :description)
+                            ON CONFLICT (version) DO NOTHING
+                        """),
+                        {"version": migration.version, "description": migration.description},
+                    )
+                logger.info("Applied migration %s: %s", migration.version, migration.description)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+            await lock_conn.commit()
+
+    return failed
+
+
+async def _main(argv: list[str]) -> int:
+    if "--status" in argv:
+        pending = {m.version for m in await pending_migrations()}
+        for m in MIGRATIONS:
+            print(f"{m.version}  {'pending' if m.version in pending else 'applied'}  {m.description}")
+        return 0
+
+    failed = await run_migrations()
+    await leadgen_engine.dispose()
+    await crm_engine.dispose()
+    if failed:
+        print(f"Migrations failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    print("Migrations up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(_main(sys.argv[1:])))
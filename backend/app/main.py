@@ -10,71 +10,12 @@ from app.api import chat, health, settings, auth, social, social_oauth, social_c
 
 from app.api.webhooks.instagram import router as instagram_webhook_router
 
+from app.config import settings as app_settings
 from app.db.leadgen_db import leadgen_engine
-from app.db.crm_db import crm_engine, crm_session
-from app.models.lead import Base
 
 logger = logging.getLogger(__name__)
 
 
-async def _init_content_scheduler_tables(engine):
-    """Initialize content scheduler tables from migration file."""
-    try:
-        import os
-        from pathlib import Path
-        
-        migration_path = Path(__file__).parent / "db" / "content_scheduler_migration.sql"
-        if not migration_path.exists():
-            logger.error(f"Content scheduler migration file not found: {migration_path}")
-            return False
-            
-        with open(migration_path, 'r') as f:
-            migration_sql = f.read()
-        
-        async with engine.begin() as conn:
-            raw = await conn.get_raw_connection()
-            await raw.driver_connection.execute(migration_sql)
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Content scheduler table initialization failed: {e}")
-        return False
-
-
-async def _init_carousel_tables(engine):
-    """Initialize carousel tables from migration file."""
-    try:
-        import os
-        from pathlib import Path
-        
-        migration_path = Path(__file__).parent / "db" / "carousel_migration.sql"
-        if not migration_path.exists():
-            logger.error(f"Carousel migration file not found: {migration_path}")
-            return False
-            
-        with open(migration_path, 'r') as f:
-            migration_sql = f.read()
-        
-        async with engine.begin() as conn:
-            raw = await conn.get_raw_connection()
-            await raw.driver_connection.execute(migration_sql)
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Carousel table initialization failed: {e}")
-        return False
-
-
-
-
-
-
-
-
-
-
 def _validate_jwt_secret():
     """Validate JWT secret strength at startup."""
     from app.config import settings
@@ -96,138 +37,63 @@ def _validate_jwt_secret():
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database tables on startup."""
+    """Apply pending migrations and start background services on startup."""
     # Validate JWT secret strength
     _validate_jwt_secret()
     
-    try:
-        # Ensure leadgen schema exists, then create tables
-        from sqlalchemy import text as sa_text
-        async with leadgen_engine.begin() as conn:
-            await conn.execute(sa_text("CREATE SCHEMA IF NOT EXISTS leadgen"))
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("LeadGen database initialized (schema: leadgen)")
-        
-        # Create settings table and seed defaults
-        await settings.init_settings_table(leadgen_engine)
-        logger.info("Settings initialized")
-        
-        # Initialize notifications table (shared leadgen engine — same DB)
-        await notifications.init_notifications_table(leadgen_engine)
-        logger.info("Notifications table initialized")
-        
-        # Email inbox tables (public schema)
-        await email_inbox.init_email_tables()
-        logger.info("Email inbox tables initialized")
-        
-        # Verify CRM schema exists (don't re-create, just verify)
-        crm_schema_ok = await verify_crm_schema()
-        logger.info("CRM schema verified")
-
-        # Ensure metadata JSONB column on deals (idempotent)
-        if crm_schema_ok:
-            try:
-                from app.db.crm_db import crm_engine
-                async with crm_engine.begin() as conn:
-                    await conn.execute(sa_text(
-                        "ALTER TABLE crm.deals ADD COLUMN IF NOT EXISTS metadata JSONB DEFAULT '{}'::jsonb"
-                    ))
-                    await conn.execute(sa_text(
-                        "ALTER TABLE crm.organizations ADD COLUMN IF NOT EXISTS emails JSONB DEFAULT '[]'::jsonb"
-                    ))
-                    await conn.execute(sa_text(
-                        "ALTER TABLE crm.organizations ADD COLUMN IF NOT EXISTS contact_numbers JSONB DEFAULT '[]'::jsonb"
-                    ))
-                logger.info("Deals metadata and organization contact columns ensured")
-            except Exception as e:
-                logger.warning("Failed to ensure CRM metadata/contact columns: %s", e)
-
-
-        
-        # Video Copycat tables — must run before content scheduler (compositions FK → storyboards)
+    # Schema changes are versioned migrations (app/db/migration_runner.py),
+    # normally applied once per deploy before the workers start. With
+    # MIGRATE_ON_STARTUP this is a single SELECT when nothing is pending.
+    if app_settings.MIGRATE_ON_STARTUP:
         try:
-            await video_copycat.init_video_copycat_tables()
-            logger.info("Video Copycat tables initialized")
+            from app.db.migration_runner import run_migrations
+            failed = await run_migrations()
+            if failed:
+                logger.error("Schema migrations failed: %s", ", ".join(failed))
         except Exception as e:
-            logger.error("Failed to initialize Video Copycat tables: %s", e)
-
-        # Content Scheduler tables (public schema) — compositions + scheduling
-        await _init_content_scheduler_tables(leadgen_engine)
-        logger.info("Content scheduler tables initialized")
-
-        # Carousel tables (crm schema) — text-to-carousel + Instagram posting
-        await _init_carousel_tables(crm_engine)
-        logger.info("Carousel tables initialized")
-
-    except Exception as e:
-        logger.error("Failed to initialize databases: %s", e)
-
-    # UGC Studio tables — isolated because of known jsonb cast issue
-    try:
-        await ugc_studio.init_ugc_tables()
-        await ugc_studio.seed_templates()
-        logger.info("UGC Studio tables initialized")
-    except Exception as e:
-        logger.error("Failed to initialize UGC Studio tables: %s", e)
-
-    # Video Editor tables (Remotion-based) — isolated
-    try:
-        await video_editor.init_video_editor_tables()
-        await video_editor.seed_remotion_templates()
-        logger.info("Video Editor tables initialized")
-    except Exception as e:
-        logger.error("Failed to initialize Video Editor tables: %s", e)
+            logger.error("Failed to run schema migrations: %s", e)
 
-    # Video Assets tables (assets + digital copies) — isolated
     try:
-        await video_assets.init_video_copycat_tables()
-        logger.info("Video Assets tables initialized")
+        # Seed default settings and load API keys into env
+        await settings.init_settings_table(leadgen_engine)
+        logger.info("Settings initialized")
     except Exception as e:
-        logger.error("Failed to initialize Video Assets tables: %s", e)
-
+        logger.error("Failed to initialize settings: %s", e)
 
+    await email_inbox.warm_gmail_token()
 
     # Start background scheduler (competitor syncs, etc.)
     from app.services.scheduler import start_scheduler, stop_scheduler
     await start_scheduler()
 
+    # One LISTEN connection per process feeds every notification SSE stream
+    from app.services.notification_bus import start_listener, stop_listener
+    await start_listener()
+
     yield
 
     # Shutdown scheduler
     await stop_scheduler()
 
+    await stop_listener()
 
-async def verify_crm_schema():
-    """Verify CRM schema exists without re-creating it."""
-    from sqlalchemy import text
-    
-    try:
-        async with crm_engine.begin() as conn:
-            result = await conn.execute(
-                text("SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'crm'")
-            )
-            schema_exists = result.fetchone()
-            
-            if not schema_exists:
-                logger.warning("CRM schema does not exist - run migration first")
-                return False
-            
-            # Check if we have the basic tables
-            table_check = await conn.execute(
-                text("SELECT COUNT(*) as count FROM information_schema.tables WHERE table_schema = 'crm'")
-            )
-            table_count = table_check.fetchone()[0]
-            
-            if table_count < 10:  # Should have many more than 10 tables
-                logger.warning("CRM schema incomplete - only %d tables found", table_count)
-                return False
-                
-            logger.info("CRM schema verified with %d tables", table_count)
-            return True
-            
-    except Exception as e:
-        logger.error("Failed to verify CRM schema: %s", e)
-        return False
+    # Close pooled scraper browser (no-op if never launched)
+    from app.services.instagram_scraper import close_browser_pool
+    await close_browser_pool()
+
+    # Close pooled embedding connections + cache
+    from app.services.embedding_client import close_embedding_clients
+    await close_embedding_clients()
+
+    # Close shared per-platform social API clients
+    from app.api.social_sync import close_social_sync_clients
+    await close_social_sync_clients()
+
+    # Close the lead website fetch cache and HTML parse workers
+    from app.services.leadgen.page_cache import close_page_cache
+    from app.services.leadgen.parse_pool import shutdown_parse_pool
+    await close_page_cache()
+    shutdown_parse_pool()
 
 
 app = FastAPI(title="socialRecycle", version="0.1.0", lifespan=lifespan)
@@ -275,8 +141,6 @@ app.add_middleware(TenantGuardMiddleware)
 from app.middleware.auth_guard import AuthGuardMiddleware
 app.add_middleware(AuthGuardMiddleware)
 
-from app.config import settings as app_settings
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=app_settings.allowed_origins_list,
@@ -7,11 +7,12 @@ import logging
 import re
 
 import jwt
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
+from app.services.auth_cache import get_user_auth
 
 logger = logging.getLogger(__name__)
 
@@ -90,39 +91,53 @@ def _validate_token(token: str) -> dict | None:
         return None
 
 
-class AuthGuardMiddleware(BaseHTTPMiddleware):
-    """Require valid JWT for all /api/* routes unless whitelisted."""
+class AuthGuardMiddleware:
+    """Require valid JWT for all /api/* routes unless whitelisted.
 
-    async def dispatch(self, request: Request, call_next):
+    Pure ASGI middleware (no BaseHTTPMiddleware task/stream wrapping).
+    User info is written to ``scope["state"]`` so ``request.state`` sees it
+    downstream.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
         path = request.url.path
 
         # Non-API routes (frontend pages, static files) — pass through
         if not path.startswith("/api"):
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Public API paths — pass through
         if _is_public(path):
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # OPTIONS (CORS preflight) — pass through
         if request.method == "OPTIONS":
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Extract Bearer token
         auth_header = request.headers.get("authorization", "")
         if not auth_header.lower().startswith("bearer "):
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Not authenticated"},
             )
+            return await response(scope, receive, send)
 
         token = auth_header[7:]  # Strip "Bearer "
         payload = _validate_token(token)
         if not payload:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Invalid or expired token"},
             )
+            return await response(scope, receive, send)
 
         # Attach user info to request state for downstream use
         request.state.user_id = payload["user_id"]
@@ -130,25 +145,18 @@ class AuthGuardMiddleware(BaseHTTPMiddleware):
         request.state.org_id = payload.get("org_id")
         request.state.is_superadmin = payload.get("is_superadmin", False)
 
-        # If JWT is missing org_id or is_superadmin, do a quick DB lookup
-        # This handles stale tokens created before org assignment or role changes
+        # If JWT is missing org_id or is_superadmin, fill them from the (cached)
+        # users row. This handles stale tokens created before org assignment or
+        # role changes.
         if not request.state.org_id or not request.state.is_superadmin:
             try:
-                from app.db.crm_db import crm_session
-                from sqlalchemy import text as sa_text
-                async with crm_session() as session:
-                    await session.execute(sa_text("SET search_path TO crm, public"))
-                    row = await session.execute(
-                        sa_text("SELECT org_id, is_superadmin FROM users WHERE id = :uid AND status = true"),
-                        {"uid": payload["user_id"]}
-                    )
-                    user_row = row.first()
-                    if user_row:
-                        if not request.state.org_id and user_row[0]:
-                            request.state.org_id = user_row[0]
-                        if not request.state.is_superadmin and user_row[1]:
-                            request.state.is_superadmin = user_row[1]
+                user_row = await get_user_auth(payload["user_id"])
+                if user_row and user_row["status"]:
+                    if not request.state.org_id and user_row["org_id"]:
+                        request.state.org_id = user_row["org_id"]
+                    if not request.state.is_superadmin and user_row["is_superadmin"]:
+                        request.state.is_superadmin = user_row["is_superadmin"]
             except Exception as e:
                 logger.warning("Auth guard DB fallback failed: %s", e)
 
-        return await call_next(request)
+        return await self.app(scope, receive, send)
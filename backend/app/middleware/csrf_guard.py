@@ -13,9 +13,9 @@ import os
 from typing import List
 from urllib.parse import urlparse
 
-from fastapi import Request, Response, HTTPException
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
 
@@ -43,21 +43,26 @@ CSRF_EXEMPT_PATHS = [
 _DEV_MODE = os.getenv("ENV", "production").lower() in ("dev", "development", "local")
 
 
-class CSRFGuardMiddleware(BaseHTTPMiddleware):
+class CSRFGuardMiddleware:
     """CSRF protection middleware for state-changing operations."""
 
-    def __init__(self, app, allowed_origins: List[str] = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, allowed_origins: List[str] = None):
+        self.app = app
         self.allowed_origins = allowed_origins or settings.allowed_origins_list
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
+
         # Skip CSRF check for safe methods
         if request.method not in CSRF_PROTECTED_METHODS:
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Skip CSRF check for exempt paths
         if any(request.url.path.startswith(path) for path in CSRF_EXEMPT_PATHS):
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Validate Origin or Referer header
         if not self._validate_origin(request):
@@ -66,12 +71,13 @@ class CSRFGuardMiddleware(BaseHTTPMiddleware):
                 request.method,
                 request.url.path
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={"error": "Invalid origin or referer header", "code": "CSRF_VIOLATION"}
             )
+            return await response(scope, receive, send)
 
-        return await call_next(request)
+        return await self.app(scope, receive, send)
 
     def _validate_origin(self, request: Request) -> bool:
         """Validate Origin or Referer header against allowed origins."""
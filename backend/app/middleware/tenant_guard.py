@@ -8,9 +8,9 @@ cross-tenant administration.
 """
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ def get_current_org_id(request: Request) -> int:
     return int(org_id)
 
 
-class TenantGuardMiddleware(BaseHTTPMiddleware):
+class TenantGuardMiddleware:
     """Enforce org_id on all authenticated /api/* requests.
 
     - If user has org_id → passes through (org_id already on request.state)
@@ -40,17 +40,24 @@ class TenantGuardMiddleware(BaseHTTPMiddleware):
     - Non-API and unauthenticated routes → passes through (handled by AuthGuard)
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request = Request(scope)
         path = request.url.path
 
         # Only enforce on API routes
         if not path.startswith("/api"):
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Skip if no user_id set (unauthenticated — AuthGuard handles this)
         user_id = getattr(request.state, "user_id", None)
         if not user_id:
-            return await call_next(request)
+            return await self.app(scope, receive, send)
 
         # Check org_id
         org_id = getattr(request.state, "org_id", None)
@@ -62,11 +69,12 @@ class TenantGuardMiddleware(BaseHTTPMiddleware):
                 user_id,
                 path,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403,
                 content={
                     "detail": "No organization assigned. Contact your administrator."
                 },
             )
+            return await response(scope, receive, send)
 
-        return await call_next(request)
+        return await self.app(scope, receive, send)
@@ -271,7 +271,11 @@ class VideoRecord(BaseModel):
                     return VideoRuntime.from_seconds(total_duration)
         
         # Fallback: estimate from post content
-        post_text = post_data.get('post_text', '') or ''
+        return VideoRecord._estimate_runtime(post_data.get('post_text', '') or '')
+    
+    @staticmethod
+    def _estimate_runtime(post_text: str) -> VideoRuntime:
+        """Estimate runtime from caption length when no analysis exists"""
         word_count = len(post_text.split())
         estimated_seconds = min(max(word_count * 0.5, 15), 90)  # 0.5 sec per word, 15-90s range
         
@@ -497,6 +501,79 @@ class VideoRecord(BaseModel):
         return directives
 
 
+class VideoRecordSummary(BaseModel):
+    """
+    Lightweight list-view projection of a VideoRecord
+    
+    Carries metrics, runtime, format and hook only; transcript, pacing and
+    directives are served by the single-record detail endpoint.
+    """
+    
+    id: int
+    competitor_id: Optional[int] = None
+    competitor_handle: str = "unknown"
+    platform: str
+    title: str
+    url: str
+    hook: Optional[str] = None
+    media_type: Optional[str] = None
+    posted_at: Optional[datetime] = None
+    scraped_at: Optional[datetime] = None
+    engagement_score: float = 0.0
+    metrics: VideoMetrics
+    runtime: VideoRuntime
+    format: str  # short_form | mid_form | long_form
+    detected_format: Optional[str] = None
+    
+    @classmethod
+    def from_list_row(cls, row: Dict[str, Any]) -> 'VideoRecordSummary':
+        """
+        Create a summary from a VideoRecordService list-projection row
+        
+        Runtime inputs arrive pre-extracted from the JSONB columns:
+        va_runtime / va_total_duration (from video_analysis) and
+        frame_seconds (sum of frame_chunks durations).
+        """
+        post_text = row.get('post_text', '') or ''
+        hook = row.get('hook', '') or ''
+        
+        runtime_raw = row.get('va_runtime') or row.get('va_total_duration')
+        if runtime_raw:
+            runtime = VideoRuntime.from_seconds(runtime_raw)
+        elif (row.get('frame_seconds') or 0) > 0:
+            runtime = VideoRuntime.from_seconds(row['frame_seconds'])
+        else:
+            runtime = VideoRecord._estimate_runtime(post_text)
+        
+        return cls(
+            id=row['id'],
+            competitor_id=row.get('competitor_id'),
+            competitor_handle=row.get('competitor_handle') or 'unknown',
+            platform=row.get('platform') or 'unknown',
+            title=hook if hook else VideoRecord._extract_title_from_text(post_text),
+            url=row.get('post_url') or '',
+            hook=hook or None,
+            media_type=row.get('media_type'),
+            posted_at=row.get('posted_at'),
+            scraped_at=row.get('fetched_at'),
+            engagement_score=float(row.get('engagement_score') or 0),
+            metrics=VideoMetrics(
+                likes=int(row.get('likes', 0) or 0),
+                comments=int(row.get('comments', 0) or 0),
+                shares=int(row.get('shares', 0) or 0) if row.get('shares') else None
+            ),
+            runtime=runtime,
+            format=VideoRecord._classify_format(runtime.seconds),
+            detected_format=row.get('detected_format'),
+        )
+
+
+class VideoRecordPage(BaseModel):
+    """A page of VideoRecordSummary rows with a keyset cursor for the next page"""
+    records: List[VideoRecordSummary] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
 def audit_metrics_and_runtime():
     """
     Audit function to document current metric calculations and runtime issues
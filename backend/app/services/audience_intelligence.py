@@ -20,14 +20,11 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-import httpx
 import numpy as np
 
-logger = logging.getLogger(__name__)
+from app.services.embedding_client import embed_texts
 
-# FastEmbed endpoint configuration
-FASTEMBED_URL = "http://10.0.0.11:11435/api/embed"
-FASTEMBED_TIMEOUT = 30.0
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -168,30 +165,7 @@ USAGE_HINTS = {
 
 async def get_embeddings(texts: List[str]) -> Optional[np.ndarray]:
     """Get embeddings from FastEmbed server."""
-    if not texts:
-        return None
-        
-    try:
-        async with httpx.AsyncClient(timeout=FASTEMBED_TIMEOUT) as client:
-            response = await client.post(
-                FASTEMBED_URL,
-                json={"input": texts},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            embeddings = data.get("embeddings", [])
-            
-            if not embeddings or len(embeddings) != len(texts):
-                logger.warning("FastEmbed returned incorrect number of embeddings")
-                return None
-                
-            return np.array(embeddings, dtype=np.float32)
-            
-    except Exception as e:
-        logger.warning("FastEmbed request failed: %s", e)
-        return None
+    return await embed_texts(texts)
 
 
 def extract_objections(comments: List[Dict]) -> List[Dict]:
@@ -0,0 +1,115 @@
+"""Short-TTL cache of per-user auth facts used by AuthGuardMiddleware.
+
+Most JWTs lack ``org_id`` or ``is_superadmin``, so the auth guard used to
+open a CRM session and query ``users`` on nearly every request. This
+module caches ``user_id -> {org_id, is_superadmin, status}``:
+
+  - in-process for ``AUTH_CACHE_TTL_SECONDS`` (default 30s)
+  - in Redis for ``AUTH_CACHE_REDIS_TTL_SECONDS`` (default 300s), so a
+    fresh worker or container reuses what another one already loaded
+
+Call ``invalidate_user(user_id)`` whenever a user's org, role, superadmin
+flag or status changes. It drops both the local and the Redis entry. Other
+workers' local copies expire within the short TTL.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Optional
+
+from app.services.redis_pool import get_redis_pool
+from app.services.shared_state import KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+AUTH_CACHE_REDIS_TTL_SECONDS = int(os.getenv("AUTH_CACHE_REDIS_TTL_SECONDS", "300"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+# user_id -> (expires_at monotonic, record or None for "no active user")
+_local: dict[int, tuple[float, Optional[dict[str, Any]]]] = {}
+
+
+def _redis_key(user_id: int) -> str:
+    return f"{KEY_PREFIX}auth:user:{user_id}"
+
+
+def _store_local(user_id: int, record: Optional[dict[str, Any]]) -> None:
+    if len(_local) >= AUTH_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for uid in [uid for uid, (exp, _) in _local.items() if exp <= now]:
+            _local.pop(uid, None)
+        if len(_local) >= AUTH_CACHE_MAX_ENTRIES:
+            _local.clear()
+    _local[user_id] = (time.monotonic() + AUTH_CACHE_TTL_SECONDS, record)
+
+
+async def _load_from_db(user_id: int) -> Optional[dict[str, Any]]:
+    from sqlalchemy import text as sa_text
+
+    from app.db.crm_db import crm_session
+
+    async with crm_session() as session:
+        await session.execute(sa_text("SET search_path TO crm, public"))
+        row = await session.execute(
+            sa_text("SELECT org_id, is_superadmin, status FROM users WHERE id = :uid"),
+            {"uid": user_id},
+        )
+        user_row = row.first()
+    if not user_row:
+        return None
+    return {
+        "org_id": user_row[0],
+        "is_superadmin": bool(user_row[1]),
+        "status": bool(user_row[2]),
+    }
+
+
+async def get_user_auth(user_id: int) -> Optional[dict[str, Any]]:
+    """Return ``{org_id, is_superadmin, status}`` for a user, or None if unknown.
+
+    Raises whatever the DB raises on a cold miss; callers decide how to
+    degrade.
+    """
+    cached = _local.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    redis = await get_redis_pool()
+    if redis is not None:
+        try:
+            raw = await redis.get(_redis_key(user_id))
+            if raw is not None:
+                record = json.loads(raw)
+                _store_local(user_id, record)
+                return record
+        except Exception as exc:
+            logger.warning("Auth cache read failed for user %s: %s", user_id, exc)
+
+    record = await _load_from_db(user_id)
+    _store_local(user_id, record)
+    if redis is not None:
+        try:
+            await redis.set(_redis_key(user_id), json.dumps(record), ex=AUTH_CACHE_REDIS_TTL_SECONDS)
+        except Exception as exc:
+            logger.warning("Auth cache write failed for user %s: %s", user_id, exc)
+    return record
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Forget cached auth facts for a user after their org/role/status changed."""
+    _local.pop(user_id, None)
+    redis = await get_redis_pool()
+    if redis is None:
+        return
+    try:
+        await redis.delete(_redis_key(user_id))
+    except Exception as exc:
+        logger.warning("Auth cache invalidation failed for user %s: %s", user_id, exc)
+
+
+def clear_local() -> None:
+    """Drop every in-process entry (tests, bulk role changes)."""
+    _local.clear()
@@ -13,7 +13,8 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 import json
 from datetime import datetime
-import subprocess
+
+from app.services.media_exec import MediaExecError, probe_duration, run_media
 
 # Audio processing
 try:
@@ -153,11 +154,11 @@ async def generate_voice_audio(
             'ffmpeg', '-f', 'lavfi', '-i', 'anullsrc=r=22050:cl=mono', 
             '-t', '3', '-y', str(silence_path)
         ]
-        subprocess.run(cmd, check=True, capture_output=True)
+        await run_media(cmd)
         
         # Convert to MP3
         cmd = ['ffmpeg', '-i', str(silence_path), '-y', str(file_path)]
-        subprocess.run(cmd, check=True, capture_output=True)
+        await run_media(cmd)
         
         # Clean up WAV
         silence_path.unlink()
@@ -165,7 +166,7 @@ async def generate_voice_audio(
         logger.info(f"Generated silent audio placeholder: {file_path}")
         return str(file_path)
         
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except MediaExecError:
         # Ultimate fallback: empty file
         file_path.touch()
         logger.warning("Created empty audio file placeholder")
@@ -245,10 +246,7 @@ async def generate_avatar_video(
     try:
         if Path(audio_path).exists():
             # Create static image video with audio
-            duration_cmd = ['ffprobe', '-v', 'quiet', '-show_entries', 
-                          'format=duration', '-of', 'csv=p=0', audio_path]
-            result = subprocess.run(duration_cmd, capture_output=True, text=True)
-            duration = float(result.stdout.strip()) if result.stdout.strip() else 3.0
+            duration = await probe_duration(audio_path) or 3.0
         else:
             duration = 3.0
         
@@ -267,7 +265,7 @@ async def generate_avatar_video(
                 '-i', audio_path, '-t', str(duration),
                 '-c:v', 'libx264', '-c:a', 'aac', '-y', str(file_path)
             ]
-            subprocess.run(cmd, check=True, capture_output=True)
+            await run_media(cmd)
             placeholder_img.unlink()  # Clean up temp image
             
             logger.info(f"Generated placeholder avatar video: {file_path}")
@@ -277,7 +275,7 @@ async def generate_avatar_video(
             shutil.copy2(audio_path, file_path.with_suffix('.mp3'))
             logger.info(f"Created audio placeholder: {file_path}")
             
-    except (subprocess.CalledProcessError, FileNotFoundError, Exception) as e:
+    except Exception as e:
         logger.error(f"Video generation failed: {e}")
         # Ultimate fallback: empty file
         file_path.touch()
@@ -352,7 +350,7 @@ async def compose_scene(
         cmd.extend(['-c:v', 'libx264', '-c:a', 'aac', '-y', str(output_path)])
         
         # Execute composition
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = await run_media(cmd, check=False)
         
         if result.returncode == 0:
             logger.info(f"Scene composed successfully: {output_path}")
@@ -360,7 +358,7 @@ async def compose_scene(
         else:
             logger.error(f"FFmpeg composition failed: {result.stderr}")
             
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    except MediaExecError as e:
         logger.error(f"Scene composition failed: {e}")
     
     # Fallback: Just copy avatar video
@@ -11,16 +11,13 @@ import json
 from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any
 
-import httpx
 import numpy as np
 # from sklearn.cluster import KMeans, DBSCAN
 # from sklearn.metrics import silhouette_score
 
-logger = logging.getLogger(__name__)
+from app.services.embedding_client import embed_texts
 
-# FastEmbed endpoint configuration
-FASTEMBED_URL = "http://10.0.0.11:11435/api/embed"
-FASTEMBED_TIMEOUT = 30.0
+logger = logging.getLogger(__name__)
 
 # Sentiment keyword sets (keep existing logic - it works fine)
 POSITIVE_WORDS = {
@@ -57,30 +54,7 @@ async def get_embeddings(texts: List[str]) -> Optional[np.ndarray]:
     
     Returns None if FastEmbed is unreachable (for fallback handling).
     """
-    if not texts:
-        return None
-        
-    try:
-        async with httpx.AsyncClient(timeout=FASTEMBED_TIMEOUT) as client:
-            response = await client.post(
-                FASTEMBED_URL,
-                json={"input": texts},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            embeddings = data.get("embeddings", [])
-            
-            if not embeddings or len(embeddings) != len(texts):
-                logger.warning("FastEmbed returned incorrect number of embeddings")
-                return None
-                
-            return np.array(embeddings, dtype=np.float32)
-            
-    except Exception as e:
-        logger.warning("FastEmbed request failed: %s", e)
-        return None
+    return await embed_texts(texts)
 
 
 def classify_comment_type(text: str) -> str:
@@ -28,10 +28,13 @@ async def scrape_post_comments(
 ) -> List[Dict[str, Any]]:
     """Scrape comments from a single Instagram post using authenticated Playwright.
     
+    Runs on a pooled page in the shared authenticated browser context.
+    
     Returns list of comments: [{username, text, likes, timestamp, is_reply}]
     """
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
+        from app.services.instagram_scraper import get_browser_pool
     except ImportError:
         logger.error("Playwright not installed")
         return []
@@ -60,66 +63,41 @@ async def scrape_post_comments(
             pass
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-                timezone_id="America/New_York",
-            )
-            
-            # Load cookies
-            if COOKIE_PATH.exists():
-                try:
-                    cookies = json.loads(COOKIE_PATH.read_text())
-                    if cookies:
-                        await context.add_cookies(cookies)
-                except Exception as e:
-                    logger.warning("Failed to load cookies: %s", e)
-            
-            page = await context.new_page()
+        async with get_browser_pool().page() as page:
             page.on("response", intercept_response)
-            
-            post_url = f"https://www.instagram.com/p/{shortcode}/"
-            logger.info("Scraping comments from %s", post_url)
-            
-            await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-            
-            # Wait for page to render comments
-            await asyncio.sleep(4)
-            
-            # Scroll to load more comments
-            for _ in range(3):
-                await page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(1.5)
-            
-            # Try clicking "View all X comments" to expand
             try:
-                view_all = await page.query_selector('text=/View all.*comment/i')
-                if view_all:
-                    await view_all.click()
-                    await asyncio.sleep(3)
-                    # Scroll more in expanded view
-                    for _ in range(3):
-                        await page.evaluate("window.scrollBy(0, 600)")
-                        await asyncio.sleep(1.5)
-            except Exception:
-                pass
-            
-            # Primary extraction: DOM (Instagram 2026 format)
-            # Comments are rendered in div containers with Reply text nodes
-            captured_comments.extend(await _extract_comments_from_dom(page))
-            logger.info("DOM extraction: %d comments from %s", len(captured_comments), shortcode)
-            
-            await browser.close()
+                post_url = f"https://www.instagram.com/p/{shortcode}/"
+                logger.info("Scraping comments from %s", post_url)
+                
+                await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
+                
+                # Wait for page to render comments
+                await asyncio.sleep(4)
+                
+                # Scroll to load more comments
+                for _ in range(3):
+                    await page.evaluate("window.scrollBy(0, 500)")
+                    await asyncio.sleep(1.5)
+                
+                # Try clicking "View all X comments" to expand
+                try:
+                    view_all = await page.query_selector('text=/View all.*comment/i')
+                    if view_all:
+                        await view_all.click()
+                        await asyncio.sleep(3)
+                        # Scroll more in expanded view
+                        for _ in range(3):
+                            await page.evaluate("window.scrollBy(0, 600)")
+                            await asyncio.sleep(1.5)
+                except Exception:
+                    pass
+                
+                # Primary extraction: DOM (Instagram 2026 format)
+                # Comments are rendered in div containers with Reply text nodes
+                captured_comments.extend(await _extract_comments_from_dom(page))
+                logger.info("DOM extraction: %d comments from %s", len(captured_comments), shortcode)
+            finally:
+                page.remove_listener("response", intercept_response)
     
     except Exception as e:
         logger.error("Comment scraping error for %s: %s", shortcode, e)
@@ -444,6 +422,32 @@ def _analyze_comments(comments: List[Dict], post_caption: str = "") -> Dict:
     }
 
 
+async def scrape_and_analyze_post_comments(
+    shortcode: str,
+    post_caption: Optional[str] = "",
+    comments_per_post: int = 50,
+) -> Dict:
+    """Scrape one post's comments and return ONLY the audience analysis.
+    
+    Raw comments are held in memory for the duration of the call.
+    """
+    raw_comments = await scrape_post_comments(shortcode, limit=comments_per_post)
+    
+    # Analyze using ML pipeline service (FastEmbed + clustering), fallback to regex
+    try:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(
+                f"{ML_SERVICE_URL}/analyze-comments",
+                json={"comments": raw_comments, "post_caption": post_caption or ""}
+            )
+            if response.status_code == 200:
+                return response.json()
+            logger.warning("ML service failed with HTTP %s, falling back to regex", response.status_code)
+    except Exception as e:
+        logger.warning("ML service unavailable, falling back to regex: %s", e)
+    return _analyze_comments(raw_comments, post_caption or "")
+
+
 async def scrape_competitor_comments(
     db: AsyncSession,
     competitor_id: int,
@@ -480,24 +484,7 @@ async def scrape_competitor_comments(
         logger.info("Scraping + analyzing comments for %s...", shortcode)
         
         try:
-            # Scrape raw comments (held in memory only)
-            raw_comments = await scrape_post_comments(shortcode, limit=comments_per_post)
-            
-            # Analyze using ML pipeline service (FastEmbed + clustering), fallback to regex
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        f"{ML_SERVICE_URL}/analyze-comments",
-                        json={"comments": raw_comments, "post_caption": post_caption or ""}
-                    )
-                    if response.status_code == 200:
-                        analysis = response.json()
-                    else:
-                        logger.warning("ML service failed with HTTP %s, falling back to regex", response.status_code)
-                        analysis = _analyze_comments(raw_comments, post_caption or "")
-            except Exception as e:
-                logger.warning("ML service unavailable, falling back to regex: %s", e)
-                analysis = _analyze_comments(raw_comments, post_caption or "")
+            analysis = await scrape_and_analyze_post_comments(shortcode, post_caption, comments_per_post)
             
             # Store ONLY the analysis, not raw comments
             await db.execute(
@@ -0,0 +1,419 @@
+"""Per-org analytics snapshot behind the content-intel dashboards.
+
+``crm.competitor_post_analytics`` holds one narrow, precomputed row per
+competitor post: resolved hook, format, topic labels, engagement score and
+engagement rate. The trending-topics, top-content, hooks and top-videos
+endpoints read (and rank) these rows instead of loading ``cp.*`` — with
+transcripts, comment data and frame analysis — for the whole org.
+
+Each post's topic phrases are extracted once (and again only if its
+caption changes); trending topics are then a GROUP BY over the stored
+phrases (``load_topic_stats``) rather than an NLP pass per request.
+
+Virality blends engagement with a recency boost that changes as posts age,
+so it is computed in SQL at read time (``VIRALITY_SQL``) from the stored
+components rather than frozen into the snapshot.
+
+The snapshot is rebuilt after each sync-all run, whenever a post write
+marks it stale (``mark_snapshot_stale``), and otherwise at most every
+``SNAPSHOT_MAX_AGE_SECONDS`` on read (enrichment stages update hooks and
+formats without touching the snapshot).
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.shared_state import SharedLock
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv("ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS", "900"))
+# Lease on an org's rebuild; renewed while held, so only a crashed worker lets it lapse
+SNAPSHOT_LOCK_TTL_SECONDS = 120
+
+# content_intel.calculate_recency_weight: 2.0 within 7 whole days, 1.5
+# within 14, else 1.0 (undated posts count as new)
+RECENCY_WEIGHT_SQL = """CASE
+        WHEN CAST(:now AS TIMESTAMP) - COALESCE(a.posted_at, CAST(:now AS TIMESTAMP)) < INTERVAL '8 days' THEN 2.0
+        WHEN CAST(:now AS TIMESTAMP) - COALESCE(a.posted_at, CAST(:now AS TIMESTAMP)) < INTERVAL '15 days' THEN 1.5
+        ELSE 1.0
+    END"""
+
+# Same blend as content_intel._post_virality_score
+VIRALITY_SQL = f"""ROUND(CAST(
+    a.engagement_score * {RECENCY_WEIGHT_SQL} + a.engagement_rate * 1000.0 AS NUMERIC), 2)"""
+
+RANK_ORDER_SQL = (
+    "virality_score DESC, a.engagement_score DESC, a.engagement_rate DESC, "
+    "COALESCE(a.posted_at, CAST(:now AS TIMESTAMP)) DESC, a.post_id DESC"
+)
+
+_SNAPSHOT_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS crm.competitor_post_analytics (
+        post_id INTEGER PRIMARY KEY REFERENCES crm.competitor_posts(id) ON DELETE CASCADE,
+        org_id INTEGER NOT NULL,
+        competitor_id INTEGER NOT NULL,
+        handle VARCHAR,
+        platform VARCHAR,
+        media_type VARCHAR,
+        is_video BOOLEAN NOT NULL DEFAULT FALSE,
+        post_url VARCHAR,
+        post_text TEXT,
+        hook TEXT,
+        detected_format VARCHAR,
+        topic_labels JSONB NOT NULL DEFAULT '[]'::jsonb,
+        likes INTEGER NOT NULL DEFAULT 0,
+        comments INTEGER NOT NULL DEFAULT 0,
+        shares INTEGER NOT NULL DEFAULT 0,
+        followers INTEGER NOT NULL DEFAULT 0,
+        engagement_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        engagement_rate DOUBLE PRECISION NOT NULL DEFAULT 0,
+        posted_at TIMESTAMP,
+        refreshed_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_competitor_post_analytics_org_posted "
+    "ON crm.competitor_post_analytics (org_id, posted_at DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS crm.competitor_analytics_snapshots (
+        org_id INTEGER PRIMARY KEY,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        stale BOOLEAN NOT NULL DEFAULT FALSE,
+        refreshed_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+    """,
+]
+
+
+async def init_competitor_analytics_tables(engine) -> None:
+    """Create the snapshot tables (idempotent)."""
+    async with engine.begin() as conn:
+        for statement in _SNAPSHOT_DDL:
+            await conn.execute(text(statement))
+
+
+def _now() -> datetime:
+    """Naive local time, matching content_intel.calculate_recency_weight."""
+    return datetime.now()
+
+
+# ── Writes ───────────────────────────────────────────────────────────
+
+async def mark_snapshot_stale(db: AsyncSession, org_id: Optional[int]) -> None:
+    """Flag an org's snapshot for rebuild on next read. Does not commit."""
+    if org_id is None:
+        return
+    await db.execute(
+        text("UPDATE crm.competitor_analytics_snapshots SET stale = TRUE WHERE org_id = :org_id"),
+        {"org_id": org_id},
+    )
+
+
+def _build_rows(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Derive snapshot rows from source posts (CPU-bound: hooks, n-grams).
+
+    Topic phrases are only extracted for new posts or changed captions.
+    """
+    from app.api import content_intel as ci
+
+    rows = []
+    for post in posts:
+        rows.append({
+            "post_id": post["id"],
+            "competitor_id": post["competitor_id"],
+            "handle": post.get("handle"),
+            "platform": post.get("platform"),
+            "media_type": post.get("media_type"),
+            "is_video": ci._is_video_like_post(post),
+            "post_url": post.get("post_url"),
+            "post_text": post.get("post_text") or "",
+            "hook": ci._post_hook(post) or "",
+            "detected_format": post.get("detected_format"),
+            "topic_labels": (
+                post["cached_topic_labels"] if post.get("topics_current")
+                else json.dumps(ci._post_topic_phrases(post.get("post_text") or ""))
+            ),
+            "likes": int(post.get("likes") or 0),
+            "comments": int(post.get("comments") or 0),
+            "shares": int(post.get("shares") or 0),
+            "followers": int(post.get("followers") or 0),
+            "engagement_score": ci._post_engagement_score(post),
+            "engagement_rate": ci._post_engagement_rate(post),
+            "posted_at": post.get("posted_at"),
+        })
+    return rows
+
+
+async def refresh_org_snapshot(db: AsyncSession, org_id: int) -> int:
+    """Rebuild the analytics snapshot for one org and commit.
+
+    Returns the number of posts in the snapshot.
+    """
+    result = await db.execute(
+        text("""
+            SELECT cp.id, cp.competitor_id, c.handle, cp.platform, cp.media_type,
+                   cp.post_url, cp.post_text, cp.hook, cp.transcript, cp.detected_format,
+                   cp.likes, cp.comments, cp.shares, cp.posted_at,
+                   COALESCE(c.followers, 0) AS followers,
+                   CAST(a.topic_labels AS TEXT) AS cached_topic_labels,
+                   (a.post_id IS NOT NULL AND a.post_text = COALESCE(cp.post_text, '')) AS topics_current
+            FROM crm.competitor_posts cp
+            JOIN crm.competitors c ON c.id = cp.competitor_id
+            LEFT JOIN crm.competitor_post_analytics a ON a.post_id = cp.id
+            WHERE c.org_id = :org_id
+        """),
+        {"org_id": org_id},
+    )
+    posts = [dict(row._mapping) for row in result.fetchall()]
+    rows = await asyncio.to_thread(_build_rows, posts)
+
+    columns = [
+        "post_id", "competitor_id", "handle", "platform", "media_type", "is_video",
+        "post_url", "post_text", "hook", "detected_format", "topic_labels", "likes",
+        "comments", "shares", "followers", "engagement_score", "engagement_rate", "posted_at",
+    ]
+    params: Dict[str, Any] = {"org_id": org_id}
+    params.update({col: [row[col] for row in rows] for col in columns})
+
+    await db.execute(
+        text("""
+            DELETE FROM crm.competitor_post_analytics
+            WHERE org_id = :org_id AND NOT (post_id = ANY(CAST(:post_id AS INTEGER[])))
+        """),
+        {"org_id": org_id, "post_id": params["post_id"]},
+    )
+    if rows:
+        await db.execute(
+            text("""
+                INSERT INTO crm.competitor_post_analytics
+                    (post_id, org_id, competitor_id, handle, platform, media_type, is_video,
+                     post_url, post_text, hook, detected_format, topic_labels, likes, comments,
+                     shares, followers, engagement_score, engagement_rate, posted_at, refreshed_at)
+                SELECT v.post_id, CAST(:org_id AS INTEGER), v.competitor_id, v.handle, v.platform,
+                       v.media_type, v.is_video, v.post_url, v.post_text, v.hook, v.detected_format,
+                       CAST(v.topic_labels AS JSONB), v.likes, v.comments, v.shares, v.followers,
+                       v.engagement_score, v.engagement_rate, v.posted_at, NOW()
+                FROM UNNEST(
+                    CAST(:post_id AS INTEGER[]), CAST(:competitor_id AS INTEGER[]),
+                    CAST(:handle AS TEXT[]), CAST(:platform AS TEXT[]),
+                    CAST(:media_type AS TEXT[]), CAST(:is_video AS BOOLEAN[]),
+                    CAST(:post_url AS TEXT[]), CAST(:post_text AS TEXT[]),
+                    CAST(:hook AS TEXT[]), CAST(:detected_format AS TEXT[]),
+                    CAST(:topic_labels AS TEXT[]), CAST(:likes AS INTEGER[]),
+                    CAST(:comments AS INTEGER[]), CAST(:shares AS INTEGER[]),
+                    CAST(:followers AS INTEGER[]), CAST(:engagement_score AS DOUBLE PRECISION[]),
+                    CAST(:engagement_rate AS DOUBLE PRECISION[]), CAST(:posted_at AS TIMESTAMP[])
+                ) AS v(post_id, competitor_id, handle, platform, media_type, is_video,
+                       post_url, post_text, hook, detected_format, topic_labels, likes,
+                       comments, shares, followers, engagement_score, engagement_rate, posted_at)
+                ON CONFLICT (post_id) DO UPDATE SET
+                    org_id = EXCLUDED.org_id,
+                    competitor_id = EXCLUDED.competitor_id,
+                    handle = EXCLUDED.handle,
+                    platform = EXCLUDED.platform,
+                    media_type = EXCLUDED.media_type,
+                    is_video = EXCLUDED.is_video,
+                    post_url = EXCLUDED.post_url,
+                    post_text = EXCLUDED.post_text,
+                    hook = EXCLUDED.hook,
+                    detected_format = EXCLUDED.detected_format,
+                    topic_labels = EXCLUDED.topic_labels,
+                    likes = EXCLUDED.likes,
+                    comments = EXCLUDED.comments,
+                    shares = EXCLUDED.shares,
+                    followers = EXCLUDED.followers,
+                    engagement_score = EXCLUDED.engagement_score,
+                    engagement_rate = EXCLUDED.engagement_rate,
+                    posted_at = EXCLUDED.posted_at,
+                    refreshed_at = NOW()
+            """),
+            params,
+        )
+    await db.execute(
+        text("""
+            INSERT INTO crm.competitor_analytics_snapshots (org_id, post_count, stale, refreshed_at)
+            VALUES (:org_id, :post_count, FALSE, NOW())
+            ON CONFLICT (org_id) DO UPDATE SET
+                post_count = EXCLUDED.post_count, stale = FALSE, refreshed_at = NOW()
+        """),
+        {"org_id": org_id, "post_count": len(rows)},
+    )
+    await db.commit()
+    logger.info("Analytics snapshot refreshed for org %s (%d posts)", org_id, len(rows))
+    return len(rows)
+
+
+async def _snapshot_is_stale(db: AsyncSession, org_id: int) -> Optional[bool]:
+    """True/False for an existing snapshot, None if the org has none yet."""
+    result = await db.execute(
+        text("""
+            SELECT stale OR refreshed_at < NOW() - make_interval(secs => :max_age)
+            FROM crm.competitor_analytics_snapshots
+            WHERE org_id = :org_id
+        """),
+        {"org_id": org_id, "max_age": SNAPSHOT_MAX_AGE_SECONDS},
+    )
+    row = result.first()
+    return None if row is None else bool(row[0])
+
+
+async def ensure_org_snapshot(db: AsyncSession, org_id: int) -> None:
+    """Rebuild the org's snapshot first if it is missing, stale or too old.
+
+    One worker rebuilds an org at a time (shared lock). While it does,
+    other readers serve the previous snapshot rather than queueing behind
+    it; only an org with no snapshot yet waits for the rebuild. If a
+    rebuild fails but an older snapshot exists, that one is served.
+    """
+    stale = await _snapshot_is_stale(db, org_id)
+    if stale is False:
+        return
+
+    lock = SharedLock(f"analytics-snapshot:{org_id}", ttl_seconds=SNAPSHOT_LOCK_TTL_SECONDS)
+    if not await lock.acquire(blocking=stale is None):
+        return
+    try:
+        # Another worker may have rebuilt it while we waited for the lock
+        stale = await _snapshot_is_stale(db, org_id)
+        if stale is False:
+            return
+        try:
+            await refresh_org_snapshot(db, org_id)
+        except SQLAlchemyError as e:
+            await db.rollback()
+            if stale is None:
+                raise
+            logger.warning("Analytics snapshot refresh failed for org %s, serving previous: %s", org_id, e)
+    finally:
+        await lock.release()
+
+
+# ── Reads ────────────────────────────────────────────────────────────
+
+def _window_filters(platform: Optional[str], days: Optional[int], params: Dict[str, Any]) -> str:
+    clauses = ""
+    if days is not None:
+        clauses += " AND a.posted_at >= :cutoff_date"
+        params["cutoff_date"] = (datetime.now(timezone.utc) - timedelta(days=days)).replace(tzinfo=None)
+    if platform:
+        clauses += " AND a.platform = :platform"
+        params["platform"] = platform
+    return clauses
+
+
+async def load_ranked_posts(
+    db: AsyncSession,
+    org_id: int,
+    platform: Optional[str] = None,
+    days: Optional[int] = 30,
+    limit: Optional[int] = None,
+    columns: str = "a.*",
+) -> List[Dict[str, Any]]:
+    """Snapshot rows for an org, best first, each with ``virality_score``
+    and ``total_count`` (rows in the window before ``limit``)."""
+    await ensure_org_snapshot(db, org_id)
+    params: Dict[str, Any] = {"org_id": org_id, "now": _now()}
+    query = f"""
+        SELECT {columns}, {VIRALITY_SQL} AS virality_score, COUNT(*) OVER () AS total_count
+        FROM crm.competitor_post_analytics a
+        WHERE a.org_id = :org_id {_window_filters(platform, days, params)}
+        ORDER BY {RANK_ORDER_SQL}
+    """
+    if limit is not None:
+        query += " LIMIT :limit"
+        params["limit"] = int(limit)
+    result = await db.execute(text(query), params)
+    return [dict(row._mapping) for row in result.fetchall()]
+
+
+async def load_top_video_per_competitor(
+    db: AsyncSession,
+    org_id: int,
+    platform: str = "instagram",
+    days: Optional[int] = 30,
+    limit: int = 5,
+) -> List[Dict[str, Any]]:
+    """Best video-like post of each of the ``limit`` largest competitors
+    that have one, ranked by competitor followers then engagement rate."""
+    await ensure_org_snapshot(db, org_id)
+    params: Dict[str, Any] = {"org_id": org_id, "now": _now(), "limit": int(limit)}
+    window = _window_filters(None, days, params)
+    params["platform"] = platform
+    result = await db.execute(
+        text(f"""
+            SELECT best.* FROM (
+                SELECT DISTINCT ON (a.competitor_id)
+                       a.post_id, a.competitor_id, {VIRALITY_SQL} AS virality_score
+                FROM crm.competitor_post_analytics a
+                WHERE a.org_id = :org_id AND a.is_video
+                  AND lower(a.platform) = lower(:platform) {window}
+                ORDER BY a.competitor_id, {RANK_ORDER_SQL}
+            ) AS best
+            JOIN crm.competitors c ON c.id = best.competitor_id
+            ORDER BY COALESCE(c.followers, 0) DESC, COALESCE(c.avg_engagement_rate, 0) DESC
+            LIMIT :limit
+        """),
+        params,
+    )
+    return [dict(row._mapping) for row in result.fetchall()]
+
+
+async def load_topic_stats(
+    db: AsyncSession,
+    org_id: int,
+    platform: Optional[str] = None,
+    days: Optional[int] = 30,
+    limit: int = 20,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Aggregate stored topic phrases over the window, best first.
+
+    Mirrors content_intel.analyze_trending_topics: a phrase needs at least
+    two occurrences and scores frequency × avg engagement × avg recency.
+    Returns (posts in window, phrase stats).
+    """
+    await ensure_org_snapshot(db, org_id)
+    params: Dict[str, Any] = {"org_id": org_id, "now": _now(), "limit": int(limit)}
+    window = _window_filters(platform, days, params)
+
+    total = await db.execute(
+        text(f"SELECT COUNT(*) FROM crm.competitor_post_analytics a WHERE a.org_id = :org_id {window}"),
+        params,
+    )
+    result = await db.execute(
+        text(f"""
+            WITH w AS (
+                SELECT a.handle, a.topic_labels, a.engagement_score,
+                       {RECENCY_WEIGHT_SQL} AS recency_weight
+                FROM crm.competitor_post_analytics a
+                WHERE a.org_id = :org_id {window}
+            )
+            SELECT p.phrase,
+                   COUNT(*) AS frequency,
+                   AVG(w.engagement_score) AS avg_engagement,
+                   AVG(w.recency_weight) AS avg_recency,
+                   COUNT(*) * AVG(w.engagement_score) * AVG(w.recency_weight) AS final_score,
+                   (ARRAY_AGG(DISTINCT COALESCE(w.handle, 'Unknown')))[1:5] AS sources
+            FROM w
+            CROSS JOIN LATERAL jsonb_array_elements_text(w.topic_labels) AS p(phrase)
+            GROUP BY p.phrase
+            HAVING COUNT(*) >= 2
+            ORDER BY final_score DESC, p.phrase
+            LIMIT :limit
+        """),
+        params,
+    )
+    stats = [
+        {**dict(row._mapping), "avg_engagement": float(row._mapping["avg_engagement"]),
+         "avg_recency": float(row._mapping["avg_recency"]), "final_score": float(row._mapping["final_score"])}
+        for row in result.fetchall()
+    ]
+    return int(total.scalar() or 0), stats
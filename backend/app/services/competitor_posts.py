@@ -0,0 +1,146 @@
+"""Bulk upsert for the crm.competitor_posts cache.
+
+A post is identified by (competitor_id, shortcode) — or its post URL when
+there is no shortcode (X posts, old rows). One ``INSERT ... SELECT FROM
+UNNEST(...) ON CONFLICT DO UPDATE`` writes a whole profile's posts:
+metrics, caption and media URLs are refreshed in place, while enrichment
+columns (transcript, comments_data, content_analysis, video_analysis,
+detected_format, index hashes) are never touched. The statement reports
+which rows were genuinely inserted so only those get classified/enriched.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Must match uq_competitor_posts_post_key (migration 0008 in app/db/migration_runner.py)
+POST_KEY_SQL = "COALESCE(NULLIF(shortcode, ''), post_url)"
+
+
+@dataclass
+class PostRow:
+    """One post to write to crm.competitor_posts."""
+    post_text: str = ""
+    likes: int = 0
+    comments: int = 0
+    shares: int = 0
+    engagement_score: float = 0.0
+    hook: str = ""
+    post_url: str = ""
+    posted_at: Optional[datetime] = None
+    media_type: Optional[str] = None
+    media_url: str = ""
+    thumbnail_url: str = ""
+    shortcode: Optional[str] = None
+
+    @property
+    def key(self) -> Optional[str]:
+        return self.shortcode or self.post_url or None
+
+
+@dataclass
+class UpsertResult:
+    new_ids: List[int] = field(default_factory=list)
+    updated_ids: List[int] = field(default_factory=list)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """posted_at is TIMESTAMP (no tz); store aware datetimes as UTC."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def upsert_competitor_posts(
+    db: AsyncSession,
+    competitor_id: int,
+    org_id: int,
+    platform: str,
+    posts: List[PostRow],
+) -> UpsertResult:
+    """Insert new posts and refresh existing ones in a single statement.
+
+    Does not commit. Raises SQLAlchemyError on failure.
+    """
+    if not posts:
+        return UpsertResult()
+
+    # A post listed twice in one batch would make ON CONFLICT touch the
+    # same row twice (an error) — keep the last copy
+    by_key: Dict[Any, PostRow] = {}
+    for i, post in enumerate(posts):
+        by_key[post.key if post.key is not None else ("no-key", i)] = post
+    rows = list(by_key.values())
+
+    result = await db.execute(
+        text(f"""
+            INSERT INTO crm.competitor_posts AS cp
+                (competitor_id, platform, org_id, post_text, likes, comments, shares,
+                 engagement_score, hook, post_url, posted_at, media_type, media_url,
+                 thumbnail_url, shortcode, fetched_at)
+            SELECT CAST(:competitor_id AS INTEGER), CAST(:platform AS VARCHAR),
+                   CAST(:org_id AS INTEGER), v.*, NOW()
+            FROM UNNEST(
+                CAST(:post_text AS TEXT[]), CAST(:likes AS INTEGER[]),
+                CAST(:comments AS INTEGER[]), CAST(:shares AS INTEGER[]),
+                CAST(:engagement_score AS DOUBLE PRECISION[]), CAST(:hook AS TEXT[]),
+                CAST(:post_url AS TEXT[]), CAST(:posted_at AS TIMESTAMP[]),
+                CAST(:media_type AS TEXT[]), CAST(:media_url AS TEXT[]),
+                CAST(:thumbnail_url AS TEXT[]), CAST(:shortcode AS TEXT[])
+            ) AS v
+            ON CONFLICT (competitor_id, ({POST_KEY_SQL})) DO UPDATE SET
+                likes = EXCLUDED.likes,
+                comments = EXCLUDED.comments,
+                shares = EXCLUDED.shares,
+                engagement_score = EXCLUDED.engagement_score,
+                post_text = EXCLUDED.post_text,
+                hook = COALESCE(NULLIF(EXCLUDED.hook, ''), cp.hook),
+                media_type = COALESCE(EXCLUDED.media_type, cp.media_type),
+                media_url = COALESCE(NULLIF(EXCLUDED.media_url, ''), cp.media_url),
+                -- Instagram CDN URLs expire: once a post is a day old, take the
+                -- fresh thumbnail along with a fresh media URL even if empty
+                thumbnail_url = CASE
+                    WHEN COALESCE(EXCLUDED.media_url, '') <> ''
+                         AND cp.media_url LIKE '%scontent%'
+                         AND cp.posted_at <= NOW() - INTERVAL '1 day'
+                    THEN EXCLUDED.thumbnail_url
+                    ELSE COALESCE(NULLIF(EXCLUDED.thumbnail_url, ''), cp.thumbnail_url)
+                END,
+                shortcode = COALESCE(NULLIF(EXCLUDED.shortcode, ''), cp.shortcode),
+                org_id = COALESCE(cp.org_id, EXCLUDED.org_id),
+                fetched_at = NOW()
+            RETURNING cp.id, (cp.xmax = 0) AS inserted
+        """),
+        {
+            "competitor_id": competitor_id,
+            "platform": platform,
+            "org_id": org_id,
+            "post_text": [p.post_text or "" for p in rows],
+            "likes": [p.likes or 0 for p in rows],
+            "comments": [p.comments or 0 for p in rows],
+            "shares": [p.shares or 0 for p in rows],
+            "engagement_score": [float(p.engagement_score or 0) for p in rows],
+            "hook": [p.hook or "" for p in rows],
+            "post_url": [p.post_url or None for p in rows],
+            "posted_at": [_naive_utc(p.posted_at) for p in rows],
+            "media_type": [p.media_type for p in rows],
+            "media_url": [p.media_url or "" for p in rows],
+            "thumbnail_url": [p.thumbnail_url or "" for p in rows],
+            "shortcode": [p.shortcode or None for p in rows],
+        },
+    )
+
+    outcome = UpsertResult()
+    for post_id, inserted in result.fetchall():
+        (outcome.new_ids if inserted else outcome.updated_ids).append(post_id)
+    logger.debug(
+        "Upserted %d posts for competitor %s (%d new)",
+        len(rows), competitor_id, len(outcome.new_ids),
+    )
+    return outcome
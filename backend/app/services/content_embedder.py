@@ -8,6 +8,8 @@ Infrastructure:
 - Embedding model: nomic-embed-text via http://10.0.0.11:11435
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -18,35 +20,29 @@ import httpx
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.embedding_client import get_embedding_client
+
 logger = logging.getLogger(__name__)
 
 QDRANT_URL = os.getenv("QDRANT_URL", "http://10.0.0.11:6333")
-FASTEMBED_URL = os.getenv("FASTEMBED_URL", "http://10.0.0.11:11435")
+EMBEDDING_MODEL = "nomic-embed-text-v1.5"
 COLLECTION_NAME = "content_recommendations"
 EMBEDDING_DIM = 768  # nomic-embed-text dimension
+UPSERT_BATCH_SIZE = 256
 
 
 async def _get_embedding(text_input: str) -> Optional[List[float]]:
-    """Get embedding vector from the embedding service."""
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{FASTEMBED_URL}/v1/embeddings",
-                json={"input": text_input[:8000], "model": "nomic-embed-text-v1.5"},
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                return data["data"][0]["embedding"]
-            else:
-                logger.warning("Embedding service returned %d: %s", resp.status_code, resp.text[:200])
-                return None
-    except Exception as e:
-        logger.error("Embedding service error: %s", e)
-        return None
+    """Get embedding vector from the embedding service (batched + cached)."""
+    return await get_embedding_client(EMBEDDING_MODEL).embed(text_input[:8000])
+
 
+async def _ensure_collection(db: AsyncSession):
+    """Create Qdrant collection if it doesn't exist.
 
-async def _ensure_collection():
-    """Create Qdrant collection if it doesn't exist."""
+    A freshly created collection is empty, so the stored index hashes no
+    longer describe anything in Qdrant; they are cleared so every post
+    is re-embedded on this run.
+    """
     try:
         async with httpx.AsyncClient(timeout=10) as client:
             # Check if exists
@@ -66,6 +62,7 @@ async def _ensure_collection():
             )
             if resp.status_code in (200, 201):
                 logger.info("Created Qdrant collection: %s", COLLECTION_NAME)
+                await _reset_index_hashes(db)
                 return True
             else:
                 logger.error("Failed to create collection: %s", resp.text[:200])
@@ -75,6 +72,17 @@ async def _ensure_collection():
         return False
 
 
+async def _reset_index_hashes(db: AsyncSession) -> None:
+    """Forget which posts are indexed (the collection was recreated)."""
+    result = await db.execute(text("""
+        UPDATE crm.competitor_posts
+        SET index_doc_hash = NULL, index_payload_hash = NULL, indexed_at = NULL
+        WHERE index_doc_hash IS NOT NULL OR index_payload_hash IS NOT NULL
+    """))
+    await db.commit()
+    logger.info("Cleared index hashes for %d posts after recreating %s", result.rowcount or 0, COLLECTION_NAME)
+
+
 def _build_document_text(post: Dict[str, Any]) -> str:
     """Build a rich text document from a post for embedding.
     
@@ -179,51 +187,77 @@ def _build_metadata(post: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _hash(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _payload_hash(metadata: Dict[str, Any]) -> str:
+    """Hash of a point's payload, ignoring the indexed_at timestamp."""
+    return _hash({k: v for k, v in metadata.items() if k != "indexed_at"})
+
+
 async def index_top_content(
     db: AsyncSession,
     min_engagement_percentile: float = 0.8,
     days: int = 90,
     limit: int = 200,
+    competitor_ids: Optional[List[int]] = None,
 ) -> Dict:
     """Index top competitor content into Qdrant for recommendations.
     
     Only indexes the top tier (default top 20%) by engagement score.
     Prefer posts with transcripts and audience intel for richer embeddings.
     
-    Returns: {indexed: int, skipped: int, errors: [str]}
+    Incremental: each post stores the hash of its embedded document and of
+    its payload. Posts whose document changed are re-embedded and upserted;
+    posts where only metrics changed get a payload-only update; the rest
+    are left alone.
+    
+    Returns: {indexed: int, payload_updated: int, unchanged: int, skipped: int, errors: [str]}
     """
-    if not await _ensure_collection():
+    if not await _ensure_collection(db):
         return {"indexed": 0, "skipped": 0, "errors": ["Failed to connect to Qdrant"]}
     
-    # Load all posts with engagement stats
+    # Rank on the narrow (id, competitor, score) columns, then load full
+    # rows only for the top posts
     cutoff = datetime.now() - timedelta(days=days)
+    competitor_filter = "AND competitor_id = ANY(:competitor_ids)" if competitor_ids else ""
+    params: Dict[str, Any] = {"cutoff": cutoff, "pct": min_engagement_percentile, "lim": limit}
+    if competitor_ids:
+        params["competitor_ids"] = list(competitor_ids)
     result = await db.execute(
-        text("""
-            SELECT cp.*, c.handle,
-                   PERCENT_RANK() OVER (
-                       PARTITION BY cp.competitor_id 
-                       ORDER BY cp.engagement_score
-                   ) as engagement_percentile
-            FROM crm.competitor_posts cp
+        text(f"""
+            WITH ranked AS (
+                SELECT id,
+                       PERCENT_RANK() OVER (
+                           PARTITION BY competitor_id
+                           ORDER BY engagement_score
+                       ) AS engagement_percentile
+                FROM crm.competitor_posts
+                WHERE (posted_at >= :cutoff OR posted_at IS NULL)
+                {competitor_filter}
+            )
+            SELECT cp.id, cp.competitor_id, cp.platform, cp.media_type, cp.shortcode,
+                   cp.post_url, cp.post_text, cp.hook, cp.transcript, cp.comments_data,
+                   cp.likes, cp.comments, cp.shares, cp.engagement_score, cp.posted_at,
+                   cp.index_doc_hash, cp.index_payload_hash, c.handle
+            FROM ranked r
+            JOIN crm.competitor_posts cp ON cp.id = r.id
             JOIN crm.competitors c ON c.id = cp.competitor_id
-            WHERE cp.posted_at >= :cutoff OR cp.posted_at IS NULL
+            WHERE r.engagement_percentile >= :pct
             ORDER BY cp.engagement_score DESC
+            LIMIT :lim
         """),
-        {"cutoff": cutoff},
+        params,
     )
-    all_posts = [dict(row._mapping) for row in result.fetchall()]
-    
-    # Filter to top percentile
-    top_posts = [
-        p for p in all_posts
-        if p.get("engagement_percentile", 0) >= min_engagement_percentile
-    ][:limit]
+    top_posts = [dict(row._mapping) for row in result.fetchall()]
     
     if not top_posts:
         return {"indexed": 0, "skipped": 0, "errors": ["No top content found to index"]}
     
-    stats = {"indexed": 0, "skipped": 0, "errors": []}
-    points = []
+    stats = {"indexed": 0, "payload_updated": 0, "unchanged": 0, "skipped": 0, "errors": []}
+    to_embed = []       # (post_id, doc_text, doc_hash, metadata, payload_hash)
+    payload_only = []   # (post_id, metadata, payload_hash)
     
     for post in top_posts:
         post_id = post.get("id")
@@ -236,49 +270,94 @@ async def index_top_content(
             stats["skipped"] += 1
             continue
         
-        embedding = await _get_embedding(doc_text)
+        metadata = _build_metadata(post)
+        doc_hash = _hash([EMBEDDING_MODEL, doc_text])
+        payload_hash = _payload_hash(metadata)
+        
+        if doc_hash != post.get("index_doc_hash"):
+            to_embed.append((post_id, doc_text, doc_hash, metadata, payload_hash))
+        elif payload_hash != post.get("index_payload_hash"):
+            payload_only.append((post_id, metadata, payload_hash))
+        else:
+            stats["unchanged"] += 1
+    
+    # Embed changed documents — the shared client batches these requests
+    # and bounds how many are in flight
+    embeddings = await asyncio.gather(*(_get_embedding(item[1]) for item in to_embed))
+    
+    points = []
+    indexed_rows = []   # (post_id, doc_hash, payload_hash) to record once sent
+    for (post_id, _, doc_hash, metadata, payload_hash), embedding in zip(to_embed, embeddings):
         if not embedding:
             stats["errors"].append(f"post {post_id}: embedding failed")
             continue
-        
-        metadata = _build_metadata(post)
-        
-        points.append({
-            "id": post_id,
-            "vector": embedding,
-            "payload": metadata,
-        })
-        
-        # Batch upsert every 20 points
-        if len(points) >= 20:
-            success = await _upsert_points(points)
-            if success:
-                stats["indexed"] += len(points)
-            else:
-                stats["errors"].append(f"batch upsert failed ({len(points)} points)")
-            points = []
+        points.append({"id": post_id, "vector": embedding, "payload": metadata})
+        indexed_rows.append((post_id, doc_hash, payload_hash))
     
-    # Flush remaining
-    if points:
-        success = await _upsert_points(points)
-        if success:
-            stats["indexed"] += len(points)
+    for i in range(0, len(points), UPSERT_BATCH_SIZE):
+        batch = points[i:i + UPSERT_BATCH_SIZE]
+        if await _upsert_points(batch):
+            stats["indexed"] += len(batch)
+            await _mark_indexed(db, indexed_rows[i:i + UPSERT_BATCH_SIZE])
         else:
-            stats["errors"].append(f"final upsert failed ({len(points)} points)")
+            stats["errors"].append(f"batch upsert failed ({len(batch)} points)")
+    
+    for i in range(0, len(payload_only), UPSERT_BATCH_SIZE):
+        batch = payload_only[i:i + UPSERT_BATCH_SIZE]
+        if await _set_payloads([(post_id, metadata) for post_id, metadata, _ in batch]):
+            stats["payload_updated"] += len(batch)
+            await _mark_indexed(db, [(post_id, None, payload_hash) for post_id, _, payload_hash in batch])
+        else:
+            stats["errors"].append(f"payload update failed ({len(batch)} points)")
+    
+    await db.commit()
     
     logger.info(
-        "Content indexing complete: %d indexed, %d skipped, %d errors",
-        stats["indexed"], stats["skipped"], len(stats["errors"])
+        "Content indexing complete: %d indexed, %d payload-only, %d unchanged, %d skipped, %d errors",
+        stats["indexed"], stats["payload_updated"], stats["unchanged"], stats["skipped"], len(stats["errors"])
     )
     return stats
 
 
+async def _mark_indexed(db: AsyncSession, rows: List[tuple]) -> None:
+    """Record the document/payload hashes Qdrant now holds for these posts.
+
+    A None doc hash leaves the stored document hash unchanged.
+    """
+    if not rows:
+        return
+    await db.execute(
+        text("""
+            UPDATE crm.competitor_posts cp
+            SET index_doc_hash = COALESCE(v.doc_hash, cp.index_doc_hash),
+                index_payload_hash = v.payload_hash,
+                indexed_at = NOW()
+            FROM (
+                SELECT UNNEST(CAST(:ids AS INTEGER[])) AS id,
+                       UNNEST(CAST(:doc_hashes AS TEXT[])) AS doc_hash,
+                       UNNEST(CAST(:payload_hashes AS TEXT[])) AS payload_hash
+            ) v
+            WHERE cp.id = v.id
+        """),
+        {
+            "ids": [r[0] for r in rows],
+            "doc_hashes": [r[1] for r in rows],
+            "payload_hashes": [r[2] for r in rows],
+        },
+    )
+
+
 async def _upsert_points(points: List[Dict]) -> bool:
-    """Upsert a batch of points into Qdrant."""
+    """Upsert a batch of points into Qdrant, waiting until the server has applied it.
+
+    Hashes are only recorded for confirmed writes, so the upsert must not
+    return before Qdrant has the points.
+    """
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(timeout=60) as client:
             resp = await client.put(
                 f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points",
+                params={"wait": "true"},
                 json={"points": points},
             )
             return resp.status_code == 200
@@ -287,6 +366,24 @@ async def _upsert_points(points: List[Dict]) -> bool:
         return False
 
 
+async def _set_payloads(updates: List[tuple]) -> bool:
+    """Replace the payload of existing points in one batch request (confirmed)."""
+    try:
+        async with httpx.AsyncClient(timeout=60) as client:
+            resp = await client.post(
+                f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points/batch",
+                params={"wait": "true"},
+                json={"operations": [
+                    {"overwrite_payload": {"payload": metadata, "points": [post_id]}}
+                    for post_id, metadata in updates
+                ]},
+            )
+            return resp.status_code == 200
+    except Exception as e:
+        logger.error("Qdrant payload update error: %s", e)
+        return False
+
+
 async def search_similar_content(
     query: str,
     platform: str = None,
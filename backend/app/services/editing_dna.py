@@ -147,16 +147,6 @@ async def _get_api_key(db: Optional[AsyncSession] = None) -> str:
     raise ValueError("Google AI Studio API key not configured. Add it in Settings.")
 
 
-async def init_editing_dna_table(db: AsyncSession):
-    """Initialize the editing_dna table if it doesn't exist."""
-    try:
-        await db.execute(text(EDITING_DNA_DDL))
-        await db.commit()
-        logger.info("Editing DNA table initialized")
-    except Exception as e:
-        logger.warning(f"Error initializing editing DNA table: {e}")
-        await db.rollback()
-
 # ═══════════════════════════════════════════════════════════════════════
 # CORE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════
@@ -0,0 +1,216 @@
+"""Streaming enrichment pipeline for competitor posts.
+
+Replaces the old "loop competitors → loop posts → download → transcribe →
+UPDATE → commit" sequence with stages connected by bounded queues:
+
+    candidates ──► download workers ──► transcribe workers ──► UPDATE
+    candidates ──► comment workers (scrape + analyze) ──────► UPDATE
+
+Each worker opens its own short-lived DB session per write, so no session
+is shared across concurrent tasks, and each stage has its own parallelism
+(env-configurable). The download → transcribe queue is bounded so
+downloads can't run far ahead of Whisper and fill the shared temp dir.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.db.crm_db import crm_session
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_WORKERS = int(os.getenv("ENRICH_DOWNLOAD_WORKERS", "4"))
+TRANSCRIBE_WORKERS = int(os.getenv("ENRICH_TRANSCRIBE_WORKERS", "2"))
+COMMENT_WORKERS = int(os.getenv("ENRICH_COMMENT_WORKERS", "2"))
+# Max downloaded-but-not-yet-transcribed videos held on disk
+DOWNLOAD_BUFFER = int(os.getenv("ENRICH_DOWNLOAD_BUFFER", "4"))
+
+_DONE = object()
+
+
+async def _update_post(sql: str, params: Dict[str, Any]) -> None:
+    """Run one UPDATE in its own session (workers never share a session)."""
+    async with crm_session() as db:
+        await db.execute(text(sql), params)
+        await db.commit()
+
+
+async def _load_candidates(sql: str, competitor_ids: List[int], limit: int) -> List[Any]:
+    async with crm_session() as db:
+        result = await db.execute(text(sql), {"ids": competitor_ids, "lim": limit})
+        return result.fetchall()
+
+
+async def _drain(queue: asyncio.Queue, worker, count: int) -> None:
+    """Run ``count`` workers over ``queue`` until each sees the sentinel."""
+    for _ in range(count):
+        await queue.put(_DONE)
+    await asyncio.gather(*(worker() for _ in range(count)))
+
+
+# ── Transcription ────────────────────────────────────────────────────
+
+async def run_transcription_pipeline(
+    competitor_ids: List[int],
+    limit_per_competitor: int = 10,
+    download_workers: Optional[int] = None,
+    transcribe_workers: Optional[int] = None,
+) -> Dict[str, int]:
+    """Download + transcribe untranscribed videos across competitors concurrently.
+
+    Returns: {transcribed: int, failed: int, total_processed: int}
+    """
+    from app.services.video_transcriber import _download_video, transcribe_downloaded_video
+
+    download_workers = download_workers or DOWNLOAD_WORKERS
+    transcribe_workers = transcribe_workers or TRANSCRIBE_WORKERS
+    totals = {"transcribed": 0, "failed": 0, "total_processed": 0}
+
+    posts = await _load_candidates(
+        """
+        SELECT id, shortcode, media_url FROM (
+            SELECT id, shortcode, media_url,
+                   ROW_NUMBER() OVER (PARTITION BY competitor_id ORDER BY engagement_score DESC) AS rn
+            FROM crm.competitor_posts
+            WHERE competitor_id = ANY(:ids)
+              AND media_type IN ('video', 'reel')
+              AND transcript IS NULL
+              AND shortcode IS NOT NULL
+        ) ranked
+        WHERE rn <= :lim
+        """,
+        competitor_ids,
+        limit_per_competitor,
+    )
+    if not posts:
+        return totals
+
+    download_q: asyncio.Queue = asyncio.Queue()
+    transcribe_q: asyncio.Queue = asyncio.Queue(maxsize=DOWNLOAD_BUFFER)
+    for post in posts:
+        download_q.put_nowait(post)
+
+    async def downloader():
+        while True:
+            item = await download_q.get()
+            if item is _DONE:
+                return
+            post_id, shortcode, media_url = item
+            totals["total_processed"] += 1
+            try:
+                video_path = await _download_video(shortcode, media_url or "")
+            except Exception as e:
+                logger.warning("Download failed for %s: %s", shortcode, e)
+                video_path = None
+            if video_path is None:
+                totals["failed"] += 1
+                continue
+            await transcribe_q.put((post_id, shortcode, video_path))
+
+    async def transcriber():
+        while True:
+            item = await transcribe_q.get()
+            if item is _DONE:
+                return
+            post_id, shortcode, video_path = item
+            try:
+                segments = await transcribe_downloaded_video(video_path, shortcode)
+                if segments:
+                    await _update_post(
+                        "UPDATE crm.competitor_posts SET transcript = :t WHERE id = :id",
+                        {"t": json.dumps(segments), "id": post_id},
+                    )
+                    totals["transcribed"] += 1
+                else:
+                    totals["failed"] += 1
+            except Exception as e:
+                logger.warning("Transcription failed for %s: %s", shortcode, e)
+                totals["failed"] += 1
+            finally:
+                if video_path.exists():
+                    video_path.unlink()
+
+    transcribers = [asyncio.create_task(transcriber()) for _ in range(transcribe_workers)]
+    try:
+        await _drain(download_q, downloader, download_workers)
+        for _ in range(transcribe_workers):
+            await transcribe_q.put(_DONE)
+        await asyncio.gather(*transcribers)
+    finally:
+        for task in transcribers:
+            task.cancel()
+
+    logger.info("Transcription pipeline done for %d competitors: %s", len(competitor_ids), totals)
+    return totals
+
+
+# ── Comments ─────────────────────────────────────────────────────────
+
+async def run_comment_pipeline(
+    competitor_ids: List[int],
+    top_n_per_competitor: int = 15,
+    comments_per_post: int = 50,
+    workers: Optional[int] = None,
+) -> Dict[str, int]:
+    """Scrape + analyze comment threads on top posts across competitors concurrently.
+
+    Raw comment text is never persisted — only the analysis.
+    Returns: {analyzed: int, processed: int}
+    """
+    from app.services.comment_scraper import scrape_and_analyze_post_comments
+
+    workers = workers or COMMENT_WORKERS
+    totals = {"analyzed": 0, "processed": 0}
+
+    posts = await _load_candidates(
+        """
+        SELECT id, shortcode, post_text FROM (
+            SELECT id, shortcode, post_text,
+                   ROW_NUMBER() OVER (PARTITION BY competitor_id ORDER BY engagement_score DESC) AS rn
+            FROM crm.competitor_posts
+            WHERE competitor_id = ANY(:ids)
+              AND comments_data IS NULL
+              AND shortcode IS NOT NULL
+              AND comments > 5
+        ) ranked
+        WHERE rn <= :lim
+        """,
+        competitor_ids,
+        top_n_per_competitor,
+    )
+    if not posts:
+        return totals
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for post in posts:
+        queue.put_nowait(post)
+
+    async def commenter():
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            post_id, shortcode, post_caption = item
+            totals["processed"] += 1
+            try:
+                analysis = await scrape_and_analyze_post_comments(shortcode, post_caption, comments_per_post)
+                await _update_post(
+                    "UPDATE crm.competitor_posts SET comments_data = :c WHERE id = :id",
+                    {"c": json.dumps(analysis), "id": post_id},
+                )
+                totals["analyzed"] += 1
+            except Exception as e:
+                logger.error("Comment analysis failed for %s: %s", shortcode, e)
+            # Random delay per worker to avoid Instagram rate limiting
+            await asyncio.sleep(random.uniform(2, 5))
+
+    await _drain(queue, commenter, workers)
+
+    logger.info("Comment pipeline done for %d competitors: %s", len(competitor_ids), totals)
+    return totals
@@ -2,11 +2,12 @@
 Garage S3 utilities for War Room
 """
 import os
-import boto3
 from botocore.exceptions import ClientError
 from datetime import datetime, timedelta
 import logging
 
+from app.services.s3_media import get_s3_client, presigned_get_url
+
 logger = logging.getLogger(__name__)
 
 # Garage S3 configuration
@@ -19,17 +20,16 @@ GARAGE_CONFIG = {
 }
 
 def create_s3_client():
-    """Create S3 client for Garage."""
-    return boto3.client(
-        's3',
-        endpoint_url=GARAGE_CONFIG["endpoint_url"],
-        aws_access_key_id=GARAGE_CONFIG["access_key_id"],
-        aws_secret_access_key=GARAGE_CONFIG["secret_access_key"],
-        region_name=GARAGE_CONFIG["region_name"],
+    """Shared (pooled) S3 client for Garage."""
+    return get_s3_client(
+        GARAGE_CONFIG["endpoint_url"],
+        GARAGE_CONFIG["access_key_id"],
+        GARAGE_CONFIG["secret_access_key"],
+        GARAGE_CONFIG["region_name"],
     )
 
 def generate_signed_url(s3_key: str, expiration: int = 3600) -> str:
-    """Generate a signed URL for accessing S3 objects.
+    """Generate a signed URL for accessing S3 objects (cached while fresh).
     
     Args:
         s3_key: The S3 object key (path)
@@ -39,19 +39,10 @@ def generate_signed_url(s3_key: str, expiration: int = 3600) -> str:
         Signed URL string
     """
     try:
-        s3_client = create_s3_client()
-        
-        response = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': GARAGE_CONFIG["bucket"],
-                'Key': s3_key
-            },
-            ExpiresIn=expiration
+        return presigned_get_url(
+            create_s3_client(), GARAGE_CONFIG["bucket"], s3_key, expires_in=expiration
         )
         
-        return response
-        
     except ClientError as e:
         logger.error(f"Error generating signed URL for {s3_key}: {e}")
         return None
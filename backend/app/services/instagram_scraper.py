@@ -9,6 +9,10 @@ Uses Playwright to:
 4. Extract profile data + recent posts with full engagement metrics
 5. Auto re-login when Instagram invalidates the session
 
+Browsers are pooled (see browser_pool.py): one Chromium per process and one
+authenticated context per scraping account, so each profile scrape costs a
+page navigation rather than a browser cold start plus a login check.
+
 Works on public AND login-walled profiles thanks to authenticated sessions.
 """
 
@@ -348,24 +352,31 @@ def _parse_media_items(items: List[Dict]) -> List[ScrapedPost]:
     return posts
 
 
-async def _load_cookies() -> Optional[List[Dict]]:
+def _cookie_path(account_id: Optional[int] = None) -> Path:
+    """Cookie file for a scraping account (the shared file when account_id is None)."""
+    if account_id is None:
+        return COOKIE_PATH
+    return COOKIE_PATH.with_name(f"{COOKIE_PATH.stem}_{account_id}{COOKIE_PATH.suffix}")
+
+
+async def _load_cookies(path: Path = COOKIE_PATH) -> Optional[List[Dict]]:
     """Load saved cookies from disk."""
-    if COOKIE_PATH.exists():
+    if path.exists():
         try:
-            cookies = json.loads(COOKIE_PATH.read_text())
+            cookies = json.loads(path.read_text())
             if isinstance(cookies, list) and len(cookies) > 0:
-                logger.info("Loaded %d cookies from %s", len(cookies), COOKIE_PATH)
+                logger.info("Loaded %d cookies from %s", len(cookies), path)
                 return cookies
         except (json.JSONDecodeError, IOError) as e:
             logger.warning("Failed to load cookies: %s", e)
     return None
 
 
-async def _save_cookies(cookies: List[Dict]) -> None:
+async def _save_cookies(cookies: List[Dict], path: Path = COOKIE_PATH) -> None:
     """Save cookies to disk for reuse."""
-    COOKIE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    COOKIE_PATH.write_text(json.dumps(cookies, indent=2))
-    logger.info("Saved %d cookies to %s", len(cookies), COOKIE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cookies, indent=2))
+    logger.info("Saved %d cookies to %s", len(cookies), path)
 
 
 async def _has_valid_session(context) -> bool:
@@ -389,15 +400,20 @@ async def _has_valid_session(context) -> bool:
         await page.close()
 
 
-async def _login_to_instagram(context) -> bool:
+async def _login_to_instagram(context, account: Optional[Dict[str, Any]] = None) -> bool:
     """Login to Instagram and save session cookies.
     
-    Uses the new multi-account system with fallback to legacy settings.
+    Logs in as ``account`` when given (a dict from InstagramAccountManager),
+    otherwise uses the new multi-account system with fallback to legacy settings.
     """
     from app.services.instagram_account_manager import get_instagram_credentials_for_scraping, mark_instagram_account_used
     
-    # Get credentials from the account manager (handles env vars, social accounts, and legacy settings)
-    username, password, totp_secret, account_id = await get_instagram_credentials_for_scraping()
+    if account:
+        username, password = account.get("username"), account.get("password")
+        totp_secret, account_id = account.get("totp_secret"), account.get("id")
+    else:
+        # Get credentials from the account manager (handles env vars, social accounts, and legacy settings)
+        username, password, totp_secret, account_id = await get_instagram_credentials_for_scraping()
     logger.warning("SCRAPER_LOGIN: Credentials loaded, username=@%s, has_totp=%s, source=%s", username, bool(totp_secret), "db" if account_id else "env")
     
     if not username or not password:
@@ -590,8 +606,10 @@ async def _login_to_instagram(context) -> bool:
             await page.close()
             return False
         
-        # Save cookies
+        # Save cookies (per-account file + the shared file yt-dlp reads)
         cookies = await context.cookies()
+        if account:
+            await _save_cookies(cookies, _cookie_path(account_id))
         await _save_cookies(cookies)
         logger.warning("SCRAPER_LOGIN: Success, %d cookies saved", len(cookies))
         logger.info("Successfully logged in to Instagram as @%s", username)
@@ -617,9 +635,12 @@ async def _login_to_instagram(context) -> bool:
         return False
 
 
-async def _get_authenticated_context(browser):
+async def _get_authenticated_context(browser, account: Optional[Dict[str, Any]] = None):
     """Get a browser context with valid Instagram session cookies.
     
+    ``account`` selects a specific scraping account (its own cookie file);
+    without it the shared session is used.
+    
     Flow:
     1. Try loading saved cookies
     2. If cookies exist, validate them
@@ -637,8 +658,9 @@ async def _get_authenticated_context(browser):
     )
     
     # Try loading saved cookies
-    saved_cookies = await _load_cookies()
-    logger.warning("SCRAPER_AUTH: Cookie file exists=%s at %s", COOKIE_PATH.exists(), COOKIE_PATH)
+    cookie_path = _cookie_path(account["id"]) if account else COOKIE_PATH
+    saved_cookies = await _load_cookies(cookie_path)
+    logger.warning("SCRAPER_AUTH: Cookie file exists=%s at %s", cookie_path.exists(), cookie_path)
     if saved_cookies:
         await context.add_cookies(saved_cookies)
         if await _has_valid_session(context):
@@ -650,7 +672,7 @@ async def _get_authenticated_context(browser):
     
     # Login fresh
     logger.warning("SCRAPER_AUTH: Starting fresh login")
-    logged_in = await _login_to_instagram(context)
+    logged_in = await _login_to_instagram(context, account)
     logger.warning("SCRAPER_AUTH: Login result=%s", logged_in)
     if not logged_in:
         logger.warning("Proceeding without authentication — login-walled profiles will fail")
@@ -658,18 +680,80 @@ async def _get_authenticated_context(browser):
     return context
 
 
-async def scrape_profile(handle: str) -> ScrapedProfile:
+# ── Browser pool ─────────────────────────────────────────────────────
+
+DEFAULT_ACCOUNT_KEY = "default"
+
+_browser_pool = None
+_scraping_accounts: Dict[str, Dict[str, Any]] = {}
+
+
+async def _create_pool_context(browser, account_key: str):
+    """Context factory for the browser pool: one authenticated context per account."""
+    return await _get_authenticated_context(browser, _scraping_accounts.get(account_key))
+
+
+async def _persist_pool_cookies(context, account_key: str) -> None:
+    """Save a context's cookies before the pool recycles it."""
+    account = _scraping_accounts.get(account_key)
+    cookies = await context.cookies(["https://www.instagram.com"])
+    if cookies:
+        await _save_cookies(cookies, _cookie_path(account["id"]) if account else COOKIE_PATH)
+
+
+def get_browser_pool():
+    """Return the process-wide browser pool, creating it on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        from app.services.browser_pool import BrowserPool
+        _browser_pool = BrowserPool(_create_pool_context, on_recycle=_persist_pool_cookies)
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Close the pooled Chromium instance (app shutdown)."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
+
+
+async def get_scraping_account_keys() -> List[str]:
+    """Pool keys for every active scraping account (falls back to the shared session)."""
+    try:
+        from app.db.crm_db import crm_session
+        from app.services.instagram_account_manager import InstagramAccountManager
+        from sqlalchemy import text
+
+        async with crm_session() as db:
+            await db.execute(text("SET search_path TO crm, public"))
+            accounts = await InstagramAccountManager(db).get_all_accounts("scraping")
+    except Exception as e:
+        logger.warning("Could not load scraping accounts, using shared session: %s", e)
+        accounts = []
+
+    keys = []
+    for account in accounts:
+        if account.get("password"):
+            key = f"account-{account['id']}"
+            _scraping_accounts[key] = account
+            keys.append(key)
+    return keys or [DEFAULT_ACCOUNT_KEY]
+
+
+async def scrape_profile(handle: str, account_key: str = DEFAULT_ACCOUNT_KEY) -> ScrapedProfile:
     """Scrape a public Instagram profile using Playwright.
     
-    Launches headless Chromium, navigates to the profile page, and intercepts
-    the GraphQL/API responses that Instagram makes internally to load profile data.
+    Checks out a pooled page in ``account_key``'s authenticated context,
+    navigates to the profile page, and intercepts the GraphQL/API responses
+    that Instagram makes internally to load profile data.
     """
     handle = handle.strip().lstrip("@").lower()
     logger.warning("SCRAPER_PROFILE: Starting scrape for @%s", handle)
     profile = ScrapedProfile(handle=handle, scraped_at=datetime.now())
 
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         profile.error = "Playwright not installed. Run: pip install playwright && playwright install chromium"
         return profile
@@ -728,59 +812,43 @@ async def scrape_profile(handle: str) -> ScrapedProfile:
             pass
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                ],
-            )
-            logger.warning("SCRAPER_PROFILE: Browser launched")
-
-            # Use authenticated context (loads cookies or logs in)
-            context = await _get_authenticated_context(browser)
-            logger.warning("SCRAPER_PROFILE: Auth context ready")
-
-            page = await context.new_page()
+        async with get_browser_pool().page(account_key) as page:
+            logger.warning("SCRAPER_PROFILE: Pooled page ready (account %s)", account_key)
             page.on("response", intercept_response)
-
-            # Navigate to profile
-            url = f"https://www.instagram.com/{handle}/"
-            logger.info("Navigating to %s", url)
-
-            resp = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            logger.warning("SCRAPER_PROFILE: Profile page loaded, status=%s", resp.status if resp else "none")
-
-            if resp and resp.status == 404:
-                profile.error = "Profile not found (404)"
-                await browser.close()
-                return profile
-
-            # Wait for profile content to render
-            # Try waiting for specific selectors that indicate data has loaded
             try:
-                await page.wait_for_selector(
-                    'header section, [data-testid="user-avatar"], meta[property="og:title"]',
-                    timeout=15000,
-                )
-            except Exception:
-                logger.debug("Timeout waiting for header section, continuing...")
-
-            # Give extra time for API calls to complete
-            await asyncio.sleep(3)
-            logger.warning("SCRAPER_PROFILE: Data captured: %s", list(captured_data.keys()))
-
-            # If network interception didn't capture data, try extracting from DOM
-            if "user" not in captured_data and "user_v1" not in captured_data:
-                logger.info("No API data intercepted, trying DOM extraction...")
-                dom_data = await _extract_from_dom(page, handle)
-                if dom_data:
-                    captured_data["dom"] = dom_data
-
-            await browser.close()
+                # Navigate to profile
+                url = f"https://www.instagram.com/{handle}/"
+                logger.info("Navigating to %s", url)
+
+                resp = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                logger.warning("SCRAPER_PROFILE: Profile page loaded, status=%s", resp.status if resp else "none")
+
+                if resp and resp.status == 404:
+                    profile.error = "Profile not found (404)"
+                    return profile
+
+                # Wait for profile content to render
+                # Try waiting for specific selectors that indicate data has loaded
+                try:
+                    await page.wait_for_selector(
+                        'header section, [data-testid="user-avatar"], meta[property="og:title"]',
+                        timeout=15000,
+                    )
+                except Exception:
+                    logger.debug("Timeout waiting for header section, continuing...")
+
+                # Give extra time for API calls to complete
+                await asyncio.sleep(3)
+                logger.warning("SCRAPER_PROFILE: Data captured: %s", list(captured_data.keys()))
+
+                # If network interception didn't capture data, try extracting from DOM
+                if "user" not in captured_data and "user_v1" not in captured_data:
+                    logger.info("No API data intercepted, trying DOM extraction...")
+                    dom_data = await _extract_from_dom(page, handle)
+                    if dom_data:
+                        captured_data["dom"] = dom_data
+            finally:
+                page.remove_listener("response", intercept_response)
 
     except Exception as e:
         profile.error = f"Browser error: {str(e)}"
@@ -985,30 +1053,41 @@ async def scrape_multiple(
 ) -> List[ScrapedProfile]:
     """Scrape multiple profiles with random delays between requests.
     
-    Shares a single authenticated browser session across all profiles
-    to avoid multiple logins.
+    Handles are spread round-robin across the scraping accounts. Each
+    account works through its share sequentially (with the random delay)
+    on its own pooled context, and accounts run concurrently.
     """
-    results = []
-    for i, handle in enumerate(handles):
-        logger.info("Scraping @%s (%d/%d)", handle, i + 1, len(handles))
-        profile = await scrape_profile(handle)
-        results.append(profile)
+    account_keys = await get_scraping_account_keys()
+    results: List[Optional[ScrapedProfile]] = [None] * len(handles)
 
-        if profile.error:
-            logger.warning("@%s: %s", handle, profile.error)
-        else:
-            logger.info(
-                "@%s: %s followers, %s posts scraped",
-                handle,
-                profile.followers,
-                len(profile.posts),
-            )
+    async def _run_account(account_key: str, indexed: List[tuple]) -> None:
+        for n, (i, handle) in enumerate(indexed):
+            logger.info("Scraping @%s (%d/%d) via %s", handle, i + 1, len(handles), account_key)
+            profile = await scrape_profile(handle, account_key)
+            results[i] = profile
 
-        if i < len(handles) - 1:
-            delay = random.uniform(*delay_range)
-            logger.debug("Waiting %.1fs before next request...", delay)
-            await asyncio.sleep(delay)
+            if profile.error:
+                logger.warning("@%s: %s", handle, profile.error)
+            else:
+                logger.info(
+                    "@%s: %s followers, %s posts scraped",
+                    handle,
+                    profile.followers,
+                    len(profile.posts),
+                )
+
+            if n < len(indexed) - 1:
+                delay = random.uniform(*delay_range)
+                logger.debug("Waiting %.1fs before next request...", delay)
+                await asyncio.sleep(delay)
+
+    assignments: Dict[str, List[tuple]] = {key: [] for key in account_keys}
+    for i, handle in enumerate(handles):
+        assignments[account_keys[i % len(account_keys)]].append((i, handle))
 
+    await asyncio.gather(*(
+        _run_account(key, indexed) for key, indexed in assignments.items() if indexed
+    ))
     return results
 
 
@@ -1022,19 +1101,15 @@ async def force_relogin() -> bool:
         logger.info("Cleared saved Instagram cookies")
     
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         return False
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-        )
-        context = await _get_authenticated_context(browser)
-        is_valid = await _has_valid_session(context)
-        await browser.close()
-        return is_valid
+    # Rebuild the shared-session context from scratch (fresh login)
+    pool = get_browser_pool()
+    await pool.reset(DEFAULT_ACCOUNT_KEY)
+    async with pool.page(DEFAULT_ACCOUNT_KEY) as page:
+        return await _has_valid_session(page.context)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1046,66 +1121,55 @@ async def follow_instagram_user(handle: str) -> Dict[str, Any]:
     
     Returns: {"success": bool, "message": str, "user_id": str|None}
     """
-    from playwright.async_api import async_playwright
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
-        )
-        context = await _get_authenticated_context(browser)
-        page = await context.new_page()
-        
+    async with get_browser_pool().page(DEFAULT_ACCOUNT_KEY) as page:
         try:
             # Navigate to the profile
             clean_handle = handle.lstrip("@")
             await page.goto(f"https://www.instagram.com/{clean_handle}/", wait_until="domcontentloaded", timeout=15000)
             await asyncio.sleep(3)
-            
+        
             # Check if already following
             follow_btn = await page.query_selector('button:has-text("Follow")')
             following_btn = await page.query_selector('button:has-text("Following")')
             requested_btn = await page.query_selector('button:has-text("Requested")')
-            
+        
             if following_btn:
                 logger.info("Already following @%s", clean_handle)
                 return {"success": True, "message": f"Already following @{clean_handle}", "already_following": True}
-            
+        
             if requested_btn:
                 logger.info("Follow request already pending for @%s", clean_handle)
                 return {"success": True, "message": f"Follow request pending for @{clean_handle}", "already_following": True}
-            
+        
             if not follow_btn:
                 logger.warning("No follow button found for @%s", clean_handle)
                 return {"success": False, "message": f"Could not find follow button for @{clean_handle}"}
-            
+        
             # Click follow
             await follow_btn.click()
             await asyncio.sleep(2)
-            
+        
             # Verify follow worked
             following_after = await page.query_selector('button:has-text("Following")')
             requested_after = await page.query_selector('button:has-text("Requested")')
-            
+        
             if following_after:
                 logger.info("Successfully followed @%s", clean_handle)
                 # Save cookies to preserve session
-                cookies = await context.cookies(["https://www.instagram.com"])
+                cookies = await page.context.cookies(["https://www.instagram.com"])
                 await _save_cookies(cookies)
                 return {"success": True, "message": f"Now following @{clean_handle}"}
             elif requested_after:
                 logger.info("Follow request sent to @%s (private account)", clean_handle)
-                cookies = await context.cookies(["https://www.instagram.com"])
+                cookies = await page.context.cookies(["https://www.instagram.com"])
                 await _save_cookies(cookies)
                 return {"success": True, "message": f"Follow request sent to @{clean_handle} (private account)"}
             else:
                 return {"success": False, "message": f"Follow click didn't register for @{clean_handle}"}
-                
+            
         except Exception as e:
             logger.error("Failed to follow @%s: %s", handle, e)
             return {"success": False, "message": f"Error following @{handle}: {str(e)[:100]}"}
-        finally:
-            await browser.close()
 
 
 async def follow_multiple_users(handles: List[str], delay_between: float = 5.0) -> List[Dict[str, Any]]:
@@ -20,16 +20,14 @@ from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 
-import httpx
 import numpy as np
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.embedding_client import embed_text, embed_texts
+
 logger = logging.getLogger(__name__)
 
-# FastEmbed endpoint configuration
-FASTEMBED_URL = "http://10.0.0.11:11435/api/embed"
-FASTEMBED_TIMEOUT = 30.0
 
 class IntentType(Enum):
     """Comment intent categories for audience intelligence."""
@@ -119,19 +117,8 @@ TOPIC_WEIGHT_MULTIPLIERS = {
 
 
 async def get_embedding(text: str) -> Optional[List[float]]:
-    """Get embedding from FastEmbed service."""
-    try:
-        async with httpx.AsyncClient(timeout=FASTEMBED_TIMEOUT) as client:
-            response = await client.post(
-                FASTEMBED_URL,
-                json={"text": text}
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("embedding")
-    except Exception as e:
-        logger.error(f"FastEmbed error: {e}")
-        return None
+    """Get embedding from FastEmbed service (batched + cached)."""
+    return await embed_text(text)
 
 
 def calculate_cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -175,35 +162,78 @@ def classify_comment_intent_local(comment_text: str, theme: str = "") -> List[Tu
     return results
 
 
-async def classify_comment_intent_semantic(comment_text: str, context_text: str = "") -> List[Tuple[IntentType, float]]:
-    """Classify comment intent using semantic embeddings when patterns fail."""
-    
-    # Intent reference texts for embedding comparison
-    intent_references = {
-        IntentType.UTILITY_SAVE: "I want to save this for later use",
-        IntentType.IDENTITY_SHARE: "This represents me and I want to share it with others",
-        IntentType.CURIOSITY_GAP: "I have questions and want to learn more about this",
-        IntentType.FRICTION_POINT: "I am confused and need help understanding",
-        IntentType.SOCIAL_PROOF: "I completely agree with this statement",
-        IntentType.TOPIC_RELEVANCE: context_text if context_text else "This is relevant to the topic"
-    }
-    
-    # Get embedding for the comment
-    comment_embedding = await get_embedding(comment_text)
-    if not comment_embedding:
+# Intent reference texts for embedding comparison. TOPIC_RELEVANCE is
+# compared against the post's own context when one is available.
+INTENT_REFERENCE_TEXTS = {
+    IntentType.UTILITY_SAVE: "I want to save this for later use",
+    IntentType.IDENTITY_SHARE: "This represents me and I want to share it with others",
+    IntentType.CURIOSITY_GAP: "I have questions and want to learn more about this",
+    IntentType.FRICTION_POINT: "I am confused and need help understanding",
+    IntentType.SOCIAL_PROOF: "I completely agree with this statement",
+    IntentType.TOPIC_RELEVANCE: "This is relevant to the topic",
+}
+SEMANTIC_INTENT_ORDER = list(INTENT_REFERENCE_TEXTS)
+SEMANTIC_THRESHOLD = 0.7  # High confidence threshold
+
+# Unit-normalized reference embeddings, computed once per process
+_reference_matrix: Optional[np.ndarray] = None
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+async def get_reference_matrix() -> Optional[np.ndarray]:
+    """Reference embeddings for every intent, in ``SEMANTIC_INTENT_ORDER``."""
+    global _reference_matrix
+    if _reference_matrix is None:
+        embeddings = await embed_texts([INTENT_REFERENCE_TEXTS[i] for i in SEMANTIC_INTENT_ORDER])
+        if embeddings is None:
+            return None
+        _reference_matrix = _normalize_rows(embeddings)
+    return _reference_matrix
+
+
+async def classify_intents_semantic_batch(
+    comment_texts: List[str], context_text: str = ""
+) -> List[List[Tuple[IntentType, float]]]:
+    """Classify many comments against the intent references in one pass.
+
+    One embedding request covers every comment (plus the post context),
+    and all similarities come from a single matrix product.
+    """
+    if not comment_texts:
         return []
-    
+
+    references = await get_reference_matrix()
+    embeddings = await embed_texts(comment_texts + ([context_text] if context_text else []))
+    if references is None or embeddings is None:
+        return [[] for _ in comment_texts]
+
+    embeddings = _normalize_rows(embeddings)
+    if context_text:
+        references = references.copy()
+        references[SEMANTIC_INTENT_ORDER.index(IntentType.TOPIC_RELEVANCE)] = embeddings[-1]
+        embeddings = embeddings[:-1]
+
+    similarities = embeddings @ references.T  # (comments, intents)
     results = []
-    for intent_type, reference_text in intent_references.items():
-        reference_embedding = await get_embedding(reference_text)
-        if reference_embedding:
-            similarity = calculate_cosine_similarity(comment_embedding, reference_embedding)
-            if similarity > 0.7:  # High confidence threshold
-                results.append((intent_type, similarity))
-    
+    for row in similarities:
+        results.append([
+            (SEMANTIC_INTENT_ORDER[j], float(row[j]))
+            for j in np.flatnonzero(row > SEMANTIC_THRESHOLD)
+        ])
     return results
 
 
+async def classify_comment_intent_semantic(comment_text: str, context_text: str = "") -> List[Tuple[IntentType, float]]:
+    """Classify comment intent using semantic embeddings when patterns fail."""
+    results = await classify_intents_semantic_batch([comment_text], context_text)
+    return results[0]
+
+
 def calculate_topic_relevance(comment_themes: List[str], post_content: str) -> float:
     """Calculate topic relevance between comment themes and post content."""
     if not comment_themes or not post_content:
@@ -265,6 +295,19 @@ async def classify_post_intents(
     intent_scores = defaultdict(float)
     intent_evidence = defaultdict(list)
     
+    # Themes with no local pattern match go to the semantic classifier,
+    # all in one batch for the post
+    context = f"{post_content} {hook_text}".strip()
+    semantic_candidates = [
+        t["theme"] for t in themes
+        if isinstance(t, dict) and "theme" in t
+        and not classify_comment_intent_local(t["theme"]) and len(t["theme"].split()) > 2
+    ]
+    semantic_by_theme = dict(zip(
+        semantic_candidates,
+        await classify_intents_semantic_batch(semantic_candidates, context),
+    ))
+
     # Classify themes
     for theme_data in themes:
         if isinstance(theme_data, dict) and "theme" in theme_data:
@@ -285,8 +328,7 @@ async def classify_post_intents(
             
             # If no local match, try semantic
             if not local_results and len(theme.split()) > 2:
-                context = f"{post_content} {hook_text}".strip()
-                semantic_results = await classify_comment_intent_semantic(theme, context)
+                semantic_results = semantic_by_theme.get(theme, [])
                 for intent_type, confidence in semantic_results:
                     weight = count * confidence * 0.8  # Slightly lower weight for semantic
                     intent_scores[intent_type.value] += weight
@@ -451,6 +493,87 @@ def calculate_intent_scores(metrics: Dict, classified_comments: Dict) -> Dict[st
     }
 
 
+POST_COLUMNS = """
+    id, likes, comments, shares, comments_data, content_analysis,
+    hook, post_text, platform
+"""
+
+# Posts classified concurrently per batch; their embedding calls are
+# coalesced by the shared embedding client
+CLASSIFY_BATCH_SIZE = 25
+
+
+async def _classify_post_row(post_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Classify one fetched post row (no DB access).
+
+    Returns the result dict, with the updated ``content_analysis`` under
+    ``"analysis"``, or a dict with ``"error"``.
+    """
+    # Extract metrics
+    metrics = {
+        "likes": post_data["likes"] or 0,
+        "comments": post_data["comments"] or 0, 
+        "shares": post_data["shares"] or 0
+    }
+    
+    # Get comment analysis
+    comments_analysis = post_data["comments_data"] or {}
+    post_content = f"{post_data.get('hook', '')} {post_data.get('post_text', '')}".strip()
+    
+    # Classify intents
+    classified_comments = await classify_post_intents(
+        comments_analysis,
+        post_content,
+        post_data.get("hook", "")
+    )
+    
+    if "error" in classified_comments:
+        return classified_comments
+    
+    # Calculate scores
+    scores = calculate_intent_scores(metrics, classified_comments)
+    
+    # Prepare content analysis update
+    current_analysis = post_data.get("content_analysis") or {}
+    current_analysis["intent_classification"] = {
+        "classified_at": "2026-03-25T12:00:00Z",  # Current timestamp
+        "intent_scores": classified_comments["intent_scores"],
+        "power_score": scores["power_score"],
+        "dominant_intent": scores["dominant_intent"],
+        "action_priority": scores["action_priority"],
+        "should_generate_cdr": scores["should_generate_cdr"],
+        "breakdown": scores["breakdown"],
+        "engagement_quality": scores["engagement_quality"]
+    }
+    
+    return {
+        "post_id": post_data["id"],
+        "platform": post_data["platform"],
+        "metrics": metrics,
+        "classification": classified_comments,
+        "scores": scores,
+        "analysis": current_analysis,
+    }
+
+
+async def _save_post_classification(db: AsyncSession, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Write a classification's content_analysis back and commit."""
+    update_query = text("""
+        UPDATE crm.competitor_posts 
+        SET content_analysis = :analysis
+        WHERE id = :post_id
+    """)
+    
+    await db.execute(update_query, {
+        "post_id": result["post_id"],
+        "analysis": json.dumps(result.pop("analysis"))
+    })
+    
+    await db.commit()
+    result["updated"] = True
+    return result
+
+
 async def process_post_intent_classification(
     db: AsyncSession,
     post_id: int
@@ -461,9 +584,8 @@ async def process_post_intent_classification(
     """
     try:
         # Fetch post data
-        query = text("""
-            SELECT id, likes, comments, shares, comments_data, content_analysis,
-                   hook, post_text, platform
+        query = text(f"""
+            SELECT {POST_COLUMNS}
             FROM crm.competitor_posts 
             WHERE id = :post_id
         """)
@@ -474,67 +596,11 @@ async def process_post_intent_classification(
         if not row:
             return {"error": f"Post {post_id} not found"}
         
-        post_data = row._asdict()
-        
-        # Extract metrics
-        metrics = {
-            "likes": post_data["likes"] or 0,
-            "comments": post_data["comments"] or 0, 
-            "shares": post_data["shares"] or 0
-        }
-        
-        # Get comment analysis
-        comments_analysis = post_data["comments_data"] or {}
-        post_content = f"{post_data.get('hook', '')} {post_data.get('post_text', '')}".strip()
-        
-        # Classify intents
-        classified_comments = await classify_post_intents(
-            comments_analysis,
-            post_content,
-            post_data.get("hook", "")
-        )
-        
-        if "error" in classified_comments:
-            return classified_comments
-        
-        # Calculate scores
-        scores = calculate_intent_scores(metrics, classified_comments)
-        
-        # Prepare content analysis update
-        current_analysis = post_data.get("content_analysis") or {}
-        current_analysis["intent_classification"] = {
-            "classified_at": "2026-03-25T12:00:00Z",  # Current timestamp
-            "intent_scores": classified_comments["intent_scores"],
-            "power_score": scores["power_score"],
-            "dominant_intent": scores["dominant_intent"],
-            "action_priority": scores["action_priority"],
-            "should_generate_cdr": scores["should_generate_cdr"],
-            "breakdown": scores["breakdown"],
-            "engagement_quality": scores["engagement_quality"]
-        }
-        
-        # Update database
-        update_query = text("""
-            UPDATE crm.competitor_posts 
-            SET content_analysis = :analysis
-            WHERE id = :post_id
-        """)
-        
-        await db.execute(update_query, {
-            "post_id": post_id,
-            "analysis": json.dumps(current_analysis)
-        })
-        
-        await db.commit()
+        classification = await _classify_post_row(row._asdict())
+        if "error" in classification:
+            return classification
         
-        return {
-            "post_id": post_id,
-            "platform": post_data["platform"],
-            "metrics": metrics,
-            "classification": classified_comments,
-            "scores": scores,
-            "updated": True
-        }
+        return await _save_post_classification(db, classification)
         
     except Exception as e:
         logger.error(f"Error processing post {post_id}: {e}")
@@ -549,6 +615,9 @@ async def batch_classify_intents(
 ) -> Dict[str, Any]:
     """Batch process intent classification for posts.
     
+    Posts are fetched in one query and classified ``CLASSIFY_BATCH_SIZE``
+    at a time concurrently, so their embedding requests share batches.
+    
     Args:
         competitor_id: If specified, only process posts for this competitor
         limit: Maximum number of posts to process
@@ -567,19 +636,19 @@ async def batch_classify_intents(
         
         limit_clause = ""
         if limit:
-            limit_clause = f" LIMIT {limit}"
+            limit_clause = f" LIMIT {int(limit)}"
         
         query = text(f"""
-            SELECT id FROM crm.competitor_posts 
+            SELECT {POST_COLUMNS} FROM crm.competitor_posts 
             {where_clause}
             ORDER BY (likes + comments*5 + shares*10) DESC
             {limit_clause}
         """)
         
         result = await db.execute(query, params)
-        post_ids = [row[0] for row in result.fetchall()]
+        rows = [row._asdict() for row in result.fetchall()]
         
-        logger.info(f"Starting batch classification for {len(post_ids)} posts")
+        logger.info(f"Starting batch classification for {len(rows)} posts")
         
         # Process posts
         results = {
@@ -594,50 +663,60 @@ async def batch_classify_intents(
         
         total_power_score = 0
         
-        for post_id in post_ids:
-            try:
-                classification_result = await process_post_intent_classification(db, post_id)
-                
-                if "error" in classification_result:
+        for i in range(0, len(rows), CLASSIFY_BATCH_SIZE):
+            chunk = rows[i:i + CLASSIFY_BATCH_SIZE]
+            classifications = await asyncio.gather(
+                *(_classify_post_row(row) for row in chunk), return_exceptions=True
+            )
+            
+            for row, classification_result in zip(chunk, classifications):
+                post_id = row["id"]
+                try:
+                    if isinstance(classification_result, Exception):
+                        raise classification_result
+                    
+                    if "error" in classification_result:
+                        results["errors"] += 1
+                        logger.error(f"Post {post_id}: {classification_result['error']}")
+                        continue
+                    
+                    await _save_post_classification(db, classification_result)
+                    results["processed"] += 1
+                    
+                    # Update statistics
+                    scores = classification_result["scores"]
+                    power_score = scores["power_score"]
+                    dominant_intent = scores["dominant_intent"]
+                    action_priority = scores["action_priority"]
+                    
+                    total_power_score += power_score
+                    results["dominant_intents"][dominant_intent] += 1
+                    
+                    if action_priority in ["HIGH", "CRITICAL"]:
+                        results["high_priority"] += 1
+                    
+                    if scores["should_generate_cdr"]:
+                        results["cdr_candidates"] += 1
+                    
+                    # Store summary for top posts
+                    if len(results["post_details"]) < 10:
+                        results["post_details"].append({
+                            "post_id": post_id,
+                            "power_score": power_score,
+                            "dominant_intent": dominant_intent,
+                            "action_priority": action_priority,
+                            "metrics": classification_result["metrics"]
+                        })
+                    
+                    # Log progress every 50 posts
+                    if results["processed"] % 50 == 0:
+                        logger.info(f"Processed {results['processed']}/{len(rows)} posts")
+                        
+                except Exception as e:
                     results["errors"] += 1
-                    logger.error(f"Post {post_id}: {classification_result['error']}")
+                    logger.error(f"Error processing post {post_id}: {e}")
+                    await db.rollback()
                     continue
-                
-                results["processed"] += 1
-                
-                # Update statistics
-                scores = classification_result["scores"]
-                power_score = scores["power_score"]
-                dominant_intent = scores["dominant_intent"]
-                action_priority = scores["action_priority"]
-                
-                total_power_score += power_score
-                results["dominant_intents"][dominant_intent] += 1
-                
-                if action_priority in ["HIGH", "CRITICAL"]:
-                    results["high_priority"] += 1
-                
-                if scores["should_generate_cdr"]:
-                    results["cdr_candidates"] += 1
-                
-                # Store summary for top posts
-                if len(results["post_details"]) < 10:
-                    results["post_details"].append({
-                        "post_id": post_id,
-                        "power_score": power_score,
-                        "dominant_intent": dominant_intent,
-                        "action_priority": action_priority,
-                        "metrics": classification_result["metrics"]
-                    })
-                
-                # Log progress every 50 posts
-                if results["processed"] % 50 == 0:
-                    logger.info(f"Processed {results['processed']}/{len(post_ids)} posts")
-                    
-            except Exception as e:
-                results["errors"] += 1
-                logger.error(f"Error processing post {post_id}: {e}")
-                continue
         
         # Calculate averages
         if results["processed"] > 0:
@@ -649,4 +728,4 @@ async def batch_classify_intents(
         
     except Exception as e:
         logger.error(f"Batch classification failed: {e}")
-        return {"error": f"Batch processing failed: {str(e)}"}
\ No newline at end of file
+        return {"error": f"Batch processing failed: {str(e)}"}
@@ -17,11 +17,17 @@ from urllib.parse import urljoin, urlparse
 import httpx
 from bs4 import BeautifulSoup, Comment
 
+from app.services.leadgen.page_cache import fetch_page
+from app.services.leadgen.parse_pool import parse_in_pool
+
 logger = logging.getLogger(__name__)
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
 MODEL = "claude-haiku-3-5-20241022"
 
+# robots.txt, sitemap and internal-page fetches in flight per audit
+DEEP_AUDIT_PAGE_CONCURRENCY = int(os.getenv("DEEP_AUDIT_PAGE_CONCURRENCY", "4"))
+
 # ── Patterns ──────────────────────────────────────────────────────────────
 
 SCHEMA_PATTERN = re.compile(r'"@type"\s*:\s*"([^"]+)"', re.IGNORECASE)
@@ -160,17 +166,10 @@ class DeepAuditResult:
 
 # ── Extraction ────────────────────────────────────────────────────────────
 
-async def _fetch_page(url: str, client: httpx.AsyncClient) -> tuple[str, int, float]:
-    """Fetch a page, return (html, status, load_time_ms)."""
-    start = time.monotonic()
-    try:
-        resp = await client.get(url, follow_redirects=True, timeout=15.0)
-        elapsed = (time.monotonic() - start) * 1000
-        return resp.text, resp.status_code, elapsed
-    except Exception as exc:
-        elapsed = (time.monotonic() - start) * 1000
-        logger.warning("Failed to fetch %s: %s", url, exc)
-        return "", 0, elapsed
+async def _fetch_page(url: str) -> tuple[str, int, float]:
+    """Fetch a page through the shared lead page cache, return (html, status, load_time_ms)."""
+    page = await fetch_page(url)
+    return page.text, page.status, page.elapsed_ms
 
 
 def _extract_visible_text(soup: BeautifulSoup) -> str:
@@ -225,159 +224,174 @@ def _count_blog_posts(html: str) -> int:
     return 0
 
 
+def _page_word_count(html: str) -> int:
+    """Visible word count of a page (runs in the parse pool)."""
+    return len(_extract_visible_text(BeautifulSoup(html, "html.parser")).split())
+
+
+def _parse_homepage(html: str, url: str) -> dict[str, Any]:
+    """SiteExtraction fields derived from the homepage HTML (runs in the parse pool)."""
+    fields: dict[str, Any] = {}
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Title
+    title_tag = soup.find("title")
+    fields["title"] = title_tag.get_text(strip=True) if title_tag else ""
+
+    # Meta description
+    meta = soup.find("meta", attrs={"name": "description"})
+    fields["meta_description"] = meta.get("content", "") if meta else ""
+
+    # Viewport
+    fields["has_viewport"] = bool(soup.find("meta", attrs={"name": "viewport"}))
+
+    # Canonical
+    fields["has_canonical"] = bool(CANONICAL_PATTERN.search(html))
+
+    # OG tags
+    fields["has_og_tags"] = bool(OG_PATTERN.search(html))
+
+    # Headings
+    headings: dict[str, list[str]] = {}
+    for level in ["h1", "h2", "h3", "h4"]:
+        tags = soup.find_all(level)
+        if tags:
+            headings[level] = [t.get_text(strip=True) for t in tags][:20]
+    fields["headings"] = headings
+
+    # Visible text
+    text_content = _extract_visible_text(BeautifulSoup(html, "html.parser"))
+    fields["word_count"] = len(text_content.split())
+    fields["text_content"] = text_content[:3000]
+
+    # Images
+    imgs = soup.find_all("img")
+    images_with_alt = sum(1 for img in imgs if img.get("alt", "").strip())
+    fields["images_total"] = len(imgs)
+    fields["images_with_alt"] = images_with_alt
+    fields["images_without_alt"] = len(imgs) - images_with_alt
+
+    # Forms
+    fields["forms_count"] = len(soup.find_all("form"))
+
+    # External scripts/styles
+    fields["scripts_external"] = len([
+        s for s in soup.find_all("script", src=True)
+        if s["src"].startswith("http")
+    ])
+    fields["stylesheets_external"] = len([
+        l for l in soup.find_all("link", rel="stylesheet")
+        if l.get("href", "").startswith("http")
+    ])
+
+    # Links
+    internal_pages = _count_internal_pages(html, url)
+    fields["internal_page_urls"] = internal_pages
+    fields["internal_links"] = internal_pages
+
+    # External links
+    base_domain = urlparse(url).netloc.replace("www.", "")
+    fields["external_links"] = list(set(
+        a["href"] for a in soup.find_all("a", href=True)
+        if a["href"].startswith("http")
+        and urlparse(a["href"]).netloc.replace("www.", "") != base_domain
+    ))[:30]
+
+    # Schema markup
+    fields["schema_types"] = list(set(SCHEMA_PATTERN.findall(html)))
+
+    # Social links
+    social_links: dict[str, str] = {}
+    for platform, pattern in SOCIAL_PATTERNS.items():
+        match = pattern.search(html)
+        if match:
+            social_links[platform] = match.group(0).rstrip("/")
+    fields["social_links"] = social_links
+
+    # Google Maps
+    fields["has_google_maps"] = bool(GOOGLE_MAPS_PATTERN.search(html))
+
+    # NAP
+    fields["has_nap_phone"] = bool(NAP_PHONE.search(text_content))
+    fields["has_nap_address"] = bool(NAP_ADDRESS.search(text_content))
+
+    # FAQ
+    fields["has_faq"] = bool(FAQ_PATTERN.search(html))
+
+    # Blog link
+    fields["has_blog_link"] = bool(BLOG_LINK_PATTERN.search(html))
+
+    # CTAs
+    cta_found = []
+    for pattern in CTA_PATTERNS:
+        match = pattern.search(text_content)
+        if match:
+            cta_found.append(match.group(0))
+    fields["cta_found"] = list(set(cta_found))
+
+    # Review widgets / testimonials
+    html_lower = html.lower()
+    fields["has_review_widget"] = any(p in html_lower for p in REVIEW_WIDGET_PATTERNS)
+    fields["has_testimonials"] = "testimonial" in html_lower or "customer review" in html_lower
+    return fields
+
+
 async def extract_site_data(url: str) -> SiteExtraction:
     """Extract comprehensive data from a website."""
     ext = SiteExtraction(url=url)
 
     try:
-        async with httpx.AsyncClient(
-            timeout=20.0,
-            headers={"User-Agent": "WarRoom-Auditor/1.0"},
-            limits=httpx.Limits(max_connections=5),
-        ) as client:
-            # 1. Fetch homepage
-            html, status, load_time = await _fetch_page(url, client)
-            if not html or status == 0:
-                ext.error = f"Failed to load homepage (status {status})"
-                return ext
-
-            ext.status_code = status
-            ext.load_time_ms = int(load_time)
-            ext.html_size_bytes = len(html.encode("utf-8", errors="ignore"))
-            ext.final_url = url
-            ext.is_https = urlparse(url).scheme == "https"
-
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Title
-            title_tag = soup.find("title")
-            ext.title = title_tag.get_text(strip=True) if title_tag else ""
-
-            # Meta description
-            meta = soup.find("meta", attrs={"name": "description"})
-            ext.meta_description = meta.get("content", "") if meta else ""
-
-            # Viewport
-            ext.has_viewport = bool(soup.find("meta", attrs={"name": "viewport"}))
-
-            # Canonical
-            ext.has_canonical = bool(CANONICAL_PATTERN.search(html))
-
-            # OG tags
-            ext.has_og_tags = bool(OG_PATTERN.search(html))
-
-            # Headings
-            for level in ["h1", "h2", "h3", "h4"]:
-                tags = soup.find_all(level)
-                if tags:
-                    ext.headings[level] = [t.get_text(strip=True) for t in tags][:20]
-
-            # Visible text
-            text_content = _extract_visible_text(BeautifulSoup(html, "html.parser"))
-            ext.word_count = len(text_content.split())
-            ext.text_content = text_content[:3000]
-
-            # Images
-            imgs = soup.find_all("img")
-            ext.images_total = len(imgs)
-            ext.images_with_alt = sum(1 for img in imgs if img.get("alt", "").strip())
-            ext.images_without_alt = ext.images_total - ext.images_with_alt
-
-            # Forms
-            ext.forms_count = len(soup.find_all("form"))
-
-            # External scripts/styles
-            ext.scripts_external = len([
-                s for s in soup.find_all("script", src=True)
-                if s["src"].startswith("http")
-            ])
-            ext.stylesheets_external = len([
-                l for l in soup.find_all("link", rel="stylesheet")
-                if l.get("href", "").startswith("http")
-            ])
-
-            # Links
-            internal_pages = _count_internal_pages(html, url)
-            ext.internal_page_urls = internal_pages
-            ext.internal_links = internal_pages
-            ext.pages_crawled = 1
-
-            # External links
-            parsed_base = urlparse(url)
-            base_domain = parsed_base.netloc.replace("www.", "")
-            ext.external_links = list(set(
-                a["href"] for a in soup.find_all("a", href=True)
-                if a["href"].startswith("http")
-                and urlparse(a["href"]).netloc.replace("www.", "") != base_domain
-            ))[:30]
-
-            # Schema markup
-            ext.schema_types = list(set(SCHEMA_PATTERN.findall(html)))
-
-            # Social links
-            for platform, pattern in SOCIAL_PATTERNS.items():
-                match = pattern.search(html)
-                if match:
-                    ext.social_links[platform] = match.group(0).rstrip("/")
-
-            # Google Maps
-            ext.has_google_maps = bool(GOOGLE_MAPS_PATTERN.search(html))
-
-            # NAP
-            ext.has_nap_phone = bool(NAP_PHONE.search(text_content))
-            ext.has_nap_address = bool(NAP_ADDRESS.search(text_content))
-
-            # FAQ
-            ext.has_faq = bool(FAQ_PATTERN.search(html))
-
-            # Blog link
-            ext.has_blog_link = bool(BLOG_LINK_PATTERN.search(html))
-
-            # CTAs
-            for pattern in CTA_PATTERNS:
-                match = pattern.search(text_content)
-                if match:
-                    ext.cta_found.append(match.group(0))
-            ext.cta_found = list(set(ext.cta_found))
-
-            # Review widgets / testimonials
-            html_lower = html.lower()
-            ext.has_review_widget = any(p in html_lower for p in REVIEW_WIDGET_PATTERNS)
-            ext.has_testimonials = "testimonial" in html_lower or "customer review" in html_lower
-
+        # 1. Fetch homepage (usually already fetched by the crawler for this lead)
+        html, status, load_time = await _fetch_page(url)
+        if not html or status == 0:
+            ext.error = f"Failed to load homepage (status {status})"
+            return ext
+
+        ext.status_code = status
+        ext.load_time_ms = int(load_time)
+        ext.html_size_bytes = len(html.encode("utf-8", errors="ignore"))
+        ext.final_url = url
+        ext.is_https = urlparse(url).scheme == "https"
+
+        for name, value in (await parse_in_pool(_parse_homepage, html, url)).items():
+            setattr(ext, name, value)
+        ext.pages_crawled = 1
+
+        parsed_base = urlparse(url)
+        robots_url = f"{parsed_base.scheme}://{parsed_base.netloc}/robots.txt"
+        sitemap_url = f"{parsed_base.scheme}://{parsed_base.netloc}/sitemap.xml"
+        sem = asyncio.Semaphore(DEEP_AUDIT_PAGE_CONCURRENCY)
+
+        async def _check_robots():
             # 2. Check robots.txt
-            robots_url = f"{parsed_base.scheme}://{parsed_base.netloc}/robots.txt"
-            try:
-                robots_html, robots_status, _ = await _fetch_page(robots_url, client)
-                ext.has_robots_txt = robots_status == 200 and "user-agent" in robots_html.lower()
-                if ext.has_robots_txt:
-                    ext.robots_txt_content = robots_html[:500]
-            except Exception:
-                pass
+            async with sem:
+                robots_html, robots_status, _ = await _fetch_page(robots_url)
+            ext.has_robots_txt = robots_status == 200 and "user-agent" in robots_html.lower()
+            if ext.has_robots_txt:
+                ext.robots_txt_content = robots_html[:500]
 
+        async def _check_sitemap():
             # 3. Check sitemap.xml
-            sitemap_url = f"{parsed_base.scheme}://{parsed_base.netloc}/sitemap.xml"
-            try:
-                sitemap_html, sitemap_status, _ = await _fetch_page(sitemap_url, client)
-                ext.has_sitemap = sitemap_status == 200 and "<url" in sitemap_html.lower()
-                if ext.has_sitemap:
-                    ext.sitemap_url_count = sitemap_html.lower().count("<url>")
-            except Exception:
-                pass
+            async with sem:
+                sitemap_html, sitemap_status, _ = await _fetch_page(sitemap_url)
+            ext.has_sitemap = sitemap_status == 200 and "<url" in sitemap_html.lower()
+            if ext.has_sitemap:
+                ext.sitemap_url_count = sitemap_html.lower().count("<url>")
 
+        async def _crawl_page(page_url: str):
             # 4. Crawl a few internal pages for word count boost
-            pages_to_crawl = internal_pages[:4]
-            blog_url = None
-            for page_url in pages_to_crawl:
-                await asyncio.sleep(0.5)
-                page_html, page_status, _ = await _fetch_page(page_url, client)
-                if page_status == 200 and page_html:
-                    ext.pages_crawled += 1
-                    page_text = _extract_visible_text(BeautifulSoup(page_html, "html.parser"))
-                    ext.word_count += len(page_text.split())
-                    # Check if it's a blog page
-                    if BLOG_LINK_PATTERN.search(page_url):
-                        blog_url = page_url
+            async with sem:
+                page_html, page_status, _ = await _fetch_page(page_url)
+            if page_status == 200 and page_html:
+                ext.pages_crawled += 1
+                ext.word_count += await parse_in_pool(_page_word_count, page_html)
+
+        await asyncio.gather(
+            _check_robots(),
+            _check_sitemap(),
+            *(_crawl_page(page_url) for page_url in ext.internal_page_urls[:4]),
+            return_exceptions=True,
+        )
 
     except Exception as exc:
         ext.error = str(exc)
@@ -386,66 +400,73 @@ async def extract_site_data(url: str) -> SiteExtraction:
     return ext
 
 
+def _parse_snapshot(html: str, url: str) -> dict[str, Any]:
+    """CompetitorSnapshot fields from a competitor homepage (runs in the parse pool).
+
+    Also returns ``blog_page_url``: the first internal page that looks like
+    a blog, if the site links to one.
+    """
+    fields: dict[str, Any] = {}
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Title / meta
+    title_tag = soup.find("title")
+    fields["title"] = title_tag.get_text(strip=True) if title_tag else ""
+    meta = soup.find("meta", attrs={"name": "description"})
+    fields["meta_description"] = meta.get("content", "") if meta else ""
+
+    # Word count
+    text = _extract_visible_text(BeautifulSoup(html, "html.parser"))
+    fields["word_count"] = len(text.split())
+
+    # Internal pages
+    pages = _count_internal_pages(html, url)
+    fields["pages_found"] = len(pages) + 1  # +1 for homepage
+
+    # Blog
+    fields["has_blog"] = bool(BLOG_LINK_PATTERN.search(html))
+    fields["blog_page_url"] = None
+    if fields["has_blog"]:
+        fields["blog_page_url"] = next((p for p in pages if BLOG_LINK_PATTERN.search(p)), None)
+
+    # Schema
+    fields["schema_types"] = list(set(SCHEMA_PATTERN.findall(html)))
+
+    # Social links
+    fields["social_link_count"] = sum(1 for pattern in SOCIAL_PATTERNS.values() if pattern.search(html))
+
+    # Reviews / testimonials
+    html_lower = html.lower()
+    fields["has_review_widget"] = any(p in html_lower for p in REVIEW_WIDGET_PATTERNS)
+    fields["has_testimonials"] = "testimonial" in html_lower or "customer review" in html_lower
+    fields["has_google_maps"] = bool(GOOGLE_MAPS_PATTERN.search(html))
+    fields["has_faq"] = bool(FAQ_PATTERN.search(html))
+    return fields
+
+
 async def extract_competitor_snapshot(url: str, name: str = "") -> CompetitorSnapshot:
     """Quick extraction from a competitor site for comparison."""
     snap = CompetitorSnapshot(url=url, business_name=name)
 
     try:
-        async with httpx.AsyncClient(
-            timeout=15.0,
-            headers={"User-Agent": "WarRoom-Auditor/1.0"},
-        ) as client:
-            html, status, _ = await _fetch_page(url, client)
-            if not html or status != 200:
-                snap.error = f"Failed to load (status {status})"
-                return snap
-
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Title / meta
-            title_tag = soup.find("title")
-            snap.title = title_tag.get_text(strip=True) if title_tag else ""
-            meta = soup.find("meta", attrs={"name": "description"})
-            snap.meta_description = meta.get("content", "") if meta else ""
-
-            # Word count
-            text = _extract_visible_text(BeautifulSoup(html, "html.parser"))
-            snap.word_count = len(text.split())
-
-            # Internal pages
-            pages = _count_internal_pages(html, url)
-            snap.pages_found = len(pages) + 1  # +1 for homepage
-
-            # Blog
-            snap.has_blog = bool(BLOG_LINK_PATTERN.search(html))
-            if snap.has_blog:
-                # Try to count posts
-                for page_url in pages:
-                    if BLOG_LINK_PATTERN.search(page_url):
-                        try:
-                            blog_html, blog_status, _ = await _fetch_page(page_url, client)
-                            if blog_status == 200:
-                                snap.blog_post_count = _count_blog_posts(blog_html)
-                        except Exception:
-                            pass
-                        break
-
-            # Schema
-            snap.schema_types = list(set(SCHEMA_PATTERN.findall(html)))
-
-            # Social links
-            social_count = 0
-            for _, pattern in SOCIAL_PATTERNS.items():
-                if pattern.search(html):
-                    social_count += 1
-            snap.social_link_count = social_count
-
-            # Reviews / testimonials
-            html_lower = html.lower()
-            snap.has_review_widget = any(p in html_lower for p in REVIEW_WIDGET_PATTERNS)
-            snap.has_testimonials = "testimonial" in html_lower or "customer review" in html_lower
-            snap.has_google_maps = bool(GOOGLE_MAPS_PATTERN.search(html))
-            snap.has_faq = bool(FAQ_PATTERN.search(html))
+        html, status, _ = await _fetch_page(url)
+        if not html or status != 200:
+            snap.error = f"Failed to load (status {status})"
+            return snap
+
+        fields = await parse_in_pool(_parse_snapshot, html, url)
+        blog_page_url = fields.pop("blog_page_url")
+        for field_name, value in fields.items():
+            setattr(snap, field_name, value)
+
+        # Try to count posts
+        if blog_page_url:
+            try:
+                blog_html, blog_status, _ = await _fetch_page(blog_page_url)
+                if blog_status == 200:
+                    snap.blog_post_count = await parse_in_pool(_count_blog_posts, blog_html)
+            except Exception:
+                pass
 
     except Exception as exc:
         snap.error = str(exc)
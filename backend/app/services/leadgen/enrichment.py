@@ -9,6 +9,14 @@ Sources:
   6. News mentions (via Brave Search)
   7. Social presence scan (verify profiles, extract followers)
   8. Website audit (SEO, mobile, SSL, contact info scoring)
+
+Sources that don't need the website (reviews, BBB, Glassdoor, Reddit) run
+alongside the website branch (discovery -> crawl -> news, social scan,
+audit). Each source call holds a slot from its own budget in
+``throttle.source_slot``; site crawls are spaced per host by
+``throttle.polite``. Results are shared across orgs through
+``enrichment_cache`` (per-source TTLs), so a cache hit skips the fetch
+and its slot entirely.
 """
 
 import asyncio
@@ -19,15 +27,22 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.lead import Lead, SearchJob
-from app.services.leadgen.website_crawler import crawl_website
+from app.services.leadgen import enrichment_cache
+from app.services.leadgen.enrichment_cache import business_key, decode_as, digest_key, domain_key, place_key
+from app.services.leadgen.website_crawler import CrawlResult, crawl_website
 from app.services.leadgen.lead_scorer import score_lead
 from app.services.leadgen.phone_validator import is_fake_phone, clean_phone
-from app.services.leadgen.review_scraper import scrape_yelp_reviews, fetch_google_reviews
+from app.services.leadgen.review_scraper import (
+    GoogleReviewResult, ReviewItem, YelpScrapeResult, scrape_yelp_reviews, fetch_google_reviews,
+)
 from app.services.leadgen.review_analyzer import analyze_reviews
-from app.services.leadgen.bbb_scraper import scrape_bbb
-from app.services.leadgen.news_scraper import search_news, search_reddit, search_glassdoor
+from app.services.leadgen.bbb_scraper import BBBResult, scrape_bbb
+from app.services.leadgen.news_scraper import (
+    GlassdoorResult, NewsMention, NewsResult, search_news, search_reddit, search_glassdoor,
+)
 from app.services.leadgen.social_scanner import scan_social_profiles
-from app.services.leadgen.website_auditor import audit_website
+from app.services.leadgen.website_auditor import WebsiteAudit, audit_website
+from app.services.leadgen.throttle import LEADGEN_ENRICH_CONCURRENCY, source_slot
 from app.services.notify import send_notification
 
 logger = logging.getLogger(__name__)
@@ -185,98 +200,53 @@ async def enrich_lead(lead_id: int, db: AsyncSession) -> None:
     lead.enrichment_status = "crawling"
     await db.commit()
 
-    # ── Website discovery (find website if missing) ──
-    if not skip_crawl and not lead.website:
-        discovered = await _discover_website(lead.name, lead.city, lead.state)
-        if discovered:
-            lead.website = discovered
-            logger.info("Discovered website for lead %d (%s): %s", lead_id, lead.name, discovered)
+    async def _website_branch() -> None:
+        # ── Website discovery (find website if missing) ──
+        if not skip_crawl and not lead.website:
+            async def _discover() -> dict:
+                return {"website": await _discover_website(lead.business_name, lead.city, lead.state)}
+
+            # Only cache hits: a miss is often a transient SERP failure
+            found = await _source(
+                "discovery", business_key(lead.business_name, lead.city, lead.state), _discover,
+                cacheable=lambda r: bool(r["website"]),
+            )
+            discovered = found["website"]
+            if discovered:
+                lead.website = discovered
+                logger.info("Discovered website for lead %d (%s): %s", lead_id, lead.business_name, discovered)
+
+        # ── Website crawl (skip if recent audit exists) ──
+        if not skip_crawl:
+            if not lead.website:
+                lead.has_website = False
+                lead.audit_status = "no_website"
+            else:
+                lead.has_website = True
+                crawl = await _source(
+                    "crawl", domain_key(lead.website), lambda: crawl_website(lead.website),
+                    decode=decode_as(CrawlResult),
+                )
+                _apply_crawl(lead, crawl)
 
-    # ── Website crawl (skip if recent audit exists) ──
-    if not skip_crawl:
-        if not lead.website:
-            lead.has_website = False
-            lead.audit_status = "no_website"
-        else:
-            lead.has_website = True
-            crawl = await crawl_website(lead.website)
-
-            lead.website_status = crawl.status_code
-            lead.website_platform = crawl.platform
-            lead.emails = crawl.emails
-            if crawl.phones:
-                valid_phones = [p for p in crawl.phones if not is_fake_phone(p)]
-                lead.website_phones = valid_phones if valid_phones else []
-            lead.facebook_url = crawl.facebook
-            lead.instagram_url = crawl.instagram
-            lead.linkedin_url = crawl.linkedin
-            lead.twitter_url = crawl.twitter
-            lead.tiktok_url = crawl.tiktok
-            lead.youtube_url = crawl.youtube
-            lead.yelp_url = crawl.yelp
-
-            # Quick audit lite
-            audit_flags = []
-            if crawl.platform and crawl.platform != "custom":
-                audit_flags.append(f"Built on {crawl.platform.title()}")
-            if not crawl.emails:
-                audit_flags.append("No email found on website")
-            if not crawl.phones:
-                audit_flags.append("No phone found on website")
-            has_ssl = lead.website.startswith("https://") if lead.website else False
-            if not has_ssl:
-                audit_flags.append("No SSL (HTTP only)")
-            social_count = sum(1 for x in [crawl.facebook, crawl.instagram, crawl.linkedin, crawl.twitter] if x)
-            if social_count == 0:
-                audit_flags.append("No social media links")
-            elif social_count < 2:
-                audit_flags.append("Minimal social presence")
-            lead.audit_lite_flags = audit_flags
+        # ── Sources that use the website or the socials found on it ──
+        sources = [
+            _run_source(lead_id, "News enrichment", _enrich_news(lead)),
+            _run_source(lead_id, "Social scan", _enrich_social_scan(lead)),
+        ]
+        # Website audit (deeper) — only if not skipping crawl
+        if not skip_crawl and lead.website and lead.has_website:
+            sources.append(_run_source(lead_id, "Website audit", _enrich_website_audit(lead)))
+        await asyncio.gather(*sources)
 
     # ── Intel sources (always run, even when crawl is skipped) ──
-
-    # Reviews
-    try:
-        await _enrich_reviews(lead)
-    except Exception as exc:
-        logger.warning("Review enrichment failed for lead %d: %s", lead_id, exc)
-
-    # BBB
-    try:
-        await _enrich_bbb(lead)
-    except Exception as exc:
-        logger.warning("BBB enrichment failed for lead %d: %s", lead_id, exc)
-
-    # Glassdoor
-    try:
-        await _enrich_glassdoor(lead)
-    except Exception as exc:
-        logger.warning("Glassdoor enrichment failed for lead %d: %s", lead_id, exc)
-
-    # Reddit mentions
-    try:
-        await _enrich_reddit(lead)
-    except Exception as exc:
-        logger.warning("Reddit enrichment failed for lead %d: %s", lead_id, exc)
-
-    # News mentions
-    try:
-        await _enrich_news(lead)
-    except Exception as exc:
-        logger.warning("News enrichment failed for lead %d: %s", lead_id, exc)
-
-    # Social presence scan
-    try:
-        await _enrich_social_scan(lead)
-    except Exception as exc:
-        logger.warning("Social scan failed for lead %d: %s", lead_id, exc)
-
-    # Website audit (deeper) — only if not skipping crawl
-    if not skip_crawl and lead.website and lead.has_website:
-        try:
-            await _enrich_website_audit(lead)
-        except Exception as exc:
-            logger.warning("Website audit failed for lead %d: %s", lead_id, exc)
+    await asyncio.gather(
+        _run_source(lead_id, "Website enrichment", _website_branch()),
+        _run_source(lead_id, "Review enrichment", _enrich_reviews(lead)),
+        _run_source(lead_id, "BBB enrichment", _enrich_bbb(lead)),
+        _run_source(lead_id, "Glassdoor enrichment", _enrich_glassdoor(lead)),
+        _run_source(lead_id, "Reddit enrichment", _enrich_reddit(lead)),
+    )
 
     lead.enrichment_status = "enriched"
     score, tier = score_lead(lead)
@@ -297,14 +267,92 @@ async def enrich_lead(lead_id: int, db: AsyncSession) -> None:
         )
 
 
+async def _source(name: str, key, fetch, **cache_options):
+    """Fetch one source's result through the shared cache, in its own slot."""
+    async def _fetch():
+        async with source_slot(name):
+            return await fetch()
+
+    return await enrichment_cache.fetch_through(name, key, _fetch, **cache_options)
+
+
+async def _run_source(lead_id: int, label: str, coro) -> None:
+    """Await one enrichment source; a failure only loses that source's data."""
+    try:
+        await coro
+    except Exception as exc:
+        logger.warning("%s failed for lead %d: %s", label, lead_id, exc)
+
+
+def _apply_crawl(lead: Lead, crawl) -> None:
+    """Copy crawl results and the quick audit-lite flags onto the lead."""
+    lead.website_status = crawl.status_code
+    lead.website_platform = crawl.platform
+    lead.emails = crawl.emails
+    if crawl.phones:
+        valid_phones = [p for p in crawl.phones if not is_fake_phone(p)]
+        lead.website_phones = valid_phones if valid_phones else []
+    lead.facebook_url = crawl.facebook
+    lead.instagram_url = crawl.instagram
+    lead.linkedin_url = crawl.linkedin
+    lead.twitter_url = crawl.twitter
+    lead.tiktok_url = crawl.tiktok
+    lead.youtube_url = crawl.youtube
+    # Review enrichment may already have found the Yelp page concurrently
+    lead.yelp_url = crawl.yelp or lead.yelp_url
+
+    # Quick audit lite
+    audit_flags = []
+    if crawl.platform and crawl.platform != "custom":
+        audit_flags.append(f"Built on {crawl.platform.title()}")
+    if not crawl.emails:
+        audit_flags.append("No email found on website")
+    if not crawl.phones:
+        audit_flags.append("No phone found on website")
+    has_ssl = lead.website.startswith("https://") if lead.website else False
+    if not has_ssl:
+        audit_flags.append("No SSL (HTTP only)")
+    social_count = sum(1 for x in [crawl.facebook, crawl.instagram, crawl.linkedin, crawl.twitter] if x)
+    if social_count == 0:
+        audit_flags.append("No social media links")
+    elif social_count < 2:
+        audit_flags.append("Minimal social presence")
+    lead.audit_lite_flags = audit_flags
+
+
+async def enrich_leads(lead_ids: list[int], semaphore: asyncio.Semaphore | None = None) -> int:
+    """Enrich the given leads concurrently; returns how many were processed.
+
+    Each lead gets its own session to avoid SQLAlchemy concurrent-access
+    issues. Pass a shared ``semaphore`` to bound several calls together
+    (e.g. successive search batches of one job).
+    """
+    from app.db.leadgen_db import leadgen_session
+
+    enriched = 0
+    # Leads in flight; each external source is further bounded by source_slot()
+    semaphore = semaphore or asyncio.Semaphore(LEADGEN_ENRICH_CONCURRENCY)
+
+    async def _enrich_one(lead_id: int):
+        nonlocal enriched
+        async with semaphore:
+            # Each task gets its own DB session — prevents shared-session hangs
+            async with leadgen_session() as task_db:
+                try:
+                    await enrich_lead(lead_id, task_db)
+                except Exception as exc:
+                    logger.error("Failed to enrich lead %d: %s", lead_id, exc)
+            enriched += 1
+
+    await asyncio.gather(*(_enrich_one(lead_id) for lead_id in lead_ids), return_exceptions=True)
+    return enriched
+
+
 async def enrich_job(job_id: int, db: AsyncSession) -> None:
     """Enrich all pending leads in a search job.
     
-    Each lead gets its own session to avoid SQLAlchemy concurrent-access issues.
     Only leads WITH websites get crawled; no-website leads are scored immediately.
     """
-    from app.db.leadgen_db import leadgen_session
-
     result = await db.execute(
         select(Lead.id, Lead.has_website)
         .where(Lead.search_job_id == job_id, Lead.enrichment_status == "pending")
@@ -317,22 +365,7 @@ async def enrich_job(job_id: int, db: AsyncSession) -> None:
     )
     await db.commit()
 
-    enriched = 0
-    semaphore = asyncio.Semaphore(3)  # Limit concurrency for website crawls
-
-    async def _enrich_one(lead_id: int):
-        nonlocal enriched
-        async with semaphore:
-            # Each task gets its own DB session — prevents shared-session hangs
-            async with leadgen_session() as task_db:
-                try:
-                    await enrich_lead(lead_id, task_db)
-                except Exception as exc:
-                    logger.error("Failed to enrich lead %d: %s", lead_id, exc)
-            enriched += 1
-
-    tasks = [_enrich_one(row[0]) for row in lead_rows]
-    await asyncio.gather(*tasks, return_exceptions=True)
+    enriched = await enrich_leads([row[0] for row in lead_rows])
 
     await db.execute(
         update(SearchJob)
@@ -347,7 +380,11 @@ async def _enrich_bbb(lead: Lead) -> None:
     """Scrape BBB for rating, accreditation, complaints."""
     if not lead.business_name or not lead.city:
         return
-    bbb = await scrape_bbb(lead.business_name, lead.city, lead.state or "")
+    bbb = await _source(
+        "bbb", business_key(lead.business_name, lead.city, lead.state),
+        lambda: scrape_bbb(lead.business_name, lead.city, lead.state or ""),
+        decode=decode_as(BBBResult),
+    )
     if bbb.url:
         lead.bbb_url = bbb.url
     if bbb.rating:
@@ -366,7 +403,11 @@ async def _enrich_glassdoor(lead: Lead) -> None:
     """Search for Glassdoor listing via direct scrape."""
     if not lead.business_name:
         return
-    gd = await search_glassdoor(lead.business_name)
+    gd = await _source(
+        "glassdoor", business_key(lead.business_name),
+        lambda: search_glassdoor(lead.business_name),
+        decode=decode_as(GlassdoorResult),
+    )
     if gd.url:
         lead.glassdoor_url = gd.url
     if gd.rating:
@@ -383,7 +424,13 @@ async def _enrich_reddit(lead: Lead) -> None:
     """Search Reddit for mentions of the business."""
     if not lead.business_name:
         return
-    mentions = await search_reddit(lead.business_name)
+    # Errors come back as an empty list, so only cache actual mentions
+    mentions = await _source(
+        "reddit", business_key(lead.business_name),
+        lambda: search_reddit(lead.business_name),
+        decode=lambda payload: [NewsMention(**m) for m in payload],
+        cacheable=bool,
+    )
     if mentions:
         lead.reddit_mentions = [
             {"title": m.title, "url": m.url, "source": m.source, "snippet": m.snippet, "date": m.date}
@@ -396,7 +443,14 @@ async def _enrich_news(lead: Lead) -> None:
     """Search for recent news about the business or owner."""
     if not lead.business_name:
         return
-    result = await search_news(lead.business_name, lead.website or "")
+    key = business_key(lead.business_name)
+    if key:
+        key = f"{key}|{domain_key(lead.website) or ''}"
+    result = await _source(
+        "news", key,
+        lambda: search_news(lead.business_name, lead.website or ""),
+        decode=decode_as(NewsResult, mentions=NewsMention),
+    )
     if result.mentions:
         lead.news_mentions = [
             {"title": m.title, "url": m.url, "source": m.source, "snippet": m.snippet, "date": m.date}
@@ -410,13 +464,18 @@ async def _enrich_social_scan(lead: Lead) -> None:
     if not any([lead.facebook_url, lead.instagram_url, lead.linkedin_url,
                 lead.twitter_url, lead.tiktok_url, lead.youtube_url]):
         return
-    scan = await scan_social_profiles(
-        facebook_url=lead.facebook_url or "",
-        instagram_url=lead.instagram_url or "",
-        linkedin_url=lead.linkedin_url or "",
-        twitter_url=lead.twitter_url or "",
-        tiktok_url=lead.tiktok_url or "",
-        youtube_url=lead.youtube_url or "",
+    urls = {
+        "facebook_url": lead.facebook_url or "",
+        "instagram_url": lead.instagram_url or "",
+        "linkedin_url": lead.linkedin_url or "",
+        "twitter_url": lead.twitter_url or "",
+        "tiktok_url": lead.tiktok_url or "",
+        "youtube_url": lead.youtube_url or "",
+    }
+    scan = await _source(
+        "social", digest_key("social", urls),
+        lambda: scan_social_profiles(**urls),
+        cacheable=bool,
     )
     if scan:
         lead.social_scan = scan
@@ -428,7 +487,12 @@ async def _enrich_website_audit(lead: Lead) -> None:
     """Run a deeper website audit than the lite flags."""
     if not lead.website:
         return
-    audit = await audit_website(lead.website)
+    # A failed fetch scores 0 — don't cache that
+    audit = await _source(
+        "audit", domain_key(lead.website), lambda: audit_website(lead.website),
+        decode=decode_as(WebsiteAudit),
+        cacheable=lambda a: a.score > 0,
+    )
     if audit.score > 0:
         lead.website_audit_score = audit.score
         lead.website_audit_grade = audit.grade
@@ -442,13 +506,29 @@ async def _enrich_reviews(lead: Lead) -> None:
     """Scrape Yelp + Google reviews, analyze, and populate review columns."""
     all_review_texts: list[str] = []
 
-    # Yelp reviews
-    if lead.business_name and lead.city:
-        yelp_result = await scrape_yelp_reviews(
-            lead.business_name,
-            lead.city,
-            lead.state or "",
+    async def _yelp():
+        if not (lead.business_name and lead.city):
+            return None
+        return await _source(
+            "yelp", business_key(lead.business_name, lead.city, lead.state),
+            lambda: scrape_yelp_reviews(lead.business_name, lead.city, lead.state or ""),
+            decode=decode_as(YelpScrapeResult, reviews=ReviewItem),
+        )
+
+    async def _google():
+        # Google reviews (if we have a place_id)
+        if not lead.google_place_id:
+            return None
+        return await _source(
+            "google_reviews", place_key(lead.google_place_id),
+            lambda: fetch_google_reviews(lead.google_place_id),
+            decode=decode_as(GoogleReviewResult, reviews=ReviewItem),
         )
+
+    yelp_result, google_result = await asyncio.gather(_yelp(), _google())
+
+    # Yelp reviews
+    if yelp_result is not None:
         if yelp_result.yelp_url:
             lead.yelp_url = lead.yelp_url or yelp_result.yelp_url
         if yelp_result.yelp_rating:
@@ -457,9 +537,7 @@ async def _enrich_reviews(lead: Lead) -> None:
             lead.yelp_reviews_count = yelp_result.yelp_reviews_count
         all_review_texts.extend(r.text for r in yelp_result.reviews if r.text)
 
-    # Google reviews (if we have a place_id)
-    if lead.google_place_id:
-        google_result = await fetch_google_reviews(lead.google_place_id)
+    if google_result is not None:
         all_review_texts.extend(r.text for r in google_result.reviews if r.text)
 
     # Analyze combined reviews
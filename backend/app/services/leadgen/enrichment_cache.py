@@ -0,0 +1,204 @@
+"""Cross-tenant cache of enrichment source results.
+
+Every enrichment source is public web data about a business, so a crawl,
+audit, BBB lookup, etc. fetched for one org's lead is just as valid for
+another org searching the same city and category. Results are stored in
+``leadgen.enrichment_cache`` keyed by ``(source, cache_key)``:
+
+  - ``domain_key(url)`` — normalized host, for website crawls and audits
+  - ``place_key(place_id)`` — Google place ID, for Google reviews
+  - ``business_key(name, city, state)`` — for directory/search sources
+
+Each source has its own TTL (``SOURCE_TTLS``, overridable with
+``ENRICHMENT_CACHE_TTLS="news=12h,crawl=7d"``). Rows carry ``fetched_at``,
+``expires_at`` and hit counters. Failed fetches are never cached, and a
+cache outage only costs a refetch.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import re
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from sqlalchemy import text
+
+from app.db.leadgen_db import leadgen_engine
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DAY = 86400
+_DEFAULT_TTLS = {
+    "discovery": 30 * _DAY,
+    "crawl": 14 * _DAY,
+    "audit": 14 * _DAY,
+    "yelp": 7 * _DAY,
+    "google_reviews": 7 * _DAY,
+    "bbb": 30 * _DAY,
+    "glassdoor": 30 * _DAY,
+    "reddit": 3 * _DAY,
+    "news": 1 * _DAY,
+    "social": 7 * _DAY,
+}
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": _DAY}
+
+
+def _parse_ttls(raw: str) -> dict[str, int]:
+    ttls = dict(_DEFAULT_TTLS)
+    for part in raw.split(","):
+        name, _, value = part.partition("=")
+        match = re.fullmatch(r"\s*(\d+)\s*([smhd]?)\s*", value)
+        if name.strip() and match:
+            ttls[name.strip()] = int(match.group(1)) * _UNIT_SECONDS[match.group(2) or "s"]
+    return ttls
+
+
+SOURCE_TTLS = _parse_ttls(os.getenv("ENRICHMENT_CACHE_TTLS", ""))
+ENRICHMENT_CACHE_ENABLED = os.getenv("ENRICHMENT_CACHE_ENABLED", "true").lower() != "false"
+
+
+# ── Keys ─────────────────────────────────────────────────────────────
+
+def _norm(value: Optional[str]) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (value or "").lower()).strip()
+
+
+def domain_key(url: Optional[str]) -> Optional[str]:
+    """``https://www.Foo.com/contact`` -> ``domain:foo.com``."""
+    if not url:
+        return None
+    host = (urlparse(url if "://" in url else f"http://{url}").hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"domain:{host}" if host else None
+
+
+def place_key(place_id: Optional[str]) -> Optional[str]:
+    return f"place:{place_id}" if place_id else None
+
+
+def business_key(name: Optional[str], city: Optional[str] = "", state: Optional[str] = "") -> Optional[str]:
+    if not _norm(name):
+        return None
+    return f"biz:{_norm(name)}|{_norm(city)}|{_norm(state)}"
+
+
+def digest_key(prefix: str, value: Any) -> str:
+    """Stable key for composite inputs (e.g. a set of social URLs)."""
+    raw = json.dumps(value, sort_keys=True, default=str)
+    return f"{prefix}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+# ── (De)serialization ────────────────────────────────────────────────
+
+def encode(value: Any) -> Any:
+    """Dataclasses (and lists/dicts of them) to JSON-able structures."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: encode(v) for k, v in value.items()}
+    return value
+
+
+def decode_as(cls: type, **nested: type) -> Callable[[Any], Any]:
+    """Decoder rebuilding ``cls`` from its dict, with list fields of ``nested`` types."""
+    names = {f.name for f in dataclasses.fields(cls)}
+
+    def _decode(payload: dict) -> Any:
+        kwargs = {k: v for k, v in payload.items() if k in names}
+        for field_name, item_cls in nested.items():
+            kwargs[field_name] = [item_cls(**item) for item in kwargs.get(field_name) or []]
+        return cls(**kwargs)
+
+    return _decode
+
+
+def _has_no_error(value: Any) -> bool:
+    return not getattr(value, "error", "")
+
+
+# ── Storage ──────────────────────────────────────────────────────────
+
+async def lookup(source: str, key: str) -> Optional[Any]:
+    """Fresh cached payload for ``(source, key)``, or None."""
+    async with leadgen_engine.begin() as conn:
+        row = (await conn.execute(text("""
+            UPDATE leadgen.enrichment_cache
+               SET hit_count = hit_count + 1, last_hit_at = NOW()
+             WHERE source = :source AND cache_key = :key AND expires_at > NOW()
+            RETURNING payload
+        """), {"source": source, "key": key})).first()
+    if row is None:
+        return None
+    payload = row[0]
+    return json.loads(payload) if isinstance(payload, str) else payload
+
+
+async def store(source: str, key: str, payload: Any) -> None:
+    ttl = SOURCE_TTLS.get(source, _DAY)
+    async with leadgen_engine.begin() as conn:
+        await conn.execute(text("""
+            INSERT INTO leadgen.enrichment_cache
+                (source, cache_key, payload, fetched_at, expires_at, hit_count)
+            VALUES (:source, :key, CAST(:payload AS JSONB), NOW(), NOW() + :ttl, 0)
+            ON CONFLICT (source, cache_key) DO UPDATE SET
+                payload = EXCLUDED.payload,
+                fetched_at = EXCLUDED.fetched_at,
+                expires_at = EXCLUDED.expires_at,
+                hit_count = 0
+        """), {
+            "source": source,
+            "key": key,
+            "payload": json.dumps(payload, default=str),
+            "ttl": timedelta(seconds=ttl),
+        })
+
+
+async def purge_expired() -> int:
+    """Delete expired rows; returns how many were removed."""
+    async with leadgen_engine.begin() as conn:
+        result = await conn.execute(text(
+            "DELETE FROM leadgen.enrichment_cache WHERE expires_at <= NOW()"
+        ))
+    return result.rowcount or 0
+
+
+async def fetch_through(
+    source: str,
+    key: Optional[str],
+    fetch: Callable[[], Awaitable[T]],
+    *,
+    decode: Callable[[Any], T] = lambda payload: payload,
+    cacheable: Callable[[T], bool] = _has_no_error,
+) -> T:
+    """Return the cached result for ``(source, key)`` or fetch and cache it.
+
+    With no key (not enough identifying data) or the cache disabled, this
+    is just ``await fetch()``.
+    """
+    if not key or not ENRICHMENT_CACHE_ENABLED:
+        return await fetch()
+
+    try:
+        payload = await lookup(source, key)
+        if payload is not None:
+            logger.debug("Enrichment cache hit: %s %s", source, key)
+            return decode(payload)
+    except Exception as exc:
+        logger.warning("Enrichment cache read failed for %s %s: %s", source, key, exc)
+
+    result = await fetch()
+    if cacheable(result):
+        try:
+            await store(source, key, encode(result))
+        except Exception as exc:
+            logger.warning("Enrichment cache write failed for %s %s: %s", source, key, exc)
+    return result
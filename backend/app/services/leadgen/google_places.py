@@ -1,21 +1,61 @@
-"""Business discovery via Google Places, Yelp, and OpenStreetMap Overpass APIs."""
+"""Business discovery via Google Places, Yelp, and OpenStreetMap Overpass APIs.
 
+All sources are queried at once. ``iter_places`` yields each source's
+deduplicated results in priority order, so Google (with place ids and
+reviews) always gets first claim on ``max_results``, and cancels the rest
+once it is reached; ``search_places`` collects them.
+"""
+
+import asyncio
 import httpx
 import logging
 import os
 from dataclasses import dataclass, field
 from datetime import date
+from typing import AsyncIterator
 
 from app.services.leadgen.phone_validator import clean_phone
 
 logger = logging.getLogger(__name__)
 
 # ── Google Places daily rate limiter (free tier: 30 requests/day) ────
-DAILY_PLACES_LIMIT = 30
+# The count lives in leadgen.api_quota so it survives restarts and is shared
+# by every worker; the module counters below are only a fallback for when
+# the database can't be reached.
+DAILY_PLACES_LIMIT = int(os.getenv("GOOGLE_PLACES_DAILY_LIMIT", "30"))
 _places_call_count = 0
 _places_call_date: str = ""
 
 
+async def _reserve_places_call() -> bool:
+    """Count one Google Places/Geocoding call against today's quota.
+
+    Returns False (and counts nothing) once the daily limit is reached.
+    """
+    try:
+        from sqlalchemy import text as sa_text
+        from app.db.leadgen_db import leadgen_engine
+        async with leadgen_engine.begin() as conn:
+            row = (await conn.execute(sa_text("""
+                INSERT INTO leadgen.api_quota (service, day, calls)
+                VALUES ('google_places', :day, 1)
+                ON CONFLICT (service, day) DO UPDATE SET calls = api_quota.calls + 1
+                WHERE api_quota.calls < :limit
+                RETURNING calls
+            """), {"day": date.today(), "limit": DAILY_PLACES_LIMIT})).first()
+    except Exception as exc:
+        logger.warning("Shared Places quota unavailable, counting in-process: %s", exc)
+        if not _check_places_rate_limit():
+            return False
+        _increment_places_count()
+        return True
+
+    if row is None:
+        return False
+    logger.info("Google Places API calls today: %d/%d", row[0], DAILY_PLACES_LIMIT)
+    return True
+
+
 def _check_places_rate_limit() -> bool:
     """Returns True if we can make another Google Places call today."""
     global _places_call_count, _places_call_date
@@ -223,10 +263,6 @@ async def _get_google_maps_key() -> str:
 
 async def _search_google_places(query: str, location: str, max_results: int, radius_km: int = 25) -> list[PlaceResult]:
     """Search Google Places API (requires google_maps_api_key in settings or GOOGLE_MAPS_API_KEY env)."""
-    if not _check_places_rate_limit():
-        logger.warning("Google Places daily limit reached (%d/%d) — skipping", _places_call_count, DAILY_PLACES_LIMIT)
-        return []
-
     api_key = await _get_google_maps_key()
     if not api_key:
         logger.warning("No Google Maps API key found in settings DB or environment")
@@ -244,8 +280,8 @@ async def _search_google_places(query: str, location: str, max_results: int, rad
 
             # Use locationBias to expand search radius beyond exact city
             # First geocode the location to get lat/lng, then set radius
-            if not page_token and radius_km and radius_km > 0:
-                _increment_places_count()  # Geocode counts against quota
+            if not page_token and radius_km and radius_km > 0 and await _reserve_places_call():
+                # Geocode counts against quota
                 geo_resp = await client.get(
                     "https://maps.googleapis.com/maps/api/geocode/json",
                     params={"address": location, "key": api_key},
@@ -270,12 +306,11 @@ async def _search_google_places(query: str, location: str, max_results: int, rad
                 "X-Goog-FieldMask": ",".join(PLACES_DETAIL_FIELDS),
             }
 
-            if not _check_places_rate_limit():
-                logger.warning("Google Places daily limit hit mid-search, stopping pagination")
+            if not await _reserve_places_call():
+                logger.warning("Google Places daily limit (%d) reached, stopping", DAILY_PLACES_LIMIT)
                 break
 
             try:
-                _increment_places_count()
                 response = await client.post(PLACES_TEXT_SEARCH_URL, json=body, headers=headers)
             except httpx.HTTPError as exc:
                 logger.error("Google Places HTTP error: %s", exc)
@@ -560,76 +595,100 @@ async def _search_osm_nominatim(query: str, location: str, max_results: int) ->
     return results[:max_results]
 
 
+def _dedupe_key(place: PlaceResult) -> str:
+    return f"{place.name.lower().strip()}|{place.city.lower().strip()}"
+
+
 def _deduplicate_results(results: list[PlaceResult]) -> list[PlaceResult]:
     """Remove duplicates across sources by matching name + city (case-insensitive)."""
     seen: set[str] = set()
     deduped: list[PlaceResult] = []
     for place in results:
-        key = f"{place.name.lower().strip()}|{place.city.lower().strip()}"
+        key = _dedupe_key(place)
         if key not in seen:
             seen.add(key)
             deduped.append(place)
     return deduped
 
 
-async def search_places(query: str, location: str, max_results: int = 60, radius_km: int = 25) -> list[PlaceResult]:
-    """Search for businesses matching query in location.
+# iter_places yields sources strictly in this order, whatever order they finish in
+SOURCE_PRIORITY = ("google_places", "yelp", "openstreetmap")
+
 
-    Sources tried in order of priority:
-    1. Google Places API (if google_maps_api_key in settings DB)
+async def iter_places(
+    query: str, location: str, max_results: int = 60, radius_km: int = 25,
+) -> AsyncIterator[tuple[str, list[PlaceResult]]]:
+    """Yield ``(source, places)`` batches, one per source, in priority order.
+
+    Sources run concurrently, but a source's batch is only yielded once
+    every higher-priority source has finished:
+    1. Google Places API (if google_maps_api_key in settings DB or env)
     2. Yelp (scraped from frontend, no API key needed)
-    3. OpenStreetMap Overpass API (always available, no key needed)
+    3. OpenStreetMap Overpass (always available, no key needed)
 
-    Results are deduplicated across sources. The `source` field on each
-    PlaceResult indicates where it came from.
+    A fast lower-priority source therefore can't fill ``max_results`` and
+    cut Google off. Each batch is deduplicated against everything yielded
+    before it. Once ``max_results`` places have been yielded the remaining
+    sources are cancelled. The `source` field on each PlaceResult indicates
+    where it came from.
     """
-    all_results: list[PlaceResult] = []
-    sources_tried: list[str] = []
-    sources_used: list[str] = []
-
-    # 1. Google Places (primary) — check env var OR settings DB
+    searches = {}
     google_key = os.getenv("GOOGLE_MAPS_API_KEY", "") or await _get_google_maps_key()
     if google_key:
-        sources_tried.append("google_places")
-        google_results = await _search_google_places(query, location, max_results, radius_km)
-        if google_results:
-            sources_used.append(f"google_places({len(google_results)})")
-            all_results.extend(google_results)
+        searches["google_places"] = _search_google_places(query, location, max_results, radius_km)
     else:
         logger.info("No Google Maps API key in env or settings DB — skipping Google Places")
+    searches["yelp"] = _search_yelp(query, location, max_results)
+    searches["openstreetmap"] = _search_openstreetmap(query, location, max_results)
+
+    tasks = {asyncio.create_task(coro): name for name, coro in searches.items()}
+    seen: set[str] = set()
+    found = 0
+    sources_used: list[str] = []
 
-    # 2. Yelp scrape (secondary, fills gaps — no API key needed)
-    remaining = max_results - len(all_results)
-    if remaining > 0:
-        sources_tried.append("yelp")
-        yelp_results = await _search_yelp(query, location, remaining)
-        if yelp_results:
-            sources_used.append(f"yelp({len(yelp_results)})")
-            all_results.extend(yelp_results)
-
-    # 3. OpenStreetMap Overpass (tertiary, always available)
-    remaining = max_results - len(all_results)
-    if remaining > 0:
-        sources_tried.append("openstreetmap")
-        osm_results = await _search_openstreetmap(query, location, remaining)
-        if osm_results:
-            sources_used.append(f"openstreetmap({len(osm_results)})")
-            all_results.extend(osm_results)
-
-    # Deduplicate across sources
-    deduped = _deduplicate_results(all_results)
-
-    if not deduped:
+    try:
+        for task in sorted(tasks, key=lambda t: SOURCE_PRIORITY.index(tasks[t])):
+            if found >= max_results:
+                break
+            source = tasks[task]
+            try:
+                results = await task
+            except Exception as exc:
+                logger.warning("Place search via %s failed: %s", source, exc)
+                continue
+
+            batch: list[PlaceResult] = []
+            for place in results:
+                key = _dedupe_key(place)
+                if key not in seen:
+                    seen.add(key)
+                    batch.append(place)
+            batch = batch[:max_results - found]
+            if batch:
+                found += len(batch)
+                sources_used.append(f"{source}({len(batch)})")
+                yield source, batch
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if not found:
         logger.warning(
             "No results found for '%s in %s' — tried sources: %s",
-            query, location, ", ".join(sources_tried) or "none",
+            query, location, ", ".join(searches) or "none",
         )
     else:
         logger.info(
             "search_places('%s', '%s'): %d results from %s (tried: %s)",
-            query, location, len(deduped),
-            ", ".join(sources_used),
-            ", ".join(sources_tried),
+            query, location, found, ", ".join(sources_used), ", ".join(searches),
         )
 
-    return deduped[:max_results]
+
+async def search_places(query: str, location: str, max_results: int = 60, radius_km: int = 25) -> list[PlaceResult]:
+    """Search for businesses matching query in location (all sources, deduplicated)."""
+    results: list[PlaceResult] = []
+    async for _, batch in iter_places(query, location, max_results, radius_km):
+        results.extend(batch)
+    return results
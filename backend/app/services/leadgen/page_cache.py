@@ -0,0 +1,149 @@
+"""Shared page fetches for the lead website crawler and auditors.
+
+``crawl_website``, ``audit_website`` and the deep auditor all start from a
+lead's homepage, and usually run within seconds of each other. ``fetch_page``
+downloads a URL once and serves the same response to everyone asking for it
+within ``PAGE_CACHE_TTL_SECONDS``; concurrent requests for a URL that is
+already downloading wait for that download instead of starting another.
+The download runs in its own task, so a caller that is cancelled (say, an
+auditor hitting its deadline) doesn't cancel it for the others waiting.
+The cache is bounded both by entry count and by total page size.
+
+Fetches go through one pooled client and ``throttle.polite`` so the
+business's site sees a single, spaced-out crawler.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from app.services.leadgen.throttle import polite
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_TTL_SECONDS = float(os.getenv("PAGE_CACHE_TTL_SECONDS", "600"))
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "256"))
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Bigger pages are returned but not kept
+PAGE_CACHE_MAX_PAGE_BYTES = int(os.getenv("PAGE_CACHE_MAX_PAGE_BYTES", str(2 * 1024 * 1024)))
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
+@dataclass
+class FetchedPage:
+    """One downloaded page; status 0 means the request itself failed."""
+    url: str
+    status: int = 0
+    text: str = ""
+    elapsed_ms: float = 0.0
+    error: str = ""
+
+
+_client: Optional[httpx.AsyncClient] = None
+# normalized url -> (expires_at monotonic, page), oldest first
+_pages: "OrderedDict[str, tuple[float, FetchedPage]]" = OrderedDict()
+_pages_bytes = 0
+_inflight: dict[str, "asyncio.Task[FetchedPage]"] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=HEADERS,
+            follow_redirects=True,
+            timeout=20.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _client
+
+
+def _cache_key(url: str) -> str:
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def _forget(key: str) -> None:
+    global _pages_bytes
+    entry = _pages.pop(key, None)
+    if entry is not None:
+        _pages_bytes -= len(entry[1].text)
+
+
+def _remember(key: str, page: FetchedPage) -> None:
+    global _pages_bytes
+    if page.status != 200 or len(page.text) > PAGE_CACHE_MAX_PAGE_BYTES:
+        return
+    _forget(key)
+    _pages[key] = (time.monotonic() + PAGE_CACHE_TTL_SECONDS, page)
+    _pages_bytes += len(page.text)
+    while len(_pages) > PAGE_CACHE_MAX_ENTRIES or _pages_bytes > PAGE_CACHE_MAX_BYTES:
+        _forget(next(iter(_pages)))
+
+
+async def _download(url: str, timeout: float) -> FetchedPage:
+    start = time.monotonic()
+    try:
+        async with polite(url):
+            resp = await _get_client().get(url, timeout=timeout)
+        return FetchedPage(
+            url=url, status=resp.status_code, text=resp.text,
+            elapsed_ms=(time.monotonic() - start) * 1000,
+        )
+    except Exception as exc:
+        logger.warning("Failed to fetch %s: %s", url, exc)
+        return FetchedPage(url=url, elapsed_ms=(time.monotonic() - start) * 1000, error=str(exc))
+
+
+async def _fetch_into_cache(key: str, url: str, timeout: float) -> FetchedPage:
+    try:
+        page = await _download(url, timeout)
+        _remember(key, page)
+        return page
+    finally:
+        _inflight.pop(key, None)
+
+
+async def fetch_page(url: str, timeout: float = 15.0) -> FetchedPage:
+    """GET a page, reusing a recent or in-flight fetch of the same URL."""
+    key = _cache_key(url)
+    cached = _pages.get(key)
+    if cached:
+        if cached[0] > time.monotonic():
+            return cached[1]
+        _forget(key)
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_into_cache(key, url, timeout))
+        _inflight[key] = task
+    # Shielded: cancelling this caller leaves the download to the others
+    return await asyncio.shield(task)
+
+
+def clear_page_cache() -> None:
+    global _pages_bytes
+    _pages.clear()
+    _pages_bytes = 0
+
+
+async def close_page_cache() -> None:
+    """Close the pooled client and drop cached pages on shutdown."""
+    global _client
+    clear_page_cache()
+    if _client is not None:
+        await _client.aclose()
+        _client = None
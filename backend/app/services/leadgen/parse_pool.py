@@ -0,0 +1,67 @@
+"""Process pool for CPU-heavy HTML parsing.
+
+BeautifulSoup with ``html.parser`` is pure Python; a large homepage can
+hold the GIL for hundreds of milliseconds, which a thread pool doesn't
+help with. ``parse_in_pool(fn, *args)`` runs a module-level parse function
+in a small spawn-based process pool instead, so the event loop keeps
+serving other requests.
+
+Parse functions must be importable top-level functions taking and
+returning picklable values (strings, dicts, dataclasses). If the pool
+can't be used (e.g. worker processes are forbidden), calls fall back to a
+thread.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LEADGEN_PARSE_WORKERS = int(os.getenv("LEADGEN_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_disabled = LEADGEN_PARSE_WORKERS <= 0
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool, _pool_disabled
+    if _pool is None and not _pool_disabled:
+        try:
+            # spawn: never fork a process that's running an event loop and threads
+            _pool = ProcessPoolExecutor(
+                max_workers=LEADGEN_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        except (OSError, ValueError, NotImplementedError) as exc:
+            logger.warning("HTML parse pool unavailable, parsing in threads: %s", exc)
+            _pool_disabled = True
+    return _pool
+
+
+async def parse_in_pool(fn: Callable[..., T], *args: Any) -> T:
+    """Run ``fn(*args)`` in the parse pool (or a thread if there is none)."""
+    global _pool
+    pool = _get_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM on a huge page?) — start a fresh pool next time
+            logger.warning("HTML parse pool broke, recreating it")
+            _pool = None
+    return await asyncio.to_thread(fn, *args)
+
+
+def shutdown_parse_pool() -> None:
+    """Stop worker processes on shutdown."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
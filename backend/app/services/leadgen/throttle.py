@@ -0,0 +1,101 @@
+"""Concurrency budgets for lead enrichment.
+
+Two independent limits keep a large enrichment job fast without hammering
+anyone:
+
+  - ``source_slot(name)`` — a per-source semaphore, so e.g. Yelp and BBB
+    each get their own budget instead of every lead sharing one global
+    cap. Override with ``LEADGEN_SOURCE_CONCURRENCY="yelp=2,crawl=12"``.
+  - ``polite(url)`` — a per-host limiter for crawling business websites:
+    at most ``LEADGEN_DOMAIN_CONCURRENCY`` requests in flight per host and
+    ``LEADGEN_DOMAIN_MIN_INTERVAL`` seconds between request starts.
+"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+from app.utils.concurrency import parse_concurrency
+
+# Max concurrent calls per external source across all leads in the process
+_DEFAULT_SOURCE_CONCURRENCY = {
+    "discovery": 4,
+    "crawl": 8,
+    "yelp": 3,
+    "google_reviews": 6,
+    "bbb": 3,
+    "glassdoor": 2,
+    "reddit": 3,
+    "news": 3,
+    "social": 4,
+    "audit": 6,
+}
+# Leads enriched at once by enrich_job (each holds a DB session only briefly)
+LEADGEN_ENRICH_CONCURRENCY = int(os.getenv("LEADGEN_ENRICH_CONCURRENCY", "12"))
+LEADGEN_DOMAIN_CONCURRENCY = int(os.getenv("LEADGEN_DOMAIN_CONCURRENCY", "2"))
+LEADGEN_DOMAIN_MIN_INTERVAL = float(os.getenv("LEADGEN_DOMAIN_MIN_INTERVAL", "0.5"))
+# Idle host entries are dropped once the table grows past this
+_MAX_TRACKED_HOSTS = 2000
+
+
+SOURCE_CONCURRENCY = parse_concurrency(os.getenv("LEADGEN_SOURCE_CONCURRENCY", ""), _DEFAULT_SOURCE_CONCURRENCY)
+
+_source_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+class _HostState:
+    __slots__ = ("semaphore", "lock", "next_start", "users")
+
+    def __init__(self) -> None:
+        self.semaphore = asyncio.Semaphore(LEADGEN_DOMAIN_CONCURRENCY)
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0
+        self.users = 0
+
+
+_hosts: dict[str, _HostState] = {}
+
+
+def source_slot(name: str) -> asyncio.Semaphore:
+    """Semaphore bounding concurrent calls to one enrichment source."""
+    sem = _source_semaphores.get(name)
+    if sem is None:
+        sem = asyncio.Semaphore(SOURCE_CONCURRENCY.get(name, 4))
+        _source_semaphores[name] = sem
+    return sem
+
+
+def _host_key(url: str) -> str:
+    host = (urlparse(url).hostname or url).lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _host_state(host: str) -> _HostState:
+    state = _hosts.get(host)
+    if state is None:
+        if len(_hosts) >= _MAX_TRACKED_HOSTS:
+            now = time.monotonic()
+            for key in [k for k, s in _hosts.items() if s.users == 0 and s.next_start <= now]:
+                del _hosts[key]
+        state = _hosts[host] = _HostState()
+    return state
+
+
+@asynccontextmanager
+async def polite(url: str) -> AsyncIterator[None]:
+    """Hold a per-host slot, spacing request starts to the same host."""
+    state = _host_state(_host_key(url))
+    state.users += 1
+    try:
+        async with state.semaphore:
+            async with state.lock:
+                wait = state.next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                state.next_start = time.monotonic() + LEADGEN_DOMAIN_MIN_INTERVAL
+            yield
+    finally:
+        state.users -= 1
@@ -7,9 +7,11 @@ import ssl
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
-import httpx
 from bs4 import BeautifulSoup
 
+from app.services.leadgen.page_cache import fetch_page
+from app.services.leadgen.parse_pool import parse_in_pool
+
 logger = logging.getLogger(__name__)
 
 EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
@@ -45,6 +47,38 @@ class WebsiteAudit:
             self.top_fixes = []
 
 
+def _analyze_content(audit: WebsiteAudit, content: str) -> WebsiteAudit:
+    """Fill in the page checks from the homepage HTML (runs in the parse pool)."""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Check for email
+    audit.has_email = bool(EMAIL_PATTERN.search(content))
+    
+    # Check for phone
+    audit.has_phone = bool(PHONE_PATTERN.search(content))
+    
+    # Check meta description
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc and meta_desc.get("content"):
+        audit.has_meta_description = True
+        audit.meta_description_length = len(meta_desc["content"])
+    
+    # Check viewport meta tag
+    viewport = soup.find("meta", attrs={"name": "viewport"})
+    audit.has_viewport = bool(viewport)
+    
+    # Check page title
+    title = soup.find("title")
+    if title:
+        audit.page_title_length = len(title.text.strip())
+    
+    # Count social links
+    for platform, pattern in SOCIAL_PATTERNS.items():
+        if pattern.search(content):
+            audit.has_socials += 1
+    return audit
+
+
 async def audit_website(url: str) -> WebsiteAudit:
     """Audit a website and return a score with improvement recommendations."""
     audit = WebsiteAudit(url=url)
@@ -54,47 +88,22 @@ async def audit_website(url: str) -> WebsiteAudit:
         parsed = urlparse(url)
         audit.has_ssl = parsed.scheme == "https"
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(url, follow_redirects=True)
-            
-            if response.status_code != 200:
-                audit.summary = f"Website returned status {response.status_code}"
-                return audit
-            
-            content = response.text
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Check for email
-            audit.has_email = bool(EMAIL_PATTERN.search(content))
-            
-            # Check for phone
-            audit.has_phone = bool(PHONE_PATTERN.search(content))
-            
-            # Check meta description
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc and meta_desc.get("content"):
-                audit.has_meta_description = True
-                audit.meta_description_length = len(meta_desc["content"])
-            
-            # Check viewport meta tag
-            viewport = soup.find("meta", attrs={"name": "viewport"})
-            audit.has_viewport = bool(viewport)
-            
-            # Check page title
-            title = soup.find("title")
-            if title:
-                audit.page_title_length = len(title.text.strip())
-            
-            # Count social links
-            for platform, pattern in SOCIAL_PATTERNS.items():
-                if pattern.search(content):
-                    audit.has_socials += 1
-            
-            # Calculate score
-            audit.score = _calculate_audit_score(audit)
-            audit.grade = _score_to_grade(audit.score)
-            audit.summary = _generate_summary(audit)
-            audit.top_fixes = _generate_top_fixes(audit)
+        # Usually already fetched by the crawler for this lead
+        page = await fetch_page(url)
+        if page.error:
+            raise RuntimeError(page.error)
+        
+        if page.status != 200:
+            audit.summary = f"Website returned status {page.status}"
+            return audit
+        
+        audit = await parse_in_pool(_analyze_content, audit, page.text)
+        
+        # Calculate score
+        audit.score = _calculate_audit_score(audit)
+        audit.grade = _score_to_grade(audit.score)
+        audit.summary = _generate_summary(audit)
+        audit.top_fixes = _generate_top_fixes(audit)
             
     except Exception as exc:
         logger.error("Website audit failed for %s: %s", url, exc)
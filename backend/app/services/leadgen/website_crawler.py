@@ -6,9 +6,11 @@ import re
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
 
-import httpx
 from bs4 import BeautifulSoup
 
+from app.services.leadgen.page_cache import fetch_page
+from app.services.leadgen.parse_pool import parse_in_pool
+
 logger = logging.getLogger(__name__)
 
 EMAIL_PATTERN = re.compile(
@@ -51,12 +53,6 @@ JUNK_PHONE_PREFIXES = {
     "8005551212",  # 411 directory
 }
 
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.5",
-}
-
 
 def _clean_phones(raw_phones: set[str]) -> list[str]:
     """Deduplicate and normalize phone numbers."""
@@ -178,22 +174,27 @@ def _strip_script_style(page_source: str) -> str:
     return cleaned
 
 
-async def _scrape_page(url: str, session: httpx.AsyncClient) -> tuple[str, set[str], set[str], dict[str, str]]:
+def _extract_page_data(raw_content: str) -> tuple[set[str], set[str], dict[str, str]]:
+    """Emails, phones and socials from a page (runs in the parse pool)."""
+    # Extract tel: links before stripping (most reliable phone source)
+    tel_phones = _extract_tel_phones(raw_content)
+    # Strip script/style to avoid junk emails/phones from JS bundles
+    content = _strip_script_style(raw_content)
+    emails = set(EMAIL_PATTERN.findall(content))
+    phones = tel_phones | set(PHONE_PATTERN.findall(content))
+    socials = _extract_socials(raw_content)  # Socials from full content (links)
+    return emails, phones, socials
+
+
+async def _scrape_page(url: str) -> tuple[str, set[str], set[str], dict[str, str]]:
     """Visit a page and extract emails, phones, socials from content."""
     try:
-        response = await session.get(url, timeout=15.0, follow_redirects=True, headers=HEADERS)
-        if response.status_code != 200:
+        page = await fetch_page(url)
+        if page.status != 200:
             return "", set(), set(), {}
 
-        raw_content = response.text
-        # Extract tel: links before stripping (most reliable phone source)
-        tel_phones = _extract_tel_phones(raw_content)
-        # Strip script/style to avoid junk emails/phones from JS bundles
-        content = _strip_script_style(raw_content)
-        emails = set(EMAIL_PATTERN.findall(content))
-        phones = tel_phones | set(PHONE_PATTERN.findall(content))
-        socials = _extract_socials(raw_content)  # Socials from full content (links)
-        return raw_content, emails, phones, socials
+        emails, phones, socials = await parse_in_pool(_extract_page_data, page.text)
+        return page.text, emails, phones, socials
     except Exception as exc:
         logger.warning("Failed to scrape %s: %s", url, exc)
         return "", set(), set(), {}
@@ -204,58 +205,57 @@ async def crawl_website(url: str) -> CrawlResult:
     result = CrawlResult(url=url)
 
     try:
-        async with httpx.AsyncClient(timeout=25.0, headers=HEADERS) as session:
-            # Scrape homepage
-            homepage_content, all_emails, all_phones, all_socials = await _scrape_page(url, session)
-            if not homepage_content:
-                result.error = "Failed to load homepage"
-                return result
-
-            result.status_code = 200
-            result.platform = _detect_platform(homepage_content)
-
-            # Collect all subpages to crawl (deduplicated)
-            visited = {url.rstrip("/")}
-            subpages: list[str] = []
-
-            # Priority 1: Contact/about pages (pattern-matched)
-            contact_pages = _find_contact_pages(homepage_content, url)
-            for p in contact_pages:
-                normalized = p.rstrip("/")
-                if normalized not in visited:
-                    visited.add(normalized)
-                    subpages.append(p)
-
-            # Priority 2: Navigation links (nav, header, footer)
-            nav_links = _find_nav_links(homepage_content, url)
-            for p in nav_links:
-                normalized = p.rstrip("/")
-                if normalized not in visited:
-                    visited.add(normalized)
-                    subpages.append(p)
-
-            # Limit total subpages to avoid hammering small sites
-            subpages = subpages[:10]
-            logger.info("Crawling %s: found %d subpages to scrape", url, len(subpages))
-
-            for sub_url in subpages:
-                await asyncio.sleep(0.8)  # Be polite
-                _, page_emails, page_phones, page_socials = await _scrape_page(sub_url, session)
-                all_emails.update(page_emails)
-                all_phones.update(page_phones)
-                for platform, link in page_socials.items():
-                    if platform not in all_socials:
-                        all_socials[platform] = link
-
-            result.emails = _clean_emails(all_emails)
-            result.phones = _clean_phones(all_phones)
-            result.facebook = all_socials.get("facebook", "")
-            result.instagram = all_socials.get("instagram", "")
-            result.linkedin = all_socials.get("linkedin", "")
-            result.twitter = all_socials.get("twitter", "")
-            result.tiktok = all_socials.get("tiktok", "")
-            result.youtube = all_socials.get("youtube", "")
-            result.yelp = all_socials.get("yelp", "")
+        # Scrape homepage
+        homepage_content, all_emails, all_phones, all_socials = await _scrape_page(url)
+        if not homepage_content:
+            result.error = "Failed to load homepage"
+            return result
+
+        result.status_code = 200
+        result.platform = _detect_platform(homepage_content)
+
+        # Collect all subpages to crawl (deduplicated)
+        visited = {url.rstrip("/")}
+        subpages: list[str] = []
+
+        # Priority 1: Contact/about pages (pattern-matched)
+        contact_pages = _find_contact_pages(homepage_content, url)
+        for p in contact_pages:
+            normalized = p.rstrip("/")
+            if normalized not in visited:
+                visited.add(normalized)
+                subpages.append(p)
+
+        # Priority 2: Navigation links (nav, header, footer)
+        nav_links = await parse_in_pool(_find_nav_links, homepage_content, url)
+        for p in nav_links:
+            normalized = p.rstrip("/")
+            if normalized not in visited:
+                visited.add(normalized)
+                subpages.append(p)
+
+        # Limit total subpages to avoid hammering small sites
+        subpages = subpages[:10]
+        logger.info("Crawling %s: found %d subpages to scrape", url, len(subpages))
+
+        # Fetched together; polite() spaces requests to the same host
+        pages = await asyncio.gather(*(_scrape_page(sub_url) for sub_url in subpages))
+        for _, page_emails, page_phones, page_socials in pages:
+            all_emails.update(page_emails)
+            all_phones.update(page_phones)
+            for platform, link in page_socials.items():
+                if platform not in all_socials:
+                    all_socials[platform] = link
+
+        result.emails = _clean_emails(all_emails)
+        result.phones = _clean_phones(all_phones)
+        result.facebook = all_socials.get("facebook", "")
+        result.instagram = all_socials.get("instagram", "")
+        result.linkedin = all_socials.get("linkedin", "")
+        result.twitter = all_socials.get("twitter", "")
+        result.tiktok = all_socials.get("tiktok", "")
+        result.youtube = all_socials.get("youtube", "")
+        result.yelp = all_socials.get("yelp", "")
 
     except Exception as exc:
         result.error = str(exc)
@@ -0,0 +1,249 @@
+"""Async ffmpeg / ffprobe execution.
+
+Media tools used to be run with ``subprocess.run`` straight from async
+handlers, freezing the event loop for the whole render. ``run_media``
+starts them as asyncio subprocesses instead:
+
+  - ffmpeg runs are bounded process-wide by ``FFMPEG_CONCURRENCY`` so a
+    burst of renders can't starve the box; ffprobe calls are cheap and
+    skip the limit.
+  - each run has a timeout, and the process is killed if it expires or
+    the calling task is cancelled (e.g. the client went away).
+  - with ``on_progress`` set, ffmpeg is started with ``-progress pipe:1``
+    and the callback receives parsed ``FfmpegProgress`` updates.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_CONCURRENCY = int(os.getenv("FFMPEG_CONCURRENCY", "2"))
+FFMPEG_TIMEOUT_SECONDS = float(os.getenv("FFMPEG_TIMEOUT_SECONDS", "300"))
+FFPROBE_TIMEOUT_SECONDS = float(os.getenv("FFPROBE_TIMEOUT_SECONDS", "30"))
+# Only the tail of stderr is kept; ffmpeg logs a line per frame on long renders
+_STDERR_TAIL_BYTES = 16 * 1024
+
+_ffmpeg_semaphore: Optional[asyncio.Semaphore] = None
+_ffmpeg_available: Optional[bool] = None
+
+
+class MediaExecError(RuntimeError):
+    """A media tool exited non-zero, timed out, or could not be started."""
+
+    def __init__(self, message: str, returncode: Optional[int] = None, stderr: str = ""):
+        super().__init__(message)
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+@dataclass
+class MediaResult:
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+@dataclass
+class FfmpegProgress:
+    """One ``-progress`` block from ffmpeg."""
+    out_time_seconds: float = 0.0
+    # 0.0–1.0 when the expected duration is known, else None
+    fraction: Optional[float] = None
+    speed: str = ""
+    done: bool = False
+
+
+ProgressCallback = Callable[[FfmpegProgress], Union[None, Awaitable[None]]]
+
+
+def _get_ffmpeg_semaphore() -> asyncio.Semaphore:
+    global _ffmpeg_semaphore
+    if _ffmpeg_semaphore is None:
+        _ffmpeg_semaphore = asyncio.Semaphore(max(FFMPEG_CONCURRENCY, 1))
+    return _ffmpeg_semaphore
+
+
+def _with_progress_flags(cmd: Sequence[str]) -> list[str]:
+    # Global options go right after the binary, before any input
+    return [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+
+
+def _parse_progress_block(fields: dict[str, str], duration: Optional[float]) -> FfmpegProgress:
+    out_us = fields.get("out_time_us") or fields.get("out_time_ms") or "0"
+    try:
+        # out_time_ms is also microseconds (long-standing ffmpeg quirk)
+        seconds = max(int(out_us), 0) / 1_000_000
+    except ValueError:
+        seconds = 0.0
+    done = fields.get("progress") == "end"
+    fraction = None
+    if duration and duration > 0:
+        fraction = 1.0 if done else min(seconds / duration, 1.0)
+    return FfmpegProgress(
+        out_time_seconds=seconds, fraction=fraction,
+        speed=fields.get("speed", "").strip(), done=done,
+    )
+
+
+async def _read_progress(
+    stream: asyncio.StreamReader,
+    on_progress: Optional[ProgressCallback],
+    duration: Optional[float],
+) -> str:
+    """Consume stdout; with a callback, parse it as ``-progress`` output."""
+    if on_progress is None:
+        return (await stream.read()).decode(errors="replace")
+
+    fields: dict[str, str] = {}
+    async for raw in stream:
+        key, _, value = raw.decode(errors="replace").strip().partition("=")
+        if not key:
+            continue
+        fields[key] = value
+        if key != "progress":
+            continue
+        try:
+            outcome = on_progress(_parse_progress_block(fields, duration))
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as exc:
+            logger.debug("Progress callback failed: %s", exc)
+        fields = {}
+    return ""
+
+
+async def _read_tail(stream: asyncio.StreamReader) -> str:
+    tail = b""
+    while chunk := await stream.read(65536):
+        tail = (tail + chunk)[-_STDERR_TAIL_BYTES:]
+    return tail.decode(errors="replace")
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def _exec(
+    cmd: Sequence[str],
+    timeout: float,
+    on_progress: Optional[ProgressCallback],
+    duration: Optional[float],
+) -> MediaResult:
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise MediaExecError(f"{cmd[0]} not found") from exc
+
+    try:
+        stdout, stderr, returncode = await asyncio.wait_for(
+            asyncio.gather(
+                _read_progress(proc.stdout, on_progress, duration),
+                _read_tail(proc.stderr),
+                proc.wait(),
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        await _kill(proc)
+        raise MediaExecError(f"{cmd[0]} timed out after {timeout:.0f}s")
+    except BaseException:
+        # Cancelled (or failed) mid-run: don't leave an orphaned ffmpeg behind
+        await _kill(proc)
+        raise
+    return MediaResult(returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+async def run_media(
+    cmd: Sequence[str],
+    *,
+    timeout: Optional[float] = None,
+    check: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+    duration: Optional[float] = None,
+) -> MediaResult:
+    """Run an ffmpeg/ffprobe command without blocking the event loop.
+
+    Args:
+        cmd: Full argv, starting with ``ffmpeg`` or ``ffprobe``
+        timeout: Seconds before the process is killed (defaults per tool)
+        check: Raise ``MediaExecError`` on a non-zero exit
+        on_progress: ffmpeg only — called with each progress update
+        duration: Expected output duration, to fill ``FfmpegProgress.fraction``
+
+    Returns:
+        MediaResult with the exit code, stdout and the tail of stderr
+    """
+    is_ffmpeg = os.path.basename(cmd[0]) == "ffmpeg"
+    if timeout is None:
+        timeout = FFMPEG_TIMEOUT_SECONDS if is_ffmpeg else FFPROBE_TIMEOUT_SECONDS
+    if on_progress is not None and is_ffmpeg:
+        cmd = _with_progress_flags(cmd)
+    else:
+        on_progress = None
+
+    if is_ffmpeg:
+        async with _get_ffmpeg_semaphore():
+            result = await _exec(cmd, timeout, on_progress, duration)
+    else:
+        result = await _exec(cmd, timeout, on_progress, duration)
+
+    if check and result.returncode != 0:
+        raise MediaExecError(
+            f"{cmd[0]} exited with {result.returncode}: {result.stderr[-2000:]}",
+            returncode=result.returncode, stderr=result.stderr,
+        )
+    return result
+
+
+async def ffmpeg_available() -> bool:
+    """Whether ffmpeg can be run here.
+
+    Only a positive answer is cached: a failed check (binary not yet
+    mounted, a slow first start) is retried on the next call.
+    """
+    global _ffmpeg_available
+    if _ffmpeg_available:
+        return True
+    try:
+        result = await _exec(["ffmpeg", "-version"], 5, None, None)
+    except MediaExecError:
+        return False
+    _ffmpeg_available = result.returncode == 0
+    return _ffmpeg_available
+
+
+async def probe(path: str) -> dict[str, Any]:
+    """``ffprobe`` format and stream info for a media file."""
+    result = await run_media([
+        "ffprobe", "-v", "quiet", "-print_format", "json",
+        "-show_format", "-show_streams", path,
+    ])
+    return json.loads(result.stdout or "{}")
+
+
+async def probe_duration(path: str) -> Optional[float]:
+    """Duration of a media file in seconds, or None if it can't be read."""
+    try:
+        result = await run_media([
+            "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
+            "-of", "csv=p=0", path,
+        ])
+        return float(result.stdout.strip())
+    except (MediaExecError, ValueError):
+        return None
@@ -16,18 +16,61 @@ Phase 2 Roadmap: Deep Psychographic Profiling
 - Temporal engagement modeling
 """
 
+import asyncio
+import copy
 import logging
 import json
+import os
 import random
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.nano_banana import _get_api_key, call_gemini_api
+from app.services.shared_state import get_json, set_json
 
 logger = logging.getLogger(__name__)
 
+# Persona LLM calls in flight across all simulations in this process
+PERSONA_CONCURRENCY = int(os.getenv("MIROFISH_PERSONA_CONCURRENCY", "6"))
+# A persona that hasn't answered by then is dropped from the aggregate
+PERSONA_TIMEOUT_SECONDS = float(os.getenv("MIROFISH_PERSONA_TIMEOUT_SECONDS", "45"))
+# Persona sets are rebuilt at most this often unless competitor data changes
+PERSONA_CACHE_TTL_SECONDS = float(os.getenv("MIROFISH_PERSONA_CACHE_TTL_SECONDS", "600"))
+
+_persona_semaphore: Optional[asyncio.Semaphore] = None
+# org_id -> (expires_at monotonic, shared version, personas)
+_persona_cache: Dict[int, tuple] = {}
+
+
+def _get_persona_semaphore() -> asyncio.Semaphore:
+    global _persona_semaphore
+    if _persona_semaphore is None:
+        _persona_semaphore = asyncio.Semaphore(PERSONA_CONCURRENCY)
+    return _persona_semaphore
+
+
+def _persona_version_key(org_id: int) -> str:
+    return f"mirofish:personas-version:{org_id}"
+
+
+async def invalidate_personas(org_id: Optional[int] = None) -> None:
+    """Drop cached personas for one org after its competitor data changed.
+
+    Posts are upserted by the scheduler leader and queue workers, not the
+    API process serving simulations, so the org's version key in shared
+    state is bumped; every process's cache entry for the org then misses.
+    ``org_id=None`` clears this process's cache only.
+    """
+    if org_id is None:
+        _persona_cache.clear()
+        return
+    _persona_cache.pop(org_id, None)
+    await set_json(_persona_version_key(org_id), uuid.uuid4().hex, ttl_seconds=86400)
+
 
 class MiroFishEngine:
     """
@@ -47,8 +90,15 @@ class MiroFishEngine:
         - Sentiment responses
         - Interaction styles
         
-        Returns persona profiles with predicted behavior patterns.
+        Returns persona profiles with predicted behavior patterns. Results are
+        cached per org for PERSONA_CACHE_TTL_SECONDS; new competitor posts
+        invalidate them via invalidate_personas().
         """
+        version = await get_json(_persona_version_key(org_id))
+        cached = _persona_cache.get(org_id)
+        if cached and cached[0] > time.monotonic() and cached[1] == version:
+            return copy.deepcopy(cached[2])
+
         try:
             # Query competitor posts and engagement data
             query = text("""
@@ -77,13 +127,14 @@ class MiroFishEngine:
             
             if not posts:
                 logger.warning(f"No competitor posts found for org {org_id}")
-                return []
-            
-            # Analyze engagement patterns to create persona clusters
-            personas = self._cluster_into_personas(posts)
-            
-            logger.info(f"Generated {len(personas)} personas from {len(posts)} competitor posts")
-            return personas
+                personas = []
+            else:
+                # Analyze engagement patterns to create persona clusters
+                personas = self._cluster_into_personas(posts)
+                logger.info(f"Generated {len(personas)} personas from {len(posts)} competitor posts")
+
+            _persona_cache[org_id] = (time.monotonic() + PERSONA_CACHE_TTL_SECONDS, version, personas)
+            return copy.deepcopy(personas)
             
         except Exception as e:
             logger.error(f"Failed to generate personas: {e}")
@@ -275,21 +326,29 @@ class MiroFishEngine:
         Aggregates responses into viral_score, engagement_rate, sentiment, and specific recommendations.
         
         Recommendations must be SPECIFIC: "Shorten intro by 3 seconds" not "make it better"
+
+        Personas run concurrently (bounded by PERSONA_CONCURRENCY, each capped
+        at PERSONA_TIMEOUT_SECONDS); personas that fail or time out are left
+        out of the aggregate rather than failing the simulation.
         """
         try:
             api_key = await _get_api_key()
             
-            # Simulate each persona's response
-            persona_responses = []
-            for persona in personas:
-                response = await self._simulate_persona_response(content_data, persona, api_key)
-                if response:
-                    persona_responses.append(response)
+            # Simulate every persona's response at once
+            responses = await asyncio.gather(*(
+                self._simulate_persona_response(content_data, persona, api_key)
+                for persona in personas
+            ))
+            persona_responses = [r for r in responses if r]
             
             # Aggregate responses into final prediction
             result = self._aggregate_persona_responses(persona_responses, content_data)
+            result["personas_simulated"] = len(persona_responses)
+            result["personas_failed"] = len(personas) - len(persona_responses)
             
-            logger.info(f"Simulation complete: {len(persona_responses)} persona responses")
+            logger.info(
+                f"Simulation complete: {len(persona_responses)}/{len(personas)} persona responses"
+            )
             return result
             
         except Exception as e:
@@ -310,15 +369,27 @@ class MiroFishEngine:
             prompt = self._build_persona_prompt(content_data, persona)
             
             # Call Gemini API
-            response = await call_gemini_api(
-                api_key=api_key,
-                messages=[{"role": "user", "content": prompt}],
-                model="gemini-1.5-flash"
-            )
+            async with _get_persona_semaphore():
+                result = await asyncio.wait_for(
+                    call_gemini_api(
+                        api_key=api_key,
+                        model="gemini-1.5-flash",
+                        messages=[{"role": "user", "parts": [{"text": prompt}]}],
+                        generation_config={"temperature": 0.7, "maxOutputTokens": 1024},
+                    ),
+                    timeout=PERSONA_TIMEOUT_SECONDS,
+                )
+            
+            candidates = result.get("candidates", [])
+            parts = candidates[0].get("content", {}).get("parts", []) if candidates else []
+            response = "".join(part.get("text", "") for part in parts)
             
             # Parse structured response
             return self._parse_persona_response(response, persona["id"])
             
+        except asyncio.TimeoutError:
+            logger.warning(f"Persona simulation timed out for {persona['id']}")
+            return None
         except Exception as e:
             logger.error(f"Persona simulation failed for {persona['id']}: {e}")
             return None
@@ -0,0 +1,204 @@
+"""Push-based notification fan-out over Postgres LISTEN/NOTIFY.
+
+Every insert into public.notifications also runs ``pg_notify`` on
+``NOTIFY_CHANNEL`` inside the same transaction, so the event is delivered
+exactly when the row becomes visible (on commit) and never for a rollback.
+
+Each process keeps ONE dedicated asyncpg connection listening on that
+channel and fans events out in memory to the SSE subscribers of the
+matching user. Open browser tabs therefore cost a queue each, not a
+SELECT every few seconds.
+
+Payloads carry the full notification when it fits under Postgres' 8000
+byte NOTIFY limit; larger ones are sent as ``{"id", "user_id"}`` only and
+the subscriber loads the row itself. Catch-up after a reconnect is the
+SSE layer's job (``Last-Event-ID``), not the bus's; so is catch-up after
+an overflow, which the bus only flags (see ``take_overflow``).
+
+If the listener cannot connect, ``is_listening()`` returns False and the
+stream endpoint falls back to polling, so notifications keep working
+without a LISTEN-capable connection.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "warroom_notifications"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_MAX_PAYLOAD_BYTES = 7900
+
+# Per-subscriber buffer; a tab that stops reading drops events rather than
+# growing without bound, and the queue is flagged so the stream re-reads
+# what it missed from the DB
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Delay between reconnect attempts when the listener connection drops
+_RECONNECT_DELAY_SECONDS = 5.0
+
+
+
+class SubscriberQueue(asyncio.Queue):
+    """A subscriber's event buffer, remembering whether it dropped events."""
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.overflowed = False
+
+
+_subscribers: dict[int, set[SubscriberQueue]] = defaultdict(set)
+_listener_task: Optional[asyncio.Task] = None
+_listening = False
+
+
+def _listen_dsn() -> str:
+    """asyncpg wants a plain postgresql:// DSN, not the SQLAlchemy URL."""
+    return settings.POSTGRES_URL.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def build_payload(notification: dict[str, Any]) -> str:
+    """Serialize a notification for pg_notify, trimming it if it is too big."""
+    payload = json.dumps(notification, default=str)
+    if len(payload.encode("utf-8")) < _MAX_PAYLOAD_BYTES:
+        return payload
+    return json.dumps({"id": notification["id"], "user_id": notification["user_id"]})
+
+
+async def publish(db: AsyncSession, notification: dict[str, Any]) -> None:
+    """Queue a NOTIFY for a freshly inserted notification.
+
+    Must run on the same session as the INSERT, before commit — Postgres
+    holds the event until the transaction commits.
+    """
+    await db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": NOTIFY_CHANNEL, "payload": build_payload(notification)},
+    )
+
+
+# ── Subscribers ──────────────────────────────────────────────────────
+
+def subscribe(user_id: int) -> SubscriberQueue:
+    """Register an SSE client for a user's notifications."""
+    queue = SubscriberQueue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers[user_id].add(queue)
+    return queue
+
+
+def unsubscribe(user_id: int, queue: SubscriberQueue) -> None:
+    """Remove an SSE client; safe to call more than once."""
+    queues = _subscribers.get(user_id)
+    if not queues:
+        return
+    queues.discard(queue)
+    if not queues:
+        _subscribers.pop(user_id, None)
+
+
+def dispatch(payload: str) -> int:
+    """Fan one NOTIFY payload out to the user's subscribers.
+
+    Returns the number of queues the event was delivered to.
+    """
+    try:
+        event = json.loads(payload)
+        user_id = int(event["user_id"])
+    except (TypeError, ValueError, KeyError) as exc:
+        logger.warning("Ignoring malformed notification payload: %s", exc)
+        return 0
+
+    delivered = 0
+    for queue in list(_subscribers.get(user_id, ())):
+        try:
+            queue.put_nowait(event)
+            delivered += 1
+        except asyncio.QueueFull:
+            queue.overflowed = True
+            logger.debug("Notification subscriber for user %s is full, dropping event", user_id)
+    return delivered
+
+
+def take_overflow(queue: SubscriberQueue) -> bool:
+    """Whether the queue dropped events since the last call.
+
+    Clears the flag and empties the queue: the caller is expected to
+    re-read everything after its last delivered id from the DB.
+    """
+    if not queue.overflowed:
+        return False
+    queue.overflowed = False
+    while not queue.empty():
+        queue.get_nowait()
+    return True
+
+
+def is_listening() -> bool:
+    """True while this process holds a live LISTEN connection."""
+    return _listening
+
+
+# ── Listener ─────────────────────────────────────────────────────────
+
+def _on_notify(connection, pid, channel, payload) -> None:
+    dispatch(payload)
+
+
+async def _listen_forever() -> None:
+    """Hold one LISTEN connection, reconnecting if it drops."""
+    global _listening
+    import asyncpg
+
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(_listen_dsn())
+            closed = asyncio.Event()
+            conn.add_termination_listener(lambda _conn: closed.set())
+            await conn.add_listener(NOTIFY_CHANNEL, _on_notify)
+            _listening = True
+            logger.info("Notification listener attached to channel %s", NOTIFY_CHANNEL)
+            await closed.wait()
+            logger.warning("Notification listener connection closed, reconnecting")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Notification listener unavailable (%s), retrying in %.0fs", exc, _RECONNECT_DELAY_SECONDS)
+        finally:
+            _listening = False
+            if conn is not None and not conn.is_closed():
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+        await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+async def start_listener() -> None:
+    """Start the per-process listener (idempotent)."""
+    global _listener_task
+    if _listener_task is not None and not _listener_task.done():
+        return
+    _listener_task = asyncio.create_task(_listen_forever())
+
+
+async def stop_listener() -> None:
+    """Stop the listener on shutdown."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except (asyncio.CancelledError, Exception):
+        pass
+    _listener_task = None
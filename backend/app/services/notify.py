@@ -18,6 +18,7 @@ from typing import Optional
 from sqlalchemy import text
 
 from app.db.leadgen_db import leadgen_session
+from app.services import notification_bus
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ async def send_notification(
     user_id: int = 1,
     expires_at: Optional[datetime] = None,
 ) -> Optional[int]:
-    """Insert a notification into public.notifications.
+    """Insert a notification into public.notifications and push it to SSE clients.
 
     Returns the notification id on success, None on failure.
     Never raises — all errors are caught and logged so callers are never broken.
@@ -51,7 +52,7 @@ async def send_notification(
                 text("""
                     INSERT INTO public.notifications (user_id, type, title, message, data, expires_at)
                     VALUES (:user_id, :type, :title, :message, CAST(:data AS jsonb), :expires_at)
-                    RETURNING id
+                    RETURNING id, user_id, type, title, message, data, read, created_at, expires_at
                 """),
                 {
                     "user_id": user_id,
@@ -63,8 +64,10 @@ async def send_notification(
                 },
             )
             row = result.fetchone()
+            if row:
+                await notification_bus.publish(db, dict(row._mapping))
             await db.commit()
-            notif_id = row[0] if row else None
+            notif_id = row.id if row else None
             logger.info("Notification created: [%s] %s (id=%s)", type, title, notif_id)
             return notif_id
     except Exception as exc:
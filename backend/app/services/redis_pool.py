@@ -6,6 +6,7 @@ Reads REDIS_URL from env or falls back to localhost:6379/2.
 
 import logging
 import os
+import time
 from typing import Optional
 
 from arq import create_pool
@@ -15,6 +16,12 @@ logger = logging.getLogger(__name__)
 
 _pool: Optional[ArqRedis] = None
 _redis_available: Optional[bool] = None
+_redis_down_since: float = 0.0
+
+# How long to trust a failed connection attempt before probing Redis again.
+# Keeps calls cheap while Redis is down, but lets every worker converge back
+# onto Redis (shared locks, leader lease) once it recovers.
+REDIS_RETRY_AFTER_SECONDS = 30.0
 
 
 def get_redis_settings() -> RedisSettings:
@@ -42,11 +49,13 @@ async def get_redis_pool() -> Optional[ArqRedis]:
 
     Returns None if Redis is unavailable (caller should fall back to asyncio).
     """
-    global _pool, _redis_available
+    global _pool, _redis_available, _redis_down_since
 
     # If we already know Redis is down, don't retry every call
     if _redis_available is False:
-        return None
+        if time.monotonic() - _redis_down_since < REDIS_RETRY_AFTER_SECONDS:
+            return None
+        _redis_available = None
 
     if _pool is not None:
         try:
@@ -62,6 +71,7 @@ async def get_redis_pool() -> Optional[ArqRedis]:
         return _pool
     except Exception as exc:
         _redis_available = False
+        _redis_down_since = time.monotonic()
         _pool = None
         logger.warning("Redis unavailable (%s) — falling back to asyncio", exc)
         return None
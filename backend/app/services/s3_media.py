@@ -0,0 +1,192 @@
+"""Shared S3 (Garage) access: pooled clients, presign cache, streaming reads.
+
+  - One boto3 client per (endpoint, credentials) for the whole process, with
+    a connection pool sized by ``S3_MAX_POOL_CONNECTIONS``. boto3 clients
+    are thread-safe, so async callers run blocking calls through
+    ``asyncio.to_thread`` against the shared pool instead of building a new
+    client (and TCP connection) per request.
+  - Presigned GET URLs are cached in memory per (client, bucket, key,
+    expiry). A cached URL is reused for ``PRESIGN_REUSE_FRACTION`` of its
+    lifetime, so callers always get a URL with at least the remaining
+    fraction left, and list endpoints stop re-signing every row.
+  - ``stream_object_response`` serves an object as a chunked
+    ``StreamingResponse`` with Range (206) and If-None-Match (304) support.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))
+S3_STREAM_CHUNK_SIZE = int(os.getenv("S3_STREAM_CHUNK_SIZE", str(256 * 1024)))
+PRESIGN_CACHE_SIZE = int(os.getenv("PRESIGN_CACHE_SIZE", "20000"))
+PRESIGN_REUSE_FRACTION = float(os.getenv("PRESIGN_REUSE_FRACTION", "0.5"))
+
+# Response headers copied from GetObject onto the proxied response
+_PASSTHROUGH_HEADERS = {
+    "ETag": "etag",
+    "LastModified": "last-modified",
+    "ContentRange": "content-range",
+    "ContentLength": "content-length",
+}
+
+
+# ── Pooled clients ───────────────────────────────────────────────────
+
+_clients: Dict[Tuple[str, str, str, str], object] = {}
+_clients_lock = threading.Lock()
+
+
+def get_s3_client(endpoint_url: str, access_key: str, secret_key: str, region: str = "ai-local"):
+    """Process-wide boto3 S3 client for one endpoint/credential set."""
+    key = (endpoint_url, access_key, secret_key, region)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = boto3.client(
+                    "s3",
+                    endpoint_url=endpoint_url,
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region,
+                    config=Config(
+                        signature_version="s3v4",
+                        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    ),
+                )
+                _clients[key] = client
+    return client
+
+
+# ── Presigned URL cache ──────────────────────────────────────────────
+
+class PresignCache:
+    """Bounded in-memory cache of presigned URLs with per-entry TTL."""
+
+    def __init__(self, max_entries: int = PRESIGN_CACHE_SIZE, reuse_fraction: float = PRESIGN_REUSE_FRACTION):
+        self.max_entries = max_entries
+        self.reuse_fraction = reuse_fraction
+        self._entries: "OrderedDict[tuple, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, reuse_until = entry
+            if time.monotonic() >= reuse_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+
+    def put(self, key: tuple, url: str, expires_in: int) -> None:
+        with self._lock:
+            self._entries[key] = (url, time.monotonic() + expires_in * self.reuse_fraction)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+presign_cache = PresignCache()
+
+
+def presigned_get_url(client, bucket: str, key: str, expires_in: int = 3600) -> str:
+    """Presigned GET URL for ``bucket/key``, reused from cache while fresh."""
+    cache_key = (id(client), bucket, key, expires_in)
+    url = presign_cache.get(cache_key)
+    if url is None:
+        url = client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expires_in,
+        )
+        presign_cache.put(cache_key, url, expires_in)
+    return url
+
+
+# ── Streaming reads ──────────────────────────────────────────────────
+
+async def _iter_body(body, chunk_size: int = S3_STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a botocore StreamingBody chunk by chunk off the event loop."""
+    try:
+        while True:
+            chunk = await asyncio.to_thread(body.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+
+def _error_code(e: ClientError) -> str:
+    return str(e.response.get("Error", {}).get("Code", ""))
+
+
+async def stream_object_response(
+    client,
+    bucket: str,
+    key: str,
+    request: Request,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Stream ``bucket/key`` to the client, honouring Range and If-None-Match.
+
+    Raises HTTPException(404) if the object does not exist and
+    HTTPException(416) for an unsatisfiable range.
+    """
+    params = {"Bucket": bucket, "Key": key}
+    range_header = request.headers.get("range")
+    if range_header:
+        params["Range"] = range_header
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        params["IfNoneMatch"] = if_none_match
+
+    extra = dict(headers or {})
+    try:
+        obj = await asyncio.to_thread(client.get_object, **params)
+    except ClientError as e:
+        code = _error_code(e)
+        if code in ("304", "NotModified"):
+            return Response(status_code=304, headers={**extra, "etag": if_none_match})
+        if code in ("416", "InvalidRange"):
+            raise HTTPException(status_code=416, detail="Requested range not satisfiable")
+        if code in ("404", "NoSuchKey", "NotFound"):
+            raise HTTPException(status_code=404, detail="Object not found")
+        raise
+
+    response_headers = {"accept-ranges": "bytes", **extra}
+    for field, header in _PASSTHROUGH_HEADERS.items():
+        value = obj.get(field)
+        if value is None:
+            continue
+        if field == "LastModified" and hasattr(value, "strftime"):
+            value = value.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        response_headers[header] = str(value)
+
+    return StreamingResponse(
+        _iter_body(obj["Body"]),
+        status_code=206 if obj.get("ContentRange") else 200,
+        media_type=obj.get("ContentType") or "application/octet-stream",
+        headers=response_headers,
+    )
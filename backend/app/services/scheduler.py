@@ -2,15 +2,32 @@
 
 Uses asyncio tasks instead of APScheduler to avoid extra dependencies.
 Runs twice-daily competitor syncs at randomized times within windows.
+
+Safe to run with several uvicorn workers / backend containers: every
+process competes for a single Postgres advisory lock and only the current
+holder runs the job loops. If the leader dies, its connection (and with
+it the lock) goes away and another process takes over.
 """
 import asyncio
 import logging
+import os
 import random
+import socket
+import uuid
 from datetime import datetime, time, timedelta, timezone
+from typing import Optional
 
 logger = logging.getLogger("scheduler")
 
 _running_tasks: list[asyncio.Task] = []
+_leader_task: Optional[asyncio.Task] = None
+
+# Arbitrary constant shared by all workers for pg_try_advisory_lock
+LEADER_ADVISORY_LOCK_ID = 734_001
+# How often the leader re-checks its lock connection (and followers retry)
+LEADER_RENEW_INTERVAL = int(os.getenv("SCHEDULER_LEADER_CHECK_INTERVAL", "10"))
+
+_instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
 
 async def _competitor_sync_job():
@@ -30,17 +47,12 @@ async def _competitor_sync_job():
 
 async def _social_sync_job():
     """Sync all connected social accounts. Called by the scheduler."""
-    from app.db.crm_db import crm_session
-    from app.api.social_sync import sync_all
+    from app.api.social_sync import sync_accounts
 
     logger.info("Scheduled social sync starting")
     try:
-        async with crm_session() as db:
-            result = await sync_all(db)
-            logger.info(
-                "Scheduled social sync complete: %d account results",
-                len(result.get("results", [])),
-            )
+        results = await sync_accounts()
+        logger.info("Scheduled social sync complete: %d account results", len(results))
     except Exception as e:
         logger.error("Scheduled social sync failed: %s", e)
 
@@ -69,6 +81,14 @@ async def _follower_polling_job():
         logger.error("Scheduled follower polling failed: %s", e)
 
 
+async def _enrichment_cache_purge_job():
+    """Drop expired rows from the shared lead enrichment cache."""
+    from app.services.leadgen.enrichment_cache import purge_expired
+
+    removed = await purge_expired()
+    logger.info("Enrichment cache purge removed %d expired rows", removed)
+
+
 def _random_time_in_window(start_hour: int, end_hour: int) -> time:
     """Generate a random time within the given hour window."""
     hour = random.randint(start_hour, end_hour - 1)
@@ -118,9 +138,8 @@ async def _hourly_loop(job_name: str, job_fn, interval_seconds: int = 3600):
         await asyncio.sleep(interval_seconds)
 
 
-async def start_scheduler():
-    """Start all scheduled background tasks."""
-    logger.info("Starting background scheduler")
+def _start_jobs():
+    """Start all scheduled job loops in this process."""
 
     # Morning sync: 6am-10am EST
     morning = asyncio.create_task(
@@ -142,15 +161,140 @@ async def start_scheduler():
         _hourly_loop("instagram-follower-polling", _follower_polling_job, 3600)
     )
 
-    _running_tasks.extend([morning, afternoon, social_morning, social_afternoon, follower_polling])
+    # Enrichment cache cleanup: nightly
+    enrichment_cache_purge = asyncio.create_task(
+        _daily_loop("enrichment-cache-purge", _enrichment_cache_purge_job, 2, 5)
+    )
+
+    _running_tasks.extend([
+        morning, afternoon, social_morning, social_afternoon, follower_polling, enrichment_cache_purge,
+    ])
     logger.info(
-        "Scheduler started: competitor sync (AM 6-10, PM 4-8 EST), social sync (AM 8-12, PM 1-5 EST), and Instagram follower polling (hourly)"
+        "Scheduler started: competitor sync (AM 6-10, PM 4-8 EST), social sync (AM 8-12, PM 1-5 EST), Instagram follower polling (hourly), and enrichment cache purge (nightly)"
     )
 
 
-async def stop_scheduler():
-    """Cancel all scheduled tasks."""
+def _stop_jobs():
+    """Cancel all scheduled job loops in this process."""
     for task in _running_tasks:
         task.cancel()
     _running_tasks.clear()
+
+
+class _AdvisoryLockLeadership:
+    """Leadership via a session-level Postgres advisory lock.
+
+    This is the only source of truth for leadership: mixing it with a
+    Redis lease let two processes lead at once whenever one of them lost
+    Redis. The lock lives as long as the dedicated connection, so a
+    crashed leader releases it automatically.
+    """
+
+    def __init__(self):
+        self._conn = None
+
+    @property
+    def held(self) -> bool:
+        return self._conn is not None
+
+    async def try_acquire(self) -> bool:
+        from sqlalchemy import text
+        from app.db.crm_db import crm_engine
+
+        if self._conn is not None:
+            try:
+                await self._conn.execute(text("SELECT 1"))
+                await self._conn.commit()
+                return True
+            except Exception as e:
+                logger.warning("Scheduler advisory-lock connection lost: %s", e)
+                await self.release()
+                return False
+
+        conn = await crm_engine.connect()
+        try:
+            result = await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": LEADER_ADVISORY_LOCK_ID}
+            )
+            if result.scalar():
+                await conn.commit()
+                self._conn = conn
+                return True
+        except Exception as e:
+            logger.warning("Scheduler advisory-lock attempt failed: %s", e)
+        await conn.close()
+        return False
+
+    async def release(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        try:
+            from sqlalchemy import text
+            await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": LEADER_ADVISORY_LOCK_ID})
+        except Exception:
+            pass
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+
+async def _leader_loop():
+    """Compete for scheduler leadership; run the jobs only while leader."""
+    advisory = _AdvisoryLockLeadership()
+    is_leader = False
+    try:
+        while True:
+            try:
+                leased = await advisory.try_acquire()
+            except Exception as e:
+                logger.error("Scheduler leader election error: %s", e)
+                leased = False
+
+            if leased and not is_leader:
+                logger.info("Scheduler: %s acquired leadership", _instance_id)
+                _start_jobs()
+                is_leader = True
+            elif not leased and is_leader:
+                logger.warning("Scheduler: %s lost leadership — stopping jobs", _instance_id)
+                _stop_jobs()
+                is_leader = False
+
+            await asyncio.sleep(LEADER_RENEW_INTERVAL)
+    finally:
+        if is_leader:
+            _stop_jobs()
+        await advisory.release()
+
+
+async def start_scheduler():
+    """Start the scheduler in this process.
+
+    Each process joins the leader election; only the elected leader runs
+    the job loops. Set ``SCHEDULER_ENABLED=false`` on API-only workers to
+    keep them out of the election entirely.
+    """
+    global _leader_task
+    from app.config import settings
+
+    if not settings.SCHEDULER_ENABLED:
+        logger.info("Scheduler disabled (SCHEDULER_ENABLED=false)")
+        return
+
+    logger.info("Starting background scheduler (instance %s)", _instance_id)
+    _leader_task = asyncio.create_task(_leader_loop())
+
+
+async def stop_scheduler():
+    """Cancel all scheduled tasks and give up leadership."""
+    global _leader_task
+    if _leader_task is not None:
+        _leader_task.cancel()
+        try:
+            await _leader_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _leader_task = None
+    _stop_jobs()
     logger.info("Scheduler stopped")
@@ -0,0 +1,212 @@
+"""Cross-process shared state backed by Redis.
+
+Lets multiple uvicorn workers (and multiple backend containers) agree on
+state that used to live in module globals:
+
+  - JSON status blobs (e.g. the competitor sync-all progress)
+  - Named mutual-exclusion locks (e.g. one sync per competitor)
+  - Sliding-window rate limits (e.g. auto-reply sends per account)
+
+Every helper degrades to an in-process equivalent when Redis is not
+reachable, so a single-worker deployment without Redis behaves exactly
+as before.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Optional
+
+from app.services.redis_pool import get_redis_pool
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "warroom:"
+
+# In-process fallbacks (used only when Redis is unavailable)
+_local_values: dict[str, Any] = {}
+_local_locks: dict[str, asyncio.Lock] = {}
+_local_windows: dict[str, list[float]] = defaultdict(list)
+
+# Compare-and-delete so a lock holder never releases someone else's lock
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Compare-and-extend for lock renewal
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _key(name: str) -> str:
+    return f"{KEY_PREFIX}{name}"
+
+
+# ── JSON values ──────────────────────────────────────────────────────
+
+async def get_json(name: str, default: Any = None) -> Any:
+    """Read a JSON value shared across workers."""
+    redis = await get_redis_pool()
+    if redis is None:
+        return _local_values.get(name, default)
+    try:
+        raw = await redis.get(_key(name))
+    except Exception as exc:
+        logger.warning("Shared state read failed for %s: %s", name, exc)
+        return _local_values.get(name, default)
+    if raw is None:
+        return default
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+async def set_json(name: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+    """Write a JSON value shared across workers.
+
+    The local copy is always updated too, so readers in this process see
+    the latest value even if Redis drops out mid-run.
+    """
+    _local_values[name] = value
+    redis = await get_redis_pool()
+    if redis is None:
+        return
+    try:
+        await redis.set(_key(name), json.dumps(value, default=str), ex=ttl_seconds)
+    except Exception as exc:
+        logger.warning("Shared state write failed for %s: %s", name, exc)
+
+
+# ── Locks ────────────────────────────────────────────────────────────
+
+class SharedLock:
+    """Async context manager for a named lock held across workers.
+
+    Backed by ``SET NX PX`` with a random token; the lease expires after
+    ``ttl_seconds`` so a crashed holder can never wedge the lock forever.
+    While held, the lease is renewed every third of the TTL, so holders
+    that outlive the TTL keep the lock. Falls back to a per-process
+    ``asyncio.Lock`` without Redis.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int = 900, poll_interval: float = 0.5):
+        self.name = name
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self.poll_interval = poll_interval
+        self._token: Optional[str] = None
+        self._local: Optional[asyncio.Lock] = None
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def _acquire_local(self, blocking: bool) -> bool:
+        lock = _local_locks.get(self.name)
+        if lock is None:
+            lock = asyncio.Lock()
+            _local_locks[self.name] = lock
+        if not blocking and lock.locked():
+            return False
+        await lock.acquire()
+        self._local = lock
+        return True
+
+    async def _refresh(self, redis, token: str) -> None:
+        key = _key(f"lock:{self.name}")
+        while True:
+            await asyncio.sleep(self.ttl_ms / 3000)
+            try:
+                if not await redis.eval(_RENEW_SCRIPT, 1, key, token, self.ttl_ms):
+                    logger.warning("Shared lock %s expired while held", self.name)
+                    return
+            except Exception as exc:
+                logger.warning("Failed to renew shared lock %s: %s", self.name, exc)
+
+    async def acquire(self, blocking: bool = True) -> bool:
+        redis = await get_redis_pool()
+        if redis is None:
+            return await self._acquire_local(blocking)
+
+        token = uuid.uuid4().hex
+        while True:
+            try:
+                acquired = await redis.set(_key(f"lock:{self.name}"), token, nx=True, px=self.ttl_ms)
+            except Exception as exc:
+                logger.warning("Shared lock %s unavailable, using a local lock: %s", self.name, exc)
+                return await self._acquire_local(blocking)
+            if acquired:
+                self._token = token
+                self._refresher = asyncio.create_task(self._refresh(redis, token))
+                return True
+            if not blocking:
+                return False
+            await asyncio.sleep(self.poll_interval)
+
+    async def release(self) -> None:
+        if self._local is not None:
+            self._local.release()
+            self._local = None
+            return
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+        if self._token is None:
+            return
+        token, self._token = self._token, None
+        redis = await get_redis_pool()
+        if redis is None:
+            return
+        try:
+            await redis.eval(_RELEASE_SCRIPT, 1, _key(f"lock:{self.name}"), token)
+        except Exception as exc:
+            logger.warning("Failed to release shared lock %s: %s", self.name, exc)
+
+    async def __aenter__(self) -> "SharedLock":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
+
+
+# ── Rate limiting ────────────────────────────────────────────────────
+
+async def rate_limit_exceeded(name: str, limit: int, window_seconds: float) -> bool:
+    """Check whether ``name`` already has ``limit`` hits within the window."""
+    now = time.time()
+    redis = await get_redis_pool()
+    if redis is None:
+        _local_windows[name] = [ts for ts in _local_windows[name] if now - ts < window_seconds]
+        return len(_local_windows[name]) >= limit
+
+    key = _key(f"ratelimit:{name}")
+    try:
+        await redis.zremrangebyscore(key, 0, now - window_seconds)
+        return await redis.zcard(key) >= limit
+    except Exception as exc:
+        logger.warning("Rate limit check failed for %s: %s", name, exc)
+        return False
+
+
+async def record_rate_limit_hit(name: str, window_seconds: float) -> None:
+    """Record one hit against the ``name`` sliding window."""
+    now = time.time()
+    redis = await get_redis_pool()
+    if redis is None:
+        _local_windows[name].append(now)
+        return
+
+    key = _key(f"ratelimit:{name}")
+    try:
+        await redis.zadd(key, {f"{now}:{uuid.uuid4().hex[:8]}": now})
+        await redis.expire(key, int(window_seconds) + 1)
+    except Exception as exc:
+        logger.warning("Rate limit record failed for %s: %s", name, exc)
@@ -5,8 +5,6 @@ If a matching rule is found, sends the reply via Instagram Graph API.
 Includes rate limiting and deduplication.
 """
 import logging
-import time
-from collections import defaultdict
 
 import httpx
 from sqlalchemy import select, text
@@ -14,36 +12,29 @@ from sqlalchemy import select, text
 from app.db.crm_db import crm_session
 from app.models.crm.social import SocialAccount
 from app.services.auto_reply_engine import AutoReplyEngine
+from app.services.shared_state import rate_limit_exceeded, record_rate_limit_hit
 
 logger = logging.getLogger(__name__)
 
 IG_GRAPH_API = "https://graph.instagram.com/v21.0"
 
 # ── Rate Limiting ────────────────────────────────────────────────────
-# Track replies per account: {account_id: [(timestamp, ...)]}
-_reply_timestamps: dict[str, list[float]] = defaultdict(list)
+# Replies per account are counted in a shared sliding window so the limit
+# holds across all API workers, not per process.
 MAX_REPLIES_PER_MINUTE = 10
+REPLY_RATE_WINDOW_SECONDS = 60.0
 
 
-def _is_rate_limited(account_key: str) -> bool:
+async def _is_rate_limited(account_key: str) -> bool:
     """Check if an account has exceeded the reply rate limit."""
-    now = time.time()
-    window = 60.0  # 1 minute
+    return await rate_limit_exceeded(
+        f"auto-reply:{account_key}", MAX_REPLIES_PER_MINUTE, REPLY_RATE_WINDOW_SECONDS
+    )
 
-    # Prune old timestamps
-    _reply_timestamps[account_key] = [
-        ts for ts in _reply_timestamps[account_key] if now - ts < window
-    ]
 
-    if len(_reply_timestamps[account_key]) >= MAX_REPLIES_PER_MINUTE:
-        return True
-
-    return False
-
-
-def _record_reply(account_key: str):
+async def _record_reply(account_key: str):
     """Record a reply timestamp for rate limiting."""
-    _reply_timestamps[account_key].append(time.time())
+    await record_rate_limit_hit(f"auto-reply:{account_key}", REPLY_RATE_WINDOW_SECONDS)
 
 
 # ── Account Lookup ───────────────────────────────────────────────────
@@ -183,7 +174,7 @@ async def process_comment(
         account_key = f"comment:{social_account_id}"
 
         # Rate limiting
-        if _is_rate_limited(account_key):
+        if await _is_rate_limited(account_key):
             logger.warning("Rate limited — skipping comment reply for account %s", social_account_id)
             await _log_reply(org_id, platform, "comment", "keyword", comment_id, comment_text, "comment",
                              social_account_id=social_account_id, error="rate_limited")
@@ -223,7 +214,7 @@ async def process_comment(
         )
 
         if result.get("success"):
-            _record_reply(account_key)
+            await _record_reply(account_key)
             logger.info("Replied to comment %s with rule %s", comment_id, rule.id)
             await _log_reply(org_id, platform, "comment", "keyword", comment_id, comment_text, "comment",
                              social_account_id=social_account_id, rule_id=rule.id,
@@ -283,7 +274,7 @@ async def process_dm(
         account_key = f"dm:{social_account_id}"
 
         # Rate limiting
-        if _is_rate_limited(account_key):
+        if await _is_rate_limited(account_key):
             logger.warning("Rate limited — skipping DM reply for account %s", social_account_id)
             await _log_reply(org_id, platform, "dm", "keyword", message_id, message_text, "dm",
                              social_account_id=social_account_id, error="rate_limited")
@@ -324,7 +315,7 @@ async def process_dm(
         )
 
         if result.get("success"):
-            _record_reply(account_key)
+            await _record_reply(account_key)
             logger.info("Replied to DM %s with rule %s", message_id, rule.id)
             await _log_reply(org_id, platform, "dm", "keyword", message_id, message_text, "dm",
                              social_account_id=social_account_id, rule_id=rule.id,
@@ -388,7 +379,7 @@ async def process_follow(
         account_key = f"follow:{social_account_id}"
 
         # Rate limiting
-        if _is_rate_limited(account_key):
+        if await _is_rate_limited(account_key):
             logger.warning("Rate limited — skipping follow reply for account %s", social_account_id)
             await _log_reply(
                 org_id, platform, "follow", "follow", external_id, "", "dm",
@@ -435,7 +426,7 @@ async def process_follow(
             )
 
             if result.get("success"):
-                _record_reply(account_key)
+                await _record_reply(account_key)
                 logger.info("Sent welcome DM to new follower %s with rule %s", username, rule.id)
                 await _log_reply(
                     org_id, platform, "follow", "follow", external_id, "", "dm",
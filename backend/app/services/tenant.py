@@ -11,6 +11,8 @@ Hierarchy levels:
     employee = 10  (sees only their own data)
 """
 import logging
+import os
+import time
 from typing import Optional
 
 from fastapi import Request
@@ -57,6 +59,112 @@ def org_filter(
 
 
 # ── Visibility service ──────────────────────────────────────────────
+#
+# Each org's reporting tree is loaded with ONE query into an in-memory
+# adjacency map and kept for VISIBILITY_CACHE_TTL_SECONDS. Visible sets
+# are memoized per user on top of it, so list endpoints calling
+# build_data_filter pay a dict lookup instead of a role query + recursive
+# CTE. Call invalidate_visibility(org_id) after changing a user's role,
+# org, or reports_to.
+
+VISIBILITY_CACHE_TTL_SECONDS = float(os.getenv("VISIBILITY_CACHE_TTL_SECONDS", "60"))
+
+
+class _OrgTree:
+    """Reporting tree of one org: role levels + direct reports per user."""
+
+    __slots__ = ("loaded_at", "levels", "children", "all_ids", "visible", "visible_sets")
+
+    def __init__(self, rows):
+        self.loaded_at = time.monotonic()
+        self.levels: dict[int, Optional[int]] = {}
+        self.children: dict[int, list[int]] = {}
+        self.all_ids: list[int] = []
+        self.visible: dict[int, list[int]] = {}
+        self.visible_sets: dict[int, frozenset[int]] = {}
+        for r in rows:
+            uid = r["id"]
+            self.all_ids.append(uid)
+            if r["has_role"]:
+                self.levels[uid] = r["hierarchy_level"]
+            if r["reports_to"] is not None:
+                self.children.setdefault(r["reports_to"], []).append(uid)
+
+    def subordinates(self, user_id: int) -> list[int]:
+        """Everyone below user_id in the tree (breadth-first, cycle-safe)."""
+        seen = {user_id}
+        out: list[int] = []
+        frontier = [user_id]
+        while frontier:
+            nxt = []
+            for uid in frontier:
+                for child in self.children.get(uid, ()):
+                    if child not in seen:
+                        seen.add(child)
+                        out.append(child)
+                        nxt.append(child)
+            frontier = nxt
+        return out
+
+    def visible_ids(self, user_id: int) -> list[int]:
+        cached = self.visible.get(user_id)
+        if cached is not None:
+            return cached
+
+        if user_id not in self.levels:
+            visible = [user_id]  # Fallback: can only see self
+        else:
+            level = self.levels[user_id] or 10
+            if level >= 40:
+                # Admin: sees everyone in org
+                visible = self.all_ids
+            elif level >= 20:
+                # Director/Manager: sees self + reporting tree below them
+                visible = [user_id] + self.subordinates(user_id)
+            else:
+                # Employee: self only
+                visible = [user_id]
+
+        self.visible[user_id] = visible
+        return visible
+
+    def can_see(self, viewer_id: int, target_id: int) -> bool:
+        visible = self.visible_sets.get(viewer_id)
+        if visible is None:
+            visible = frozenset(self.visible_ids(viewer_id))
+            self.visible_sets[viewer_id] = visible
+        return target_id in visible
+
+
+_org_trees: dict[int, _OrgTree] = {}
+
+
+async def _load_org_tree(db: AsyncSession, org_id: int) -> _OrgTree:
+    tree = _org_trees.get(org_id)
+    if tree and time.monotonic() - tree.loaded_at < VISIBILITY_CACHE_TTL_SECONDS:
+        return tree
+
+    result = await db.execute(
+        text("""
+            SELECT u.id, u.reports_to, r.hierarchy_level, (r.id IS NOT NULL) AS has_role
+            FROM users u
+            LEFT JOIN roles r ON u.role_id = r.id
+            WHERE u.org_id = :org_id
+        """),
+        {"org_id": org_id},
+    )
+    tree = _OrgTree(result.mappings().all())
+    _org_trees[org_id] = tree
+    return tree
+
+
+def invalidate_visibility(org_id: Optional[int] = None) -> None:
+    """Drop the cached reporting tree for one org (or every org)."""
+    if org_id is None:
+        _org_trees.clear()
+    else:
+        _org_trees.pop(org_id, None)
+
 
 async def get_visible_user_ids(
     db: AsyncSession,
@@ -71,58 +179,10 @@ async def get_visible_user_ids(
     - employee (10): self only
 
     Returns list of user IDs whose data is visible to the requesting user.
+    Served from the cached org tree; the returned list must not be mutated.
     """
-    # Get current user's role hierarchy level
-    result = await db.execute(
-        text("""
-            SELECT u.id, r.hierarchy_level, r.name as role_name
-            FROM users u
-            JOIN roles r ON u.role_id = r.id
-            WHERE u.id = :user_id AND u.org_id = :org_id
-        """),
-        {"user_id": user_id, "org_id": org_id},
-    )
-    row = result.mappings().first()
-
-    if not row:
-        return [user_id]  # Fallback: can only see self
-
-    level = row["hierarchy_level"] or 10
-
-    # Admin: sees everyone in org
-    if level >= 40:
-        result = await db.execute(
-            text("SELECT id FROM users WHERE org_id = :org_id"),
-            {"org_id": org_id},
-        )
-        return [r["id"] for r in result.mappings().all()]
-
-    # Director/Manager: sees self + direct reports (recursive)
-    if level >= 20:
-        # Recursive CTE: find all users in the reporting tree below this user
-        result = await db.execute(
-            text("""
-                WITH RECURSIVE subordinates AS (
-                    -- Base: direct reports
-                    SELECT id FROM users
-                    WHERE reports_to = :user_id AND org_id = :org_id
-                    
-                    UNION ALL
-                    
-                    -- Recursive: their reports
-                    SELECT u.id FROM users u
-                    INNER JOIN subordinates s ON u.reports_to = s.id
-                    WHERE u.org_id = :org_id
-                )
-                SELECT id FROM subordinates
-            """),
-            {"user_id": user_id, "org_id": org_id},
-        )
-        subordinate_ids = [r["id"] for r in result.mappings().all()]
-        return [user_id] + subordinate_ids
-
-    # Employee: self only
-    return [user_id]
+    tree = await _load_org_tree(db, org_id)
+    return tree.visible_ids(user_id)
 
 
 async def can_see_user(
@@ -132,8 +192,8 @@ async def can_see_user(
     org_id: int,
 ) -> bool:
     """Check if viewer can see target user's data."""
-    visible = await get_visible_user_ids(db, viewer_id, org_id)
-    return target_id in visible
+    tree = await _load_org_tree(db, org_id)
+    return tree.can_see(viewer_id, target_id)
 
 
 def visibility_filter(
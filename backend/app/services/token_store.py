@@ -8,7 +8,7 @@ Usage:
     await delete_tokens("google_calendar")
 
 Tokens are stored in the `public.oauth_tokens` table as JSONB.
-Table auto-created on first use.
+Table created by app.db.migration_runner.
 """
 import json
 import logging
@@ -16,36 +16,16 @@ from typing import Optional
 
 from sqlalchemy import text
 
-from app.db.leadgen_db import leadgen_engine, leadgen_session
+from app.db.leadgen_db import leadgen_session
 
 logger = logging.getLogger(__name__)
 
 # Uses shared leadgen engine (same knowledge DB, public schema)
-_engine = leadgen_engine
 _session = leadgen_session
 
-_TABLE_CREATED = False
-
-
-async def _ensure_table():
-    """Create the oauth_tokens table if it doesn't exist."""
-    global _TABLE_CREATED
-    if _TABLE_CREATED:
-        return
-    async with _engine.begin() as conn:
-        await conn.execute(text("""
-            CREATE TABLE IF NOT EXISTS public.oauth_tokens (
-                service     VARCHAR(50) PRIMARY KEY,
-                tokens      JSONB NOT NULL DEFAULT '{}',
-                updated_at  TIMESTAMP DEFAULT now()
-            )
-        """))
-    _TABLE_CREATED = True
-
 
 async def load_tokens(service: str) -> Optional[dict]:
     """Load tokens for a service from the DB."""
-    await _ensure_table()
     async with _session() as db:
         result = await db.execute(
             text("SELECT tokens FROM public.oauth_tokens WHERE service = :service"),
@@ -60,7 +40,6 @@ async def load_tokens(service: str) -> Optional[dict]:
 
 async def save_tokens(service: str, tokens: dict) -> None:
     """Save tokens for a service to the DB (upsert)."""
-    await _ensure_table()
     async with _session() as db:
         await db.execute(
             text("""
@@ -78,7 +57,6 @@ async def save_tokens(service: str, tokens: dict) -> None:
 
 async def delete_tokens(service: str) -> None:
     """Delete tokens for a service."""
-    await _ensure_table()
     async with _session() as db:
         await db.execute(
             text("DELETE FROM public.oauth_tokens WHERE service = :service"),
@@ -1,15 +1,15 @@
 """Video Analysis Service — Extract video storyboards for copycat pipeline."""
 
-import json
 import logging
 import os
-import subprocess
 import tempfile
 from dataclasses import dataclass, asdict
 from typing import List, Optional
 import httpx
 import yt_dlp
 
+from app.services.media_exec import MediaExecError, probe, run_media
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -143,15 +143,10 @@ async def _download_video(video_url: str, temp_dir: str) -> str:
 async def _get_video_metadata(video_path: str) -> dict:
     """Extract video metadata using ffprobe."""
     
-    cmd = [
-        'ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', '-show_streams', video_path
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    
-    data = json.loads(result.stdout)
+    try:
+        data = await probe(video_path)
+    except MediaExecError as e:
+        raise RuntimeError(f"ffprobe failed: {e.stderr or e}") from e
     
     video_stream = next(s for s in data['streams'] if s['codec_type'] == 'video')
     
@@ -192,7 +187,7 @@ async def _extract_key_frames(video_path: str, frames_dir: str, duration: float)
             '-frames:v', '1', '-q:v', '2', frame_path
         ]
         
-        result = subprocess.run(cmd, capture_output=True)
+        result = await run_media(cmd, timeout=60, check=False)
         if result.returncode == 0 and os.path.exists(frame_path):
             frame_paths.append(frame_path)
     
@@ -7,13 +7,16 @@ format. Provides ffmpeg fallback when Remotion isn't available.
 import json
 import logging
 import shutil
-import subprocess
 import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import httpx
+
+from app.services.media_exec import ProgressCallback, ffmpeg_available, run_media
+
 logger = logging.getLogger(__name__)
 
 
@@ -247,12 +250,13 @@ def generate_remotion_config(composition: Composition) -> dict:
     return config
 
 
-def render_with_ffmpeg(composition: Composition) -> str:
+async def render_with_ffmpeg(composition: Composition, on_progress: Optional[ProgressCallback] = None) -> str:
     """
     MVP fallback: Use ffmpeg to composite layers when Remotion isn't available.
     
     Args:
         composition: Video composition
+        on_progress: Optional callback receiving ffmpeg render progress
         
     Returns:
         Path to rendered video file
@@ -260,7 +264,7 @@ def render_with_ffmpeg(composition: Composition) -> str:
     logger.info(f"Rendering composition {composition.storyboard_id} with ffmpeg")
     
     # Check if ffmpeg is available
-    if not _check_ffmpeg():
+    if not await ffmpeg_available():
         logger.warning("ffmpeg not available for video rendering, skipping composition")
         raise RuntimeError("ffmpeg not available for video rendering")
     
@@ -288,21 +292,15 @@ def render_with_ffmpeg(composition: Composition) -> str:
             # Check if asset is a URL that needs downloading
             if asset_path.startswith(("http://", "https://")):
                 try:
-                    import httpx
-                    import asyncio
-                    
                     # Download to temp file
                     temp_file = temp_path / f"asset_{len(downloaded_files)}.{asset_path.split('.')[-1]}"
                     
-                    async def download_asset():
-                        async with httpx.AsyncClient() as client:
-                            resp = await client.get(asset_path)
-                            resp.raise_for_status()
-                            with open(temp_file, "wb") as f:
-                                f.write(resp.content)
+                    async with httpx.AsyncClient() as client:
+                        resp = await client.get(asset_path)
+                        resp.raise_for_status()
+                        with open(temp_file, "wb") as f:
+                            f.write(resp.content)
                     
-                    # Run download in sync context
-                    asyncio.run(download_asset())
                     downloaded_files.append(temp_file)
                     asset_path = str(temp_file)
                     
@@ -333,7 +331,10 @@ def render_with_ffmpeg(composition: Composition) -> str:
         ]
         
         logger.info(f"Running ffmpeg command: {' '.join(cmd[:10])}...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        result = await run_media(
+            cmd, timeout=300, check=False,
+            on_progress=on_progress, duration=composition.duration,
+        )
         
         if result.returncode != 0:
             logger.error(f"ffmpeg failed: {result.stderr}")
@@ -347,16 +348,6 @@ def render_with_ffmpeg(composition: Composition) -> str:
         return final_path
 
 
-def _check_ffmpeg() -> bool:
-    """Check if ffmpeg is available."""
-    try:
-        result = subprocess.run(["ffmpeg", "-version"], 
-                              capture_output=True, timeout=5)
-        return result.returncode == 0
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
-
-
 def _build_ffmpeg_filter(composition: Composition, layers: List[CompositionLayer], temp_path: Path) -> str:
     """Build ffmpeg filter_complex string for layering."""
     filters = []
@@ -389,7 +380,7 @@ def _build_ffmpeg_filter(composition: Composition, layers: List[CompositionLayer
     return ";".join(filters)
 
 
-def add_captions(video_path: str, script: dict, style: str = "hormozi") -> str:
+async def add_captions(video_path: str, script: dict, style: str = "hormozi") -> str:
     """
     Add captions to rendered video using ffmpeg drawtext filter.
     
@@ -403,7 +394,7 @@ def add_captions(video_path: str, script: dict, style: str = "hormozi") -> str:
     """
     logger.info(f"Adding {style} captions to video {video_path}")
     
-    if not _check_ffmpeg():
+    if not await ffmpeg_available():
         raise RuntimeError("ffmpeg not available for caption burning")
     
     if not Path(video_path).exists():
@@ -479,7 +470,7 @@ def add_captions(video_path: str, script: dict, style: str = "hormozi") -> str:
     ]
     
     logger.info(f"Adding captions with ffmpeg...")
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    result = await run_media(cmd, timeout=300, check=False)
     
     if result.returncode != 0:
         logger.error(f"Caption burning failed: {result.stderr}")
@@ -489,7 +480,7 @@ def add_captions(video_path: str, script: dict, style: str = "hormozi") -> str:
     return str(output_path)
 
 
-def auto_level_audio(avatar_path: str, background_path: str, output_path: str) -> None:
+async def auto_level_audio(avatar_path: str, background_path: str, output_path: str) -> None:
     """
     Auto-level avatar speech vs background music using ffmpeg.
     
@@ -498,7 +489,7 @@ def auto_level_audio(avatar_path: str, background_path: str, output_path: str) -
         background_path: Path to background music
         output_path: Path for output audio
     """
-    if not _check_ffmpeg():
+    if not await ffmpeg_available():
         raise RuntimeError("ffmpeg not available for audio leveling")
     
     # Extract audio from avatar video and normalize levels
@@ -514,7 +505,7 @@ def auto_level_audio(avatar_path: str, background_path: str, output_path: str) -
     ]
     
     logger.info("Auto-leveling audio tracks...")
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    result = await run_media(cmd, timeout=120, check=False)
     
     if result.returncode != 0:
         logger.error(f"Audio leveling failed: {result.stderr}")
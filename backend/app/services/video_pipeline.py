@@ -7,7 +7,6 @@ import os
 import json
 import logging
 import uuid
-import asyncio
 import httpx
 import tempfile
 from datetime import datetime
@@ -23,6 +22,7 @@ from app.services.editing_dna import process_competitor_for_dna, map_dna_to_remo
 from app.services.nano_banana import generate_reference_sheet, generate_scene
 from app.services.veo_service import generate_video_from_image, generate_video_from_text, check_video_status
 from app.services.video_composer import build_composition, generate_remotion_config, render_with_ffmpeg
+from app.services.media_exec import FfmpegProgress
 
 logger = logging.getLogger(__name__)
 
@@ -97,16 +97,6 @@ CREATE INDEX IF NOT EXISTS idx_video_pipelines_org_user ON crm.video_pipelines(o
 CREATE INDEX IF NOT EXISTS idx_video_pipelines_status ON crm.video_pipelines(status);
 """
 
-async def init_pipeline_table(db: AsyncSession):
-    """Initialize the video_pipelines table if it doesn't exist."""
-    try:
-        await db.execute(text(PIPELINE_DDL))
-        await db.commit()
-        logger.info("Video pipeline table initialized")
-    except Exception as e:
-        logger.warning(f"Error initializing video pipeline table: {e}")
-        await db.rollback()
-
 # ═══════════════════════════════════════════════════════════════════════
 # DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════
@@ -191,6 +181,21 @@ async def _update_pipeline_status(
     await db.execute(text(query), update_data)
     await db.commit()
 
+def _render_progress_reporter(db: AsyncSession, pipeline_id: int):
+    """``on_progress`` callback spreading the final render over 95–99%."""
+    last = {"progress": 95}
+
+    async def report(update: FfmpegProgress) -> None:
+        if update.fraction is None:
+            return
+        progress = 95 + int(update.fraction * 4)
+        if progress <= last["progress"]:
+            return
+        last["progress"] = progress
+        await _update_pipeline_status(db, pipeline_id, "composing", progress, "rendering_final_video")
+
+    return report
+
 async def _download_asset(url: str, dest: str) -> None:
     """Download asset from URL to local file."""
     async with httpx.AsyncClient() as client:
@@ -224,9 +229,6 @@ async def create_video_from_competitor_reference(
     Returns:
         Pipeline result with operation ID and initial status
     """
-    # Initialize pipeline table if needed
-    await init_pipeline_table(db)
-    
     # Use existing pipeline_id or create new record
     if existing_pipeline_id:
         pipeline_id = existing_pipeline_id
@@ -517,7 +519,9 @@ async def create_video_from_competitor_reference(
                 await _update_pipeline_status(db, pipeline_id, "composing", 95, "rendering_final_video", assets)
                 
                 # Render with ffmpeg (available in Docker container)
-                final_video_path = await asyncio.to_thread(render_with_ffmpeg, composition)
+                final_video_path = await render_with_ffmpeg(
+                    composition, on_progress=_render_progress_reporter(db, pipeline_id)
+                )
                 
                 # Upload to S3 if available
                 final_video_url = final_video_path  # Default to local path
@@ -642,9 +646,6 @@ async def create_video_from_template(
     Returns:
         Pipeline result
     """
-    # Initialize pipeline table if needed
-    await init_pipeline_table(db)
-    
     # Create pipeline record
     result = await db.execute(text("""
         INSERT INTO crm.video_pipelines (
@@ -826,7 +827,9 @@ async def create_video_from_template(
                 await _update_pipeline_status(db, pipeline_id, "composing", 95, "rendering_final_video", assets)
                 
                 # Render with ffmpeg (available in Docker container)
-                final_video_path = await asyncio.to_thread(render_with_ffmpeg, composition)
+                final_video_path = await render_with_ffmpeg(
+                    composition, on_progress=_render_progress_reporter(db, pipeline_id)
+                )
                 
                 # Upload to S3 if available
                 final_video_url = final_video_path  # Default to local path
@@ -1032,7 +1035,9 @@ async def get_pipeline_status(db: AsyncSession, pipeline_id: int) -> Dict[str, A
                     await _update_pipeline_status(db, pipeline_id, "composing", 95, "rendering_final_video", generated_assets)
                     
                     # Render with ffmpeg (available in Docker container)
-                    final_video_path = await asyncio.to_thread(render_with_ffmpeg, composition)
+                    final_video_path = await render_with_ffmpeg(
+                        composition, on_progress=_render_progress_reporter(db, pipeline_id)
+                    )
                     
                     # Upload to S3 if available
                     final_video_url = final_video_path  # Default to local path
@@ -5,17 +5,64 @@ Service for constructing VideoRecord models from competitor_posts data.
 Handles data transformation and normalization for the CDR platform.
 """
 
+import base64
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import json
 
-from app.models.video_record import VideoRecord
+from app.models.video_record import VideoRecord, VideoRecordPage, VideoRecordSummary
 
 logger = logging.getLogger(__name__)
 
+# List-view projection: no transcript / video_analysis / frame_chunks /
+# content_analysis payloads, only the runtime values pulled out of them
+LIST_COLUMNS = """
+    cp.id,
+    cp.competitor_id,
+    cp.platform,
+    cp.post_text,
+    cp.hook,
+    cp.post_url,
+    cp.posted_at,
+    cp.fetched_at,
+    cp.likes,
+    cp.comments,
+    cp.shares,
+    COALESCE(cp.engagement_score, 0) AS engagement_score,
+    cp.media_type,
+    cp.detected_format,
+    cp.video_analysis -> 'runtime' AS va_runtime,
+    cp.video_analysis -> 'total_duration' AS va_total_duration,
+    (
+        SELECT SUM(CAST(ch ->> 'duration' AS DOUBLE PRECISION))
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(cp.frame_chunks) = 'array' THEN cp.frame_chunks ELSE '[]'::jsonb END
+        ) AS ch
+        WHERE jsonb_typeof(ch) = 'object'
+          AND ch ->> 'duration' ~ '^\\s*[-+]?[0-9]*\\.?[0-9]+\\s*$'
+    ) AS frame_seconds,
+    c.handle AS competitor_handle
+"""
+
+
+def encode_cursor(engagement_score: float, post_id: int) -> str:
+    """Opaque keyset cursor for the (engagement_score, id) ordering"""
+    raw = json.dumps([engagement_score, post_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, post_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(score), int(post_id)
+    except (TypeError, ValueError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
 
 class VideoRecordService:
     """Service for building VideoRecord models from database data"""
@@ -23,12 +70,16 @@ class VideoRecordService:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    async def get_video_record(self, post_id: int) -> Optional[VideoRecord]:
+    async def get_video_record(self, post_id: int, org_id: Optional[int] = None) -> Optional[VideoRecord]:
         """
         Get a single VideoRecord by post ID
         
+        The only place the transcript, frame_chunks and analysis payloads
+        are loaded; list endpoints use get_video_record_page.
+        
         Args:
             post_id: ID of the competitor_posts record
+            org_id: Optional filter by organization (for multi-tenant)
             
         Returns:
             VideoRecord or None if not found
@@ -60,8 +111,9 @@ class VideoRecordService:
                     FROM crm.competitor_posts cp
                     LEFT JOIN crm.competitors c ON cp.competitor_id = c.id
                     WHERE cp.id = :post_id
+                      AND (CAST(:org_id AS INTEGER) IS NULL OR c.org_id = :org_id)
                 """),
-                {"post_id": post_id}
+                {"post_id": post_id, "org_id": org_id}
             )
             
             row = result.fetchone()
@@ -181,44 +233,141 @@ class VideoRecordService:
             logger.error("Failed to get video records: %s", e)
             return []
     
+    async def get_video_record_page(
+        self,
+        competitor_id: Optional[int] = None,
+        limit: int = 20,
+        days: Optional[int] = None,
+        platform: Optional[str] = None,
+        org_id: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> VideoRecordPage:
+        """
+        Get a page of lightweight VideoRecordSummary rows
+        
+        Ordered by (engagement_score, id) descending with keyset
+        pagination: pass the returned next_cursor to fetch the next page.
+        
+        Args:
+            competitor_id: Optional filter by competitor
+            limit: Page size
+            days: Optional filter by days back from now
+            platform: Optional filter by platform
+            org_id: Optional filter by organization (for multi-tenant)
+            cursor: next_cursor from the previous page
+            
+        Returns:
+            VideoRecordPage
+            
+        Raises:
+            ValueError: if cursor is malformed
+        """
+        query_parts = [f"""
+            SELECT {LIST_COLUMNS}
+            FROM crm.competitor_posts cp
+            LEFT JOIN crm.competitors c ON cp.competitor_id = c.id
+            WHERE 1=1
+        """]
+        params: Dict[str, Any] = {}
+        
+        if competitor_id:
+            query_parts.append("AND cp.competitor_id = :competitor_id")
+            params["competitor_id"] = competitor_id
+        
+        if days:
+            query_parts.append("AND cp.posted_at >= :cutoff_date")
+            params["cutoff_date"] = datetime.now() - timedelta(days=days)
+        
+        if platform:
+            query_parts.append("AND cp.platform = :platform")
+            params["platform"] = platform.lower()
+        
+        if org_id:
+            query_parts.append("AND c.org_id = :org_id")
+            params["org_id"] = org_id
+        
+        if cursor:
+            after_score, after_id = decode_cursor(cursor)
+            query_parts.append(
+                "AND (COALESCE(cp.engagement_score, 0), cp.id) < (:after_score, :after_id)"
+            )
+            params["after_score"] = after_score
+            params["after_id"] = after_id
+        
+        # One extra row tells us whether another page exists
+        query_parts.append("""
+            ORDER BY COALESCE(cp.engagement_score, 0) DESC, cp.id DESC
+            LIMIT :limit
+        """)
+        params["limit"] = limit + 1
+        
+        result = await self.db.execute(text("\n".join(query_parts)), params)
+        rows = [dict(row._mapping) for row in result.fetchall()]
+        
+        records = []
+        for row in rows[:limit]:
+            try:
+                records.append(VideoRecordSummary.from_list_row(row))
+            except Exception as e:
+                logger.warning("Failed to process post %s: %s", row.get("id"), e)
+        
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(float(last["engagement_score"] or 0), last["id"])
+        
+        return VideoRecordPage(records=records, next_cursor=next_cursor)
+    
     async def get_video_records_for_competitor(
         self,
         competitor_id: int,
-        limit: int = 10
-    ) -> List[VideoRecord]:
+        limit: int = 10,
+        org_id: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> VideoRecordPage:
         """
-        Get video records for a specific competitor
+        Get video record summaries for a specific competitor
         
         Args:
             competitor_id: Competitor ID
-            limit: Maximum records to return
+            limit: Page size
+            org_id: Optional filter by organization
+            cursor: next_cursor from the previous page
             
         Returns:
-            List of VideoRecord objects
+            VideoRecordPage ordered by engagement
         """
-        return await self.get_video_records(
+        return await self.get_video_record_page(
             competitor_id=competitor_id,
-            limit=limit
+            limit=limit,
+            org_id=org_id,
+            cursor=cursor
         )
     
     async def get_recent_video_records(
         self,
         days: int = 30,
-        limit: int = 50
-    ) -> List[VideoRecord]:
+        limit: int = 50,
+        org_id: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> VideoRecordPage:
         """
-        Get recent video records across all competitors
+        Get recent video record summaries across all competitors
         
         Args:
             days: How many days back to look
-            limit: Maximum records to return
+            limit: Page size
+            org_id: Optional filter by organization
+            cursor: next_cursor from the previous page
             
         Returns:
-            List of VideoRecord objects ordered by engagement
+            VideoRecordPage ordered by engagement
         """
-        return await self.get_video_records(
+        return await self.get_video_record_page(
             days=days,
-            limit=limit
+            limit=limit,
+            org_id=org_id,
+            cursor=cursor
         )
     
     async def analyze_runtime_issues(self) -> Dict[str, Any]:
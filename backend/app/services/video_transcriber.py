@@ -201,6 +201,29 @@ async def _transcribe_audio(file_path: Path) -> Optional[List[Dict]]:
         return None
 
 
+async def transcribe_downloaded_video(video_path: Path, shortcode: str) -> Optional[List[Dict]]:
+    """Transcribe an already-downloaded video. Does not delete the file.
+    
+    Returns Whisper segments, or None if transcription failed.
+    """
+    # Check video duration before transcribing
+    video_duration = await _get_duration(video_path)
+    
+    # Transcribe
+    segments = await _transcribe_audio(video_path)
+    if not segments:
+        return None
+    
+    # Detect if Instagram served a clip (short preview) instead of full reel
+    transcript_duration = max(s.get("end", 0) for s in segments)
+    is_clip = transcript_duration < 15 and video_duration < 15  # Likely a clip preview
+    if is_clip:
+        logger.warning("⚠️ %s: Only %.1fs downloaded (Instagram clip preview, not full reel)", shortcode, transcript_duration)
+    
+    logger.info("✅ %s: %d segments (%.1fs) transcribed", shortcode, len(segments), transcript_duration)
+    return segments
+
+
 async def transcribe_competitor_videos(
     db: AsyncSession,
     competitor_id: int,
@@ -244,29 +267,15 @@ async def transcribe_competitor_videos(
             continue
         
         try:
-            # Check video duration before transcribing
-            video_duration = await _get_duration(video_path)
-            
-            # Transcribe
-            segments = await _transcribe_audio(video_path)
+            segments = await transcribe_downloaded_video(video_path, shortcode)
             
             if segments:
-                # Detect if Instagram served a clip (short preview) instead of full reel
-                transcript_duration = max(s.get("end", 0) for s in segments) if segments else 0
-                is_clip = transcript_duration < 15 and video_duration < 15  # Likely a clip preview
-                
-                # Store transcript with clip marker if needed
-                transcript_data = segments
-                if is_clip:
-                    logger.warning("⚠️ %s: Only %.1fs downloaded (Instagram clip preview, not full reel)", shortcode, transcript_duration)
-                
                 await db.execute(
                     text("UPDATE crm.competitor_posts SET transcript = :t WHERE id = :id"),
-                    {"t": json.dumps(transcript_data), "id": post_id},
+                    {"t": json.dumps(segments), "id": post_id},
                 )
                 await db.commit()
                 stats["transcribed"] += 1
-                logger.info("✅ %s: %d segments (%.1fs) stored", shortcode, len(segments), transcript_duration)
             else:
                 stats["failed"] += 1
                 stats["errors"].append(f"{shortcode}: transcription failed")
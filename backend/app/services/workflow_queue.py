@@ -1,53 +1,328 @@
-"""Minimal Arq worker settings for workflow queue.
+"""Arq job queue for the competitor sync pipeline.
 
-This is a stub to prevent the worker container from crashing.
-The original workflow_queue.py was removed during socialRecycle cleanup.
+The sync-all pipeline is split into stages, each registered as an arq task
+on its own queue so it can run in a dedicated worker container with its
+own concurrency limit:
 
-This minimal implementation:
-1. Provides WorkerSettings for arq worker startup
-2. Configures Redis connection using existing redis_pool settings
-3. Registers no background tasks (empty worker that stays alive)
-4. Provides hooks for future task registration if needed
+    scrape      → Instagram profile + post scraping (per batch of competitors)
+    transcribe  → video download + Whisper transcription
+    comments    → comment scraping + audience analysis
+    analysis    → Hook/Value/CTA content structure analysis
+    index       → incremental Qdrant indexing (runs on the analysis worker)
+
+``sync_all_competitors_task`` is the orchestrator: it runs on the default
+``workflow_queue`` and drives the stages in order via ``run_stage``.
+
+Worker commands (one container each, scale independently):
+    arq app.services.workflow_queue.WorkerSettings            # orchestrator
+    arq app.services.workflow_queue.ScrapeWorkerSettings
+    arq app.services.workflow_queue.TranscribeWorkerSettings
+    arq app.services.workflow_queue.CommentsWorkerSettings
+    arq app.services.workflow_queue.AnalysisWorkerSettings
+
+If Redis is unavailable, ``run_stage`` runs the stage inline in the calling
+process, so the pipeline still works (just without the isolation).
 """
 
 import logging
-from typing import Optional, List, Callable, Any
+import os
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
 
-from app.services.redis_pool import get_redis_settings
+from arq import Retry
+from arq.jobs import Job, JobStatus
+
+from app.services.redis_pool import get_redis_pool, get_redis_settings
+from app.services.shared_state import get_json, set_json
 
 logger = logging.getLogger(__name__)
 
 # Import Redis settings from existing redis_pool configuration
 REDIS_SETTINGS = get_redis_settings()
 
-# Background task functions (currently empty)
-# Future tasks can be added here and registered in FUNCTIONS below
-async def placeholder_task() -> str:
-    """Placeholder task to demonstrate arq task structure."""
-    logger.info("Placeholder task executed")
-    return "placeholder complete"
+DEFAULT_QUEUE = "workflow_queue"
+STAGE_QUEUES = {
+    "scrape": "workflow_queue:scrape",
+    "transcribe": "workflow_queue:transcribe",
+    "comments": "workflow_queue:comments",
+    "analysis": "workflow_queue:analysis",
+}
+# Indexing is light (embeddings are cached/batched) — share the analysis worker
+STAGE_QUEUES["index"] = STAGE_QUEUES["analysis"]
+
+MAX_TRIES = int(os.getenv("WORKFLOW_MAX_TRIES", "3"))
+RETRY_BACKOFF_SECONDS = 30
+PROGRESS_TTL_SECONDS = 24 * 3600
+
+
+def _progress_key(job_id: str) -> str:
+    return f"job-progress:{job_id}"
+
+
+async def report_progress(ctx: Dict[str, Any], **progress: Any) -> None:
+    """Store progress for the running job so the API can report it."""
+    job_id = ctx.get("job_id")
+    if not job_id:
+        return
+    await set_json(_progress_key(job_id), progress, ttl_seconds=PROGRESS_TTL_SECONDS)
+
+
+def _retry_or_raise(ctx: Dict[str, Any], exc: Exception) -> None:
+    """Ask arq to retry a failed stage with linear backoff, if tries remain."""
+    job_try = ctx.get("job_try", 1)
+    if not ctx.get("inline") and job_try < MAX_TRIES:
+        logger.warning("Job %s failed (try %d/%d): %s — retrying", ctx.get("job_id"), job_try, MAX_TRIES, exc)
+        raise Retry(defer=job_try * RETRY_BACKOFF_SECONDS) from exc
+    raise exc
+
+
+@asynccontextmanager
+async def _crm_db():
+    """Open a CRM session with the search_path the enrichment SQL expects."""
+    from sqlalchemy import text
+    from app.db.crm_db import crm_session
+
+    async with crm_session() as db:
+        await db.execute(text("SET search_path TO crm, public"))
+        yield db
+
+
+# ── Stage tasks ──────────────────────────────────────────────────────
+
+async def scrape_competitors_task(ctx: Dict[str, Any], competitor_ids: List[int], org_id: int) -> Dict[str, Any]:
+    """Scrape Instagram profiles + posts for the given competitors and persist them."""
+    from sqlalchemy import select
+    from app.api.scraper import invalidate_synced_personas, sync_instagram_competitor_batch
+    from app.models.crm.competitor import Competitor
+
+    await report_progress(ctx, stage="scrape", total=len(competitor_ids), message="Scraping profiles")
+    async with _crm_db() as db:
+        try:
+            result = await db.execute(select(Competitor).where(Competitor.id.in_(competitor_ids)))
+            competitors = result.scalars().all()
+            batch_result = await sync_instagram_competitor_batch(db, competitors, org_id)
+            await db.commit()
+            await invalidate_synced_personas(db)
+        except Exception as exc:
+            await db.rollback()
+            _retry_or_raise(ctx, exc)
+
+    summary = {
+        "total": batch_result.total,
+        "success": batch_result.success,
+        "failed": batch_result.failed,
+        "posts_saved": batch_result.posts_saved,
+    }
+    await report_progress(ctx, stage="scrape", done=True, **summary)
+    return summary
+
+
+async def transcribe_competitors_task(
+    ctx: Dict[str, Any], competitor_ids: List[int], limit_per_competitor: int = 10
+) -> Dict[str, Any]:
+    """Download + transcribe untranscribed competitor videos."""
+    from app.services.enrichment_pipeline import run_transcription_pipeline
+
+    await report_progress(ctx, stage="transcribe", total=len(competitor_ids), message="Transcribing videos")
+    try:
+        # Streaming download → Whisper pipeline; each worker uses its own session
+        result = await run_transcription_pipeline(competitor_ids, limit_per_competitor=limit_per_competitor)
+    except Exception as exc:
+        _retry_or_raise(ctx, exc)
+
+    await report_progress(ctx, stage="transcribe", done=True, **result)
+    return result
+
+
+async def analyze_comments_task(
+    ctx: Dict[str, Any], competitor_ids: List[int], top_n_per_competitor: int = 15
+) -> Dict[str, Any]:
+    """Scrape + analyze comment threads on top competitor posts."""
+    from app.services.enrichment_pipeline import run_comment_pipeline
+
+    await report_progress(ctx, stage="comments", total=len(competitor_ids), message="Analyzing comments")
+    try:
+        result = await run_comment_pipeline(competitor_ids, top_n_per_competitor=top_n_per_competitor)
+    except Exception as exc:
+        _retry_or_raise(ctx, exc)
+
+    await report_progress(ctx, stage="comments", done=True, **result)
+    return result
+
+
+async def analyze_content_task(ctx: Dict[str, Any], competitor_ids: List[int]) -> Dict[str, Any]:
+    """Run Hook/Value/CTA structure analysis on transcribed posts."""
+    from app.services.content_analyzer import analyze_competitor_content_batch
+
+    await report_progress(ctx, stage="analysis", total=len(competitor_ids), message="Analyzing content structure")
+    async with _crm_db() as db:
+        try:
+            result = await analyze_competitor_content_batch(db, competitor_ids)
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            _retry_or_raise(ctx, exc)
+
+    await report_progress(ctx, stage="analysis", done=True, **result)
+    return result
+
+
+async def index_content_task(ctx: Dict[str, Any], competitor_ids: List[int]) -> Dict[str, Any]:
+    """Incrementally index the competitors' top posts into Qdrant."""
+    from app.services.content_embedder import index_top_content
+
+    await report_progress(ctx, stage="index", total=len(competitor_ids), message="Indexing content")
+    async with _crm_db() as db:
+        try:
+            result = await index_top_content(db, competitor_ids=competitor_ids)
+        except Exception as exc:
+            await db.rollback()
+            _retry_or_raise(ctx, exc)
+
+    summary = {k: v for k, v in result.items() if k != "errors"}
+    summary["errors"] = len(result.get("errors", []))
+    await report_progress(ctx, stage="index", done=True, **summary)
+    return result
+
+
+async def sync_all_competitors_task(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Orchestrator: run the full competitor sync pipeline."""
+    from app.api.content_intel import _run_sync_all, get_sync_all_status
+
+    await _run_sync_all()
+    return await get_sync_all_status()
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "scrape": scrape_competitors_task,
+    "transcribe": transcribe_competitors_task,
+    "comments": analyze_comments_task,
+    "analysis": analyze_content_task,
+    "index": index_content_task,
+}
+
+# The orchestrator waits on every stage in turn, so the whole pipeline has
+# to fit in its job timeout.
+ORCHESTRATOR_TIMEOUT = 6 * 3600
+
+# Wall-clock budget per stage (seconds), all tries and retry backoff
+# included. Transcription is the long pole. The critical path
+# (scrape → transcribe ‖ comments → analysis → index) has to stay under
+# ORCHESTRATOR_TIMEOUT with room left for queueing.
+STAGE_BUDGETS = {
+    "scrape": 3600,
+    "transcribe": 9000,
+    "comments": 9000,
+    "analysis": 2700,
+    "index": 2700,
+}
+CRITICAL_PATH = (("scrape",), ("transcribe", "comments"), ("analysis",), ("index",))
 
-# Task registry - arq requires at least one function
-FUNCTIONS: List[Callable[..., Any]] = [placeholder_task]
+
+def _per_try_timeout(budget: int) -> int:
+    backoff = sum(job_try * RETRY_BACKOFF_SECONDS for job_try in range(1, MAX_TRIES))
+    return max((budget - backoff) // MAX_TRIES, 60)
+
+
+# Per-try job timeouts for the stage workers
+STAGE_TIMEOUTS = {stage: _per_try_timeout(budget) for stage, budget in STAGE_BUDGETS.items()}
+
+
+# ── Enqueue / await helpers ──────────────────────────────────────────
+
+async def enqueue_task(task_name: str, *args, _queue_name: str = DEFAULT_QUEUE, _job_id: Optional[str] = None, **kwargs) -> Optional[str]:
+    """Enqueue a background task. Returns the job ID, or None if Redis is down."""
+    try:
+        redis = await get_redis_pool()
+        if redis is None:
+            logger.warning("Redis unavailable, cannot enqueue task %s", task_name)
+            return None
+
+        job = await redis.enqueue_job(
+            task_name, *args, _job_id=_job_id or f"{task_name}:{uuid.uuid4().hex}",
+            _queue_name=_queue_name, **kwargs,
+        )
+        if job is None:
+            # A job with this ID is already queued/running — report its ID
+            logger.info("Task %s already enqueued as %s", task_name, _job_id)
+            return _job_id
+        return job.job_id
+
+    except Exception as e:
+        logger.error("Failed to enqueue task %s: %s", task_name, e)
+        return None
+
+
+async def run_stage(stage: str, *args, job_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """Run a pipeline stage on its worker queue and wait for the result.
+
+    Falls back to running the stage inline in this process when Redis is
+    unavailable or the enqueue fails. Waits at most the stage's budget.
+    Raises whatever the stage raised after its final retry.
+    """
+    fn = STAGE_FUNCTIONS[stage]
+    queue = STAGE_QUEUES[stage]
+    inline_ctx = {"job_id": job_id, "job_try": 1, "inline": True}
+
+    redis = await get_redis_pool()
+    if redis is None:
+        logger.info("Redis unavailable — running stage %s inline", stage)
+        return await fn(inline_ctx, *args, **kwargs)
+
+    job_id = job_id or f"{stage}:{uuid.uuid4().hex}"
+    try:
+        job = await redis.enqueue_job(fn.__name__, *args, _job_id=job_id, _queue_name=queue, **kwargs)
+    except Exception as e:
+        logger.error("Failed to enqueue stage %s (%s) — running it inline", stage, e)
+        return await fn(inline_ctx, *args, **kwargs)
+    if job is None:
+        job = Job(job_id, redis, _queue_name=queue)
+    return await job.result(timeout=STAGE_BUDGETS[stage], poll_delay=2)
+
+
+async def get_job_info(job_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a job's status, progress and (if finished) result across all queues."""
+    redis = await get_redis_pool()
+    progress = await get_json(_progress_key(job_id))
+    if redis is None:
+        return {"job_id": job_id, "status": "unknown", "progress": progress} if progress else None
+
+    for queue in dict.fromkeys([DEFAULT_QUEUE, *STAGE_QUEUES.values()]):
+        job = Job(job_id, redis, _queue_name=queue)
+        status = await job.status()
+        if status == JobStatus.not_found:
+            continue
+        info: Dict[str, Any] = {"job_id": job_id, "queue": queue, "status": status.value, "progress": progress}
+        result_info = await job.result_info()
+        if result_info is not None:
+            info["success"] = result_info.success
+            info["result"] = result_info.result if result_info.success else str(result_info.result)
+            info["finished_at"] = result_info.finish_time.isoformat()
+        return info
+    return None
+
+
+# ── Worker settings ──────────────────────────────────────────────────
 
 class WorkerSettings:
-    """Arq worker configuration."""
-    
+    """Arq worker configuration — orchestrator on the default queue."""
+
     # Redis connection settings
     redis_settings = REDIS_SETTINGS
-    
-    # Task functions to register (currently empty)
-    functions = FUNCTIONS
-    
+
+    functions = [sync_all_competitors_task]
+
     # Worker configuration
-    queue_name = "workflow_queue"
-    max_jobs = 10
-    job_timeout = 300  # 5 minutes
-    keep_result = 3600  # Keep results for 1 hour
-    
+    queue_name = DEFAULT_QUEUE
+    max_jobs = 2
+    job_timeout = ORCHESTRATOR_TIMEOUT
+    keep_result = 24 * 3600
+    max_tries = 1  # Stages retry themselves; never rerun a whole sync
+
     # Logging
     log_results = True
-    
+
     @classmethod
     def get_worker_settings(cls) -> dict:
         """Get worker configuration as dict."""
@@ -58,30 +333,32 @@ class WorkerSettings:
             "max_jobs": cls.max_jobs,
             "job_timeout": cls.job_timeout,
             "keep_result": cls.keep_result,
+            "max_tries": cls.max_tries,
             "log_results": cls.log_results,
         }
 
 
-# For future use: helper function to enqueue tasks
-async def enqueue_task(task_name: str, *args, **kwargs) -> Optional[str]:
-    """Enqueue a background task (future use)."""
-    from app.services.redis_pool import get_redis_pool
-    
-    try:
-        redis = await get_redis_pool()
-        if redis is None:
-            logger.warning("Redis unavailable, cannot enqueue task %s", task_name)
-            return None
-        
-        # Task enqueueing would be implemented here when needed
-        logger.info("Task enqueueing not implemented: %s", task_name)
-        return None
-        
-    except Exception as e:
-        logger.error("Failed to enqueue task %s: %s", task_name, e)
-        return None
+def _stage_worker(stage: str, default_max_jobs: int) -> type:
+    """Build a WorkerSettings class for one pipeline stage.
+
+    Concurrency is set per stage via ``WORKFLOW_<STAGE>_CONCURRENCY``.
+    """
+    return type(
+        f"{stage.title()}WorkerSettings",
+        (WorkerSettings,),
+        {
+            "__doc__": f"Arq worker configuration — {stage} stage.",
+            "functions": [fn for s, fn in STAGE_FUNCTIONS.items() if STAGE_QUEUES[s] == STAGE_QUEUES[stage]],
+            "queue_name": STAGE_QUEUES[stage],
+            "max_jobs": int(os.getenv(f"WORKFLOW_{stage.upper()}_CONCURRENCY", str(default_max_jobs))),
+            "job_timeout": STAGE_TIMEOUTS[stage],
+            "max_tries": MAX_TRIES,
+        },
+    )
 
 
-# Module-level worker settings for arq command line
-# This is what gets imported by: arq app.services.workflow_queue.WorkerSettings
-WorkerSettings = WorkerSettings
\ No newline at end of file
+# Scraping shares one Instagram session, so keep it serial by default
+ScrapeWorkerSettings = _stage_worker("scrape", 1)
+TranscribeWorkerSettings = _stage_worker("transcribe", 2)
+CommentsWorkerSettings = _stage_worker("comments", 2)
+AnalysisWorkerSettings = _stage_worker("analysis", 4)
@@ -0,0 +1,15 @@
+"""Parsing for per-name concurrency limits read from the environment."""
+
+
+def parse_concurrency(raw: str, defaults: dict[str, int]) -> dict[str, int]:
+    """Overlay ``name=N,name=N`` settings on a dict of default limits.
+
+    Malformed entries are ignored and every limit is at least 1, so a bad
+    env var degrades to the defaults instead of breaking startup.
+    """
+    limits = dict(defaults)
+    for part in raw.split(","):
+        name, _, value = part.partition("=")
+        if name.strip() and value.strip().isdigit():
+            limits[name.strip()] = max(int(value), 1)
+    return limits
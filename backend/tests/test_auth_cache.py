@@ -0,0 +1,61 @@
+"""Tests for the auth guard's user cache (no DB or Redis needed)."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import auth_cache
+
+ROW = {"org_id": 7, "is_superadmin": False, "status": True}
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_second_lookup_is_served_from_memory():
+    auth_cache.clear_local()
+    load = AsyncMock(return_value=ROW)
+    with patch.object(auth_cache, "get_redis_pool", AsyncMock(return_value=None)), \
+         patch.object(auth_cache, "_load_from_db", load):
+        assert _run(auth_cache.get_user_auth(1)) == ROW
+        assert _run(auth_cache.get_user_auth(1)) == ROW
+    assert load.await_count == 1
+
+
+def test_invalidate_forces_reload():
+    auth_cache.clear_local()
+    load = AsyncMock(side_effect=[ROW, {**ROW, "org_id": 8}])
+    with patch.object(auth_cache, "get_redis_pool", AsyncMock(return_value=None)), \
+         patch.object(auth_cache, "_load_from_db", load):
+        assert _run(auth_cache.get_user_auth(2))["org_id"] == 7
+        _run(auth_cache.invalidate_user(2))
+        assert _run(auth_cache.get_user_auth(2))["org_id"] == 8
+
+
+def test_unknown_user_is_cached_as_none():
+    auth_cache.clear_local()
+    load = AsyncMock(return_value=None)
+    with patch.object(auth_cache, "get_redis_pool", AsyncMock(return_value=None)), \
+         patch.object(auth_cache, "_load_from_db", load):
+        assert _run(auth_cache.get_user_auth(3)) is None
+        assert _run(auth_cache.get_user_auth(3)) is None
+    assert load.await_count == 1
+
+
+def test_expired_entry_is_reloaded():
+    auth_cache.clear_local()
+    load = AsyncMock(return_value=ROW)
+    with patch.object(auth_cache, "get_redis_pool", AsyncMock(return_value=None)), \
+         patch.object(auth_cache, "_load_from_db", load), \
+         patch.object(auth_cache, "AUTH_CACHE_TTL_SECONDS", -1):
+        _run(auth_cache.get_user_auth(4))
+        _run(auth_cache.get_user_auth(4))
+    assert load.await_count == 2
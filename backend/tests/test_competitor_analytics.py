@@ -0,0 +1,175 @@
+"""Tests for the competitor analytics snapshot (DB faked)."""
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.api import content_intel
+from app.api.content_intel import analyze_trending_topics
+from app.services import competitor_analytics
+
+
+def _source_post(**overrides):
+    post = {
+        "id": 1, "competitor_id": 3, "handle": "coach", "platform": "instagram",
+        "media_type": "image", "post_url": "https://instagram.com/p/a", "post_text": "Caption",
+        "hook": "Stored hook from caption text", "transcript": None, "detected_format": "listicle",
+        "likes": 90, "comments": 10, "shares": 500, "posted_at": datetime(2026, 1, 1), "followers": 1000,
+    }
+    post.update(overrides)
+    return post
+
+
+def _fake_db(source_rows):
+    source = MagicMock()
+    source.fetchall.return_value = [MagicMock(_mapping=row) for row in source_rows]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=source)
+    db.commit = AsyncMock()
+    return db
+
+
+class TestSnapshotRefresh:
+
+    @pytest.mark.asyncio
+    async def test_rows_are_precomputed_and_written_in_bulk(self):
+        transcript = json.dumps([{"start": 0.5, "text": "Stop scrolling if you want better sleep tonight."}])
+        db = _fake_db([
+            _source_post(),
+            _source_post(id=2, media_type="reel", transcript=transcript, followers=0),
+        ])
+
+        count = await competitor_analytics.refresh_org_snapshot(db, 7)
+
+        assert count == 2
+        # source select, stale-row delete, bulk upsert, snapshot state
+        assert db.execute.await_count == 4
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert "SELECT cp.id" in statements[0] and "cp.*" not in statements[0]
+        assert "DELETE FROM crm.competitor_post_analytics" in statements[1]
+        assert "ON CONFLICT (post_id) DO UPDATE" in statements[2]
+        assert "competitor_analytics_snapshots" in statements[3]
+
+        params = db.execute.await_args_list[2].args[1]
+        assert params["org_id"] == 7
+        assert params["post_id"] == [1, 2]
+        # Instagram engagement ignores shares (views)
+        assert params["engagement_score"] == [100.0, 100.0]
+        assert params["engagement_rate"] == [0.1, 0.0]
+        assert params["is_video"] == [False, True]
+        assert params["hook"][0] == "Stored hook from caption text"
+        assert params["hook"][1].startswith("Stop scrolling")
+        assert all(isinstance(json.loads(labels), list) for labels in params["topic_labels"])
+        db.commit.assert_awaited_once()
+
+    def test_topic_phrases_reused_when_caption_unchanged(self):
+        cached = json.dumps(["stored phrase"])
+        with patch.object(content_intel, "_post_topic_phrases", return_value=["fresh phrase"]) as extract:
+            rows = competitor_analytics._build_rows([
+                _source_post(cached_topic_labels=cached, topics_current=True),
+                _source_post(id=2, cached_topic_labels=cached, topics_current=False),
+                _source_post(id=3),
+            ])
+        assert [r["topic_labels"] for r in rows] == [cached, '["fresh phrase"]', '["fresh phrase"]']
+        assert extract.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_org_clears_snapshot(self):
+        db = _fake_db([])
+        assert await competitor_analytics.refresh_org_snapshot(db, 7) == 0
+        statements = [str(call.args[0]) for call in db.execute.await_args_list]
+        assert "INSERT INTO crm.competitor_post_analytics" not in " ".join(statements)
+        assert db.execute.await_args_list[1].args[1]["post_id"] == []
+
+
+class TestEnsureSnapshot:
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_another_worker_rebuilds(self):
+        lock = MagicMock()
+        lock.acquire = AsyncMock(return_value=False)
+        refresh = AsyncMock()
+        with patch.object(competitor_analytics, "_snapshot_is_stale", AsyncMock(return_value=True)), \
+             patch.object(competitor_analytics, "SharedLock", return_value=lock), \
+             patch.object(competitor_analytics, "refresh_org_snapshot", refresh):
+            await competitor_analytics.ensure_org_snapshot(MagicMock(), 7)
+
+        lock.acquire.assert_awaited_once_with(blocking=False)
+        refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_waits_then_skips_if_already_built(self):
+        lock = MagicMock()
+        lock.acquire = AsyncMock(return_value=True)
+        lock.release = AsyncMock()
+        refresh = AsyncMock()
+        with patch.object(competitor_analytics, "_snapshot_is_stale", AsyncMock(side_effect=[None, False])), \
+             patch.object(competitor_analytics, "SharedLock", return_value=lock), \
+             patch.object(competitor_analytics, "refresh_org_snapshot", refresh):
+            await competitor_analytics.ensure_org_snapshot(MagicMock(), 7)
+
+        lock.acquire.assert_awaited_once_with(blocking=True)
+        refresh.assert_not_awaited()
+        lock.release.assert_awaited_once()
+
+
+class TestTrendingFromSnapshot:
+
+    @pytest.mark.asyncio
+    async def test_precomputed_topic_labels_are_used(self):
+        now = datetime.now()
+        rows = [
+            {"handle": "a", "platform": "instagram", "likes": 100, "comments": 0, "shares": 0,
+             "posted_at": now - timedelta(days=1), "topic_labels": json.dumps(["morning routine", "cold plunge"])},
+            {"handle": "b", "platform": "instagram", "likes": 50, "comments": 0, "shares": 0,
+             "posted_at": now - timedelta(days=30), "topic_labels": ["morning routine"]},
+        ]
+        topics = await analyze_trending_topics(rows, enable_clustering=False)
+
+        assert [t.topic for t in topics] == ["Morning Routine"]
+        assert topics[0].frequency == 2
+        assert sorted(topics[0].sources) == ["a", "b"]
+
+
+class TestTopicClusterCache:
+
+    @pytest.mark.asyncio
+    async def test_clusters_reused_until_vocabulary_drifts(self):
+        store = {}
+
+        async def get_json(name, default=None):
+            return store.get(name, default)
+
+        async def set_json(name, value, ttl_seconds=None):
+            store[name] = json.loads(json.dumps(value))
+
+        fits = []
+
+        def fake_cluster(topics):
+            fits.append(list(topics))
+            return {topics[0]: list(topics)}
+
+        topics = [f"Topic {i}" for i in range(8)]
+        with patch.object(content_intel, "get_json", get_json), \
+                patch.object(content_intel, "set_json", set_json), \
+                patch.object(content_intel, "cluster_topics", fake_cluster):
+            await content_intel._clusters_for_topics("k", topics)
+            # One topic swapped: 7/9 overlap, within the drift budget
+            reused = await content_intel._clusters_for_topics("k", topics[:7] + ["Topic new"])
+            assert len(fits) == 1
+            assert reused["Topic 0"] == topics[:7]
+            assert reused["Topic new"] == ["Topic new"]
+
+            # Half the vocabulary replaced: refit
+            await content_intel._clusters_for_topics("k", topics[:4] + [f"Other {i}" for i in range(4)])
+            assert len(fits) == 2
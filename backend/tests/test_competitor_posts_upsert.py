@@ -0,0 +1,62 @@
+"""Tests for the bulk competitor-post upsert (DB faked)."""
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.competitor_posts import POST_KEY_SQL, PostRow, upsert_competitor_posts
+
+
+def _fake_db(returned):
+    result = MagicMock()
+    result.fetchall.return_value = returned
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestUpsertCompetitorPosts:
+
+    @pytest.mark.asyncio
+    async def test_single_statement_and_new_ids(self):
+        db = _fake_db([(10, True), (7, False)])
+        aware = datetime(2026, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+        posts = [
+            PostRow(shortcode="abc", likes=1, posted_at=aware),
+            PostRow(post_url="https://x.com/p/1", likes=5),
+            PostRow(shortcode="abc", likes=3),  # duplicate key — last one wins
+        ]
+
+        result = await upsert_competitor_posts(db, 4, 1, "instagram", posts)
+
+        assert result.new_ids == [10]
+        assert result.updated_ids == [7]
+        db.execute.assert_awaited_once()
+        statement, params = db.execute.await_args.args
+        assert f"ON CONFLICT (competitor_id, ({POST_KEY_SQL}))" in str(statement)
+        assert params["shortcode"] == ["abc", None]
+        assert params["likes"] == [3, 5]
+        assert params["post_url"] == [None, "https://x.com/p/1"]
+
+    @pytest.mark.asyncio
+    async def test_posted_at_stored_as_naive_utc(self):
+        db = _fake_db([(1, True)])
+        aware = datetime(2026, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+        await upsert_competitor_posts(db, 4, 1, "x", [PostRow(post_url="u", posted_at=aware)])
+        assert db.execute.await_args.args[1]["posted_at"] == [datetime(2026, 1, 1, 10)]
+
+    @pytest.mark.asyncio
+    async def test_empty_is_noop(self):
+        db = _fake_db([])
+        result = await upsert_competitor_posts(db, 4, 1, "x", [])
+        assert result.new_ids == [] and result.updated_ids == []
+        db.execute.assert_not_awaited()
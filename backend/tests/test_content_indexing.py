@@ -0,0 +1,107 @@
+"""Tests for incremental Qdrant indexing in content_embedder.
+
+The DB session, embeddings and Qdrant calls are all faked.
+"""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import content_embedder
+
+
+def _post(post_id, caption, likes=10, **extra):
+    post = {
+        "id": post_id, "competitor_id": 1, "platform": "instagram", "media_type": "reel",
+        "shortcode": f"sc{post_id}", "post_url": "", "post_text": caption, "hook": "",
+        "transcript": None, "comments_data": None, "likes": likes, "comments": 1,
+        "shares": 0, "engagement_score": 5.0, "posted_at": None, "handle": "rival",
+        "index_doc_hash": None, "index_payload_hash": None,
+    }
+    post.update(extra)
+    return post
+
+
+def _indexed(post):
+    """Mark a post as already indexed with its current content."""
+    doc = content_embedder._build_document_text(post)
+    post["index_doc_hash"] = content_embedder._hash([content_embedder.EMBEDDING_MODEL, doc])
+    post["index_payload_hash"] = content_embedder._payload_hash(content_embedder._build_metadata(post))
+    return post
+
+
+def _fake_db(rows):
+    result = MagicMock()
+    result.fetchall.return_value = [MagicMock(_mapping=row) for row in rows]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+class TestIncrementalIndexing:
+
+    @pytest.mark.asyncio
+    async def test_only_changed_posts_are_embedded(self):
+        new_post = _post(1, "a brand new caption about growth")
+        unchanged = _indexed(_post(2, "an older caption that was already indexed"))
+        metrics_only = _indexed(_post(3, "caption whose likes went up since last time"))
+        metrics_only["likes"] = 999
+        edited = _indexed(_post(4, "caption before the edit happened here"))
+        edited["post_text"] = "caption after the edit happened here"
+
+        embed = AsyncMock(return_value=[0.1, 0.2])
+        upsert = AsyncMock(return_value=True)
+        set_payloads = AsyncMock(return_value=True)
+        db = _fake_db([new_post, unchanged, metrics_only, edited])
+
+        with patch.object(content_embedder, "_ensure_collection", AsyncMock(return_value=True)), \
+             patch.object(content_embedder, "_get_embedding", embed), \
+             patch.object(content_embedder, "_upsert_points", upsert), \
+             patch.object(content_embedder, "_set_payloads", set_payloads):
+            stats = await content_embedder.index_top_content(db, competitor_ids=[1])
+
+        assert stats == {"indexed": 2, "payload_updated": 1, "unchanged": 1, "skipped": 0, "errors": []}
+        assert embed.await_count == 2
+        assert [p["id"] for p in upsert.await_args.args[0]] == [1, 4]
+        assert [post_id for post_id, _ in set_payloads.await_args.args[0]] == [3]
+        # ranking query + one hash update per batch kind
+        assert db.execute.await_count == 3
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_upsert_is_not_marked_indexed(self):
+        db = _fake_db([_post(1, "a brand new caption about growth")])
+        with patch.object(content_embedder, "_ensure_collection", AsyncMock(return_value=True)), \
+             patch.object(content_embedder, "_get_embedding", AsyncMock(return_value=[0.1])), \
+             patch.object(content_embedder, "_upsert_points", AsyncMock(return_value=False)):
+            stats = await content_embedder.index_top_content(db)
+
+        assert stats["indexed"] == 0
+        assert stats["errors"] == ["batch upsert failed (1 points)"]
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_recreated_collection_clears_index_hashes(self):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(status_code=404))
+        client.put = AsyncMock(return_value=MagicMock(status_code=200))
+        client_cm = MagicMock()
+        client_cm.__aenter__ = AsyncMock(return_value=client)
+        client_cm.__aexit__ = AsyncMock(return_value=False)
+        db = _fake_db([])
+
+        with patch.object(content_embedder.httpx, "AsyncClient", return_value=client_cm):
+            assert await content_embedder._ensure_collection(db) is True
+
+        sql = str(db.execute.await_args.args[0])
+        assert "index_doc_hash = NULL" in sql
+        db.commit.assert_awaited_once()
@@ -0,0 +1,79 @@
+"""Tests for the shared FastEmbed client: coalescing, caching, failures.
+
+The HTTP call (``EmbeddingClient._post``) is patched out.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.embedding_client import EmbeddingCache, EmbeddingClient
+
+
+def _fake_post(calls):
+    async def post(texts):
+        calls.append(list(texts))
+        await asyncio.sleep(0)
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+    return post
+
+
+class TestEmbeddingClient:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_single_calls_are_coalesced(self):
+        client = EmbeddingClient(base_url="http://fastembed/api/embed", batch_size=8, batch_window_ms=5)
+        calls = []
+        client._post = _fake_post(calls)
+
+        texts = [f"text {i}" * (i + 1) for i in range(10)] + ["text 0"]
+        vectors = await asyncio.gather(*(client.embed(t) for t in texts))
+
+        assert client.base_url == "http://fastembed"
+        assert [len(c) for c in calls] == [8, 2]  # duplicate "text 0" sent once
+        assert vectors[0] == vectors[-1] == [6.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_cache_skips_identical_text(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"))
+        calls = []
+        client = EmbeddingClient(model="m", cache=cache, batch_window_ms=1)
+        client._post = _fake_post(calls)
+
+        first = await client.embed_many(["a", "bb"])
+        second = await client.embed_many(["bb", "a", "ccc"])
+
+        assert calls == [["a", "bb"], ["ccc"]]
+        assert first.shape == (2, 2)
+        np.testing.assert_array_equal(second[:2], first[::-1])
+
+        # Another model must not reuse these vectors
+        other = EmbeddingClient(model="other", cache=cache, batch_window_ms=1)
+        other_calls = []
+        other._post = _fake_post(other_calls)
+        await other.embed("a")
+        assert other_calls == [["a"]]
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_none_and_is_not_cached(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"))
+        client = EmbeddingClient(cache=cache, batch_window_ms=1)
+
+        async def broken(texts):
+            raise RuntimeError("connection refused")
+        client._post = broken
+
+        assert await client.embed("hello") is None
+        assert await client.embed_many(["hello", "world"]) is None
+        assert cache.get_many(["hello"]) == {}
+        cache.close()
@@ -0,0 +1,68 @@
+"""Tests for the cross-tenant lead enrichment cache (no DB needed)."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.leadgen import enrichment_cache as cache
+from app.services.leadgen.bbb_scraper import BBBResult
+from app.services.leadgen.review_scraper import ReviewItem, YelpScrapeResult
+
+
+def test_keys_are_normalized():
+    assert cache.domain_key("https://www.Joes-Pizza.com/contact") == "domain:joes-pizza.com"
+    assert cache.domain_key("joes-pizza.com") == "domain:joes-pizza.com"
+    assert cache.business_key("Joe's Pizza, LLC", "Austin", "TX") == cache.business_key("joe s pizza llc", " austin ", "tx")
+    assert cache.business_key("", "Austin") is None
+    assert cache.place_key(None) is None
+
+
+def test_nested_dataclasses_round_trip():
+    yelp = YelpScrapeResult(yelp_url="u", yelp_rating=4.5, reviews=[ReviewItem(text="great", rating=5.0)])
+    decoded = cache.decode_as(YelpScrapeResult, reviews=ReviewItem)(cache.encode(yelp))
+    assert decoded == yelp
+
+
+def test_ttl_overrides():
+    ttls = cache._parse_ttls("news=12h,crawl=2d,bad=x")
+    assert ttls["news"] == 12 * 3600
+    assert ttls["crawl"] == 2 * 86400
+    assert "bad" not in ttls
+
+
+def test_hit_skips_fetch():
+    fetch = AsyncMock()
+    with patch.object(cache, "lookup", AsyncMock(return_value={"rating": "A+"})):
+        result = asyncio.run(cache.fetch_through("bbb", "biz:x||", fetch, decode=cache.decode_as(BBBResult)))
+    assert result.rating == "A+"
+    fetch.assert_not_awaited()
+
+
+def test_miss_fetches_and_stores_only_successes():
+    store = AsyncMock()
+    with patch.object(cache, "lookup", AsyncMock(return_value=None)), patch.object(cache, "store", store):
+        asyncio.run(cache.fetch_through("bbb", "k", AsyncMock(return_value=BBBResult(rating="B"))))
+        asyncio.run(cache.fetch_through("bbb", "k", AsyncMock(return_value=BBBResult(error="403"))))
+    assert store.await_count == 1
+    assert store.await_args.args[2]["rating"] == "B"
+
+
+def test_cache_outage_falls_back_to_fetch():
+    with patch.object(cache, "lookup", AsyncMock(side_effect=OSError("down"))), \
+         patch.object(cache, "store", AsyncMock(side_effect=OSError("down"))):
+        result = asyncio.run(cache.fetch_through("bbb", "k", AsyncMock(return_value=BBBResult(rating="C"))))
+    assert result.rating == "C"
+
+
+def test_no_key_bypasses_cache():
+    lookup = AsyncMock()
+    with patch.object(cache, "lookup", lookup):
+        asyncio.run(cache.fetch_through("bbb", None, AsyncMock(return_value=BBBResult())))
+    lookup.assert_not_awaited()
@@ -0,0 +1,81 @@
+"""Tests for the streaming competitor enrichment pipeline.
+
+DB access, downloads, Whisper and comment scraping are all patched out;
+these tests cover the queue wiring, counters and temp-file cleanup.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import enrichment_pipeline
+
+
+class TestTranscriptionPipeline:
+    """run_transcription_pipeline: download → transcribe → update."""
+
+    @pytest.mark.asyncio
+    async def test_transcribes_and_cleans_up(self, tmp_path):
+        posts = [(i, f"sc{i}", "") for i in range(6)]
+
+        async def fake_download(shortcode, media_url=""):
+            if shortcode == "sc3":
+                return None
+            path = tmp_path / f"{shortcode}.mp4"
+            path.write_bytes(b"x")
+            return path
+
+        async def fake_transcribe(path, shortcode):
+            await asyncio.sleep(0)
+            return None if shortcode == "sc5" else [{"start": 0.0, "end": 20.0, "text": "hi"}]
+
+        update = AsyncMock()
+        with patch.object(enrichment_pipeline, "_load_candidates", AsyncMock(return_value=posts)), \
+             patch.object(enrichment_pipeline, "_update_post", update), \
+             patch("app.services.video_transcriber._download_video", fake_download), \
+             patch("app.services.video_transcriber.transcribe_downloaded_video", fake_transcribe):
+            totals = await enrichment_pipeline.run_transcription_pipeline(
+                [1, 2], download_workers=3, transcribe_workers=2
+            )
+
+        assert totals == {"transcribed": 4, "failed": 2, "total_processed": 6}
+        assert update.await_count == 4
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_no_candidates(self):
+        with patch.object(enrichment_pipeline, "_load_candidates", AsyncMock(return_value=[])):
+            totals = await enrichment_pipeline.run_transcription_pipeline([1])
+        assert totals == {"transcribed": 0, "failed": 0, "total_processed": 0}
+
+
+class TestCommentPipeline:
+    """run_comment_pipeline: scrape + analyze → update."""
+
+    @pytest.mark.asyncio
+    async def test_failed_post_does_not_stop_others(self):
+        posts = [(i, f"sc{i}", "caption") for i in range(4)]
+
+        async def fake_analyze(shortcode, caption, comments_per_post):
+            if shortcode == "sc1":
+                raise RuntimeError("scrape failed")
+            return {"analyzed": 3}
+
+        update = AsyncMock()
+        with patch.object(enrichment_pipeline, "_load_candidates", AsyncMock(return_value=posts)), \
+             patch.object(enrichment_pipeline, "_update_post", update), \
+             patch("app.services.comment_scraper.scrape_and_analyze_post_comments", fake_analyze), \
+             patch.object(enrichment_pipeline.random, "uniform", return_value=0):
+            totals = await enrichment_pipeline.run_comment_pipeline([1], workers=2)
+
+        assert totals == {"analyzed": 3, "processed": 4}
+        assert update.await_count == 3
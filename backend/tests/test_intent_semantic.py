@@ -0,0 +1,97 @@
+"""Tests for the vectorized semantic intent classifier.
+
+``embed_texts`` is patched with deterministic vectors; no FastEmbed needed.
+"""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import intent_classifier
+from app.services.intent_classifier import IntentType, SEMANTIC_INTENT_ORDER
+
+
+def _one_hot(index: int, dim: int = 8) -> np.ndarray:
+    vec = np.zeros(dim, dtype=np.float32)
+    vec[index] = 1.0
+    return vec
+
+
+# Reference i is axis i; the post context lands on axis 6
+VECTORS = {intent_classifier.INTENT_REFERENCE_TEXTS[intent]: _one_hot(i) for i, intent in enumerate(SEMANTIC_INTENT_ORDER)}
+VECTORS.update({
+    "post context": _one_hot(6),
+    "keeping it for my notes later": _one_hot(0) * 2,                    # UTILITY_SAVE
+    "describes my own daily routine": _one_hot(1) + 0.1 * _one_hot(7),   # IDENTITY_SHARE
+    "talks about the post context": _one_hot(6),                         # TOPIC_RELEVANCE via context
+    "completely unrelated words here": _one_hot(7),
+})
+
+
+@pytest.fixture
+def fake_embed():
+    calls = []
+
+    async def embed(texts):
+        calls.append(list(texts))
+        return np.vstack([VECTORS[t] for t in texts])
+
+    intent_classifier._reference_matrix = None
+    with patch.object(intent_classifier, "embed_texts", embed):
+        yield calls
+    intent_classifier._reference_matrix = None
+
+
+class TestSemanticIntent:
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_matrix_pass(self, fake_embed):
+        texts = [
+            "keeping it for my notes later",
+            "describes my own daily routine",
+            "talks about the post context",
+            "completely unrelated words here",
+        ]
+        results = await intent_classifier.classify_intents_semantic_batch(texts, "post context")
+
+        assert [[intent for intent, _ in r] for r in results] == [
+            [IntentType.UTILITY_SAVE],
+            [IntentType.IDENTITY_SHARE],
+            [IntentType.TOPIC_RELEVANCE],
+            [],
+        ]
+        assert results[0][0][1] == pytest.approx(1.0)
+        # references once + one call for all comments and the context
+        assert len(fake_embed) == 2
+        assert fake_embed[1] == texts + ["post context"]
+
+        await intent_classifier.classify_intents_semantic_batch(texts[:1])
+        assert len(fake_embed) == 3  # references are cached
+
+    @pytest.mark.asyncio
+    async def test_post_themes_are_embedded_together(self, fake_embed):
+        analysis = {
+            "themes": [
+                {"theme": "keeping it for my notes later", "count": 2},
+                {"theme": "describes my own daily routine", "count": 1},
+                {"theme": "saving this", "count": 3},  # local keyword match
+            ],
+        }
+        result = await intent_classifier.classify_post_intents(analysis, "post context")
+
+        assert fake_embed[1] == [
+            "keeping it for my notes later",
+            "describes my own daily routine",
+            "post context",
+        ]
+        assert result["intent_scores"]["UTILITY_SAVE"] == pytest.approx(3 * 0.9 + 2 * 0.8)
+        assert result["intent_scores"]["IDENTITY_SHARE"] > 0
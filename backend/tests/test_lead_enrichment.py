@@ -0,0 +1,98 @@
+"""Tests for single-lead enrichment (DB, search and scrapers patched out)."""
+import asyncio
+import os
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+os.environ.setdefault("LEADGEN_DB_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.models.lead import Lead
+from app.services.leadgen import enrichment, enrichment_cache
+
+_INTEL_SOURCES = (
+    "_enrich_reviews", "_enrich_bbb", "_enrich_glassdoor", "_enrich_reddit",
+    "_enrich_news", "_enrich_social_scan", "_enrich_website_audit",
+)
+_KEY = enrichment_cache.business_key("Joe's Pizza", "Austin", "TX")
+
+
+def _lead(**overrides):
+    fields = dict(
+        id=1, business_name="Joe's Pizza", city="Austin", state="TX",
+        website=None, google_place_id=None, enrichment_status="pending",
+        website_audit_date=None,
+    )
+    fields.update(overrides)
+    return Lead(**fields)
+
+
+def _db(lead):
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=lead))
+    return db
+
+
+def _enrich(lead, discover, lookup=None, store=None):
+    """Run enrich_lead with every network source patched; returns the intel mocks."""
+    intel = {name: AsyncMock() for name in _INTEL_SOURCES}
+    with ExitStack() as stack:
+        for name, mock in intel.items():
+            stack.enter_context(patch.object(enrichment, name, mock))
+        stack.enter_context(patch.object(enrichment, "_discover_website", discover))
+        stack.enter_context(patch.object(enrichment, "crawl_website", AsyncMock(side_effect=RuntimeError("no crawl"))))
+        stack.enter_context(patch.object(enrichment, "score_lead", return_value=(10, "cold")))
+        stack.enter_context(patch.object(enrichment, "send_notification", AsyncMock()))
+        stack.enter_context(patch.object(enrichment_cache, "lookup", lookup or AsyncMock(return_value=None)))
+        stack.enter_context(patch.object(enrichment_cache, "store", store or AsyncMock()))
+        asyncio.run(enrichment.enrich_lead(lead.id, _db(lead)))
+    return intel
+
+
+def test_lead_without_website_runs_discovery_and_is_marked_no_website():
+    lead = _lead()
+    discover = AsyncMock(return_value=None)
+    intel = _enrich(lead, discover)
+
+    discover.assert_awaited_once_with("Joe's Pizza", "Austin", "TX")
+    assert lead.has_website is False
+    assert lead.audit_status == "no_website"
+    assert lead.enrichment_status == "enriched"
+    intel["_enrich_news"].assert_awaited_once()
+    intel["_enrich_social_scan"].assert_awaited_once()
+    intel["_enrich_website_audit"].assert_not_awaited()
+
+
+def test_discovery_cache_hit_skips_search():
+    lead = _lead()
+    discover = AsyncMock()
+    lookup = AsyncMock(side_effect=lambda source, key: {"website": "https://joes.example"} if source == "discovery" else None)
+    _enrich(lead, discover, lookup=lookup)
+
+    discover.assert_not_awaited()
+    assert ("discovery", _KEY) in [c.args for c in lookup.await_args_list]
+    assert lead.website == "https://joes.example"
+    assert lead.has_website is True
+
+
+def test_discovery_miss_is_searched_and_stored():
+    lead = _lead()
+    store = AsyncMock()
+    _enrich(lead, AsyncMock(return_value="https://joes.example"), store=store)
+
+    stored = [c.args for c in store.await_args_list if c.args[0] == "discovery"]
+    assert stored == [("discovery", _KEY, {"website": "https://joes.example"})]
+
+
+def test_empty_discovery_result_is_not_cached():
+    lead = _lead()
+    store = AsyncMock()
+    _enrich(lead, AsyncMock(return_value=None), store=store)
+
+    assert not [c for c in store.await_args_list if c.args[0] == "discovery"]
@@ -0,0 +1,76 @@
+"""Tests for the streaming lead CSV export, without the API layer or a DB."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+os.environ.setdefault("LEADGEN_DB_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.leadgen import lead_export
+
+
+class _FakeStreamResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def partitions(self, size):
+        for i in range(0, len(self.rows), size):
+            yield self.rows[i:i + size]
+
+
+def _fake_session(rows, calls):
+    session = AsyncMock()
+
+    async def stream(query):
+        calls.append(query)
+        return _FakeStreamResult(rows)
+
+    session.stream = stream
+    session.__aenter__.return_value = session
+    return MagicMock(return_value=session)
+
+
+def _row(name="Test Plumbing Co", emails=("a@x.com", "b@x.com")):
+    return (
+        name, "1 Main St", "Miami", "FL", "33101", "555-0100", "https://x.com",
+        list(emails), 4.5, 10, "Plumber", "wordpress", 80, "hot",
+        None, None, None, None, 70, "C", "note",
+    )
+
+
+def _collect(query, rows, calls):
+    async def main():
+        return [chunk async for chunk in lead_export.stream_leads_csv(query)]
+
+    with patch.object(lead_export, "leadgen_session", _fake_session(rows, calls)):
+        return asyncio.run(main())
+
+
+def test_csv_is_streamed_in_chunks_through_a_cursor():
+    calls = []
+    rows = [_row(name=f"Co {i}", emails=()) for i in range(3)] + [_row()]
+    with patch.object(lead_export, "EXPORT_CHUNK_ROWS", 2):
+        chunks = _collect(lead_export.export_query(1), rows, calls)
+
+    # Header, then one chunk per partition of rows
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().strip().splitlines()
+    assert lines[0].startswith("Business Name")
+    assert len(lines) == 5
+    assert "a@x.com; b@x.com" in lines[-1]
+
+    assert len(calls) == 1
+    assert len(calls[0].selected_columns) == len(lead_export.EXPORT_HEADER)
+    assert calls[0].get_execution_options().get("yield_per") == 2
+
+
+def test_export_query_filters():
+    query = str(lead_export.export_query(1, search_job_id=7, tier="hot"))
+    assert "search_job_id" in query
+    assert "lead_tier" in query
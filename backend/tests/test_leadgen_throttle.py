@@ -0,0 +1,69 @@
+"""Tests for lead enrichment source budgets and per-domain politeness."""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.leadgen import throttle
+from app.utils.concurrency import parse_concurrency
+
+
+def test_source_concurrency_overrides():
+    limits = parse_concurrency("yelp=1, crawl=20,junk", throttle._DEFAULT_SOURCE_CONCURRENCY)
+    assert limits["yelp"] == 1
+    assert limits["crawl"] == 20
+    assert limits["bbb"] == throttle._DEFAULT_SOURCE_CONCURRENCY["bbb"]
+
+
+def test_same_host_is_spaced_and_bounded():
+    in_flight = 0
+    peak = 0
+    starts = []
+
+    async def fetch(url):
+        nonlocal in_flight, peak
+        async with throttle.polite(url):
+            starts.append(time.monotonic())
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+
+    async def main():
+        await asyncio.gather(*(fetch(f"https://www.shop.example/p{i}") for i in range(4)))
+
+    throttle._hosts.clear()
+    with patch.object(throttle, "LEADGEN_DOMAIN_CONCURRENCY", 2), \
+         patch.object(throttle, "LEADGEN_DOMAIN_MIN_INTERVAL", 0.01):
+        asyncio.run(main())
+
+    assert peak <= 2
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.009 for gap in gaps)
+
+
+def test_different_hosts_do_not_wait_on_each_other():
+    async def fetch(url):
+        async with throttle.polite(url):
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*(fetch(f"https://site{i}.example/") for i in range(5)))
+
+    throttle._hosts.clear()
+    with patch.object(throttle, "LEADGEN_DOMAIN_MIN_INTERVAL", 1.0):
+        started = time.monotonic()
+        asyncio.run(main())
+    assert time.monotonic() - started < 0.5
+
+
+def test_www_and_bare_host_share_a_slot():
+    assert throttle._host_key("https://www.Shop.example/a") == throttle._host_key("http://shop.example")
@@ -8,8 +8,7 @@ Strategy:
   - Test success AND failure paths for every endpoint.
 
 NOTE: We cannot use PostgreSQL-specific features (JSONB, ARRAY, schema)
-with SQLite, so we override the DB dependency entirely and patch the
-global _ensure_* helpers to be no-ops.
+with SQLite, so we override the DB dependency entirely.
 """
 
 import asyncio
@@ -413,17 +412,6 @@ async def client():
     app.dependency_overrides.clear()
 
 
-# ── Patch ensure_* column helpers globally ───────────────────────────
-
-@pytest.fixture(autouse=True)
-def patch_ensure_columns():
-    """Prevent ALTER TABLE calls which require PostgreSQL."""
-    with patch("app.api.leadgen._ensure_enrichment_error_column", new_callable=AsyncMock), \
-         patch("app.api.leadgen._ensure_source_column", new_callable=AsyncMock), \
-         patch("app.api.leadgen._ensure_review_columns", new_callable=AsyncMock):
-        yield
-
-
 @pytest.fixture(autouse=True)
 def patch_load_assignments():
     """Mock the assignment loader to avoid CRM DB queries."""
@@ -1006,29 +994,35 @@ class TestListContacts:
 # TESTS: Export
 # =====================================================================
 
+def _fake_csv_stream(calls):
+    """Stand-in for stream_leads_csv; the CSV itself is covered in test_lead_export.py."""
+    async def stream(query):
+        calls.append(query)
+        yield b"Business Name\r\n"
+    return stream
+
+
 class TestExportLeads:
     """GET /api/leadgen/leads/export"""
 
     @pytest.mark.asyncio
     async def test_export_csv(self, client, auth_headers):
-        db = client._mock_db
-        leads = [make_fake_lead(id=1), make_fake_lead(id=2)]
-        db.execute.return_value = FakeResult(items=leads)
-
-        resp = await client.get("/api/leadgen/leads/export", headers=auth_headers)
+        calls = []
+        with patch("app.api.leadgen.stream_leads_csv", _fake_csv_stream(calls)):
+            resp = await client.get("/api/leadgen/leads/export", headers=auth_headers)
         assert resp.status_code == 200
         assert "text/csv" in resp.headers.get("content-type", "")
-        content = resp.text
-        assert "Business Name" in content  # CSV header
-        assert "Test Plumbing Co" in content
+        assert "leads_export.csv" in resp.headers.get("content-disposition", "")
+        assert resp.text.startswith("Business Name")
+        assert len(calls) == 1
 
     @pytest.mark.asyncio
     async def test_export_with_tier_filter(self, client, auth_headers):
-        db = client._mock_db
-        db.execute.return_value = FakeResult(items=[])
-
-        resp = await client.get("/api/leadgen/leads/export?tier=hot", headers=auth_headers)
+        calls = []
+        with patch("app.api.leadgen.stream_leads_csv", _fake_csv_stream(calls)):
+            resp = await client.get("/api/leadgen/leads/export?tier=hot", headers=auth_headers)
         assert resp.status_code == 200
+        assert "lead_tier" in str(calls[0])
 
 
 # =====================================================================
@@ -0,0 +1,67 @@
+"""Tests for the async ffmpeg/ffprobe runner (no ffmpeg needed)."""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import media_exec
+from app.services.media_exec import MediaExecError
+
+
+def test_progress_flags_go_before_inputs():
+    cmd = media_exec._with_progress_flags(["ffmpeg", "-y", "-i", "in.mp4", "out.mp4"])
+    assert cmd[:4] == ["ffmpeg", "-progress", "pipe:1", "-nostats"]
+    assert cmd[-1] == "out.mp4"
+
+
+def test_progress_output_is_parsed_per_block():
+    output = (
+        b"frame=10\nout_time_us=2500000\nspeed=1.5x\nprogress=continue\n"
+        b"frame=20\nout_time_us=5000000\nspeed=1.4x\nprogress=continue\n"
+        b"out_time_us=10000000\nprogress=end\n"
+    )
+    updates = []
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(output)
+        reader.feed_eof()
+        await media_exec._read_progress(reader, updates.append, 10.0)
+
+    asyncio.run(main())
+    assert [u.fraction for u in updates] == [0.25, 0.5, 1.0]
+    assert updates[0].speed == "1.5x"
+    assert updates[-1].done
+
+
+def test_failed_command_raises_with_stderr():
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('bad input'); sys.exit(3)"]
+    with pytest.raises(MediaExecError) as exc:
+        asyncio.run(media_exec.run_media(cmd))
+    assert exc.value.returncode == 3
+    assert "bad input" in exc.value.stderr
+
+    result = asyncio.run(media_exec.run_media(cmd, check=False))
+    assert result.returncode == 3
+
+
+def test_timeout_kills_the_process():
+    cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+    start = time.monotonic()
+    with pytest.raises(MediaExecError, match="timed out"):
+        asyncio.run(media_exec.run_media(cmd, timeout=0.3))
+    assert time.monotonic() - start < 10
+
+
+def test_missing_binary_raises_media_error():
+    with pytest.raises(MediaExecError, match="not found"):
+        asyncio.run(media_exec.run_media(["definitely-not-a-media-tool"]))
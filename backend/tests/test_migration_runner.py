@@ -0,0 +1,28 @@
+"""Sanity checks for the versioned migration registry (no DB needed)."""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.db.migration_runner import MIGRATIONS, _DB_DIR
+
+
+def test_versions_are_unique_and_ordered():
+    versions = [m.version for m in MIGRATIONS]
+    assert len(versions) == len(set(versions))
+    assert versions == sorted(versions)
+
+
+def test_sql_files_referenced_by_steps_exist():
+    for name in ("video_copycat_migration.sql", "content_scheduler_migration.sql", "carousel_migration.sql"):
+        assert (_DB_DIR / name).exists(), name
+
+
+def test_copycat_runs_before_content_scheduler():
+    order = [m.description for m in MIGRATIONS]
+    assert order.index("video copycat tables") < order.index("content scheduler tables")
@@ -0,0 +1,103 @@
+"""Tests for concurrent persona simulation and persona caching in MiroFish."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import mirofish_engine
+from app.services.mirofish_engine import MiroFishEngine
+
+PERSONAS = [{"id": f"p{i}", "name": f"Persona {i}"} for i in range(4)]
+ANSWER = '{"will_like": true, "will_comment": false, "will_share": true, "engagement_score": 80, "sentiment": "positive"}'
+
+
+def _gemini_reply(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+def test_personas_run_concurrently_and_failures_are_dropped():
+    in_flight = 0
+    peak = 0
+
+    async def fake_gemini(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "p3" in kwargs["messages"][0]["parts"][0]["text"]:
+            raise RuntimeError("boom")
+        return _gemini_reply(ANSWER)
+
+    engine = MiroFishEngine()
+    with patch.object(mirofish_engine, "_get_api_key", AsyncMock(return_value="k")), \
+         patch.object(mirofish_engine, "call_gemini_api", fake_gemini), \
+         patch.object(engine, "_build_persona_prompt", lambda c, p: p["id"]), \
+         patch.object(mirofish_engine, "_persona_semaphore", None):
+        result = asyncio.run(engine.simulate_content({"text": "hi"}, PERSONAS))
+
+    assert peak > 1
+    assert result["personas_simulated"] == 3
+    assert result["personas_failed"] == 1
+    assert result["viral_score"] > 0
+
+
+def test_slow_persona_times_out():
+    async def slow_gemini(**kwargs):
+        await asyncio.sleep(1)
+        return _gemini_reply(ANSWER)
+
+    engine = MiroFishEngine()
+    with patch.object(mirofish_engine, "_get_api_key", AsyncMock(return_value="k")), \
+         patch.object(mirofish_engine, "call_gemini_api", slow_gemini), \
+         patch.object(mirofish_engine, "PERSONA_TIMEOUT_SECONDS", 0.01), \
+         patch.object(mirofish_engine, "_persona_semaphore", None):
+        result = asyncio.run(engine.simulate_content({"text": "hi"}, PERSONAS[:1]))
+
+    assert result["personas_failed"] == 1
+    assert result["viral_score"] == 0
+
+
+class FakeDB:
+    def __init__(self):
+        self.queries = 0
+
+    async def execute(self, *args, **kwargs):
+        self.queries += 1
+        return SimpleNamespace(fetchall=lambda: [])
+
+
+def test_personas_are_cached_until_invalidated():
+    shared = {}
+
+    async def get_json(name, default=None):
+        return shared.get(name, default)
+
+    async def set_json(name, value, ttl_seconds=None):
+        shared[name] = value
+
+    asyncio.run(mirofish_engine.invalidate_personas())
+    engine = MiroFishEngine()
+    db = FakeDB()
+    with patch.object(mirofish_engine, "get_json", get_json), \
+         patch.object(mirofish_engine, "set_json", set_json):
+        asyncio.run(engine.generate_personas(1, db))
+        asyncio.run(engine.generate_personas(1, db))
+        assert db.queries == 1
+
+        asyncio.run(mirofish_engine.invalidate_personas(1))
+        asyncio.run(engine.generate_personas(1, db))
+        assert db.queries == 2
+
+        # Another process bumping the org's version also invalidates here
+        shared[mirofish_engine._persona_version_key(1)] = "bumped-elsewhere"
+        asyncio.run(engine.generate_personas(1, db))
+        assert db.queries == 3
@@ -0,0 +1,63 @@
+"""Tests for the in-process notification fan-out (no Postgres needed)."""
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import notification_bus
+
+
+def _notification(id: int, user_id: int, message: str = "hi") -> dict:
+    return {"id": id, "user_id": user_id, "type": "info", "title": "t", "message": message}
+
+
+def test_dispatch_reaches_only_that_users_subscribers():
+    async def run():
+        a1 = notification_bus.subscribe(1)
+        a2 = notification_bus.subscribe(1)
+        b = notification_bus.subscribe(2)
+        try:
+            delivered = notification_bus.dispatch(notification_bus.build_payload(_notification(5, 1)))
+            assert delivered == 2
+            assert (await a1.get())["id"] == 5
+            assert (await a2.get())["id"] == 5
+            assert b.empty()
+        finally:
+            for uid, q in ((1, a1), (1, a2), (2, b)):
+                notification_bus.unsubscribe(uid, q)
+        assert 1 not in notification_bus._subscribers
+
+    asyncio.run(run())
+
+
+def test_oversized_payload_is_trimmed_to_id_and_user():
+    payload = notification_bus.build_payload(_notification(7, 3, message="x" * 10_000))
+    assert json.loads(payload) == {"id": 7, "user_id": 3}
+
+
+def test_full_subscriber_drops_instead_of_blocking():
+    async def run():
+        q = notification_bus.subscribe(9)
+        try:
+            for i in range(notification_bus.SUBSCRIBER_QUEUE_SIZE + 5):
+                notification_bus.dispatch(json.dumps(_notification(i, 9)))
+            assert q.qsize() == notification_bus.SUBSCRIBER_QUEUE_SIZE
+            assert notification_bus.take_overflow(q)
+            assert q.empty()
+            assert not notification_bus.take_overflow(q)
+        finally:
+            notification_bus.unsubscribe(9, q)
+
+    asyncio.run(run())
+
+
+def test_malformed_payload_is_ignored():
+    assert notification_bus.dispatch("not json") == 0
+    assert notification_bus.dispatch(json.dumps({"id": 1})) == 0
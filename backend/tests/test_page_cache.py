@@ -0,0 +1,108 @@
+"""Tests for the shared lead website page cache and parse pool fallback."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.leadgen import page_cache, parse_pool
+from app.services.leadgen.page_cache import FetchedPage
+
+
+def _fake_download(calls, status=200):
+    async def download(url, timeout):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return FetchedPage(url=url, status=status, text="<html>ok</html>")
+    return download
+
+
+def test_concurrent_fetches_share_one_download():
+    page_cache.clear_page_cache()
+    calls = []
+
+    async def main():
+        with patch.object(page_cache, "_download", _fake_download(calls)):
+            pages = await asyncio.gather(
+                page_cache.fetch_page("https://Shop.example/"),
+                page_cache.fetch_page("https://shop.example"),
+                page_cache.fetch_page("https://shop.example/"),
+            )
+            again = await page_cache.fetch_page("https://shop.example/")
+        return pages, again
+
+    pages, again = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(p.text == "<html>ok</html>" for p in pages)
+    assert again is pages[0]
+
+
+def test_failed_pages_are_not_cached():
+    page_cache.clear_page_cache()
+    calls = []
+
+    async def main():
+        with patch.object(page_cache, "_download", _fake_download(calls, status=503)):
+            await page_cache.fetch_page("https://down.example/")
+            await page_cache.fetch_page("https://down.example/")
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_expired_pages_are_refetched():
+    page_cache.clear_page_cache()
+    calls = []
+
+    async def main():
+        with patch.object(page_cache, "_download", _fake_download(calls)), \
+             patch.object(page_cache, "PAGE_CACHE_TTL_SECONDS", -1):
+            await page_cache.fetch_page("https://shop.example/about")
+            await page_cache.fetch_page("https://shop.example/about")
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_cancelled_caller_does_not_cancel_shared_download():
+    page_cache.clear_page_cache()
+    calls = []
+
+    async def main():
+        with patch.object(page_cache, "_download", _fake_download(calls)):
+            owner = asyncio.create_task(page_cache.fetch_page("https://shop.example/"))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(page_cache.fetch_page("https://shop.example/"))
+            await asyncio.sleep(0)
+            owner.cancel()
+            return await waiter
+
+    page = asyncio.run(main())
+    assert page.text == "<html>ok</html>"
+    assert len(calls) == 1
+
+
+def test_cache_is_bounded_by_total_bytes():
+    page_cache.clear_page_cache()
+    calls = []
+
+    async def main():
+        with patch.object(page_cache, "_download", _fake_download(calls)), \
+             patch.object(page_cache, "PAGE_CACHE_MAX_BYTES", 2 * len("<html>ok</html>")):
+            for path in ("a", "b", "c"):
+                await page_cache.fetch_page(f"https://shop.example/{path}")
+
+    asyncio.run(main())
+    assert list(page_cache._pages) == ["https://shop.example/b", "https://shop.example/c"]
+    assert page_cache._pages_bytes == 2 * len("<html>ok</html>")
+
+
+def test_parse_falls_back_to_thread_without_pool():
+    with patch.object(parse_pool, "_get_pool", return_value=None):
+        assert asyncio.run(parse_pool.parse_in_pool(len, "abc")) == 3
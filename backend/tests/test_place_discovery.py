@@ -0,0 +1,82 @@
+"""Tests for concurrent multi-source place discovery (no network or DB)."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services.leadgen import google_places as gp
+from app.services.leadgen.google_places import PlaceResult
+
+
+def _places(source, *names):
+    return [PlaceResult(place_id=f"{source}-{n}", name=n, city="Austin", source=source) for n in names]
+
+
+def _source(results, delay=0.0):
+    async def search(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return results
+    return search
+
+
+def _collect(max_results):
+    async def main():
+        return [(src, [p.name for p in batch]) async for src, batch in gp.iter_places("pizza", "Austin", max_results)]
+    return asyncio.run(main())
+
+
+def test_batches_arrive_in_priority_order_and_are_deduplicated():
+    # Yelp and Overpass answer first but wait for Google, which keeps B
+    with patch.object(gp, "_get_google_maps_key", AsyncMock(return_value="key")), \
+         patch.object(gp, "_search_google_places", _source(_places("google_places", "A", "B"), 0.03)), \
+         patch.object(gp, "_search_yelp", _source(_places("yelp", "B", "C"), 0.0)), \
+         patch.object(gp, "_search_openstreetmap", _source(_places("openstreetmap", "D"), 0.01)):
+        batches = _collect(10)
+    assert batches == [("google_places", ["A", "B"]), ("yelp", ["C"]), ("openstreetmap", ["D"])]
+
+
+def test_fast_lower_priority_source_does_not_crowd_out_google():
+    with patch.object(gp, "_get_google_maps_key", AsyncMock(return_value="key")), \
+         patch.object(gp, "_search_google_places", _source(_places("google_places", "A", "B"), 0.02)), \
+         patch.object(gp, "_search_yelp", _source(_places("yelp", "C", "D", "E"))), \
+         patch.object(gp, "_search_openstreetmap", _source(_places("openstreetmap", "F"))):
+        batches = _collect(3)
+    assert batches == [("google_places", ["A", "B"]), ("yelp", ["C"])]
+
+
+def test_stops_and_cancels_once_max_results_reached():
+    cancelled = asyncio.Event()
+
+    async def slow_osm(*args, **kwargs):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch.object(gp, "_get_google_maps_key", AsyncMock(return_value="key")), \
+         patch.object(gp, "_search_google_places", _source(_places("google_places", "A", "B", "C"))), \
+         patch.object(gp, "_search_yelp", _source(_places("yelp", "D"), 0.01)), \
+         patch.object(gp, "_search_openstreetmap", slow_osm):
+        batches = _collect(2)
+    assert batches == [("google_places", ["A", "B"])]
+    assert cancelled.is_set()
+
+
+def test_failed_source_is_skipped():
+    async def broken(*args, **kwargs):
+        raise RuntimeError("blocked")
+
+    with patch.dict(os.environ, {"GOOGLE_MAPS_API_KEY": ""}), \
+         patch.object(gp, "_get_google_maps_key", AsyncMock(return_value="")), \
+         patch.object(gp, "_search_yelp", broken), \
+         patch.object(gp, "_search_openstreetmap", _source(_places("openstreetmap", "A"))):
+        places = asyncio.run(gp.search_places("pizza", "Austin", 5))
+    assert [p.name for p in places] == ["A"]
@@ -0,0 +1,117 @@
+"""Tests for the shared S3 layer: presign cache and streaming proxy responses.
+
+A fake client stands in for boto3; no Garage needed.
+"""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import FastAPI, Request
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import s3_media
+from app.services.s3_media import PresignCache, presigned_get_url, stream_object_response
+
+DATA = b"0123456789" * 100
+ETAG = '"abc123"'
+
+
+class FakeBody:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.closed = False
+
+    def read(self, size: int) -> bytes:
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
+    def close(self):
+        self.closed = True
+
+
+class FakeS3:
+    def __init__(self):
+        self.signed = []
+
+    def generate_presigned_url(self, op, Params, ExpiresIn):
+        self.signed.append(Params["Key"])
+        return f"http://garage/{Params['Bucket']}/{Params['Key']}?sig={len(self.signed)}"
+
+    def get_object(self, Bucket, Key, Range=None, IfNoneMatch=None):
+        if Key != "thumb.jpg":
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        if IfNoneMatch == ETAG:
+            raise ClientError({"Error": {"Code": "304"}}, "GetObject")
+        data, extra = DATA, {}
+        if Range:
+            start, end = (int(x) for x in Range.replace("bytes=", "").split("-"))
+            data = DATA[start:end + 1]
+            extra["ContentRange"] = f"bytes {start}-{end}/{len(DATA)}"
+        return {"Body": FakeBody(data), "ContentType": "image/jpeg", "ETag": ETAG, "ContentLength": len(data), **extra}
+
+
+class TestPresignCache:
+
+    def test_reuses_url_until_reuse_window_passes(self):
+        client = FakeS3()
+        cache = PresignCache(reuse_fraction=0.5)
+        with patch.object(s3_media, "presign_cache", cache):
+            first = presigned_get_url(client, "media", "a.jpg", expires_in=100)
+            assert presigned_get_url(client, "media", "a.jpg", expires_in=100) == first
+            presigned_get_url(client, "media", "b.jpg", expires_in=100)
+            assert client.signed == ["a.jpg", "b.jpg"]
+
+            with patch.object(s3_media.time, "monotonic", return_value=s3_media.time.monotonic() + 51):
+                assert presigned_get_url(client, "media", "a.jpg", expires_in=100) != first
+            assert client.signed == ["a.jpg", "b.jpg", "a.jpg"]
+
+    def test_evicts_oldest_entry_when_full(self):
+        cache = PresignCache(max_entries=2)
+        for i in range(3):
+            cache.put(("k", i), f"url{i}", 3600)
+        assert cache.get(("k", 0)) is None
+        assert cache.get(("k", 2)) == "url2"
+
+
+def _app(client: FakeS3) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/proxy/{key}")
+    async def proxy(key: str, request: Request):
+        return await stream_object_response(client, "media", key, request, headers={"Cache-Control": "public"})
+
+    return app
+
+
+class TestStreamObjectResponse:
+
+    @pytest.mark.asyncio
+    async def test_full_range_and_not_modified(self):
+        transport = httpx.ASGITransport(app=_app(FakeS3()))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            full = await ac.get("/proxy/thumb.jpg")
+            assert full.status_code == 200
+            assert full.content == DATA
+            assert full.headers["etag"] == ETAG
+            assert full.headers["cache-control"] == "public"
+
+            partial = await ac.get("/proxy/thumb.jpg", headers={"Range": "bytes=10-19"})
+            assert partial.status_code == 206
+            assert partial.content == DATA[10:20]
+            assert partial.headers["content-range"] == f"bytes 10-19/{len(DATA)}"
+
+            cached = await ac.get("/proxy/thumb.jpg", headers={"If-None-Match": ETAG})
+            assert cached.status_code == 304
+            assert cached.content == b""
+
+            missing = await ac.get("/proxy/nope.jpg")
+            assert missing.status_code == 404
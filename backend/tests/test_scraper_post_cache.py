@@ -0,0 +1,59 @@
+"""Tests for caching scraped posts and the post-commit persona invalidation."""
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.api import scraper
+from app.services.competitor_posts import UpsertResult
+
+
+def _db():
+    db = MagicMock()
+    db.info = {}
+
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    db.begin_nested = begin_nested
+    return db
+
+
+def _save(db, outcome):
+    post = MagicMock(likes=1, comments=0, views=0)
+    with patch.object(scraper, "upsert_competitor_posts", AsyncMock(return_value=outcome)), \
+         patch.object(scraper, "mark_snapshot_stale", AsyncMock()):
+        return asyncio.run(scraper._save_posts_to_cache(db, 5, "instagram", [post], org_id=7))
+
+
+def test_changed_posts_invalidate_personas_only_after_commit():
+    db = _db()
+    invalidate = AsyncMock()
+    with patch("app.services.mirofish_engine.invalidate_personas", invalidate):
+        assert _save(db, UpsertResult(new_ids=[1], updated_ids=[2])) == 1
+        invalidate.assert_not_awaited()
+
+        asyncio.run(scraper.invalidate_synced_personas(db))
+        invalidate.assert_awaited_once_with(7)
+
+        # Already handled: a second commit doesn't invalidate again
+        asyncio.run(scraper.invalidate_synced_personas(db))
+        assert invalidate.await_count == 1
+
+
+def test_unchanged_sync_leaves_personas_alone():
+    db = _db()
+    invalidate = AsyncMock()
+    with patch("app.services.mirofish_engine.invalidate_personas", invalidate):
+        assert _save(db, UpsertResult()) == 0
+        asyncio.run(scraper.invalidate_synced_personas(db))
+    invalidate.assert_not_awaited()
@@ -0,0 +1,54 @@
+"""Tests for social sync concurrency config and rate-limit detection."""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.api import social_sync
+from app.utils.concurrency import parse_concurrency
+
+
+def _resp(status=200, headers=None, body=None):
+    return httpx.Response(status, headers=headers or {}, json=body if body is not None else {})
+
+
+def test_concurrency_overrides_and_ignores_garbage():
+    limits = parse_concurrency("instagram=8, x=0,bogus,youtube=abc", social_sync._DEFAULT_CONCURRENCY)
+    assert limits["instagram"] == 8
+    assert limits["x"] == 1
+    assert limits["youtube"] == social_sync._DEFAULT_CONCURRENCY["youtube"]
+
+
+def test_429_uses_retry_after():
+    assert social_sync._rate_limit_delay("youtube", _resp(429, {"retry-after": "7"})) == (7.0, 7.0)
+
+
+def test_meta_throttle_code_is_retried():
+    resp = _resp(400, body={"error": {"code": 613}})
+    retry, cooldown = social_sync._rate_limit_delay("instagram", resp)
+    assert retry and cooldown
+
+
+def test_meta_usage_near_quota_cools_down_without_retry():
+    resp = _resp(200, {"x-app-usage": json.dumps({"call_count": 97, "total_time": 10})})
+    assert social_sync._rate_limit_delay("facebook", resp) == (None, 60.0)
+
+
+def test_x_exhausted_quota_cools_down_until_reset():
+    reset = str(int(time.time()) + 30)
+    resp = _resp(200, {"x-rate-limit-remaining": "0", "x-rate-limit-reset": reset})
+    retry, cooldown = social_sync._rate_limit_delay("x", resp)
+    assert retry is None and 0 < cooldown <= 30
+
+
+def test_ok_response_has_no_delay():
+    assert social_sync._rate_limit_delay("instagram", _resp(200)) == (None, None)
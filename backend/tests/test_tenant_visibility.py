@@ -0,0 +1,83 @@
+"""Tests for the cached RBAC reporting tree in app.services.tenant."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import tenant
+
+# admin(1); director(2) -> manager(3) -> employees(4, 5); employee(6) with no role
+ROWS = [
+    {"id": 1, "reports_to": None, "hierarchy_level": 40, "has_role": True},
+    {"id": 2, "reports_to": 1, "hierarchy_level": 30, "has_role": True},
+    {"id": 3, "reports_to": 2, "hierarchy_level": 20, "has_role": True},
+    {"id": 4, "reports_to": 3, "hierarchy_level": 10, "has_role": True},
+    {"id": 5, "reports_to": 3, "hierarchy_level": None, "has_role": True},
+    {"id": 6, "reports_to": 3, "hierarchy_level": None, "has_role": False},
+]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, *args, **kwargs):
+        self.queries += 1
+        return FakeResult(self.rows)
+
+
+def _visible(db, user_id, org_id=1):
+    return asyncio.run(tenant.get_visible_user_ids(db, user_id, org_id))
+
+
+def test_visibility_by_role_level():
+    tenant.invalidate_visibility()
+    db = FakeDB(ROWS)
+    assert sorted(_visible(db, 1)) == [1, 2, 3, 4, 5, 6]
+    assert sorted(_visible(db, 2)) == [2, 3, 4, 5, 6]
+    assert sorted(_visible(db, 3)) == [3, 4, 5, 6]
+    assert _visible(db, 4) == [4]
+    assert _visible(db, 5) == [5]  # NULL level counts as employee
+    assert _visible(db, 6) == [6]  # no role: self only
+    assert _visible(db, 99) == [99]  # not in org: self only
+
+
+def test_tree_is_loaded_once_per_org_until_invalidated():
+    tenant.invalidate_visibility()
+    db = FakeDB(ROWS)
+    _visible(db, 1)
+    _visible(db, 3)
+    assert asyncio.run(tenant.can_see_user(db, 2, 5, 1))
+    assert not asyncio.run(tenant.can_see_user(db, 4, 5, 1))
+    assert db.queries == 1
+
+    tenant.invalidate_visibility(1)
+    _visible(db, 1)
+    assert db.queries == 2
+
+
+def test_reporting_cycle_terminates():
+    tenant.invalidate_visibility()
+    rows = [
+        {"id": 1, "reports_to": 2, "hierarchy_level": 20, "has_role": True},
+        {"id": 2, "reports_to": 1, "hierarchy_level": 20, "has_role": True},
+    ]
+    assert sorted(_visible(FakeDB(rows), 1, org_id=2)) == [1, 2]
@@ -0,0 +1,90 @@
+"""Tests for the VideoRecord list projection and keyset pagination (DB faked)."""
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.models.video_record import VideoRecord, VideoRecordSummary
+from app.services.video_record_service import VideoRecordService, decode_cursor, encode_cursor
+
+
+def _row(post_id, score, **overrides):
+    row = {
+        "id": post_id, "competitor_id": 2, "competitor_handle": "coach", "platform": "instagram",
+        "post_text": "First line of the caption\nsecond line", "hook": "", "post_url": f"https://ig/p/{post_id}",
+        "posted_at": None, "fetched_at": None, "likes": 10, "comments": 2, "shares": 0,
+        "engagement_score": score, "media_type": "reel", "detected_format": "tutorial",
+        "va_runtime": None, "va_total_duration": None, "frame_seconds": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def _fake_db(rows):
+    result = MagicMock()
+    result.fetchall.return_value = [MagicMock(_mapping=row) for row in rows]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestVideoRecordSummary:
+
+    def test_runtime_sources_match_full_record(self):
+        cases = [
+            {"va_runtime": "1:9.09999999999994"},
+            {"va_runtime": 0, "va_total_duration": 47.4},
+            {"frame_seconds": 130.5},
+            {},
+        ]
+        for extra in cases:
+            summary = VideoRecordSummary.from_list_row(_row(1, 5.0, **extra))
+            full = VideoRecord.from_competitor_post({
+                **_row(1, 5.0),
+                "video_analysis": {k[3:]: v for k, v in extra.items() if k.startswith("va_")} or None,
+                "frame_chunks": [{"duration": extra["frame_seconds"]}] if "frame_seconds" in extra else None,
+            })
+            assert summary.runtime == full.runtime
+            assert summary.format == full.format
+            assert summary.title == full.title == "First line of the caption"
+
+
+class TestKeysetPagination:
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor(12.5, 99)) == (12.5, 99)
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_page_projects_light_columns_and_returns_cursor(self):
+        db = _fake_db([_row(9, 30.0), _row(8, 20.0), _row(7, 20.0)])
+        service = VideoRecordService(db)
+
+        page = await service.get_video_record_page(limit=2, org_id=4)
+
+        statement, params = db.execute.await_args.args
+        sql = str(statement)
+        for heavy in ("cp.transcript", "cp.content_analysis,", "cp.video_analysis,", "cp.frame_chunks,"):
+            assert heavy not in sql
+        assert "ORDER BY COALESCE(cp.engagement_score, 0) DESC, cp.id DESC" in sql
+        assert params["limit"] == 3 and params["org_id"] == 4
+
+        assert [r.id for r in page.records] == [9, 8]
+        assert decode_cursor(page.next_cursor) == (20.0, 8)
+
+        db2 = _fake_db([_row(7, 20.0)])
+        last = await VideoRecordService(db2).get_video_record_page(limit=2, cursor=page.next_cursor)
+        statement, params = db2.execute.await_args.args
+        assert "(COALESCE(cp.engagement_score, 0), cp.id) < (:after_score, :after_id)" in str(statement)
+        assert (params["after_score"], params["after_id"]) == (20.0, 8)
+        assert [r.id for r in last.records] == [7]
+        assert last.next_cursor is None
@@ -0,0 +1,41 @@
+"""Tests for the sync pipeline stage queue (Redis faked)."""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-key-for-tests")
+os.environ.setdefault("POSTGRES_URL", "postgresql+asyncpg://x:x@localhost/fake")
+
+from app.services import workflow_queue
+
+
+def test_stage_budgets_fit_the_orchestrator_timeout():
+    critical = sum(
+        max(workflow_queue.STAGE_BUDGETS[stage] for stage in step)
+        for step in workflow_queue.CRITICAL_PATH
+    )
+    assert critical < workflow_queue.ORCHESTRATOR_TIMEOUT
+    assert workflow_queue.WorkerSettings.job_timeout == workflow_queue.ORCHESTRATOR_TIMEOUT
+
+    backoff = sum(t * workflow_queue.RETRY_BACKOFF_SECONDS for t in range(1, workflow_queue.MAX_TRIES))
+    for stage, budget in workflow_queue.STAGE_BUDGETS.items():
+        assert workflow_queue.STAGE_TIMEOUTS[stage] * workflow_queue.MAX_TRIES + backoff <= budget
+
+
+def test_enqueue_failure_runs_stage_inline():
+    redis = MagicMock()
+    redis.enqueue_job = AsyncMock(side_effect=ConnectionError("redis went away"))
+    stage = AsyncMock(return_value={"processed": 2})
+
+    with patch.object(workflow_queue, "get_redis_pool", AsyncMock(return_value=redis)), \
+         patch.dict(workflow_queue.STAGE_FUNCTIONS, {"analysis": stage}):
+        result = asyncio.run(workflow_queue.run_stage("analysis", [1, 2], job_id="analysis:x"))
+
+    assert result == {"processed": 2}
+    ctx = stage.await_args.args[0]
+    assert ctx["inline"] is True and ctx["job_id"] == "analysis:x"
@@ -6,22 +6,18 @@ using FastEmbed + scikit-learn. Provides content gap analysis and video topic su
 
 import asyncio
 import logging
-import os
 import re
 import json
 from collections import Counter
 from typing import Dict, List, Optional, Tuple, Any
 
-import httpx
 import numpy as np
 from sklearn.cluster import KMeans, DBSCAN
 from sklearn.metrics import silhouette_score
 
-logger = logging.getLogger(__name__)
+from embedding_client import embed_texts
 
-# FastEmbed endpoint configuration
-FASTEMBED_URL = os.getenv("FASTEMBED_URL", "http://10.0.0.11:11435/api/embed")
-FASTEMBED_TIMEOUT = 30.0
+logger = logging.getLogger(__name__)
 
 # Sentiment keyword sets (keep existing logic - it works fine)
 POSITIVE_WORDS = {
@@ -58,30 +54,7 @@ async def get_embeddings(texts: List[str]) -> Optional[np.ndarray]:
     
     Returns None if FastEmbed is unreachable (for fallback handling).
     """
-    if not texts:
-        return None
-        
-    try:
-        async with httpx.AsyncClient(timeout=FASTEMBED_TIMEOUT) as client:
-            response = await client.post(
-                FASTEMBED_URL,
-                json={"input": texts},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            embeddings = data.get("embeddings", [])
-            
-            if not embeddings or len(embeddings) != len(texts):
-                logger.warning("FastEmbed returned incorrect number of embeddings")
-                return None
-                
-            return np.array(embeddings, dtype=np.float32)
-            
-    except Exception as e:
-        logger.warning("FastEmbed request failed: %s", e)
-        return None
+    return await embed_texts(texts)
 
 
 def classify_comment_type(text: str) -> str:
@@ -334,17 +307,17 @@ async def _analyze_comments_with_ml(comments: List[Dict], post_caption: str = ""
     
     # Check if taxonomy exists and use it for theme labeling
     try:
-        from taxonomy import load_taxonomy, batch_classify
-        taxonomy = load_taxonomy()
+        from taxonomy import get_taxonomy_index
+        taxonomy_index = get_taxonomy_index()
         
-        if taxonomy is not None and len(filtered_comments) >= 1:
+        if taxonomy_index is not None and len(filtered_comments) >= 1:
             logger.info("Using taxonomy for theme classification")
             comment_texts = [c["text"] for c in filtered_comments]
             embeddings = await get_embeddings(comment_texts)
             
             if embeddings is not None:
                 # Use taxonomy for classification
-                classifications = batch_classify(comment_texts, embeddings, taxonomy)
+                classifications = taxonomy_index.classify(comment_texts, embeddings)
                 
                 # Count themes from taxonomy classifications
                 theme_counts = Counter()
@@ -359,13 +332,13 @@ async def _analyze_comments_with_ml(comments: List[Dict], post_caption: str = ""
                 logger.info(f"Classified comments using taxonomy: {len(themes)} unique themes found")
             else:
                 logger.warning("Embeddings failed, falling back to clustering")
-                taxonomy = None  # Fall back to clustering
+                taxonomy_index = None  # Fall back to clustering
         else:
             logger.info("No taxonomy found, using clustering approach")
             
     except Exception as e:
         logger.warning(f"Taxonomy classification failed: {e}, falling back to clustering")
-        taxonomy = None
+        taxonomy_index = None
     
     # Step 3: Fall back to clustering if taxonomy not available
     if not themes and len(filtered_comments) >= 2:
@@ -0,0 +1,340 @@
+"""Shared FastEmbed client with request coalescing and a persistent cache.
+
+Every embedding caller goes through one ``EmbeddingClient`` per
+(server, model) pair instead of opening its own ``httpx.AsyncClient``:
+
+  - Coalescing: texts requested within ``EMBED_BATCH_WINDOW_MS`` of each
+    other (e.g. many concurrent single-text ``embed()`` calls) are sent to
+    FastEmbed as one batch request of up to ``EMBED_BATCH_SIZE`` texts.
+    Identical texts in flight at the same time are only sent once.
+  - Connection reuse: one keep-alive HTTP client per event loop, with at
+    most ``EMBED_MAX_CONCURRENCY`` batch requests in flight.
+  - Persistent cache: vectors are stored in SQLite keyed by
+    sha256(model + text), so re-indexing and re-classification never
+    re-embed identical text. Point ``EMBEDDING_CACHE_PATH`` at a volume
+    shared by every container to share the cache; set it to "" to disable.
+
+Two wire formats are supported. With no model the client uses FastEmbed's
+``/api/embed`` (``{"input": [...]}`` → ``{"embeddings": [...]}``); with a
+model name it uses the OpenAI-compatible ``/v1/embeddings`` route.
+
+This module is also copied verbatim into services/ml-pipeline/.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FASTEMBED_URL = os.getenv("FASTEMBED_URL", "http://10.0.0.11:11435")
+FASTEMBED_TIMEOUT = float(os.getenv("FASTEMBED_TIMEOUT", "60"))
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+EMBED_BATCH_WINDOW_MS = float(os.getenv("EMBED_BATCH_WINDOW_MS", "10"))
+EMBED_MAX_CONCURRENCY = int(os.getenv("EMBED_MAX_CONCURRENCY", "4"))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "/data/embeddings/embedding_cache.sqlite3")
+
+# SQLite's default limit on bound parameters is 999
+_SQL_CHUNK = 500
+
+
+def _base_url(url: str) -> str:
+    """Accept either the server root or a full ``/api/embed`` URL."""
+    url = url.rstrip("/")
+    for suffix in ("/api/embed", "/v1/embeddings"):
+        if url.endswith(suffix):
+            return url[: -len(suffix)]
+    return url
+
+
+def cache_key(model: Optional[str], text: str) -> str:
+    """Cache key for one text under one model."""
+    return hashlib.sha256(f"{model or 'default'}\x00{text}".encode("utf-8")).hexdigest()
+
+
+# ── Persistent cache ─────────────────────────────────────────────────
+
+class EmbeddingCache:
+    """SQLite-backed vector cache, safe to share between processes.
+
+    Calls are blocking; ``EmbeddingClient`` runs them in a thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " vector BLOB NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        except Exception as e:
+            logger.warning("Embedding cache unavailable at %s (%s) — caching disabled", self.path, e)
+            self._disabled = True
+        return self._conn
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return found
+            try:
+                for i in range(0, len(keys), _SQL_CHUNK):
+                    chunk = keys[i:i + _SQL_CHUNK]
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache read failed: %s", e)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        rows = [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache write failed: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ── Client ───────────────────────────────────────────────────────────
+
+class EmbeddingClient:
+    """Batched, cached embedding requests against one FastEmbed server/model."""
+
+    def __init__(
+        self,
+        base_url: str = FASTEMBED_URL,
+        model: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = EMBED_BATCH_SIZE,
+        batch_window_ms: float = EMBED_BATCH_WINDOW_MS,
+        max_concurrency: int = EMBED_MAX_CONCURRENCY,
+        timeout: float = FASTEMBED_TIMEOUT,
+    ):
+        self.base_url = _base_url(base_url)
+        self.model = model
+        self.cache = cache
+        self.batch_size = batch_size
+        self.batch_window = batch_window_ms / 1000
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.requests_sent = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        """(Re)create loop-bound state when first used on a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._http: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._pending: List[Tuple[str, str]] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            )
+        return self._http
+
+    # ── Public API ───────────────────────────────────────────────────
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed one text. Returns None if FastEmbed is unreachable."""
+        vectors = await self._get_vectors([text])
+        return vectors[0].tolist() if vectors[0] is not None else None
+
+    async def embed_many(self, texts: Sequence[str]) -> Optional[np.ndarray]:
+        """Embed texts as an (n, dim) float32 array.
+
+        Returns None if any text could not be embedded (for fallback handling).
+        """
+        if not texts:
+            return None
+        vectors = await self._get_vectors(list(texts))
+        if any(v is None for v in vectors):
+            return None
+        return np.vstack(vectors)
+
+    async def close(self) -> None:
+        if self._loop is not None and self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    # ── Internals ────────────────────────────────────────────────────
+
+    async def _get_vectors(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        self._bind_loop()
+        keys = [cache_key(self.model, t) for t in texts]
+        found: Dict[str, Optional[np.ndarray]] = {}
+
+        lookup = [k for k in dict.fromkeys(keys) if k not in self._inflight]
+        if self.cache is not None and lookup:
+            found.update(await asyncio.to_thread(self.cache.get_many, lookup))
+
+        waiting: Dict[str, asyncio.Future] = {}
+        for key, text in zip(keys, texts):
+            if key in found or key in waiting:
+                continue
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._loop.create_future()
+                self._inflight[key] = future
+                self._pending.append((key, text))
+            waiting[key] = future
+        self._schedule_flush()
+
+        if waiting:
+            # Shielded: the futures are shared with other callers, and
+            # cancelling this one must not cancel their results
+            results = await asyncio.gather(*(asyncio.shield(f) for f in waiting.values()))
+            found.update(zip(waiting.keys(), results))
+        return [found.get(k) for k in keys]
+
+    def _schedule_flush(self) -> None:
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._pending and self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_window, self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.batch_size):
+            task = self._loop.create_task(self._send(pending[i:i + self.batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, str]]) -> None:
+        vectors: Optional[np.ndarray] = None
+        try:
+            async with self._semaphore:
+                vectors = await self._post([text for _, text in batch])
+                self.requests_sent += 1
+        except Exception as e:
+            logger.warning("FastEmbed request failed (%d texts): %s", len(batch), e)
+
+        if vectors is not None and self.cache is not None:
+            try:
+                await asyncio.to_thread(self.cache.put_many, [(key, vec) for (key, _), vec in zip(batch, vectors)])
+            except Exception as e:
+                logger.warning("Embedding cache write failed: %s", e)
+
+        for i, (key, _) in enumerate(batch):
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(vectors[i] if vectors is not None else None)
+
+    async def _post(self, texts: List[str]) -> np.ndarray:
+        client = self._client()
+        if self.model:
+            response = await client.post(
+                f"{self.base_url}/v1/embeddings",
+                json={"input": texts, "model": self.model},
+            )
+            response.raise_for_status()
+            data = sorted(response.json().get("data", []), key=lambda d: d.get("index", 0))
+            embeddings = [d["embedding"] for d in data]
+        else:
+            response = await client.post(
+                f"{self.base_url}/api/embed",
+                json={"input": texts},
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            embeddings = response.json().get("embeddings", [])
+
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        return np.asarray(embeddings, dtype=np.float32)
+
+
+# ── Process-wide clients ─────────────────────────────────────────────
+
+_cache: Optional[EmbeddingCache] = None
+_clients: Dict[Tuple[str, Optional[str]], EmbeddingClient] = {}
+
+
+def _get_cache() -> Optional[EmbeddingCache]:
+    global _cache
+    if _cache is None and EMBEDDING_CACHE_PATH:
+        _cache = EmbeddingCache(EMBEDDING_CACHE_PATH)
+    return _cache
+
+
+def get_embedding_client(model: Optional[str] = None, base_url: Optional[str] = None) -> EmbeddingClient:
+    """Shared client for a FastEmbed server (default: ``FASTEMBED_URL``) and model."""
+    key = (_base_url(base_url or FASTEMBED_URL), model)
+    client = _clients.get(key)
+    if client is None:
+        client = EmbeddingClient(base_url=key[0], model=model, cache=_get_cache())
+        _clients[key] = client
+    return client
+
+
+async def embed_text(text: str, model: Optional[str] = None) -> Optional[List[float]]:
+    """Embed one text through the shared client."""
+    return await get_embedding_client(model).embed(text)
+
+
+async def embed_texts(texts: Sequence[str], model: Optional[str] = None) -> Optional[np.ndarray]:
+    """Embed a list of texts through the shared client."""
+    return await get_embedding_client(model).embed_many(texts)
+
+
+async def close_embedding_clients() -> None:
+    """Close pooled HTTP connections and the cache (app shutdown)."""
+    for client in _clients.values():
+        try:
+            await client.close()
+        except Exception:
+            pass
+    _clients.clear()
+    if _cache is not None:
+        _cache.close()
@@ -8,7 +8,8 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from comment_analyzer import analyze_comments_ml, get_embeddings
-from taxonomy import load_taxonomy, save_taxonomy, batch_classify, drill_down_cluster, MasterTaxonomy
+from embedding_client import close_embedding_clients
+from taxonomy import get_taxonomy_index, save_taxonomy, drill_down_cluster, MasterTaxonomy
 from taxonomy_builder import build_taxonomy_from_comments
 
 # Configure logging
@@ -22,6 +23,11 @@ app = FastAPI(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_embedding_clients()
+
+
 class CommentInput(BaseModel):
     text: str
     username: Optional[str] = ""
@@ -129,13 +135,13 @@ async def get_taxonomy() -> Union[Dict, None]:
     Returns the taxonomy JSON or null if no taxonomy exists.
     """
     try:
-        taxonomy = load_taxonomy()
+        index = get_taxonomy_index()
         
-        if taxonomy is None:
+        if index is None:
             return None
             
         from dataclasses import asdict
-        return asdict(taxonomy)
+        return asdict(index.taxonomy)
         
     except Exception as e:
         logger.error(f"Failed to load taxonomy: {e}")
@@ -152,9 +158,9 @@ async def classify_texts(request: ClassifyTextsRequest) -> List[Dict]:
     Returns list of classification results with label, safety_label, confidence.
     """
     try:
-        # Load current taxonomy
-        taxonomy = load_taxonomy()
-        if taxonomy is None:
+        # Resident taxonomy (reloaded only when taxonomy.json changes)
+        index = get_taxonomy_index()
+        if index is None:
             raise HTTPException(status_code=404, detail="No taxonomy found. Build one first.")
         
         # Get embeddings for input texts
@@ -163,7 +169,7 @@ async def classify_texts(request: ClassifyTextsRequest) -> List[Dict]:
             raise HTTPException(status_code=503, detail="FastEmbed service unavailable")
         
         # Classify against taxonomy
-        results = batch_classify(request.texts, embeddings, taxonomy)
+        results = index.classify(request.texts, embeddings)
         
         logger.info(f"Classified {len(request.texts)} texts")
         return results
@@ -1,7 +1,9 @@
 """Master Taxonomy system for comment classification.
 
 Provides centroid-based classification using pre-trained taxonomy for fast,
-zero-cost labeling of new comments.
+zero-cost labeling of new comments. The taxonomy is kept resident as a
+``TaxonomyIndex`` (see ``get_taxonomy_index``) so requests don't re-read
+taxonomy.json.
 """
 
 import json
@@ -117,6 +119,9 @@ def save_taxonomy(taxonomy: MasterTaxonomy) -> bool:
         with open(TAXONOMY_PATH, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         
+        # Swap the resident index to the new taxonomy straight away
+        _set_resident_index(TaxonomyIndex(taxonomy), os.stat(TAXONOMY_PATH).st_mtime)
+        
         logger.info(f"Saved taxonomy to {TAXONOMY_PATH}")
         return True
         
@@ -188,15 +193,7 @@ def classify_comment(text: str, embedding: List[float], taxonomy: MasterTaxonomy
             break
     
     # Determine confidence level based on thresholds
-    if confidence >= 0.85:
-        confidence_level = "HIGH"
-        is_new = False
-    elif confidence >= 0.6:
-        confidence_level = "MEDIUM"
-        is_new = False
-    else:
-        confidence_level = "LOW"
-        is_new = True
+    confidence_level, is_new = _confidence_level(confidence)
     
     return {
         "text": text,
@@ -208,6 +205,126 @@ def classify_comment(text: str, embedding: List[float], taxonomy: MasterTaxonomy
     }
 
 
+def _confidence_level(confidence: float) -> Tuple[str, bool]:
+    """Map a similarity score to (confidence_level, is_new)."""
+    if confidence >= 0.85:
+        return "HIGH", False
+    if confidence >= 0.6:
+        return "MEDIUM", False
+    return "LOW", True
+
+
+def _normalized_matrix(vectors: List[List[float]]) -> np.ndarray:
+    """Stack vectors into a float32 matrix with unit-length rows."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class TaxonomyIndex:
+    """A taxonomy with its centroids pre-normalized into matrices.
+
+    Classifying a batch is one matrix multiply against the category
+    centroids, plus one per drill-down category for its sub-topics.
+    """
+
+    def __init__(self, taxonomy: MasterTaxonomy):
+        self.taxonomy = taxonomy
+        self.categories = [c for c in taxonomy.categories if c.centroid is not None]
+        self.centroids = _normalized_matrix([c.centroid for c in self.categories]) if self.categories else None
+
+        # Category position → (sub-topics with centroids, their matrix)
+        self.sub_topics: Dict[int, Tuple[List[SubTopic], np.ndarray]] = {}
+        for i, category in enumerate(self.categories):
+            subs = [st for st in category.sub_topics if st.centroid is not None]
+            if category.drill_down_required and subs:
+                self.sub_topics[i] = (subs, _normalized_matrix([st.centroid for st in subs]))
+
+        # Same label → safety label lookup classify_comment uses
+        self.safety_labels: Dict[str, str] = {}
+        for category in taxonomy.categories:
+            self.safety_labels.setdefault(category.label, category.safety_label)
+
+    def classify(self, texts: List[str], embeddings: np.ndarray) -> List[Dict]:
+        if len(texts) != len(embeddings):
+            raise ValueError("Number of texts and embeddings must match")
+        if not texts:
+            return []
+
+        n = len(texts)
+        best = np.full(n, -1)
+        scores = np.zeros(n, dtype=np.float32)
+        if self.centroids is not None:
+            queries = _normalized_matrix(embeddings)
+            similarities = queries @ self.centroids.T  # (n_texts, n_categories)
+            best = similarities.argmax(axis=1)
+            scores = similarities[np.arange(n), best]
+            # Nothing scoring above zero counts as unknown
+            best = np.where(scores > 0, best, -1)
+            scores = np.maximum(scores, 0)
+
+        sub_labels: List[Optional[str]] = [None] * n
+        sub_scores = np.zeros(n, dtype=np.float32)
+        for cat_idx, (subs, matrix) in self.sub_topics.items():
+            rows = np.flatnonzero(best == cat_idx)
+            if len(rows) == 0:
+                continue
+            sub_sim = queries[rows] @ matrix.T
+            sub_best = sub_sim.argmax(axis=1)
+            sub_scores[rows] = sub_sim[np.arange(len(rows)), sub_best]
+            for row, j in zip(rows, sub_best):
+                sub_labels[row] = subs[j].label
+
+        results = []
+        for i, text in enumerate(texts):
+            label = self.categories[best[i]].label if best[i] >= 0 else "unknown"
+            confidence = float(scores[i])
+            confidence_level, is_new = _confidence_level(confidence)
+            result = {
+                "text": text,
+                "label": label,
+                "safety_label": self.safety_labels.get(label, "Discussion"),
+                "confidence": round(confidence, 3),
+                "confidence_level": confidence_level,
+                "is_new": is_new,
+            }
+            if sub_labels[i] is not None:
+                result["sub_topic"] = sub_labels[i]
+                result["sub_topic_confidence"] = round(float(sub_scores[i]), 3)
+            results.append(result)
+        return results
+
+
+# Resident index, reloaded when taxonomy.json changes on disk
+_resident_index: Optional[TaxonomyIndex] = None
+_resident_mtime: Optional[float] = None
+
+
+def _set_resident_index(index: Optional[TaxonomyIndex], mtime: Optional[float]) -> None:
+    global _resident_index, _resident_mtime
+    _resident_index, _resident_mtime = index, mtime
+
+
+def get_taxonomy_index() -> Optional[TaxonomyIndex]:
+    """Return the resident taxonomy index, reloading it if the file changed.
+
+    Costs one stat() per call; the JSON is only parsed when its mtime moves.
+    """
+    try:
+        mtime = os.stat(TAXONOMY_PATH).st_mtime
+    except FileNotFoundError:
+        if _resident_index is not None:
+            logger.warning(f"Taxonomy file {TAXONOMY_PATH} removed, dropping resident taxonomy")
+        _set_resident_index(None, None)
+        return None
+
+    if _resident_index is None or mtime != _resident_mtime:
+        taxonomy = load_taxonomy()
+        _set_resident_index(TaxonomyIndex(taxonomy) if taxonomy else None, mtime)
+    return _resident_index
+
+
 def batch_classify(texts: List[str], embeddings: np.ndarray, taxonomy: MasterTaxonomy) -> List[Dict]:
     """Classify a batch of comments against the taxonomy.
     
@@ -219,15 +336,8 @@ def batch_classify(texts: List[str], embeddings: np.ndarray, taxonomy: MasterTax
     Returns:
         List of classification results, one per comment.
     """
-    if len(texts) != len(embeddings):
-        raise ValueError("Number of texts and embeddings must match")
-    
-    results = []
-    for text, embedding in zip(texts, embeddings):
-        result = classify_comment(text, embedding.tolist(), taxonomy)
-        results.append(result)
-    
-    return results
+    index = _resident_index if _resident_index is not None and _resident_index.taxonomy is taxonomy else TaxonomyIndex(taxonomy)
+    return index.classify(texts, embeddings)
 
 
 def extract_keywords_from_cluster(texts: List[str], global_stopwords: set, top_k: int = 10) -> List[str]:
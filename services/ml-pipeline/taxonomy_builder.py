@@ -10,10 +10,11 @@ import uuid
 from collections import Counter
 from typing import Dict, List, Set
 
-import httpx
 import numpy as np
 from sklearn.cluster import KMeans
 
+from embedding_client import get_embedding_client
+
 from taxonomy import (
     MasterTaxonomy, TaxonomyCategory, SubTopic, save_taxonomy, 
     extract_keywords_from_cluster, drill_down_cluster
@@ -47,7 +48,7 @@ async def get_fastembed_embeddings(texts: List[str], fastembed_url: str, batch_s
     Args:
         texts: List of text strings to embed
         fastembed_url: FastEmbed server endpoint URL
-        batch_size: Number of texts per API call (prevents timeouts)
+        batch_size: Unused; the shared client batches at EMBED_BATCH_SIZE
         
     Returns:
         numpy array of shape (n_texts, 768)
@@ -55,24 +56,11 @@ async def get_fastembed_embeddings(texts: List[str], fastembed_url: str, batch_s
     if not texts:
         return np.array([])
     
-    all_embeddings = []
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            logger.info(f"Embedding batch {i//batch_size + 1}/{(len(texts)-1)//batch_size + 1} ({len(batch)} texts)")
-            response = await client.post(
-                fastembed_url,
-                json={"input": batch},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            embeddings = data.get("embeddings", [])
-            if len(embeddings) != len(batch):
-                raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
-            all_embeddings.extend(embeddings)
-    
-    return np.array(all_embeddings, dtype=np.float32)
+    logger.info(f"Embedding {len(texts)} texts (cached texts are skipped)")
+    embeddings = await get_embedding_client(base_url=fastembed_url).embed_many(texts)
+    if embeddings is None:
+        raise ValueError(f"FastEmbed failed to embed {len(texts)} texts")
+    return embeddings
 
 
 def find_representative_texts(texts: List[str], embeddings: np.ndarray, centroid: np.ndarray, top_k: int = 3) -> List[str]:
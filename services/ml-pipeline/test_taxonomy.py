@@ -3,7 +3,7 @@
 
 import json
 import numpy as np
-from taxonomy import MasterTaxonomy, TaxonomyCategory, SubTopic, save_taxonomy, load_taxonomy, classify_comment
+from taxonomy import MasterTaxonomy, TaxonomyCategory, SubTopic, save_taxonomy, load_taxonomy, classify_comment, get_taxonomy_index
 
 def test_taxonomy_basic():
     """Test basic taxonomy creation, save/load, and classification."""
@@ -76,6 +76,26 @@ def test_taxonomy_basic():
         return False
     
     print(f"✅ Classification result: {result['label']} ({result['confidence']:.3f})")
+    
+    # Vectorized batch classification must agree with the per-comment path
+    print("Testing batch classification...")
+    index = get_taxonomy_index()
+    if index is None or index.taxonomy.version != "test_1.0":
+        print("❌ Resident taxonomy index not refreshed by save")
+        return False
+    
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(20, 768)).astype(np.float32)
+    embeddings[0] = 0.15
+    texts = [f"comment {i}" for i in range(len(embeddings))]
+    batch_results = index.classify(texts, embeddings)
+    single_results = [classify_comment(t, e.tolist(), loaded_taxonomy) for t, e in zip(texts, embeddings)]
+    for batch, single in zip(batch_results, single_results):
+        if (batch["label"], batch["confidence"]) != (single["label"], single["confidence"]):
+            print(f"❌ Batch/single mismatch: {batch} vs {single}")
+            return False
+    print("✅ Batch classification matches per-comment classification")
+    
     print("✅ All tests passed!")
     return True
 
@@ -0,0 +1,235 @@
+"""Long-lived Playwright browser pool for the Instagram scrapers.
+
+Launching Chromium and re-authenticating costs several seconds per call.
+This pool keeps one headless browser and one authenticated context alive
+per process, and hands out reusable pages:
+
+  - Bounded concurrency: at most ``max_pages_per_context`` pages at once
+    (Instagram rate-limits per session, not per IP).
+  - Recycling: the context is closed and rebuilt after
+    ``max_navigations_per_context`` page checkouts, to shed memory leaks
+    and stale state. Cookies are persisted by the recycle hook, so a
+    rebuilt context usually skips the login flow.
+  - Health checks: a disconnected browser is relaunched transparently,
+    and a page that raised mid-use is closed rather than reused.
+
+The pool knows nothing about Instagram; callers supply an async
+``context_factory(browser)`` that returns a ready context and an optional
+``on_recycle(context)`` hook to persist state.
+
+This is the single-account version of backend/app/services/browser_pool.py
+(the backend rotates several scraping accounts; this service uses one).
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BROWSER_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+]
+
+DEFAULT_PAGES_PER_CONTEXT = int(os.getenv("BROWSER_POOL_PAGES_PER_CONTEXT", "2"))
+DEFAULT_MAX_NAVIGATIONS = int(os.getenv("BROWSER_POOL_MAX_NAVIGATIONS", "50"))
+
+ContextFactory = Callable[[Any], Awaitable[Any]]
+RecycleHook = Callable[[Any], Awaitable[None]]
+
+
+def playwright_installed() -> bool:
+    """Whether Playwright can be imported, without importing it."""
+    return importlib.util.find_spec("playwright") is not None
+
+
+class _ContextSlot:
+    """The authenticated browser context plus its idle pages and counters."""
+
+    def __init__(self, context: Any, max_pages: int):
+        self.context = context
+        self.semaphore = asyncio.Semaphore(max_pages)
+        self.idle_pages: List[Any] = []
+        self.in_use = 0
+        self.navigations = 0
+        # Set (under the pool lock) once the slot is removed from the pool;
+        # a retiring slot is never handed out again
+        self.retiring = False
+        self.closed = False
+
+
+class BrowserPool:
+    """Shared headless Chromium with one authenticated context and reusable pages."""
+
+    def __init__(
+        self,
+        context_factory: ContextFactory,
+        on_recycle: Optional[RecycleHook] = None,
+        max_pages_per_context: int = DEFAULT_PAGES_PER_CONTEXT,
+        max_navigations_per_context: int = DEFAULT_MAX_NAVIGATIONS,
+    ):
+        self._context_factory = context_factory
+        self._on_recycle = on_recycle
+        self.max_pages_per_context = max_pages_per_context
+        self.max_navigations_per_context = max_navigations_per_context
+
+        self._playwright = None
+        self._browser = None
+        self._slot: Optional[_ContextSlot] = None
+        self._lock = asyncio.Lock()
+        self.launches = 0
+
+    # ── Browser lifecycle ────────────────────────────────────────────
+
+    async def _ensure_browser(self):
+        """Launch Chromium if it isn't running (or has crashed)."""
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        if self._browser is not None:
+            logger.warning("Browser pool: Chromium disconnected — relaunching")
+            self._slot = None
+
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+
+        self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+        self.launches += 1
+        logger.info("Browser pool: Chromium launched (launch #%d)", self.launches)
+        return self._browser
+
+    async def _get_slot(self) -> _ContextSlot:
+        async with self._lock:
+            browser = await self._ensure_browser()
+            if self._slot is None:
+                self._slot = _ContextSlot(await self._context_factory(browser), self.max_pages_per_context)
+                logger.info("Browser pool: context ready")
+            return self._slot
+
+    async def _mark_retiring(self, slot: _ContextSlot) -> None:
+        """Take the slot out of the pool so no new checkout can land on it."""
+        async with self._lock:
+            slot.retiring = True
+            if self._slot is slot:
+                self._slot = None
+
+    async def _retire_slot(self, slot: _ContextSlot) -> None:
+        """Close a retiring context once its last page is returned."""
+        if slot.closed:
+            return
+        slot.closed = True
+        if self._on_recycle is not None:
+            try:
+                await self._on_recycle(slot.context)
+            except Exception as e:
+                logger.warning("Browser pool: recycle hook failed: %s", e)
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+        logger.info("Browser pool: recycled context after %d navigations", slot.navigations)
+
+    # ── Public API ───────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def page(self):
+        """Check out a page in the authenticated context.
+
+        Callers that attach event listeners must remove them before the
+        block exits; the page is reset to about:blank and reused.
+        """
+        while True:
+            slot = await self._get_slot()
+            await slot.semaphore.acquire()
+            if not slot.retiring:
+                break
+            # Retired while we waited for a page — use its replacement
+            slot.semaphore.release()
+
+        # Counted as in use before any await, so the context can't be
+        # closed under us by another checkout retiring the slot
+        slot.in_use += 1
+        try:
+            page = None
+            while slot.idle_pages and page is None:
+                candidate = slot.idle_pages.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await slot.context.new_page()
+
+            slot.navigations += 1
+            if slot.navigations >= self.max_navigations_per_context and not slot.retiring:
+                await self._mark_retiring(slot)
+
+            healthy = False
+            try:
+                yield page
+                healthy = True
+            finally:
+                if healthy and not slot.retiring:
+                    try:
+                        await page.goto("about:blank")
+                        slot.idle_pages.append(page)
+                    except Exception:
+                        healthy = False
+                if not healthy or slot.retiring:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+        finally:
+            slot.in_use -= 1
+            slot.semaphore.release()
+            if slot.retiring and slot.in_use == 0:
+                await self._retire_slot(slot)
+
+    async def reset(self) -> None:
+        """Drop the context so the next checkout rebuilds it."""
+        async with self._lock:
+            slot, self._slot = self._slot, None
+            if slot is None:
+                return
+            slot.retiring = True
+            if slot.in_use == 0 and not slot.closed:
+                slot.closed = True
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+
+    async def close(self) -> None:
+        """Shut down the context, the browser and Playwright."""
+        await self.reset()
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def health(self) -> Dict[str, Any]:
+        """Snapshot of pool state for health endpoints."""
+        slot = self._slot
+        return {
+            "browser_connected": bool(self._browser is not None and self._browser.is_connected()),
+            "launches": self.launches,
+            "context": None if slot is None else {
+                "pages_in_use": slot.in_use,
+                "idle_pages": len(slot.idle_pages),
+                "navigations": slot.navigations,
+            },
+        }
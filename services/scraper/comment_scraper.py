@@ -5,13 +5,14 @@ Stores top comments per post for audience intelligence analysis.
 """
 
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from browser_pool import playwright_installed
+
 # Database imports removed - scraper service doesn't access DB directly
 
 logger = logging.getLogger(__name__)
@@ -25,13 +26,14 @@ async def scrape_post_comments(
 ) -> List[Dict[str, Any]]:
     """Scrape comments from a single Instagram post using authenticated Playwright.
     
+    Runs on a pooled page in the shared authenticated browser context.
+    
     Returns list of comments: [{username, text, likes, timestamp, is_reply}]
     """
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not playwright_installed():
         logger.error("Playwright not installed")
         return []
+    from instagram_scraper import get_browser_pool
     
     comments: List[Dict] = []
     captured_comments: List[Dict] = []
@@ -57,66 +59,41 @@ async def scrape_post_comments(
             pass
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-            )
-            
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-                timezone_id="America/New_York",
-            )
-            
-            # Load cookies
-            if COOKIE_PATH.exists():
-                try:
-                    cookies = json.loads(COOKIE_PATH.read_text())
-                    if cookies:
-                        await context.add_cookies(cookies)
-                except Exception as e:
-                    logger.warning("Failed to load cookies: %s", e)
-            
-            page = await context.new_page()
+        async with get_browser_pool().page() as page:
             page.on("response", intercept_response)
-            
-            post_url = f"https://www.instagram.com/p/{shortcode}/"
-            logger.info("Scraping comments from %s", post_url)
-            
-            await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-            
-            # Wait for page to render comments
-            await asyncio.sleep(4)
-            
-            # Scroll to load more comments
-            for _ in range(3):
-                await page.evaluate("window.scrollBy(0, 500)")
-                await asyncio.sleep(1.5)
-            
-            # Try clicking "View all X comments" to expand
             try:
-                view_all = await page.query_selector('text=/View all.*comment/i')
-                if view_all:
-                    await view_all.click()
-                    await asyncio.sleep(3)
-                    # Scroll more in expanded view
-                    for _ in range(3):
-                        await page.evaluate("window.scrollBy(0, 600)")
-                        await asyncio.sleep(1.5)
-            except Exception:
-                pass
-            
-            # Primary extraction: DOM (Instagram 2026 format)
-            # Comments are rendered in div containers with Reply text nodes
-            captured_comments.extend(await _extract_comments_from_dom(page))
-            logger.info("DOM extraction: %d comments from %s", len(captured_comments), shortcode)
-            
-            await browser.close()
+                post_url = f"https://www.instagram.com/p/{shortcode}/"
+                logger.info("Scraping comments from %s", post_url)
+                
+                await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
+                
+                # Wait for page to render comments
+                await asyncio.sleep(4)
+                
+                # Scroll to load more comments
+                for _ in range(3):
+                    await page.evaluate("window.scrollBy(0, 500)")
+                    await asyncio.sleep(1.5)
+                
+                # Try clicking "View all X comments" to expand
+                try:
+                    view_all = await page.query_selector('text=/View all.*comment/i')
+                    if view_all:
+                        await view_all.click()
+                        await asyncio.sleep(3)
+                        # Scroll more in expanded view
+                        for _ in range(3):
+                            await page.evaluate("window.scrollBy(0, 600)")
+                            await asyncio.sleep(1.5)
+                except Exception:
+                    pass
+                
+                # Primary extraction: DOM (Instagram 2026 format)
+                # Comments are rendered in div containers with Reply text nodes
+                captured_comments.extend(await _extract_comments_from_dom(page))
+                logger.info("DOM extraction: %d comments from %s", len(captured_comments), shortcode)
+            finally:
+                page.remove_listener("response", intercept_response)
     
     except Exception as e:
         logger.error("Comment scraping error for %s: %s", shortcode, e)
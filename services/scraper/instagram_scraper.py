@@ -9,6 +9,10 @@ Uses Playwright to:
 4. Extract profile data + recent posts with full engagement metrics
 5. Auto re-login when Instagram invalidates the session
 
+Browsers are pooled (see browser_pool.py): one Chromium per process and one
+authenticated context, so each profile scrape costs a page navigation
+rather than a browser cold start plus a login check.
+
 Works on public AND login-walled profiles thanks to authenticated sessions.
 """
 
@@ -23,6 +27,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from browser_pool import BrowserPool, playwright_installed
+
 logger = logging.getLogger(__name__)
 
 # Persistent cookie storage path
@@ -660,19 +666,43 @@ async def _get_authenticated_context(browser):
     return context
 
 
+# ── Browser pool ─────────────────────────────────────────────────────
+
+_browser_pool = None
+
+
+async def _create_pool_context(browser):
+    """Context factory for the browser pool (single env-configured account)."""
+    return await _get_authenticated_context(browser)
+
+
+async def _persist_pool_cookies(context) -> None:
+    """Save a context's cookies before the pool recycles it."""
+    cookies = await context.cookies(["https://www.instagram.com"])
+    if cookies:
+        await _save_cookies(cookies)
+
+
+def get_browser_pool():
+    """Return the process-wide browser pool, creating it on first use."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(_create_pool_context, on_recycle=_persist_pool_cookies)
+    return _browser_pool
+
+
 async def scrape_profile(handle: str) -> ScrapedProfile:
     """Scrape a public Instagram profile using Playwright.
     
-    Launches headless Chromium, navigates to the profile page, and intercepts
-    the GraphQL/API responses that Instagram makes internally to load profile data.
+    Checks out a pooled page in the authenticated context,
+    navigates to the profile page, and intercepts the GraphQL/API responses
+    that Instagram makes internally to load profile data.
     """
     handle = handle.strip().lstrip("@").lower()
     logger.warning("SCRAPER_PROFILE: Starting scrape for @%s", handle)
     profile = ScrapedProfile(handle=handle, scraped_at=datetime.now())
 
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not playwright_installed():
         profile.error = "Playwright not installed. Run: pip install playwright && playwright install chromium"
         return profile
 
@@ -730,59 +760,43 @@ async def scrape_profile(handle: str) -> ScrapedProfile:
             pass
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                ],
-            )
-            logger.warning("SCRAPER_PROFILE: Browser launched")
-
-            # Use authenticated context (loads cookies or logs in)
-            context = await _get_authenticated_context(browser)
-            logger.warning("SCRAPER_PROFILE: Auth context ready")
-
-            page = await context.new_page()
+        async with get_browser_pool().page() as page:
+            logger.warning("SCRAPER_PROFILE: Pooled page ready")
             page.on("response", intercept_response)
-
-            # Navigate to profile
-            url = f"https://www.instagram.com/{handle}/"
-            logger.info("Navigating to %s", url)
-
-            resp = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            logger.warning("SCRAPER_PROFILE: Profile page loaded, status=%s", resp.status if resp else "none")
-
-            if resp and resp.status == 404:
-                profile.error = "Profile not found (404)"
-                await browser.close()
-                return profile
-
-            # Wait for profile content to render
-            # Try waiting for specific selectors that indicate data has loaded
             try:
-                await page.wait_for_selector(
-                    'header section, [data-testid="user-avatar"], meta[property="og:title"]',
-                    timeout=15000,
-                )
-            except Exception:
-                logger.debug("Timeout waiting for header section, continuing...")
-
-            # Give extra time for API calls to complete
-            await asyncio.sleep(3)
-            logger.warning("SCRAPER_PROFILE: Data captured: %s", list(captured_data.keys()))
-
-            # If network interception didn't capture data, try extracting from DOM
-            if "user" not in captured_data and "user_v1" not in captured_data:
-                logger.info("No API data intercepted, trying DOM extraction...")
-                dom_data = await _extract_from_dom(page, handle)
-                if dom_data:
-                    captured_data["dom"] = dom_data
-
-            await browser.close()
+                # Navigate to profile
+                url = f"https://www.instagram.com/{handle}/"
+                logger.info("Navigating to %s", url)
+
+                resp = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                logger.warning("SCRAPER_PROFILE: Profile page loaded, status=%s", resp.status if resp else "none")
+
+                if resp and resp.status == 404:
+                    profile.error = "Profile not found (404)"
+                    return profile
+
+                # Wait for profile content to render
+                # Try waiting for specific selectors that indicate data has loaded
+                try:
+                    await page.wait_for_selector(
+                        'header section, [data-testid="user-avatar"], meta[property="og:title"]',
+                        timeout=15000,
+                    )
+                except Exception:
+                    logger.debug("Timeout waiting for header section, continuing...")
+
+                # Give extra time for API calls to complete
+                await asyncio.sleep(3)
+                logger.warning("SCRAPER_PROFILE: Data captured: %s", list(captured_data.keys()))
+
+                # If network interception didn't capture data, try extracting from DOM
+                if "user" not in captured_data and "user_v1" not in captured_data:
+                    logger.info("No API data intercepted, trying DOM extraction...")
+                    dom_data = await _extract_from_dom(page, handle)
+                    if dom_data:
+                        captured_data["dom"] = dom_data
+            finally:
+                page.remove_listener("response", intercept_response)
 
     except Exception as e:
         profile.error = f"Browser error: {str(e)}"
@@ -987,8 +1001,8 @@ async def scrape_multiple(
 ) -> List[ScrapedProfile]:
     """Scrape multiple profiles with random delays between requests.
     
-    Shares a single authenticated browser session across all profiles
-    to avoid multiple logins.
+    Shares a single pooled authenticated browser session across all
+    profiles to avoid multiple logins and browser launches.
     """
     results = []
     for i, handle in enumerate(handles):
@@ -1023,20 +1037,14 @@ async def force_relogin() -> bool:
         COOKIE_PATH.unlink()
         logger.info("Cleared saved Instagram cookies")
     
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
+    if not playwright_installed():
         return False
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage", "--disable-gpu"],
-        )
-        context = await _get_authenticated_context(browser)
-        is_valid = await _has_valid_session(context)
-        await browser.close()
-        return is_valid
+    # Rebuild the shared-session context from scratch (fresh login)
+    pool = get_browser_pool()
+    await pool.reset()
+    async with pool.page() as page:
+        return await _has_valid_session(page.context)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1048,66 +1056,55 @@ async def follow_instagram_user(handle: str) -> Dict[str, Any]:
     
     Returns: {"success": bool, "message": str, "user_id": str|None}
     """
-    from playwright.async_api import async_playwright
-    
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-dev-shm-usage"],
-        )
-        context = await _get_authenticated_context(browser)
-        page = await context.new_page()
-        
+    async with get_browser_pool().page() as page:
         try:
             # Navigate to the profile
             clean_handle = handle.lstrip("@")
             await page.goto(f"https://www.instagram.com/{clean_handle}/", wait_until="domcontentloaded", timeout=15000)
             await asyncio.sleep(3)
-            
+        
             # Check if already following
             follow_btn = await page.query_selector('button:has-text("Follow")')
             following_btn = await page.query_selector('button:has-text("Following")')
             requested_btn = await page.query_selector('button:has-text("Requested")')
-            
+        
             if following_btn:
                 logger.info("Already following @%s", clean_handle)
                 return {"success": True, "message": f"Already following @{clean_handle}", "already_following": True}
-            
+        
             if requested_btn:
                 logger.info("Follow request already pending for @%s", clean_handle)
                 return {"success": True, "message": f"Follow request pending for @{clean_handle}", "already_following": True}
-            
+        
             if not follow_btn:
                 logger.warning("No follow button found for @%s", clean_handle)
                 return {"success": False, "message": f"Could not find follow button for @{clean_handle}"}
-            
+        
             # Click follow
             await follow_btn.click()
             await asyncio.sleep(2)
-            
+        
             # Verify follow worked
             following_after = await page.query_selector('button:has-text("Following")')
             requested_after = await page.query_selector('button:has-text("Requested")')
-            
+        
             if following_after:
                 logger.info("Successfully followed @%s", clean_handle)
                 # Save cookies to preserve session
-                cookies = await context.cookies(["https://www.instagram.com"])
+                cookies = await page.context.cookies(["https://www.instagram.com"])
                 await _save_cookies(cookies)
                 return {"success": True, "message": f"Now following @{clean_handle}"}
             elif requested_after:
                 logger.info("Follow request sent to @%s (private account)", clean_handle)
-                cookies = await context.cookies(["https://www.instagram.com"])
+                cookies = await page.context.cookies(["https://www.instagram.com"])
                 await _save_cookies(cookies)
                 return {"success": True, "message": f"Follow request sent to @{clean_handle} (private account)"}
             else:
                 return {"success": False, "message": f"Follow click didn't register for @{clean_handle}"}
-                
+            
         except Exception as e:
             logger.error("Failed to follow @%s: %s", handle, e)
             return {"success": False, "message": f"Error following @{handle}: {str(e)[:100]}"}
-        finally:
-            await browser.close()
 
 
 async def follow_multiple_users(handles: List[str], delay_between: float = 5.0) -> List[Dict[str, Any]]:
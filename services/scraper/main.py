@@ -5,6 +5,7 @@ Extracted from the monolith backend, this service handles:
 - Comment scraping from posts
 - Follow/batch follow actions
 - Cookie session management
+- A long-lived browser pool (one Chromium, reusable authenticated pages)
 
 Environment Variables:
 - INSTAGRAM_USERNAME: Instagram username for authenticated scraping
@@ -29,6 +30,7 @@ from instagram_scraper import (
     follow_instagram_user,
     follow_multiple_users,
     force_relogin,
+    get_browser_pool,
     COOKIE_PATH,
 )
 from comment_scraper import scrape_post_comments
@@ -98,8 +100,15 @@ async def health_check():
         "service": "war-room-scraper",
         "cookie_path_exists": COOKIE_PATH.exists(),
         "instagram_username_configured": bool(os.getenv("INSTAGRAM_USERNAME")),
+        "browser_pool": get_browser_pool().health(),
     }
 
+
+@app.on_event("shutdown")
+async def close_browser_pool():
+    """Close the pooled Chromium instance on shutdown."""
+    await get_browser_pool().close()
+
 # Cookie Status
 @app.get("/cookie-status")
 async def cookie_status():